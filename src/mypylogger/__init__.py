@@ -2,18 +2,84 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import importlib
+import threading
+from typing import TYPE_CHECKING, Any
 
-from .core import LoggerManager
 from .exceptions import ConfigurationError, FormattingError, HandlerError, MypyloggerError
 
 if TYPE_CHECKING:
     import logging
 
+    from .context import bind, clear_context, contextualize, get_context, reset_context, unbind
+    from .core import LoggerManager
+    from .lazy import Lazy, LazyLogger
+
 __version__ = "0.2.8"
 
-# Global logger manager instance
-_logger_manager = LoggerManager()
+# Public names imported from their modules on first access (PEP 562), so
+# ``import mypylogger`` stays cheap until logging is actually used
+_LAZY_ATTRIBUTES = {
+    "Lazy": ".lazy",
+    "LazyLogger": ".lazy",
+    "bind": ".context",
+    "clear_context": ".context",
+    "contextualize": ".context",
+    "get_context": ".context",
+    "reset_context": ".context",
+    "unbind": ".context",
+}
+
+# Holds the global logger manager once the first get_logger call creates it
+_managers: list[LoggerManager] = []
+_manager_lock = threading.Lock()
+
+
+def _get_manager() -> LoggerManager:
+    """Return the global LoggerManager, creating it on first use.
+
+    Returns:
+        The process-wide LoggerManager.
+    """
+    if not _managers:
+        with _manager_lock:
+            if not _managers:
+                from .core import LoggerManager  # noqa: PLC0415
+
+                _managers.append(LoggerManager())
+    return _managers[0]
+
+
+def __getattr__(name: str) -> object:
+    """Import lazily exported names on first access.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        The exported object.
+
+    Raises:
+        AttributeError: If name is not part of the package.
+    """
+    if name == "_logger_manager":
+        return _get_manager()
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including the lazily exported names.
+
+    Returns:
+        Sorted attribute names.
+    """
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 
 def get_logger(name: str | None = None) -> logging.Logger:
@@ -26,7 +92,54 @@ def get_logger(name: str | None = None) -> logging.Logger:
     Returns:
         Configured Logger instance with JSON formatting and appropriate handlers.
     """
-    return _logger_manager.get_or_create_logger(name)
+    return _get_manager().get_or_create_logger(name)
+
+
+def get_lazy_logger(name: str | None = None) -> LazyLogger:
+    """Get a logger adapter that skips evaluating arguments for disabled levels.
+
+    Args:
+        name: Logger name, resolved the same way as in get_logger.
+
+    Returns:
+        LazyLogger wrapping the configured logger. Message arguments and extra
+        values wrapped in Lazy are only computed when the level is enabled.
+    """
+    from .lazy import LazyLogger  # noqa: PLC0415
+
+    return LazyLogger(_get_manager().get_or_create_logger(name))
+
+
+def reload_config() -> None:
+    """Re-read logging configuration from the environment.
+
+    The environment is read once, when the first logger is created. After
+    changing LOG_* variables, call this to apply them to every logger
+    returned by get_logger so far and to loggers created later.
+    """
+    _get_manager().reload_config()
+
+
+def get_metrics() -> dict[str, Any]:
+    """Get the logging pipeline metrics collected so far.
+
+    Returns:
+        Records per level, bytes per handler, formatting time histogram,
+        fallback and dropped field counts and queue state, or an empty dict
+        unless LOG_METRICS is enabled.
+    """
+    return _get_manager().metrics_snapshot()
+
+
+def dump_flight_recorder() -> int:
+    """Write out the records held by the flight recorder now.
+
+    Returns:
+        Number of records written, 0 unless LOG_FLIGHT_RECORDER is enabled.
+    """
+    from .flight_recorder import dump_all  # noqa: PLC0415
+
+    return dump_all()
 
 
 def get_version() -> str:
@@ -43,7 +156,19 @@ __all__ = [
     "ConfigurationError",
     "FormattingError",
     "HandlerError",
+    "Lazy",
+    "LazyLogger",
     "MypyloggerError",
+    "bind",
+    "clear_context",
+    "contextualize",
+    "dump_flight_recorder",
+    "get_context",
+    "get_lazy_logger",
     "get_logger",
+    "get_metrics",
     "get_version",
+    "reload_config",
+    "reset_context",
+    "unbind",
 ]
@@ -0,0 +1,285 @@
+"""Asynchronous queue-backed handler for mypylogger."""
+
+from __future__ import annotations
+
+import atexit
+from contextlib import suppress
+import logging
+import queue
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+import weakref
+
+from .context import capture_context
+
+if TYPE_CHECKING:
+    from .formatters import SourceLocationJSONFormatter
+
+# Overflow policies
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DROP_NEWEST = "drop_newest"
+
+# Constants
+DEFAULT_QUEUE_SIZE = 10000
+DRAIN_BATCH_SIZE = 512  # Records written per wake-up of the writer thread
+SHUTDOWN_TIMEOUT = 5.0  # Seconds to wait for the writer thread on close/flush
+
+
+class AsyncQueueHandler(logging.Handler):
+    """Handler that enqueues records and writes them on a dedicated thread.
+
+    Source location and the final message are captured on the calling thread;
+    JSON formatting and I/O happen on the writer thread through the target
+    handlers, so output is identical to the synchronous handlers.
+    """
+
+    def __init__(
+        self,
+        targets: list[logging.Handler],
+        formatter: SourceLocationJSONFormatter,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow: str = OVERFLOW_BLOCK,
+    ) -> None:
+        """Initialize AsyncQueueHandler and start its writer thread.
+
+        Args:
+            targets: Handlers that perform the actual formatting and output.
+            formatter: Formatter used to capture source location on the calling thread.
+            queue_size: Maximum number of records waiting to be written.
+            overflow: Policy when the queue is full: block, drop_oldest or drop_newest.
+        """
+        super().__init__()
+        self._targets = list(targets)
+        self._location_formatter = formatter
+        self._queue: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=queue_size)
+        self._overflow = overflow
+        self._overflow_lock = threading.Lock()
+        self._closed = False
+        self.dropped_oldest = 0
+        self.dropped_newest = 0
+
+        self._thread = threading.Thread(
+            target=self._drain, name="mypylogger-async-writer", daemon=True
+        )
+        self._thread.start()
+
+        # Flush pending records on interpreter exit without keeping the handler alive
+        atexit.register(_close_handler, weakref.ref(self))
+
+    @property
+    def targets(self) -> list[logging.Handler]:
+        """Handlers records are dispatched to on the writer thread."""
+        return list(self._targets)
+
+    def prepare(self, record: logging.LogRecord) -> None:
+        """Capture call-site dependent state before the record changes threads.
+
+        Args:
+            record: LogRecord instance to prepare.
+        """
+        self._location_formatter.capture_source_location(record)
+        capture_context(record)
+        try:
+            # Freeze the message so later mutation of args cannot change the output
+            record.msg = record.getMessage()
+            record.args = None
+        except Exception:
+            # Leave the record untouched; the formatter falls back to plain text
+            pass
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Enqueue record for the writer thread.
+
+        Args:
+            record: LogRecord instance to emit.
+        """
+        try:
+            self.prepare(record)
+            # Handler.handle() holds self.lock here, so close() cannot slip in
+            # between the closed check and the enqueue
+            if self._closed:
+                # Writer thread is gone; write synchronously so nothing is lost
+                self._dispatch(record)
+                return
+            self._enqueue(record)
+        except Exception as e:
+            self._log_handler_error(f"Failed to enqueue log record: {e}")
+
+    def flush(self) -> None:
+        """Wait until queued records are written, then flush the target handlers."""
+        if self._closed:
+            return
+        if self._thread.is_alive():
+            deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+            with self._queue.all_tasks_done:
+                while self._queue.unfinished_tasks:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._thread.is_alive():
+                        break
+                    self._queue.all_tasks_done.wait(remaining)
+        self._flush_targets()
+
+    def close(self) -> None:
+        """Stop the writer thread, write any remaining records and close targets."""
+        self.acquire()
+        try:
+            already_closed = self._closed
+            self._closed = True
+        finally:
+            self.release()
+
+        if not already_closed:
+            if self._thread.is_alive():
+                try:
+                    self._queue.put(None, timeout=SHUTDOWN_TIMEOUT)
+                    self._thread.join(SHUTDOWN_TIMEOUT)
+                except queue.Full:
+                    self._log_handler_error("Async writer thread is stalled, draining on close")
+            self._drain_remaining()
+            for target in self._targets:
+                # One failing target must not keep the others open
+                try:
+                    target.flush()
+                    target.close()
+                except Exception as e:  # noqa: PERF203
+                    self._log_handler_error(f"Failed to close target handler: {e}")
+        super().close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the handler has been closed and no longer writes asynchronously."""
+        return self._closed
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and overflow counters.
+
+        Returns:
+            Dictionary with queue_depth, queue_size, dropped_oldest and dropped_newest.
+        """
+        return {
+            "queue_depth": self._queue.qsize(),
+            "queue_size": self._queue.maxsize,
+            "dropped_oldest": self.dropped_oldest,
+            "dropped_newest": self.dropped_newest,
+        }
+
+    def _enqueue(self, record: logging.LogRecord) -> None:
+        """Put record on the queue according to the overflow policy.
+
+        Args:
+            record: Prepared LogRecord instance.
+        """
+        if self._overflow == OVERFLOW_BLOCK:
+            try:
+                self._queue.put(record, timeout=SHUTDOWN_TIMEOUT)
+            except queue.Full:
+                # Writer is stalled; give up on this record rather than hang the caller
+                with self._overflow_lock:
+                    self.dropped_newest += 1
+                self._log_handler_error("Async writer thread is stalled, dropping log record")
+            return
+
+        try:
+            self._queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        with self._overflow_lock:
+            if self._overflow == OVERFLOW_DROP_NEWEST:
+                self.dropped_newest += 1
+                return
+
+            # Drop oldest: evict until the new record fits
+            while True:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                    self.dropped_oldest += 1
+                except queue.Empty:
+                    pass
+                try:
+                    self._queue.put_nowait(record)
+                    return
+                except queue.Full:
+                    continue
+
+    def _drain(self) -> None:
+        """Writer thread loop: write records in batches until the stop sentinel."""
+        while True:
+            batch = [self._queue.get()]
+            with suppress(queue.Empty):
+                while len(batch) < DRAIN_BATCH_SIZE:
+                    batch.append(self._queue.get_nowait())
+
+            stop = False
+            for record in batch:
+                if record is None:
+                    stop = True
+                else:
+                    self._dispatch(record)
+                self._queue.task_done()
+
+            self._flush_targets()
+            if stop:
+                return
+
+    def _drain_remaining(self) -> None:
+        """Synchronously write records left on the queue after the writer stopped."""
+        while True:
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if record is not None:
+                self._dispatch(record)
+            self._queue.task_done()
+
+    def _dispatch(self, record: logging.LogRecord) -> None:
+        """Hand record to every target handler whose level allows it.
+
+        Args:
+            record: LogRecord instance to write.
+        """
+        for target in self._targets:
+            if record.levelno >= target.level:
+                try:
+                    target.handle(record)
+                except Exception as e:
+                    self._log_handler_error(f"Async target handler failed: {e}")
+
+    def _flush_targets(self) -> None:
+        """Flush all target handlers."""
+        for target in self._targets:
+            # One failing target must not keep the others from flushing
+            try:
+                target.flush()
+            except Exception as e:  # noqa: PERF203
+                self._log_handler_error(f"Failed to flush target handler: {e}")
+
+    def _log_handler_error(self, message: str) -> None:
+        """Log handler errors to stderr without affecting user logging.
+
+        Args:
+            message: Error message to log.
+        """
+        try:
+            print(f"mypylogger: {message}", file=sys.stderr)
+        except OSError:
+            # If stderr is not available or fails, silently continue
+            # This is intentional to prevent mypylogger from crashing user applications
+            pass
+
+
+def _close_handler(handler_ref: weakref.ReferenceType[AsyncQueueHandler]) -> None:
+    """Close an async handler at interpreter exit if it is still alive.
+
+    Args:
+        handler_ref: Weak reference to the handler.
+    """
+    handler = handler_ref()
+    if handler is not None:
+        handler.close()
@@ -0,0 +1,494 @@
+"""Compact binary log encoding for mypylogger.
+
+A binary log file is a sequence of frames, each a varint body length
+followed by the body, whose first byte is the frame kind:
+
+- header: magic, format version, timestamp format and JSON backend. Starts
+  a stream; the string and call site tables and the timestamp base restart
+  with every header.
+- string: defines the next string id. Level, module, filename and function
+  names and the static field prefix are sent once per stream.
+- site: defines the next call site id as the string ids of a level, module,
+  filename, function name and static field prefix.
+- record: call site id, zigzag varint timestamp delta and line, then the
+  length-prefixed message and custom fields JSON and the rest of the line.
+- json: a complete JSON line, for records the compact form cannot hold.
+
+BinaryRecordDecoder and iter_json_lines() turn a file back into the exact
+JSON lines the formatter writes; ``python -m mypylogger.decode`` runs them
+from the command line.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator
+
+from .buffered_handler import DEFAULT_BATCH_INTERVAL, DEFAULT_FLUSH_LEVEL, BufferedFileHandler
+from .formatters import SourceLocationJSONFormatter
+from .json_backends import get_json_backend
+from .timestamps import TimestampEngine
+
+if TYPE_CHECKING:
+    import logging
+    from pathlib import Path
+
+# Constants
+MAGIC = b"MPLB"
+FORMAT_VERSION = 1
+BINARY_SUFFIX = ".bin"  # Appended to the JSON log filename
+MAX_TABLE_ENTRIES = 65536  # Strings or call sites per stream; a new stream starts when full
+READ_CHUNK = 64 * 1024  # Bytes read at a time by iter_json_lines
+
+# Frame kinds
+KIND_HEADER = 0
+KIND_STRING = 1
+KIND_SITE = 2
+KIND_RECORD = 3
+KIND_JSON = 4
+
+# LEB128 varints carry 7 bits per byte; the high bit marks a following byte
+VARINT_CONTINUATION = 0x80
+VARINT_PAYLOAD_MASK = 0x7F
+
+# Kind and magic opening every header frame, after its one-byte length
+_HEADER_START = bytes((KIND_HEADER,)) + MAGIC
+_HEADER_CHECK_BYTES = 1 + len(_HEADER_START)
+
+# Single-byte varints, the common case for lengths, deltas and ids
+_SMALL_VARINTS = [bytes((value,)) for value in range(VARINT_CONTINUATION)]
+
+
+class BinaryRecordEncoder:
+    """Stateful encoder turning records into frames of one binary stream.
+
+    The first encode() call writes the stream header. Frames must be
+    written in the order they are returned, since records refer to strings
+    and call sites defined by earlier frames.
+    """
+
+    def __init__(self, formatter: SourceLocationJSONFormatter) -> None:
+        """Initialize BinaryRecordEncoder.
+
+        Args:
+            formatter: Formatter whose JSON output the stream reproduces.
+        """
+        self.formatter = formatter
+        self._strings: dict[str | bytes, int] = {}
+        # (level, module, filename, function_name, prefix) -> record frame kind and site id
+        self._sites: dict[tuple[Any, ...], bytes] = {}
+        self._last_timestamp = 0
+        self._started = False
+
+    def reset(self) -> None:
+        """Start a new stream with the next encode() call."""
+        self._strings.clear()
+        self._sites.clear()
+        self._last_timestamp = 0
+        self._started = False
+
+    def encode(self, record: logging.LogRecord) -> bytes:
+        """Encode a record, preceded by any header, string and site frames it needs.
+
+        Args:
+            record: LogRecord instance to encode.
+
+        Returns:
+            Encoded frames.
+        """
+        out = b""
+        # A new call site defines at most five strings
+        if (
+            not self._started
+            or len(self._strings) > MAX_TABLE_ENTRIES - 5
+            or len(self._sites) >= MAX_TABLE_ENTRIES
+        ):
+            self.reset()
+            out = self._header()
+
+        formatter = self.formatter
+        parts = formatter.format_parts(record)
+        if parts is None:
+            return out + _json_frame(formatter.format_bytes(record))
+        timestamp, level, message, location, custom, prefix, suffix = parts
+        line = location["line"]
+        key = (level, location["module"], location["filename"], location["function_name"], prefix)
+        site = None
+        try:
+            encoded = message.encode("utf-8")
+            site = self._sites.get(key)
+            if site is None:
+                site, definitions = self._define_site(key)
+                out += definitions
+        except (TypeError, UnicodeEncodeError):
+            # Unexpected location types, or lone surrogates that make the JSON
+            # encoder fall back to plain text as well
+            pass
+        if site is None or type(line) is not int:
+            return out + _json_frame(formatter.format_bytes(record))
+
+        delta = timestamp - self._last_timestamp
+        self._last_timestamp = timestamp
+        body = b"".join(
+            (
+                site,
+                _varint(delta << 1 if delta >= 0 else (-delta << 1) - 1),
+                _varint(line << 1 if line >= 0 else (-line << 1) - 1),
+                _varint(len(encoded)),
+                encoded,
+                _varint(len(custom)),
+                custom,
+                # The closing brace is implied
+                suffix[:-1],
+            )
+        )
+        return out + _varint(len(body)) + body
+
+    def _header(self) -> bytes:
+        """Build the header frame starting a new stream.
+
+        Returns:
+            Encoded header frame.
+        """
+        body = bytes((KIND_HEADER,)) + MAGIC + bytes((FORMAT_VERSION,))
+        for value in (self.formatter.timestamp_format, self.formatter.json_backend.name):
+            encoded = value.encode("utf-8")
+            body += _varint(len(encoded)) + encoded
+        self._started = True
+        return _varint(len(body)) + body
+
+    def _define_site(self, site: tuple[Any, ...]) -> tuple[bytes, bytes]:
+        """Assign a call site the next id, defining any new strings first.
+
+        Args:
+            site: Level, module, filename, function name and prefix.
+
+        Returns:
+            Record frame start for the site, and the frames defining it.
+
+        Raises:
+            TypeError: If a name is not a string.
+            UnicodeEncodeError: If a name cannot be encoded as UTF-8.
+        """
+        definitions = b""
+        body = bytes((KIND_SITE,))
+        for value in site:
+            string_id = self._strings.get(value)
+            if string_id is None:
+                if isinstance(value, str):
+                    encoded = value.encode("utf-8")
+                elif isinstance(value, bytes):
+                    encoded = value
+                else:
+                    msg = f"Cannot intern {type(value).__name__}"
+                    raise TypeError(msg)
+                definitions += _varint(len(encoded) + 1) + bytes((KIND_STRING,)) + encoded
+                string_id = len(self._strings)
+                self._strings[value] = string_id
+            body += _varint(string_id)
+
+        site_start = bytes((KIND_RECORD,)) + _varint(len(self._sites))
+        self._sites[site] = site_start
+        return site_start, definitions + _varint(len(body)) + body
+
+
+class BinaryRecordDecoder:
+    """Decoder turning frames of binary streams back into JSON lines.
+
+    The fixed fields are serialized again with the JSON backend named in the
+    stream header, so the output is byte-identical to the formatter's when
+    that backend is installed; otherwise the standard library backend is
+    used.
+    """
+
+    def __init__(self) -> None:
+        """Initialize BinaryRecordDecoder."""
+        self._raw: list[bytes] = []
+        self._texts: list[str] = []
+        # Level, module, filename and function name, and the raw prefix
+        self._sites: list[tuple[str, str, str, str, bytes]] = []
+        self._last_timestamp = 0
+        self._timestamps: TimestampEngine | None = None
+        self._backend = get_json_backend()
+
+    def decode(self, body: bytes) -> bytes | None:
+        """Decode one frame body.
+
+        Args:
+            body: Frame body without its length prefix.
+
+        Returns:
+            JSON line without the trailing newline for record and json frames,
+            None for the other frames.
+
+        Raises:
+            ValueError: If the frame is malformed or no header came first.
+        """
+        try:
+            kind = body[0]
+            if kind == KIND_HEADER:
+                self._read_header(body)
+                return None
+            timestamps = self._timestamps
+            if timestamps is None:
+                msg = "Not a binary mypylogger stream: missing header"
+                raise ValueError(msg)
+            if kind == KIND_RECORD:
+                return self._read_record(body, timestamps)
+            if kind == KIND_STRING:
+                raw = body[1:]
+                self._raw.append(raw)
+                self._texts.append(raw.decode("utf-8"))
+                return None
+            if kind == KIND_SITE:
+                self._read_site(body)
+                return None
+            if kind == KIND_JSON:
+                return body[1:]
+        except (IndexError, UnicodeDecodeError) as e:
+            msg = f"Malformed binary log frame: {e}"
+            raise ValueError(msg) from e
+        msg = f"Unknown binary log frame kind {kind}"
+        raise ValueError(msg)
+
+    def _read_header(self, body: bytes) -> None:
+        """Start a new stream from a header frame.
+
+        Args:
+            body: Header frame body.
+
+        Raises:
+            ValueError: If the magic or version is not recognized.
+        """
+        if body[1:5] != MAGIC:
+            msg = "Not a binary mypylogger stream: bad magic"
+            raise ValueError(msg)
+        if body[5] != FORMAT_VERSION:
+            msg = f"Unsupported binary log format version {body[5]}"
+            raise ValueError(msg)
+        length, pos = _read_varint(body, 6)
+        timestamp_format = body[pos : pos + length].decode("utf-8")
+        length, pos = _read_varint(body, pos + length)
+        backend_name = body[pos : pos + length].decode("utf-8")
+
+        self._raw.clear()
+        self._texts.clear()
+        self._sites.clear()
+        self._last_timestamp = 0
+        self._timestamps = TimestampEngine(timestamp_format)
+        if backend_name != self._backend.name:
+            self._backend = get_json_backend(backend_name)
+
+    def _read_site(self, body: bytes) -> None:
+        """Add the call site defined by a site frame.
+
+        Args:
+            body: Site frame body.
+        """
+        texts = self._texts
+        level, pos = _read_varint(body, 1)
+        module, pos = _read_varint(body, pos)
+        filename, pos = _read_varint(body, pos)
+        function_name, pos = _read_varint(body, pos)
+        prefix, pos = _read_varint(body, pos)
+        self._sites.append(
+            (texts[level], texts[module], texts[filename], texts[function_name], self._raw[prefix])
+        )
+
+    def _read_record(self, body: bytes, timestamps: TimestampEngine) -> bytes:
+        """Rebuild the JSON line of a record frame.
+
+        Args:
+            body: Record frame body.
+            timestamps: Timestamp renderer of the current stream.
+
+        Returns:
+            JSON line without the trailing newline.
+        """
+        site, pos = _read_varint(body, 1)
+        level, module, filename, function_name, prefix = self._sites[site]
+        value, pos = _read_varint(body, pos)
+        self._last_timestamp += (value >> 1) ^ -(value & 1)
+        line, pos = _read_varint(body, pos)
+        length, pos = _read_varint(body, pos)
+        message = body[pos : pos + length].decode("utf-8")
+        length, pos = _read_varint(body, pos + length)
+        custom = body[pos : pos + length]
+        suffix = body[pos + length :]
+
+        fixed: dict[str, Any] = {
+            "timestamp": timestamps.from_integer(self._last_timestamp),
+            "level": level,
+            "message": message,
+            "module": module,
+            "filename": filename,
+            "function_name": function_name,
+            "line": (line >> 1) ^ -(line & 1),
+        }
+        fields = self._backend.dumps_bytes(fixed)[1:-1]
+        if custom:
+            fields += b"," + custom
+        return prefix + fields + suffix + b"}"
+
+
+class BinaryFileHandler(BufferedFileHandler):
+    """Batched file handler writing records in the binary encoding.
+
+    Every handler starts a new stream in the file it appends to. Interned
+    strings are only valid within their stream, so only one handler may
+    write a file at a time; use LOG_MULTIPROCESS to write from several
+    processes.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        batch_bytes: int = 0,
+        batch_interval: float = DEFAULT_BATCH_INTERVAL,
+        flush_level: int = DEFAULT_FLUSH_LEVEL,
+    ) -> None:
+        """Initialize BinaryFileHandler and open the log file.
+
+        Args:
+            filename: Path of the binary log file to append to.
+            batch_bytes: Pending bytes that trigger a write; 0 disables batching.
+            batch_interval: Maximum seconds a record waits before being written.
+            flush_level: Minimum level written immediately together with the batch.
+        """
+        super().__init__(
+            filename,
+            batch_bytes=batch_bytes,
+            batch_interval=batch_interval,
+            flush_level=flush_level,
+        )
+        self.setFormatter(SourceLocationJSONFormatter())
+        self._encoder: BinaryRecordEncoder | None = None
+
+    def _encode(self, record: logging.LogRecord) -> bytes:
+        """Encode a record as binary frames.
+
+        Args:
+            record: LogRecord instance to encode.
+
+        Returns:
+            Encoded frames.
+
+        Raises:
+            TypeError: If the formatter is not a SourceLocationJSONFormatter.
+        """
+        formatter = self.formatter
+        encoder = self._encoder
+        if encoder is None or encoder.formatter is not formatter:
+            if not isinstance(formatter, SourceLocationJSONFormatter):
+                msg = "BinaryFileHandler requires a SourceLocationJSONFormatter"
+                raise TypeError(msg)
+            # A new formatter may use another timestamp format or backend
+            encoder = self._encoder = BinaryRecordEncoder(formatter)
+        return encoder.encode(record)
+
+
+def iter_json_lines(stream: BinaryIO) -> Iterator[bytes]:
+    """Decode a binary log stream into JSON lines.
+
+    A truncated last frame, as left by a crash, is skipped.
+
+    Args:
+        stream: Binary log file opened for reading in binary mode.
+
+    Yields:
+        JSON lines without their trailing newline.
+
+    Raises:
+        ValueError: If the data is not a binary mypylogger log.
+    """
+    decoder = BinaryRecordDecoder()
+    buffer = b""
+    header_checked = False
+    while True:
+        chunk = stream.read(READ_CHUNK)
+        if not chunk:
+            if buffer and not header_checked:
+                msg = "Not a binary mypylogger stream: missing header"
+                raise ValueError(msg)
+            return
+        buffer += chunk
+        if not header_checked:
+            # Pipes may return fewer bytes than the header on the first read
+            if len(buffer) < _HEADER_CHECK_BYTES:
+                continue
+            if buffer[1:_HEADER_CHECK_BYTES] != _HEADER_START:
+                # Header frames are shorter than 128 bytes, so one length byte precedes them
+                msg = "Not a binary mypylogger stream: missing header"
+                raise ValueError(msg)
+            header_checked = True
+        pos = 0
+        while True:
+            try:
+                length, start = _read_varint(buffer, pos)
+            except IndexError:
+                break
+            end = start + length
+            if end > len(buffer):
+                break
+            line = decoder.decode(buffer[start:end])
+            pos = end
+            if line is not None:
+                yield line
+        buffer = buffer[pos:]
+
+
+def _varint(value: int) -> bytes:
+    """Encode a non-negative integer as a LEB128 varint.
+
+    Args:
+        value: Non-negative integer.
+
+    Returns:
+        Encoded varint.
+    """
+    if value < VARINT_CONTINUATION:
+        return _SMALL_VARINTS[value]
+    out = bytearray()
+    while value >= VARINT_CONTINUATION:
+        out.append((value & VARINT_PAYLOAD_MASK) | VARINT_CONTINUATION)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _json_frame(line: bytes) -> bytes:
+    """Build a frame holding a complete JSON line.
+
+    Args:
+        line: JSON line without the trailing newline.
+
+    Returns:
+        Encoded json frame.
+    """
+    return _varint(len(line) + 1) + bytes((KIND_JSON,)) + line
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Read a LEB128 varint.
+
+    Args:
+        data: Buffer to read from.
+        pos: Offset of the varint.
+
+    Returns:
+        The value and the offset just past it.
+
+    Raises:
+        IndexError: If data ends inside the varint.
+    """
+    byte = data[pos]
+    if byte < VARINT_CONTINUATION:
+        return byte, pos + 1
+    value = byte & VARINT_PAYLOAD_MASK
+    shift = 7
+    while True:
+        pos += 1
+        byte = data[pos]
+        value |= (byte & VARINT_PAYLOAD_MASK) << shift
+        if byte < VARINT_CONTINUATION:
+            return value, pos + 1
+        shift += 7
@@ -0,0 +1,228 @@
+"""Batched, buffered file handler for mypylogger."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+import sys
+import threading
+import time
+from typing import Any, BinaryIO
+import weakref
+
+from .formatters import SourceLocationJSONFormatter
+
+# Constants
+DEFAULT_BATCH_BYTES = 64 * 1024  # Write once this many bytes are pending
+DEFAULT_BATCH_INTERVAL = 0.05  # Seconds a record may wait before being written
+DEFAULT_FLUSH_LEVEL = logging.ERROR  # Records at or above this level are written at once
+
+
+class BufferedFileHandler(logging.Handler):
+    """Append-only file handler that coalesces records into batched writes.
+
+    Formatted records are collected in memory and written with a single
+    write call once batch_bytes are pending, once the oldest pending record is
+    batch_interval seconds old, or as soon as a record at flush_level or above
+    arrives. A batch_bytes of 0 writes every record immediately.
+    """
+
+    terminator = b"\n"
+
+    def __init__(
+        self,
+        filename: Path,
+        batch_bytes: int = DEFAULT_BATCH_BYTES,
+        batch_interval: float = DEFAULT_BATCH_INTERVAL,
+        flush_level: int = DEFAULT_FLUSH_LEVEL,
+    ) -> None:
+        """Initialize BufferedFileHandler and open the log file.
+
+        Args:
+            filename: Path of the log file to append to.
+            batch_bytes: Pending bytes that trigger a write; 0 disables batching.
+            batch_interval: Maximum seconds a record waits before being written.
+            flush_level: Minimum level written immediately together with the batch.
+        """
+        super().__init__()
+        self.baseFilename = str(filename)
+        self.batch_bytes = batch_bytes
+        self.batch_interval = batch_interval
+        self.flush_level = flush_level
+        self.stream: BinaryIO | None = self._open()
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._oldest_pending = 0.0
+        self.batches_written = 0
+        self.records_written = 0
+        self.bytes_written = 0
+
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if batch_bytes > 0 and batch_interval > 0:
+            self._flusher = threading.Thread(
+                target=_flush_periodically,
+                args=(weakref.ref(self), self._stop, batch_interval),
+                name="mypylogger-batch-flusher",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Add a formatted record to the batch, writing the batch when due.
+
+        Args:
+            record: LogRecord instance to emit.
+        """
+        try:
+            data = self._encode(record)
+
+            if not self._pending:
+                self._oldest_pending = time.monotonic()
+            self._pending.append(data)
+            self._pending_bytes += len(data)
+
+            if (
+                self._pending_bytes >= self.batch_bytes
+                or record.levelno >= self.flush_level
+                or time.monotonic() - self._oldest_pending >= self.batch_interval
+            ):
+                self._write_pending()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write all pending records to the file."""
+        self.acquire()
+        try:
+            self._write_pending()
+        finally:
+            self.release()
+
+    def flush_if_due(self) -> None:
+        """Write pending records whose batch interval has elapsed."""
+        self.acquire()
+        try:
+            if self._pending and time.monotonic() - self._oldest_pending >= self.batch_interval:
+                self._write_pending()
+        except Exception as e:
+            # Never let a write error kill the flusher thread
+            self._log_handler_error(f"Batch write failed: {e}")
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Write pending records, stop the flusher thread and close the file."""
+        self._stop.set()
+        self.acquire()
+        try:
+            try:
+                self._write_pending()
+            finally:
+                stream = self.stream
+                self.stream = None
+                if stream is not None:
+                    stream.close()
+        finally:
+            self.release()
+        super().close()
+
+    @property
+    def closed(self) -> bool:
+        """True once the handler has been closed."""
+        return self.stream is None
+
+    def stats(self) -> dict[str, Any]:
+        """Return batching counters.
+
+        Returns:
+            Dictionary with pending record/byte counts and records/batches written.
+        """
+        return {
+            "pending_records": len(self._pending),
+            "pending_bytes": self._pending_bytes,
+            "records_written": self.records_written,
+            "batches_written": self.batches_written,
+        }
+
+    def _encode(self, record: logging.LogRecord) -> bytes:
+        """Format a record as it is written to the file.
+
+        Args:
+            record: LogRecord instance to format.
+
+        Returns:
+            UTF-8 encoded JSON line including the terminator.
+        """
+        formatter = self.formatter
+        if isinstance(formatter, SourceLocationJSONFormatter):
+            return formatter.format_bytes(record) + self.terminator
+        return self.format(record).encode("utf-8") + self.terminator
+
+    def _open(self) -> BinaryIO:
+        """Open the log file for unbuffered appending.
+
+        Returns:
+            Binary file object; batching replaces the io buffer.
+        """
+        return Path(self.baseFilename).open("ab", buffering=0)
+
+    def _write_pending(self) -> None:
+        """Write the pending batch with a single write call. Caller holds the lock."""
+        stream = self.stream
+        if not self._pending or stream is None:
+            return
+        data = b"".join(self._pending)
+        count = len(self._pending)
+        self._pending.clear()
+        self._pending_bytes = 0
+        self._write(stream, data)
+        self.records_written += count
+        self.bytes_written += len(data)
+        self.batches_written += 1
+
+    def _write(self, stream: BinaryIO, data: bytes) -> None:
+        """Write data to the file, retrying short writes.
+
+        Args:
+            stream: Open log file.
+            data: Bytes to append.
+        """
+        view = memoryview(data)
+        while view:
+            written = stream.write(view)
+            view = view[written:]
+
+    def _log_handler_error(self, message: str) -> None:
+        """Log handler errors to stderr without affecting user logging.
+
+        Args:
+            message: Error message to log.
+        """
+        try:
+            print(f"mypylogger: {message}", file=sys.stderr)
+        except OSError:
+            # If stderr is not available or fails, silently continue
+            pass
+
+
+def _flush_periodically(
+    handler_ref: weakref.ReferenceType[BufferedFileHandler],
+    stop: threading.Event,
+    interval: float,
+) -> None:
+    """Write batches that reached their interval while no records arrive.
+
+    Args:
+        handler_ref: Weak reference so the thread does not keep the handler alive.
+        stop: Event set when the handler closes.
+        interval: Seconds between checks.
+    """
+    while not stop.wait(interval):
+        handler = handler_ref()
+        if handler is None:
+            return
+        handler.flush_if_due()
+        del handler
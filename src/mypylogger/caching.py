@@ -0,0 +1,62 @@
+"""Small bounded caches used on the formatting hot path."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe least-recently-used cache with a fixed maximum size."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize LRUCache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the oldest.
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """Return cached value and mark it as recently used.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None if the key is not cached.
+        """
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return None
+            return self._data[key]
+
+    def put(self, key: K, value: V) -> None:
+        """Store value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Return number of cached entries."""
+        return len(self._data)
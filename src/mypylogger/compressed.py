@@ -0,0 +1,432 @@
+"""Compressed log file output for mypylogger.
+
+CompressedFileHandler collects JSON lines into blocks on the logging thread
+and compresses and writes them on a background thread. Every block is one
+complete gzip member, zstd frame or lz4 frame, so the file is a plain
+concatenation that zcat, zstdcat and lz4cat read as-is, and a crash loses at
+most the block being written. gzip is always available; zstd (the standard
+library module on Python 3.14+, or the zstandard package) and lz4 (the lz4
+package) are used when installed.
+
+iter_lines() and iter_records() read such files back, block by block.
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib
+import json
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Protocol
+import zlib
+
+from .buffered_handler import DEFAULT_FLUSH_LEVEL, BufferedFileHandler
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Codec names
+CODEC_AUTO = "auto"
+CODEC_GZIP = "gzip"
+CODEC_ZSTD = "zstd"
+CODEC_LZ4 = "lz4"
+
+# Preference order for auto-detection, best ratio for the CPU spent first
+AUTO_DETECT_ORDER = (CODEC_ZSTD, CODEC_LZ4, CODEC_GZIP)
+
+VALID_CODECS = frozenset({CODEC_AUTO, CODEC_GZIP, CODEC_ZSTD, CODEC_LZ4})
+
+# Constants
+DEFAULT_BLOCK_BYTES = 256 * 1024  # Uncompressed bytes per block
+DEFAULT_BLOCK_INTERVAL = 1.0  # Seconds a record may wait before its block is written
+MAX_QUEUED_BLOCKS = 64  # Blocks waiting for compression before the logging thread waits
+READ_CHUNK = 64 * 1024  # Compressed bytes read at a time by iter_lines
+
+
+class Decompressor(Protocol):
+    """Streaming decompressor for one frame, shaped like zlib's decompress objects."""
+
+    @property
+    def eof(self) -> bool:
+        """Whether the end of the frame has been reached."""
+        ...
+
+    @property
+    def unused_data(self) -> bytes:
+        """Input bytes past the end of the frame."""
+        ...
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress the next chunk of the frame.
+
+        Args:
+            data: Compressed bytes.
+
+        Returns:
+            Decompressed bytes available so far.
+        """
+        ...
+
+
+class Codec:
+    """gzip codec; base class for the optional codecs.
+
+    compress() returns one self-contained frame, and decompressor() returns
+    a Decompressor for one frame.
+    """
+
+    name = CODEC_GZIP
+    suffix = ".gz"
+    magic = b"\x1f\x8b"
+
+    def __init__(self, level: int = 6) -> None:
+        """Initialize Codec.
+
+        Args:
+            level: Compression level.
+        """
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress data into one frame.
+
+        Args:
+            data: Uncompressed block.
+
+        Returns:
+            One complete gzip member.
+        """
+        # A fixed mtime keeps identical blocks byte-identical
+        return gzip.compress(data, self.level, mtime=0)
+
+    def decompressor(self) -> Decompressor:
+        """Create a decompressor for one frame.
+
+        Returns:
+            zlib decompressor for a gzip member.
+        """
+        return zlib.decompressobj(wbits=31)
+
+
+class ZstdCodec(Codec):
+    """zstd codec from compression.zstd or the zstandard package."""
+
+    name = CODEC_ZSTD
+    suffix = ".zst"
+    magic = b"\x28\xb5\x2f\xfd"
+
+    def __init__(self, level: int = 3) -> None:
+        """Initialize ZstdCodec.
+
+        Args:
+            level: Compression level.
+
+        Raises:
+            ImportError: If neither zstd implementation is installed.
+        """
+        super().__init__(level)
+        self._compress: Callable[[bytes], bytes]
+        self._decompressor: Callable[[], Decompressor]
+        try:
+            zstd: Any = importlib.import_module("compression.zstd")
+            self._compress = lambda data: zstd.compress(data, level)
+            self._decompressor = zstd.ZstdDecompressor
+        except ImportError:
+            zstandard: Any = importlib.import_module("zstandard")
+            self._compress = zstandard.ZstdCompressor(level=level).compress
+            self._decompressor = lambda: zstandard.ZstdDecompressor().decompressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress data into one frame.
+
+        Args:
+            data: Uncompressed block.
+
+        Returns:
+            One complete zstd frame.
+        """
+        return self._compress(data)
+
+    def decompressor(self) -> Decompressor:
+        """Create a decompressor for one frame.
+
+        Returns:
+            zstd decompressor stopping at the end of the frame.
+        """
+        return self._decompressor()
+
+
+class Lz4Codec(Codec):
+    """lz4 frame codec from the lz4 package."""
+
+    name = CODEC_LZ4
+    suffix = ".lz4"
+    magic = b"\x04\x22\x4d\x18"
+
+    def __init__(self, level: int = 0) -> None:
+        """Initialize Lz4Codec.
+
+        Args:
+            level: Compression level; 0 is the fast default.
+
+        Raises:
+            ImportError: If the lz4 package is not installed.
+        """
+        super().__init__(level)
+        self._frame: Any = importlib.import_module("lz4.frame")
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress data into one frame.
+
+        Args:
+            data: Uncompressed block.
+
+        Returns:
+            One complete lz4 frame.
+        """
+        result: bytes = self._frame.compress(data, compression_level=self.level)
+        return result
+
+    def decompressor(self) -> Decompressor:
+        """Create a decompressor for one frame.
+
+        Returns:
+            lz4 frame decompressor.
+        """
+        decompressor: Decompressor = self._frame.LZ4FrameDecompressor()
+        return decompressor
+
+
+_CODEC_CLASSES: dict[str, type[Codec]] = {
+    CODEC_GZIP: Codec,
+    CODEC_ZSTD: ZstdCodec,
+    CODEC_LZ4: Lz4Codec,
+}
+
+
+def get_codec(name: str = CODEC_AUTO) -> Codec:
+    """Create the requested codec, falling back to gzip.
+
+    Args:
+        name: Codec name, or "auto" to use the best installed codec.
+
+    Returns:
+        Codec instance. gzip is returned when the requested codec is unknown
+        or not installed.
+    """
+    candidates = AUTO_DETECT_ORDER if name == CODEC_AUTO else (name,)
+    for candidate in candidates:
+        codec_class = _CODEC_CLASSES.get(candidate)
+        if codec_class is None:
+            continue
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return Codec()
+
+
+def available_codecs() -> list[str]:
+    """List the codecs that can be used in this environment.
+
+    Returns:
+        Names of installed codecs, gzip always included.
+    """
+    return [name for name in AUTO_DETECT_ORDER if get_codec(name).name == name]
+
+
+class CompressedFileHandler(BufferedFileHandler):
+    """Batched file handler writing each batch as one compressed block.
+
+    Batching works as in BufferedFileHandler, with larger defaults so blocks
+    compress well. A finished batch is only joined on the logging thread;
+    compression and the write happen on a background thread. When
+    MAX_QUEUED_BLOCKS blocks are waiting, the logging thread waits rather
+    than dropping records.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        codec: Codec | None = None,
+        block_bytes: int = DEFAULT_BLOCK_BYTES,
+        block_interval: float = DEFAULT_BLOCK_INTERVAL,
+        flush_level: int = DEFAULT_FLUSH_LEVEL,
+    ) -> None:
+        """Initialize CompressedFileHandler, open the file and start the compressor.
+
+        Args:
+            filename: Path of the compressed log file to append to.
+            codec: Codec for the blocks; None uses gzip.
+            block_bytes: Uncompressed bytes that complete a block.
+            block_interval: Maximum seconds a record waits before its block is written.
+            flush_level: Minimum level that completes the block at once.
+        """
+        self.codec = codec or Codec()
+        self._blocks: queue.Queue[bytes | None] = queue.Queue(maxsize=MAX_QUEUED_BLOCKS)
+        self._write_lock = threading.Lock()
+        self.uncompressed_bytes = 0
+        super().__init__(
+            filename,
+            batch_bytes=max(block_bytes, 1),
+            batch_interval=block_interval,
+            flush_level=flush_level,
+        )
+        self._compressor = threading.Thread(
+            target=self._compress_blocks, name="mypylogger-compressor", daemon=True
+        )
+        self._compressor.start()
+
+    def flush(self) -> None:
+        """Queue the pending records and wait until every block is written."""
+        super().flush()
+        if self._compressor.is_alive():
+            self._blocks.join()
+
+    def close(self) -> None:
+        """Write the last block, stop the compressor and close the file."""
+        self.acquire()
+        try:
+            self._write_pending()
+        finally:
+            self.release()
+        if self._compressor.is_alive():
+            self._blocks.put(None)
+            self._compressor.join()
+        super().close()
+
+    def stats(self) -> dict[str, Any]:
+        """Return batching and compression counters.
+
+        Returns:
+            Dictionary with the batching counters, queued_blocks and
+            uncompressed_bytes; bytes_written counts compressed bytes.
+        """
+        stats = super().stats()
+        stats["queued_blocks"] = self._blocks.qsize()
+        stats["uncompressed_bytes"] = self.uncompressed_bytes
+        return stats
+
+    def _write_pending(self) -> None:
+        """Hand the pending batch to the compressor thread. Caller holds the lock."""
+        if not self._pending or self.stream is None:
+            return
+        data = b"".join(self._pending)
+        count = len(self._pending)
+        self._pending.clear()
+        self._pending_bytes = 0
+        if self._compressor_running():
+            self._blocks.put(data)
+        else:
+            self._write_block(data)
+        self.records_written += count
+        self.uncompressed_bytes += len(data)
+
+    def _compressor_running(self) -> bool:
+        """Return True once the compressor thread accepts blocks.
+
+        Returns:
+            Whether blocks can be queued.
+        """
+        compressor = getattr(self, "_compressor", None)
+        return compressor is not None and compressor.is_alive()
+
+    def _compress_blocks(self) -> None:
+        """Compress and write queued blocks until close() queues None."""
+        while True:
+            data = self._blocks.get()
+            try:
+                if data is None:
+                    return
+                self._write_block(data)
+            except Exception as e:
+                # Never let a write error kill the compressor thread
+                self._log_handler_error(f"Compressed block write failed: {e}")
+            finally:
+                self._blocks.task_done()
+
+    def _write_block(self, data: bytes) -> None:
+        """Compress data and append it to the file as one frame.
+
+        Args:
+            data: Uncompressed block.
+        """
+        frame = self.codec.compress(data)
+        with self._write_lock:
+            stream = self.stream
+            if stream is None:
+                return
+            self._write(stream, frame)
+            self.bytes_written += len(frame)
+            self.batches_written += 1
+
+
+def detect_codec(path: Path) -> Codec:
+    """Choose the codec for a compressed log file from its first bytes.
+
+    Args:
+        path: Compressed log file.
+
+    Returns:
+        Codec whose magic number starts the file; gzip for empty files.
+
+    Raises:
+        ValueError: If the file starts with an unknown magic number.
+        ImportError: If the file's codec is not installed.
+    """
+    with path.open("rb") as stream:
+        head = stream.read(4)
+    if not head:
+        return Codec()
+    for codec_class in _CODEC_CLASSES.values():
+        if head.startswith(codec_class.magic):
+            return codec_class()
+    msg = f"Not a compressed mypylogger file: {path}"
+    raise ValueError(msg)
+
+
+def iter_lines(path: Path, codec: Codec | None = None) -> Iterator[bytes]:
+    """Decompress a compressed log file and yield its lines.
+
+    Blocks are decompressed one at a time, so memory use is bounded by the
+    block size. A truncated last block, as left by a crash, is skipped.
+
+    Args:
+        path: Compressed log file.
+        codec: Codec the file was written with; None detects it.
+
+    Yields:
+        JSON lines without their trailing newline.
+    """
+    if codec is None:
+        codec = detect_codec(path)
+    with path.open("rb") as stream:
+        decompressor = codec.decompressor()
+        block: list[bytes] = []
+        data = stream.read(READ_CHUNK)
+        while data:
+            block.append(decompressor.decompress(data))
+            if decompressor.eof:
+                yield from b"".join(block).splitlines()
+                block = []
+                data = decompressor.unused_data
+                decompressor = codec.decompressor()
+                if data:
+                    continue
+            data = stream.read(READ_CHUNK)
+
+
+def iter_records(path: Path, codec: Codec | None = None) -> Iterator[dict[str, Any]]:
+    """Decompress a compressed log file and yield its records.
+
+    Args:
+        path: Compressed log file.
+        codec: Codec the file was written with; None detects it.
+
+    Yields:
+        Decoded JSON log records.
+    """
+    for line in iter_lines(path, codec):
+        if line:
+            yield json.loads(line)
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import logging
 import os
 from pathlib import Path
 import tempfile
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from .exceptions import ConfigurationError
 
@@ -19,6 +20,50 @@ class LogConfig:
     log_level: str
     log_to_file: bool
     log_file_dir: Path
+    async_mode: bool = False
+    async_queue_size: int = 10000
+    async_overflow: str = "block"
+    source_location: str = "stack"
+    precompute_filenames: bool = False
+    json_default: str = "drop"
+    timestamp_format: str = "iso"
+    json_backend: str = "stdlib"
+    json_bytes: bool = False
+    file_buffered: bool = False
+    file_batch_bytes: int = 65536
+    file_batch_interval_ms: int = 50
+    file_rotate: bool = False
+    file_max_bytes: int = 0
+    file_backup_count: int = 24
+    file_compress: bool = False
+    file_mmap: bool = False
+    file_segment_bytes: int = 64 * 1024 * 1024
+    file_sync_interval_ms: int = 1000
+    file_compression: str = ""
+    file_block_bytes: int = 262144
+    file_block_interval_ms: int = 1000
+    file_format: str = "json"
+    ship_address: str = ""
+    ship_batch_bytes: int = 65536
+    ship_batch_interval_ms: int = 1000
+    ship_spool: bool = True
+    ship_spool_max_bytes: int = 256 * 1024 * 1024
+    multiprocess: bool = False
+    static_fields: bool = False
+    service_version: str = ""
+    log_schema: str = ""
+    rate_limit: int = 0
+    rate_burst: int = 0
+    sample_rates: str = ""
+    summary_interval: int = 60
+    dedup_window_ms: int = 0
+    dedup_max_keys: int = 1024
+    exc_frame_limit: int = 50
+    metrics: bool = False
+    metrics_interval: int = 60
+    flight_recorder: int = 0
+    flight_recorder_level: str = "DEBUG"
+    flight_recorder_signal: bool = False
 
     # Environment variable mappings
     ENV_MAPPINGS: ClassVar[dict[str, str]] = {
@@ -26,6 +71,50 @@ class LogConfig:
         "LOG_LEVEL": "log_level",
         "LOG_TO_FILE": "log_to_file",
         "LOG_FILE_DIR": "log_file_dir",
+        "LOG_ASYNC": "async_mode",
+        "LOG_ASYNC_QUEUE_SIZE": "async_queue_size",
+        "LOG_ASYNC_OVERFLOW": "async_overflow",
+        "LOG_SOURCE_LOCATION": "source_location",
+        "LOG_PRECOMPUTE_FILENAMES": "precompute_filenames",
+        "LOG_JSON_DEFAULT": "json_default",
+        "LOG_TIMESTAMP_FORMAT": "timestamp_format",
+        "LOG_JSON_BACKEND": "json_backend",
+        "LOG_JSON_BYTES": "json_bytes",
+        "LOG_FILE_BUFFERED": "file_buffered",
+        "LOG_FILE_BATCH_BYTES": "file_batch_bytes",
+        "LOG_FILE_BATCH_INTERVAL_MS": "file_batch_interval_ms",
+        "LOG_FILE_ROTATE": "file_rotate",
+        "LOG_FILE_MAX_BYTES": "file_max_bytes",
+        "LOG_FILE_BACKUP_COUNT": "file_backup_count",
+        "LOG_FILE_COMPRESS": "file_compress",
+        "LOG_FILE_MMAP": "file_mmap",
+        "LOG_FILE_SEGMENT_BYTES": "file_segment_bytes",
+        "LOG_FILE_SYNC_INTERVAL_MS": "file_sync_interval_ms",
+        "LOG_FILE_COMPRESSION": "file_compression",
+        "LOG_FILE_BLOCK_BYTES": "file_block_bytes",
+        "LOG_FILE_BLOCK_INTERVAL_MS": "file_block_interval_ms",
+        "LOG_FILE_FORMAT": "file_format",
+        "LOG_SHIP_ADDRESS": "ship_address",
+        "LOG_SHIP_BATCH_BYTES": "ship_batch_bytes",
+        "LOG_SHIP_BATCH_INTERVAL_MS": "ship_batch_interval_ms",
+        "LOG_SHIP_SPOOL": "ship_spool",
+        "LOG_SHIP_SPOOL_MAX_BYTES": "ship_spool_max_bytes",
+        "LOG_MULTIPROCESS": "multiprocess",
+        "LOG_STATIC_FIELDS": "static_fields",
+        "LOG_SERVICE_VERSION": "service_version",
+        "LOG_SCHEMA": "log_schema",
+        "LOG_RATE_LIMIT": "rate_limit",
+        "LOG_RATE_BURST": "rate_burst",
+        "LOG_SAMPLE_RATES": "sample_rates",
+        "LOG_SUMMARY_INTERVAL": "summary_interval",
+        "LOG_DEDUP_WINDOW_MS": "dedup_window_ms",
+        "LOG_DEDUP_MAX_KEYS": "dedup_max_keys",
+        "LOG_EXC_FRAME_LIMIT": "exc_frame_limit",
+        "LOG_METRICS": "metrics",
+        "LOG_METRICS_INTERVAL": "metrics_interval",
+        "LOG_FLIGHT_RECORDER": "flight_recorder",
+        "LOG_FLIGHT_RECORDER_LEVEL": "flight_recorder_level",
+        "LOG_FLIGHT_RECORDER_SIGNAL": "flight_recorder_signal",
     }
 
 
@@ -33,6 +122,13 @@ class ConfigResolver:
     """Resolves configuration from environment variables with safe defaults."""
 
     VALID_LOG_LEVELS: ClassVar[set[str]] = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
+    VALID_OVERFLOW_POLICIES: ClassVar[set[str]] = {"block", "drop_oldest", "drop_newest"}
+    VALID_SOURCE_LOCATION_MODES: ClassVar[set[str]] = {"stack", "record"}
+    VALID_JSON_DEFAULTS: ClassVar[set[str]] = {"drop", "str", "repr"}
+    VALID_TIMESTAMP_FORMATS: ClassVar[set[str]] = {"iso", "ms", "us", "ns"}
+    VALID_JSON_BACKENDS: ClassVar[set[str]] = {"auto", "stdlib", "orjson", "msgspec", "ujson"}
+    VALID_FILE_COMPRESSIONS: ClassVar[set[str]] = {"", "auto", "gzip", "zstd", "lz4"}
+    VALID_FILE_FORMATS: ClassVar[set[str]] = {"json", "binary"}
 
     def resolve_config(self) -> LogConfig:
         """Get configuration from environment with fallback to safe defaults.
@@ -41,21 +137,172 @@ class ConfigResolver:
             LogConfig instance with resolved configuration values.
         """
         try:
-            app_name = os.getenv("APP_NAME", "mypylogger")
-            log_level = self._get_safe_log_level(os.getenv("LOG_LEVEL", "INFO"))
-            log_to_file = self._parse_bool(os.getenv("LOG_TO_FILE", "false"))
-            log_file_dir = self._get_safe_file_dir(os.getenv("LOG_FILE_DIR", tempfile.gettempdir()))
-
             return LogConfig(
-                app_name=app_name,
-                log_level=log_level,
-                log_to_file=log_to_file,
-                log_file_dir=log_file_dir,
+                app_name=os.getenv("APP_NAME", "mypylogger"),
+                log_level=self._get_safe_log_level(os.getenv("LOG_LEVEL", "INFO")),
+                log_to_file=self._parse_bool(os.getenv("LOG_TO_FILE", "false")),
+                log_file_dir=self._get_safe_file_dir(
+                    os.getenv("LOG_FILE_DIR", tempfile.gettempdir())
+                ),
+                **self._get_async_options(),
+                **self._get_format_options(),
+                **self._get_file_options(),
+                **self._get_ship_options(),
+                **self._get_filter_options(),
+                **self._get_diagnostic_options(),
             )
         except Exception as e:
             msg = f"Failed to resolve configuration: {e}"
             raise ConfigurationError(msg) from e
 
+    def _get_async_options(self) -> dict[str, Any]:
+        """Read the asynchronous logging settings from the environment.
+
+        Returns:
+            LogConfig keyword arguments for async logging.
+        """
+        return {
+            "async_mode": self._parse_bool(os.getenv("LOG_ASYNC", "false")),
+            "async_queue_size": self._parse_positive_int(
+                os.getenv("LOG_ASYNC_QUEUE_SIZE", ""), default=10000
+            ),
+            "async_overflow": self._get_safe_overflow_policy(
+                os.getenv("LOG_ASYNC_OVERFLOW", "block")
+            ),
+        }
+
+    def _get_format_options(self) -> dict[str, Any]:
+        """Read the record formatting settings from the environment.
+
+        Returns:
+            LogConfig keyword arguments for the JSON formatter.
+        """
+        return {
+            "source_location": self._get_safe_source_location(
+                os.getenv("LOG_SOURCE_LOCATION", "stack")
+            ),
+            "precompute_filenames": self._parse_bool(
+                os.getenv("LOG_PRECOMPUTE_FILENAMES", "false")
+            ),
+            "json_default": self._get_safe_json_default(os.getenv("LOG_JSON_DEFAULT", "drop")),
+            "timestamp_format": self._get_safe_timestamp_format(
+                os.getenv("LOG_TIMESTAMP_FORMAT", "iso")
+            ),
+            "json_backend": self._get_safe_json_backend(os.getenv("LOG_JSON_BACKEND", "stdlib")),
+            "json_bytes": self._parse_bool(os.getenv("LOG_JSON_BYTES", "false")),
+            "static_fields": self._parse_bool(os.getenv("LOG_STATIC_FIELDS", "false")),
+            "service_version": os.getenv("LOG_SERVICE_VERSION", "").strip(),
+            "log_schema": self._get_safe_schema(os.getenv("LOG_SCHEMA", "")),
+            "exc_frame_limit": self._parse_positive_int(
+                os.getenv("LOG_EXC_FRAME_LIMIT", ""), default=50
+            ),
+        }
+
+    def _get_file_options(self) -> dict[str, Any]:
+        """Read the log file output settings from the environment.
+
+        Returns:
+            LogConfig keyword arguments for file handlers.
+        """
+        return {
+            "file_buffered": self._parse_bool(os.getenv("LOG_FILE_BUFFERED", "false")),
+            "file_batch_bytes": self._parse_positive_int(
+                os.getenv("LOG_FILE_BATCH_BYTES", ""), default=65536
+            ),
+            "file_batch_interval_ms": self._parse_positive_int(
+                os.getenv("LOG_FILE_BATCH_INTERVAL_MS", ""), default=50
+            ),
+            "file_rotate": self._parse_bool(os.getenv("LOG_FILE_ROTATE", "false")),
+            "file_max_bytes": self._parse_positive_int(
+                os.getenv("LOG_FILE_MAX_BYTES", ""), default=0
+            ),
+            "file_backup_count": self._parse_positive_int(
+                os.getenv("LOG_FILE_BACKUP_COUNT", ""), default=24
+            ),
+            "file_compress": self._parse_bool(os.getenv("LOG_FILE_COMPRESS", "false")),
+            "file_mmap": self._parse_bool(os.getenv("LOG_FILE_MMAP", "false")),
+            "file_segment_bytes": self._parse_positive_int(
+                os.getenv("LOG_FILE_SEGMENT_BYTES", ""), default=64 * 1024 * 1024
+            ),
+            "file_sync_interval_ms": self._parse_positive_int(
+                os.getenv("LOG_FILE_SYNC_INTERVAL_MS", ""), default=1000
+            ),
+            "file_compression": self._get_safe_file_compression(
+                os.getenv("LOG_FILE_COMPRESSION", "")
+            ),
+            "file_block_bytes": self._parse_positive_int(
+                os.getenv("LOG_FILE_BLOCK_BYTES", ""), default=262144
+            ),
+            "file_block_interval_ms": self._parse_positive_int(
+                os.getenv("LOG_FILE_BLOCK_INTERVAL_MS", ""), default=1000
+            ),
+            "file_format": self._get_safe_file_format(os.getenv("LOG_FILE_FORMAT", "json")),
+        }
+
+    def _get_ship_options(self) -> dict[str, Any]:
+        """Read the network shipping and multiprocess settings from the environment.
+
+        Returns:
+            LogConfig keyword arguments for the network and multiprocess handlers.
+        """
+        return {
+            "ship_address": os.getenv("LOG_SHIP_ADDRESS", "").strip(),
+            "ship_batch_bytes": self._parse_positive_int(
+                os.getenv("LOG_SHIP_BATCH_BYTES", ""), default=65536
+            ),
+            "ship_batch_interval_ms": self._parse_positive_int(
+                os.getenv("LOG_SHIP_BATCH_INTERVAL_MS", ""), default=1000
+            ),
+            "ship_spool": self._parse_bool(os.getenv("LOG_SHIP_SPOOL", "true")),
+            "ship_spool_max_bytes": self._parse_positive_int(
+                os.getenv("LOG_SHIP_SPOOL_MAX_BYTES", ""), default=256 * 1024 * 1024
+            ),
+            "multiprocess": self._parse_bool(os.getenv("LOG_MULTIPROCESS", "false")),
+        }
+
+    def _get_filter_options(self) -> dict[str, Any]:
+        """Read the rate limiting, sampling and deduplication settings from the environment.
+
+        Returns:
+            LogConfig keyword arguments for the suppression filters.
+        """
+        return {
+            "rate_limit": self._parse_positive_int(os.getenv("LOG_RATE_LIMIT", ""), default=0),
+            "rate_burst": self._parse_positive_int(os.getenv("LOG_RATE_BURST", ""), default=0),
+            "sample_rates": self._get_safe_sample_rates(os.getenv("LOG_SAMPLE_RATES", "")),
+            "summary_interval": self._parse_positive_int(
+                os.getenv("LOG_SUMMARY_INTERVAL", ""), default=60
+            ),
+            "dedup_window_ms": self._parse_positive_int(
+                os.getenv("LOG_DEDUP_WINDOW_MS", ""), default=0
+            ),
+            "dedup_max_keys": self._parse_positive_int(
+                os.getenv("LOG_DEDUP_MAX_KEYS", ""), default=1024
+            ),
+        }
+
+    def _get_diagnostic_options(self) -> dict[str, Any]:
+        """Read the metrics and flight recorder settings from the environment.
+
+        Returns:
+            LogConfig keyword arguments for metrics and the flight recorder.
+        """
+        return {
+            "metrics": self._parse_bool(os.getenv("LOG_METRICS", "false")),
+            "metrics_interval": self._parse_positive_int(
+                os.getenv("LOG_METRICS_INTERVAL", ""), default=60
+            ),
+            "flight_recorder": self._parse_positive_int(
+                os.getenv("LOG_FLIGHT_RECORDER", ""), default=0
+            ),
+            "flight_recorder_level": self._get_safe_flight_recorder_level(
+                os.getenv("LOG_FLIGHT_RECORDER_LEVEL", "DEBUG")
+            ),
+            "flight_recorder_signal": self._parse_bool(
+                os.getenv("LOG_FLIGHT_RECORDER_SIGNAL", "false")
+            ),
+        }
+
     def _get_safe_log_level(self, level_str: str) -> str:
         """Validate and return safe log level.
 
@@ -70,6 +317,20 @@ class ConfigResolver:
             return level_upper
         return "INFO"  # Safe default
 
+    def _get_safe_flight_recorder_level(self, level_str: str) -> str:
+        """Validate and return a safe flight recorder level.
+
+        Args:
+            level_str: Log level string from environment.
+
+        Returns:
+            Valid log level string, defaulting to "DEBUG".
+        """
+        level_upper = level_str.upper()
+        if level_upper in self.VALID_LOG_LEVELS:
+            return level_upper
+        return "DEBUG"  # Safe default: record everything
+
     def _get_safe_file_dir(self, dir_path: str) -> Path:
         """Validate and return safe file directory path.
 
@@ -94,3 +355,160 @@ class ConfigResolver:
             Boolean value.
         """
         return value.lower() in ("true", "1", "yes", "on")
+
+    def _parse_positive_int(self, value: str, default: int) -> int:
+        """Parse a positive integer from string.
+
+        Args:
+            value: String value to parse as integer.
+            default: Value returned when parsing fails or the result is not positive.
+
+        Returns:
+            Positive integer value.
+        """
+        try:
+            parsed = int(value)
+        except (TypeError, ValueError):
+            return default
+        return parsed if parsed > 0 else default
+
+    def _get_safe_overflow_policy(self, policy_str: str) -> str:
+        """Validate and return safe async queue overflow policy.
+
+        Args:
+            policy_str: Overflow policy string from environment.
+
+        Returns:
+            Valid overflow policy string.
+        """
+        policy = policy_str.strip().lower().replace("-", "_")
+        if policy in self.VALID_OVERFLOW_POLICIES:
+            return policy
+        return "block"  # Safe default
+
+    def _get_safe_source_location(self, mode_str: str) -> str:
+        """Validate and return safe source location mode.
+
+        Args:
+            mode_str: Source location mode string from environment.
+
+        Returns:
+            Valid source location mode string.
+        """
+        mode = mode_str.strip().lower()
+        if mode in self.VALID_SOURCE_LOCATION_MODES:
+            return mode
+        return "stack"  # Safe default
+
+    def _get_safe_json_default(self, encoder_str: str) -> str:
+        """Validate and return safe encoder name for non-serializable values.
+
+        Args:
+            encoder_str: Encoder name string from environment.
+
+        Returns:
+            Valid encoder name string.
+        """
+        encoder = encoder_str.strip().lower()
+        if encoder in self.VALID_JSON_DEFAULTS:
+            return encoder
+        return "drop"  # Safe default
+
+    def _get_safe_timestamp_format(self, format_str: str) -> str:
+        """Validate and return safe timestamp format.
+
+        Args:
+            format_str: Timestamp format string from environment.
+
+        Returns:
+            Valid timestamp format string.
+        """
+        timestamp_format = format_str.strip().lower()
+        if timestamp_format in self.VALID_TIMESTAMP_FORMATS:
+            return timestamp_format
+        return "iso"  # Safe default
+
+    def _get_safe_json_backend(self, backend_str: str) -> str:
+        """Validate and return safe JSON backend name.
+
+        Args:
+            backend_str: JSON backend name from environment.
+
+        Returns:
+            Valid JSON backend name.
+        """
+        backend = backend_str.strip().lower()
+        if backend in self.VALID_JSON_BACKENDS:
+            return backend
+        # The optional backends differ from json in edge cases (non-finite
+        # floats, float notation), so they are only used when asked for
+        return "stdlib"  # Safe default
+
+    def _get_safe_file_compression(self, codec_str: str) -> str:
+        """Validate and return a safe file compression codec name.
+
+        Args:
+            codec_str: Codec name from environment.
+
+        Returns:
+            Valid codec name, or "" for uncompressed output.
+        """
+        codec = codec_str.strip().lower()
+        if codec in self.VALID_FILE_COMPRESSIONS:
+            return codec
+        return ""  # Safe default
+
+    def _get_safe_file_format(self, format_str: str) -> str:
+        """Validate and return a safe log file format.
+
+        Args:
+            format_str: File format from environment.
+
+        Returns:
+            "json" or "binary", defaulting to "json".
+        """
+        file_format = format_str.strip().lower()
+        if file_format in self.VALID_FILE_FORMATS:
+            return file_format
+        return "json"  # Safe default
+
+    def _get_safe_schema(self, schema_str: str) -> str:
+        """Validate and return a safe schema specification.
+
+        Args:
+            schema_str: Comma-separated ``name:type`` pairs from environment.
+
+        Returns:
+            Normalized schema specification, or "" if it is invalid.
+        """
+        if not schema_str.strip():
+            return ""  # No schema: generic formatting
+        # The schema compiler is only loaded when LOG_SCHEMA is set
+        from .schema import LogSchema, parse_schema  # noqa: PLC0415
+
+        try:
+            fields = parse_schema(schema_str)
+            LogSchema(fields)
+        except ConfigurationError:
+            return ""  # Safe default: generic formatting
+        return ",".join(f"{name}:{field_type.__name__}" for name, field_type in fields.items())
+
+    def _get_safe_sample_rates(self, rates_str: str) -> str:
+        """Validate and return a safe sampling specification.
+
+        Args:
+            rates_str: Comma-separated ``LEVEL:ratio`` pairs from environment.
+
+        Returns:
+            Normalized sampling specification, or "" (keep everything) if invalid.
+        """
+        if not rates_str.strip():
+            return ""
+        # Imported here so processes without sampling never load the filters
+        from .filters import parse_sample_rates  # noqa: PLC0415
+
+        try:
+            rates = parse_sample_rates(rates_str)
+        except ConfigurationError:
+            return ""  # Safe default: no sampling
+        return ",".join(f"{logging.getLevelName(level)}:{rate:g}" for level, rate in rates.items())
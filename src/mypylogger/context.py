@@ -0,0 +1,234 @@
+"""Request-scoped bound context for mypylogger.
+
+Fields bound with bind() or contextualize() are added to every record logged
+in the same thread or asyncio task. Each field is serialized to a JSON
+fragment once, when it is bound, and the formatter splices the fragments into
+the output instead of encoding the values again for every record.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import contextvars
+import json
+import sys
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+if TYPE_CHECKING:
+    import logging
+
+# Record attribute holding the context captured on the logging thread
+CONTEXT_ATTR = "_mypylogger_context"
+
+# Keys written by the formatter; bound fields cannot replace them. "exception"
+# and "stack_hash" are only written for records with exc_info, but binding them
+# would emit the same key twice in those records.
+_STANDARD_KEYS = frozenset(
+    {
+        "timestamp",
+        "level",
+        "message",
+        "module",
+        "filename",
+        "function_name",
+        "line",
+        "exception",
+        "stack_hash",
+    }
+)
+
+
+class BoundContext:
+    """Immutable set of bound fields with their pre-serialized JSON fragments."""
+
+    __slots__ = ("fields", "fragment", "fragment_bytes", "key_fragments")
+
+    def __init__(self, fields: dict[str, Any], key_fragments: dict[str, str]) -> None:
+        """Initialize BoundContext.
+
+        Args:
+            fields: Bound field values.
+            key_fragments: ``"key":value`` JSON fragment for each field.
+        """
+        self.fields = fields
+        self.key_fragments = key_fragments
+        self.fragment = ",".join(key_fragments.values())
+        self.fragment_bytes = self.fragment.encode("utf-8")
+
+    def bind(self, new_fields: dict[str, object]) -> BoundContext:
+        """Return a context with new_fields added, encoding only the new values.
+
+        Args:
+            new_fields: Fields to add or replace.
+
+        Returns:
+            New BoundContext.
+        """
+        fields = dict(self.fields)
+        key_fragments = dict(self.key_fragments)
+        for key, value in new_fields.items():
+            fragment = _encode_field(key, value)
+            if fragment is None:
+                continue
+            # Re-insert so the latest binding determines the output order
+            fields.pop(key, None)
+            key_fragments.pop(key, None)
+            fields[key] = value
+            key_fragments[key] = fragment
+        return BoundContext(fields, key_fragments)
+
+    def unbind(self, keys: Iterable[str]) -> BoundContext:
+        """Return a context without keys.
+
+        Args:
+            keys: Field names to remove.
+
+        Returns:
+            New BoundContext.
+        """
+        removed = set(keys)
+        return BoundContext(
+            {key: value for key, value in self.fields.items() if key not in removed},
+            {key: value for key, value in self.key_fragments.items() if key not in removed},
+        )
+
+    def fragment_excluding(self, keys: Iterable[str]) -> str:
+        """Join the fragments of all fields not in keys.
+
+        Used when a record sets one of the bound keys itself through extra.
+
+        Args:
+            keys: Field names written by the record.
+
+        Returns:
+            Comma-separated JSON fragment.
+        """
+        skip = set(keys)
+        return ",".join(fragment for key, fragment in self.key_fragments.items() if key not in skip)
+
+
+_EMPTY = BoundContext({}, {})
+_current: contextvars.ContextVar[BoundContext] = contextvars.ContextVar(
+    "mypylogger_context", default=_EMPTY
+)
+
+
+def bind(**fields: object) -> contextvars.Token[BoundContext]:
+    """Bind fields to every record logged in the current thread or task.
+
+    Args:
+        **fields: Field names and JSON-serializable values.
+
+    Returns:
+        Token that restores the previous context when passed to reset_context.
+    """
+    return _current.set(_current.get().bind(fields))
+
+
+def unbind(*keys: str) -> contextvars.Token[BoundContext]:
+    """Remove bound fields from the current context.
+
+    Args:
+        *keys: Field names to remove.
+
+    Returns:
+        Token that restores the previous context when passed to reset_context.
+    """
+    return _current.set(_current.get().unbind(keys))
+
+
+def clear_context() -> None:
+    """Remove all bound fields from the current context."""
+    _current.set(_EMPTY)
+
+
+def reset_context(token: contextvars.Token[BoundContext]) -> None:
+    """Restore the context that was current when token was created.
+
+    Args:
+        token: Token returned by bind or unbind.
+    """
+    _current.reset(token)
+
+
+def get_context() -> dict[str, Any]:
+    """Return a copy of the fields bound in the current context.
+
+    Returns:
+        Dictionary of bound fields.
+    """
+    return dict(_current.get().fields)
+
+
+@contextmanager
+def contextualize(**fields: object) -> Iterator[None]:
+    """Bind fields for the duration of a with block.
+
+    Args:
+        **fields: Field names and JSON-serializable values.
+
+    Yields:
+        None.
+    """
+    token = bind(**fields)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def current_context() -> BoundContext:
+    """Return the bound context of the current thread or task.
+
+    Returns:
+        Current BoundContext, empty if nothing is bound.
+    """
+    return _current.get()
+
+
+def capture_context(record: logging.LogRecord) -> None:
+    """Store the current context on record before it is formatted elsewhere.
+
+    Handlers that format records on another thread or process must call this
+    on the logging thread, since context variables do not follow the record.
+
+    Args:
+        record: LogRecord instance to annotate.
+    """
+    context = _current.get()
+    if context.fields:
+        record.__dict__[CONTEXT_ATTR] = context
+
+
+def _encode_field(key: str, value: object) -> str | None:
+    """Serialize one bound field to a ``"key":value`` fragment.
+
+    Args:
+        key: Field name.
+        value: Field value.
+
+    Returns:
+        JSON fragment, or None if the field cannot be bound.
+    """
+    if key in _STANDARD_KEYS:
+        _log_context_error(f"Cannot bind reserved field '{key}'")
+        return None
+    try:
+        encoded = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    except (TypeError, ValueError, RecursionError) as e:
+        _log_context_error(f"Skipping non-serializable bound field '{key}': {e}")
+        return None
+    return f"{json.dumps(key, ensure_ascii=False)}:{encoded}"
+
+
+def _log_context_error(message: str) -> None:
+    """Log context errors to stderr without affecting user logging.
+
+    Args:
+        message: Error message to log.
+    """
+    try:
+        print(f"mypylogger: {message}", file=sys.stderr)
+    except OSError:
+        # If stderr is not available or fails, silently continue
+        pass
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-import inspect
+import dataclasses
 import logging
 import os
 import sys
+import threading
+from typing import TYPE_CHECKING, Any
 
 from .config import ConfigResolver, LogConfig
+from .formatters import SOURCE_LOCATION_RECORD, SourceLocationJSONFormatter
 from .handlers import HandlerFactory
 
+if TYPE_CHECKING:
+    from .metrics import PipelineMetrics
+
 
 class LoggerManager:
     """Manages logger creation and configuration."""
@@ -20,6 +26,16 @@ class LoggerManager:
         self._handler_cache: dict[str, logging.Handler] = {}
         self._config_resolver = ConfigResolver()
         self._handler_factory = HandlerFactory()
+        # Resolved once per process; reload_config() replaces it
+        self._config: LogConfig | None = None
+        # Configured loggers by name. Read without the lock; entries are only
+        # added under it, after the logger is fully configured.
+        self._loggers: dict[str, logging.Logger] = {}
+        # Handlers and filters mypylogger added to each logger, replaced on reload
+        self._installed: dict[str, tuple[list[logging.Handler], list[logging.Filter]]] = {}
+        self._lock = threading.RLock()
+        # Pipeline counters, created once a config enables LOG_METRICS
+        self._metrics: PipelineMetrics | None = None
 
     def get_or_create_logger(self, name: str | None = None) -> logging.Logger:
         """Get existing logger or create new one with full configuration.
@@ -30,18 +46,32 @@ class LoggerManager:
         Returns:
             Configured Logger instance.
         """
+        if name:
+            logger = self._loggers.get(name)
+            if logger is not None:
+                return logger
+
         try:
             # Resolve logger name using fallback chain
             logger_name = self._resolve_logger_name(name)
+            logger = self._loggers.get(logger_name)
+            if logger is not None:
+                return logger
+
+            with self._lock:
+                # Another thread may have configured it while we waited
+                logger = self._loggers.get(logger_name)
+                if logger is not None:
+                    return logger
 
-            # Get or create logger
-            logger = logging.getLogger(logger_name)
+                # Get or create logger
+                logger = logging.getLogger(logger_name)
 
-            # Configure logger if not already configured
-            if not self._is_logger_configured(logger_name):
-                config = self._config_resolver.resolve_config()
-                self.configure_logger(logger, config)
-                self._configured_loggers.add(logger_name)
+                # Configure logger if not already configured
+                if not self._is_logger_configured(logger_name):
+                    self.configure_logger(logger, self.get_config())
+                    self._configured_loggers.add(logger_name)
+                self._loggers[logger_name] = logger
 
             return logger
 
@@ -50,6 +80,89 @@ class LoggerManager:
             # Return basic logger as fallback
             return logging.getLogger("mypylogger_fallback")
 
+    def get_config(self) -> LogConfig:
+        """Return the configuration new loggers are created with.
+
+        The environment is read on first use only; call reload_config() to
+        pick up changes.
+
+        Returns:
+            The cached LogConfig.
+        """
+        config = self._config
+        if config is None:
+            with self._lock:
+                config = self._config
+                if config is None:
+                    config = self._config_resolver.resolve_config()
+                    self._config = config
+        return config
+
+    def metrics_snapshot(self) -> dict[str, Any]:
+        """Return the pipeline metrics collected so far.
+
+        Returns:
+            Snapshot from PipelineMetrics.snapshot(), or an empty dict when
+            LOG_METRICS is not enabled.
+        """
+        metrics = self._metrics
+        if metrics is None:
+            return {}
+        return metrics.snapshot()
+
+    def reload_config(self) -> LogConfig:
+        """Re-read the environment and reconfigure every managed logger.
+
+        Each logger's level, handlers and filters are replaced with single
+        assignments, so a concurrent record goes entirely through the old or
+        the new setup. Handlers no longer used by any logger are then closed.
+
+        Returns:
+            The newly resolved LogConfig.
+        """
+        config = self._config_resolver.resolve_config()
+        level = _logger_level(config)
+        retired_handlers: list[logging.Handler] = []
+        retired_filters: list[logging.Filter] = []
+        with self._lock:
+            self._config = config
+            self._handler_cache = {}
+            if not config.metrics:
+                self._metrics = None
+            for logger_name, logger in self._loggers.items():
+                old_handlers, old_filters = self._installed.get(logger_name, ([], []))
+                try:
+                    handlers = self._create_handlers(config)
+                    filters = self._create_filters(logger, config)
+                except Exception as e:
+                    self._log_library_error(f"Failed to reconfigure logger {logger_name}: {e}")
+                    continue
+                logger.handlers = [h for h in logger.handlers if h not in old_handlers] + handlers
+                kept_filters = [f for f in logger.filters if f not in old_filters]
+                kept_filters.extend(filters)
+                logger.filters = kept_filters
+                logger.setLevel(level)
+                self._installed[logger_name] = (handlers, filters)
+                retired_handlers.extend(old_handlers)
+                retired_filters.extend(old_filters)
+            active = {id(h) for handlers, _ in self._installed.values() for h in handlers}
+
+        for log_filter in retired_filters:
+            # Report what the replaced dedup, rate limit and sampling filters dropped
+            flush_summary = getattr(log_filter, "flush_summary", None)
+            if flush_summary is not None:
+                flush_summary()
+        closed: set[int] = set()
+        for handler in retired_handlers:
+            if id(handler) in active or id(handler) in closed:
+                continue
+            closed.add(id(handler))
+            try:
+                handler.close()
+            except Exception as e:
+                self._log_library_error(f"Failed to close replaced handler: {e}")
+        return config
+
     def configure_logger(self, logger: logging.Logger, config: LogConfig) -> None:
         """Apply handlers, formatters, and level configuration to logger.
 
@@ -58,19 +171,19 @@ class LoggerManager:
             config: LogConfig with configuration settings.
         """
         try:
-            # Set log level
-            level = getattr(logging, config.log_level, logging.INFO)
-            logger.setLevel(level)
+            # Set log level, low enough for the flight recorder when it is enabled
+            logger.setLevel(_logger_level(config))
 
-            # Create and add console handler
-            console_handler = self._handler_factory.create_console_handler()
-            logger.addHandler(console_handler)
+            # Create and add output handlers, optionally behind an async queue
+            handlers = self._create_handlers(config)
+            for handler in handlers:
+                logger.addHandler(handler)
 
-            # Create and add file handler if configured
-            if config.log_to_file:
-                file_handler = self._handler_factory.create_file_handler(config)
-                if file_handler:
-                    logger.addHandler(file_handler)
+            # Dedup, rate limiting and sampling run before any handler formats the record
+            filters = self._create_filters(logger, config)
+            for log_filter in filters:
+                logger.addFilter(log_filter)
+            self._installed[logger.name] = (handlers, filters)
 
             # Prevent propagation to avoid duplicate logs
             logger.propagate = False
@@ -78,6 +191,294 @@ class LoggerManager:
         except Exception as e:
             self._log_library_error(f"Failed to configure logger: {e}")
 
+    def _create_handlers(self, config: LogConfig) -> list[logging.Handler]:
+        """Create the handlers for a logger, optionally behind an async queue.
+
+        Args:
+            config: LogConfig with configuration settings.
+
+        Returns:
+            Handlers to add to the logger.
+        """
+        if config.async_mode:
+            handlers = self._get_async_handlers(config)
+        else:
+            handlers = self._create_output_handlers(config)
+        if config.flight_recorder > 0:
+            # Output handlers keep LOG_LEVEL; only the recorder sees the lower levels
+            level = getattr(logging, config.log_level, logging.INFO)
+            for handler in handlers:
+                handler.setLevel(level)
+            handlers.append(self._get_flight_recorder(config))
+        metrics = self._get_metrics(config) if config.metrics else None
+        for handler in handlers:
+            for formatter in _handler_formatters(handler):
+                formatter.metrics = metrics
+            if metrics is not None:
+                metrics.watch_handler(handler)
+        return handlers
+
+    def _get_flight_recorder(self, config: LogConfig) -> logging.Handler:
+        """Get the flight recorder shared by every logger, creating it once.
+
+        Args:
+            config: LogConfig with the flight recorder enabled.
+
+        Returns:
+            FlightRecorderHandler dumping to the log directory when file
+            logging is enabled, otherwise to stderr.
+        """
+        dump_path = None
+        if config.log_to_file:
+            dump_path = config.log_file_dir / f"{config.app_name}_flight.log"
+        cache_key = f"flight:{config.flight_recorder}:{config.flight_recorder_level}:{dump_path}"
+        cached = self._handler_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        from .flight_recorder import FlightRecorderHandler, install_signal_handler  # noqa: PLC0415
+
+        recorder = FlightRecorderHandler(config.flight_recorder, dump_path=dump_path)
+        recorder.setLevel(getattr(logging, config.flight_recorder_level, logging.DEBUG))
+        # Dumps are rare, so they trust the record's own location instead of walking the stack
+        recorder.setFormatter(
+            self._handler_factory.get_formatter(
+                dataclasses.replace(config, source_location=SOURCE_LOCATION_RECORD)
+            )
+        )
+        if config.flight_recorder_signal and not install_signal_handler():
+            self._log_library_error(
+                "Flight recorder signal trigger needs SIGUSR1 and the main thread"
+            )
+        self._handler_cache[cache_key] = recorder
+        return recorder
+
+    def _get_metrics(self, config: LogConfig) -> PipelineMetrics:
+        """Return the pipeline metrics, creating them on first use.
+
+        Args:
+            config: LogConfig with metrics enabled.
+
+        Returns:
+            Metrics shared by every managed logger.
+        """
+        with self._lock:
+            if self._metrics is None:
+                from .metrics import PipelineMetrics  # noqa: PLC0415
+
+                self._metrics = PipelineMetrics(config.metrics_interval)
+            self._metrics.report_interval = config.metrics_interval
+            return self._metrics
+
+    def _create_filters(self, logger: logging.Logger, config: LogConfig) -> list[logging.Filter]:
+        """Create the filters enabled in config.
+
+        Args:
+            logger: Logger the filters are attached to; it receives their summaries.
+            config: LogConfig with configuration settings.
+
+        Returns:
+            Dedup, rate limiting and sampling filters, followed by the metrics
+            filter so it only counts records that are handled.
+        """
+        filters = self._create_suppression_filters(logger, config)
+        if config.metrics:
+            from .metrics import MetricsFilter  # noqa: PLC0415
+
+            filters.append(MetricsFilter(self._get_metrics(config), logger))
+        return filters
+
+    def _create_suppression_filters(
+        self, logger: logging.Logger, config: LogConfig
+    ) -> list[logging.Filter]:
+        """Create the dedup, rate limiting and sampling filters enabled in config.
+
+        Args:
+            logger: Logger the filters are attached to; it receives their summaries.
+            config: LogConfig with configuration settings.
+
+        Returns:
+            Filters to add to the logger.
+        """
+        if not (config.dedup_window_ms > 0 or config.rate_limit > 0 or config.sample_rates):
+            return []
+        # Imported only when filtering is configured, keeping default startup lean
+        from .filters import (  # noqa: PLC0415
+            DedupFilter,
+            RateLimitFilter,
+            SamplingFilter,
+            parse_sample_rates,
+        )
+
+        filters: list[logging.Filter] = []
+        # Dedup first, so repeats are collapsed rather than rate limited
+        if config.dedup_window_ms > 0:
+            filters.append(
+                DedupFilter(
+                    config.dedup_window_ms / 1000,
+                    logger=logger,
+                    max_keys=config.dedup_max_keys,
+                )
+            )
+        if config.rate_limit > 0:
+            filters.append(
+                RateLimitFilter(
+                    config.rate_limit,
+                    burst=config.rate_burst,
+                    logger=logger,
+                    summary_interval=config.summary_interval,
+                )
+            )
+        if config.sample_rates:
+            filters.append(
+                SamplingFilter(
+                    parse_sample_rates(config.sample_rates),
+                    logger=logger,
+                    summary_interval=config.summary_interval,
+                )
+            )
+        return filters
+
+    def _create_output_handlers(self, config: LogConfig) -> list[logging.Handler]:
+        """Create console and (if configured) file and log shipping handlers.
+
+        Args:
+            config: LogConfig with configuration settings.
+
+        Returns:
+            List of output handlers.
+        """
+        handlers: list[logging.Handler] = [self._handler_factory.create_console_handler(config)]
+
+        if config.log_to_file:
+            file_handler = self._get_file_handler(config)
+            if file_handler:
+                handlers.append(file_handler)
+
+        if config.ship_address:
+            network_handler = self._get_network_handler(config)
+            if network_handler:
+                handlers.append(network_handler)
+
+        return handlers
+
+    def _get_network_handler(self, config: LogConfig) -> logging.Handler | None:
+        """Get the log shipping handler for config.ship_address, creating it once.
+
+        One connection, batch and spool serve every logger shipping to the
+        same collector.
+
+        Args:
+            config: LogConfig with configuration settings.
+
+        Returns:
+            Network handler, or None if the address is invalid.
+        """
+        cache_key = f"ship:{config.ship_address}"
+        cached = self._handler_cache.get(cache_key)
+        if cached is not None and not getattr(cached, "closed", True):
+            return cached
+        network_handler = self._handler_factory.create_network_handler(config)
+        if network_handler is not None:
+            self._handler_cache[cache_key] = network_handler
+        return network_handler
+
+    def _get_file_handler(self, config: LogConfig) -> logging.Handler | None:
+        """Get a file handler, sharing all but the plain file handlers between loggers.
+
+        A rotating handler tracks the size and hour of the file it writes, an
+        mmap handler owns the write offset of its mapping, a compressed
+        handler the block being filled, a binary handler its string table and
+        a buffered handler its pending batch and flusher thread, so all
+        loggers writing the same files must go through one instance. In
+        multiprocess mode records go to the collector instead of the file.
+
+        Args:
+            config: LogConfig with configuration settings.
+
+        Returns:
+            File handler, or None if file logging is unavailable.
+        """
+        if config.multiprocess:
+            collector_key = f"collector:{config.app_name}:{config.log_file_dir}"
+            collector_handler = self._handler_cache.get(collector_key)
+            if collector_handler is None:
+                collector_handler = self._handler_factory.create_collector_handler(config)
+                if collector_handler is not None:
+                    self._handler_cache[collector_key] = collector_handler
+            if collector_handler is not None:
+                return collector_handler
+
+        shared_output = (
+            config.file_buffered
+            or config.file_mmap
+            or config.file_compression
+            or config.file_format != "json"
+        )
+        if shared_output and not config.file_rotate:
+            # Several writers of one mapped file would overwrite each other's
+            # records, of one compressed file interleave their blocks, of one
+            # binary file mix up each other's interned strings and of one
+            # buffered file reorder lines across their separate batches
+            shared_key = f"shared:{config.app_name}:{config.log_file_dir}"
+            shared = self._handler_cache.get(shared_key)
+            if shared is not None and not getattr(shared, "closed", True):
+                return shared
+            shared = self._handler_factory.create_file_handler(config)
+            if shared is not None:
+                self._handler_cache[shared_key] = shared
+            return shared
+
+        if not config.file_rotate:
+            return self._handler_factory.create_file_handler(config)
+
+        from .rotating_handler import RotatingFileHandler  # noqa: PLC0415
+
+        cache_key = (
+            f"rotating:{config.app_name}:{config.log_file_dir}:{config.file_max_bytes}:"
+            f"{config.file_backup_count}:{config.file_compress}:{config.file_buffered}"
+        )
+        cached = self._handler_cache.get(cache_key)
+        if isinstance(cached, RotatingFileHandler) and cached.stream is not None:
+            return cached
+
+        file_handler = self._handler_factory.create_file_handler(config)
+        if file_handler is not None:
+            self._handler_cache[cache_key] = file_handler
+        return file_handler
+
+    def _get_async_handlers(self, config: LogConfig) -> list[logging.Handler]:
+        """Get the shared async handler for this configuration, creating it once.
+
+        All loggers with the same output configuration share one queue and
+        writer thread.
+
+        Args:
+            config: LogConfig with configuration settings.
+
+        Returns:
+            List containing the async handler, or the plain output handlers if
+            the async handler could not be created.
+        """
+        # The queue and writer thread are only loaded when async logging is configured
+        from .async_handler import AsyncQueueHandler  # noqa: PLC0415
+
+        cache_key = (
+            f"async:{config.app_name}:{config.log_to_file}:{config.log_file_dir}:"
+            f"{config.async_queue_size}:{config.async_overflow}:{config.ship_address}"
+        )
+        cached = self._handler_cache.get(cache_key)
+        if isinstance(cached, AsyncQueueHandler) and not cached.closed:
+            return [cached]
+
+        targets = self._create_output_handlers(config)
+        async_handler = self._handler_factory.create_async_handler(config, targets)
+        if async_handler is None:
+            return targets
+
+        self._handler_cache[cache_key] = async_handler
+        return [async_handler]
+
     def _resolve_logger_name(self, name: str | None) -> str:
         """Resolve logger name using fallback chain.
 
@@ -97,6 +498,8 @@ class LoggerManager:
             return app_name
 
         # Try to get calling module's __name__
+        import inspect  # noqa: PLC0415
+
         try:
             frame = inspect.currentframe()
             if frame and frame.f_back and frame.f_back.f_back:
@@ -134,3 +537,32 @@ class LoggerManager:
             # If stderr is not available or fails, silently continue
             # This is intentional to prevent mypylogger from crashing user applications
             pass
+
+
+def _logger_level(config: LogConfig) -> int:
+    """Return the logger level for config.
+
+    Args:
+        config: LogConfig with configuration settings.
+
+    Returns:
+        LOG_LEVEL, or the flight recorder level when that is lower.
+    """
+    level: int = getattr(logging, config.log_level, logging.INFO)
+    if config.flight_recorder > 0:
+        level = min(level, getattr(logging, config.flight_recorder_level, logging.DEBUG))
+    return level
+
+
+def _handler_formatters(handler: logging.Handler) -> list[SourceLocationJSONFormatter]:
+    """Return the JSON formatters that format records for handler.
+
+    Args:
+        handler: Handler created by mypylogger.
+
+    Returns:
+        The handler's formatter, or those of an async handler's targets.
+    """
+    handlers = [handler, *getattr(handler, "targets", ())]
+    formatters = [getattr(h, "formatter", None) for h in handlers]
+    return [f for f in formatters if isinstance(f, SourceLocationJSONFormatter)]
@@ -0,0 +1,82 @@
+"""Command-line decoder for binary mypylogger log files.
+
+Usage: python -m mypylogger.decode [-o OUTPUT] [FILE ...]
+
+Writes the JSON lines the formatter would have written for each record,
+reading standard input when no file (or "-") is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import ExitStack
+from pathlib import Path
+import sys
+from typing import BinaryIO, Sequence
+
+from .binary import iter_json_lines
+
+
+def decode_stream(stream: BinaryIO, output: BinaryIO) -> int:
+    """Decode one binary log stream into JSON lines.
+
+    Args:
+        stream: Binary log file opened for reading in binary mode.
+        output: Binary stream the JSON lines are written to.
+
+    Returns:
+        Number of lines written.
+    """
+    count = 0
+    for line in iter_json_lines(stream):
+        output.write(line + b"\n")
+        count += 1
+    return count
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Decode binary log files given on the command line.
+
+    Args:
+        argv: Command-line arguments; None uses sys.argv.
+
+    Returns:
+        Exit code: 0 for success, 1 for failure.
+    """
+    parser = argparse.ArgumentParser(
+        description="Decode binary mypylogger log files into JSON lines",
+        prog="python -m mypylogger.decode",
+    )
+    parser.add_argument(
+        "files", nargs="*", default=["-"], help="Binary log files; '-' reads standard input"
+    )
+    parser.add_argument(
+        "--output", "-o", help="Write JSON lines to this file instead of standard output"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        with ExitStack() as stack:
+            output: BinaryIO = (
+                stack.enter_context(Path(args.output).open("wb"))
+                if args.output
+                else sys.stdout.buffer
+            )
+            for name in args.files:
+                if name == "-":
+                    decode_stream(sys.stdin.buffer, output)
+                    continue
+                with Path(name).open("rb") as stream:
+                    decode_stream(stream, output)
+            output.flush()
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head); nothing left to do
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"mypylogger.decode: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
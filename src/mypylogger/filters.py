@@ -0,0 +1,569 @@
+"""Logger filters that drop records before they are formatted.
+
+RateLimitFilter caps each call site with a token bucket, SamplingFilter
+keeps a fraction of records per level and DedupFilter collapses repeated
+messages. All are attached to the logger, so a dropped record never reaches
+a handler or the JSON formatter, and all report what they dropped in
+summary records.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import atexit
+from collections import OrderedDict
+import logging
+import random
+import sys
+import threading
+import time
+import weakref
+
+from .exceptions import ConfigurationError
+from .formatters import RECORD_LOCATION_ATTR
+from .timestamps import TimestampEngine
+
+# Constants
+DEFAULT_SUMMARY_INTERVAL = 60.0  # Seconds between suppression summaries
+DEFAULT_KEEP_LEVEL = logging.WARNING  # Records at or above this level are never dropped
+MAX_CALL_SITES = 4096  # Call-site buckets kept before evicting the least recently used
+MAX_DEDUP_KEYS = 1024  # Open dedup windows kept before the oldest is closed early
+
+_filters: weakref.WeakSet[SuppressionFilter | DedupFilter] = weakref.WeakSet()
+_timestamps = TimestampEngine()
+
+
+class _SummaryEmitter:
+    """Mixin sending summary records straight to a logger's handlers."""
+
+    logger: logging.Logger | None
+
+    def _emit(
+        self,
+        level: int,
+        location: tuple[str, int, str],
+        msg: str,
+        args: tuple[object, ...],
+        extra: dict[str, object],
+    ) -> None:
+        """Send a summary record to the logger's handlers.
+
+        Args:
+            level: Level of the summary record.
+            location: (pathname, lineno, funcName) reported for the summary.
+            msg: Message format string.
+            args: Message arguments.
+            extra: Summary fields.
+        """
+        if self.logger is None:
+            return
+        pathname, lineno, func = location
+        try:
+            summary = self.logger.makeRecord(
+                self.logger.name, level, pathname, lineno, msg, args, None, func, extra
+            )
+            # Emitted from whichever call closed the window; the formatter
+            # must report the given location, not walk this stack
+            summary.__dict__[RECORD_LOCATION_ATTR] = True
+            # Straight to the handlers, so no logger filter can drop the summary
+            self.logger.callHandlers(summary)
+        except Exception as e:
+            self._log_filter_error(f"Failed to emit suppression summary: {e}")
+
+    def _log_filter_error(self, message: str) -> None:
+        """Log filter errors to stderr without affecting user logging.
+
+        Args:
+            message: Error message to log.
+        """
+        try:
+            print(f"mypylogger: {message}", file=sys.stderr)
+        except OSError:
+            # If stderr is not available or fails, silently continue
+            pass
+
+
+class SuppressionFilter(_SummaryEmitter, logging.Filter, ABC):
+    """Base class for filters that drop records and report the counts.
+
+    Subclasses implement decide(). Every summary_interval seconds the counts
+    of dropped records are sent to the logger's handlers as one WARNING
+    record with ``suppressed_by``, ``suppressed_total`` and ``suppressed``
+    (count per key) fields, located at the first record dropped since the
+    previous summary. A timer started by the first drop of an interval sends
+    the summary, so it goes out even when no later record arrives.
+    """
+
+    suppressed_by = "filter"
+
+    def __init__(
+        self,
+        *,
+        logger: logging.Logger | None = None,
+        summary_interval: float = DEFAULT_SUMMARY_INTERVAL,
+        keep_level: int = DEFAULT_KEEP_LEVEL,
+    ) -> None:
+        """Initialize SuppressionFilter.
+
+        Args:
+            logger: Logger whose handlers receive the summary records; None
+                only counts.
+            summary_interval: Seconds between summary records.
+            keep_level: Records at or above this level always pass.
+        """
+        super().__init__()
+        self.logger = logger
+        self.summary_interval = summary_interval
+        self.keep_level = keep_level
+        self._lock = threading.Lock()
+        self._suppressed: dict[str, int] = {}
+        # (pathname, lineno, funcName) of the first record dropped in this window
+        self._first_dropped: tuple[str, int, str] | None = None
+        self._window_start = time.monotonic()
+        # Sends the summary when the interval ends, without waiting for traffic
+        self._timer: threading.Timer | None = None
+        _filters.add(self)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether record is logged.
+
+        Args:
+            record: LogRecord instance to check.
+
+        Returns:
+            True if the record should be logged.
+        """
+        if record.levelno >= self.keep_level:
+            return True
+        return self.decide(record, time.monotonic())
+
+    @abstractmethod
+    def decide(self, record: logging.LogRecord, now: float) -> bool:
+        """Decide whether a record below keep_level is logged.
+
+        Args:
+            record: LogRecord instance to check.
+            now: Current monotonic time.
+
+        Returns:
+            True if the record should be logged.
+        """
+
+    def suppressed(self) -> dict[str, int]:
+        """Return the records dropped since the last summary.
+
+        Returns:
+            Count of dropped records per key.
+        """
+        with self._lock:
+            return dict(self._suppressed)
+
+    def flush_summary(self, now: float | None = None) -> None:
+        """Emit the summary record for records dropped so far and reset the counts.
+
+        Args:
+            now: Current monotonic time; defaults to time.monotonic().
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            counts = self._suppressed
+            self._suppressed = {}
+            first_dropped = self._first_dropped
+            self._first_dropped = None
+            elapsed = now - self._window_start
+            self._window_start = now
+        if not counts or self.logger is None:
+            return
+
+        total = sum(counts.values())
+        self._emit(
+            logging.WARNING,
+            first_dropped or (__file__, 0, "flush_summary"),
+            "Suppressed %d log records in the last %.0fs",
+            (total, elapsed),
+            {
+                "suppressed_by": self.suppressed_by,
+                "suppressed_total": total,
+                "suppressed": counts,
+            },
+        )
+
+    def _count(self, key: str, record: logging.LogRecord) -> None:
+        """Count one dropped record; the caller holds the lock.
+
+        Args:
+            key: Summary key for the record.
+            record: The dropped record.
+        """
+        self._suppressed[key] = self._suppressed.get(key, 0) + 1
+        if self._first_dropped is None:
+            self._first_dropped = (record.pathname, record.lineno, record.funcName)
+            now = time.monotonic()
+            if now - self._window_start >= self.summary_interval:
+                # Nothing was dropped for a whole interval; this drop starts one
+                self._window_start = now
+            self._schedule_summary(self._window_start + self.summary_interval - now)
+
+    def _schedule_summary(self, delay: float) -> None:
+        """Start the summary timer unless one is pending; the caller holds the lock.
+
+        Args:
+            delay: Seconds until the current interval ends.
+        """
+        timer = self._timer
+        if timer is not None and timer.is_alive():
+            return
+        timer = threading.Timer(max(delay, 0.0), self._summary_due)
+        timer.name = "mypylogger-suppression"
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _summary_due(self) -> None:
+        """Send the summary from the timer at the end of the interval."""
+        with self._lock:
+            self._timer = None
+        self.flush_summary()
+
+
+class RateLimitFilter(SuppressionFilter):
+    """Token-bucket limit per call site, keyed by (pathname, lineno).
+
+    Each call site may log ``burst`` records at once and ``rate`` records per
+    second on average; records beyond that are dropped until tokens refill.
+    """
+
+    suppressed_by = "rate_limit"
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 0,
+        *,
+        logger: logging.Logger | None = None,
+        summary_interval: float = DEFAULT_SUMMARY_INTERVAL,
+        keep_level: int = DEFAULT_KEEP_LEVEL,
+        max_call_sites: int = MAX_CALL_SITES,
+    ) -> None:
+        """Initialize RateLimitFilter.
+
+        Args:
+            rate: Records per second allowed per call site.
+            burst: Bucket capacity; 0 uses rate.
+            logger: Logger whose handlers receive the summary records.
+            summary_interval: Seconds between summary records.
+            keep_level: Records at or above this level always pass.
+            max_call_sites: Call sites tracked before the least recently used
+                one is forgotten.
+        """
+        super().__init__(logger=logger, summary_interval=summary_interval, keep_level=keep_level)
+        self.rate = rate
+        self.burst = max(burst or rate, 1.0)
+        self.max_call_sites = max_call_sites
+        # (pathname, lineno) -> [tokens, last refill time]
+        self._buckets: OrderedDict[tuple[str, int], list[float]] = OrderedDict()
+
+    def decide(self, record: logging.LogRecord, now: float) -> bool:
+        """Take a token from the call site's bucket.
+
+        Args:
+            record: LogRecord instance to check.
+            now: Current monotonic time.
+
+        Returns:
+            True if a token was available.
+        """
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [self.burst, now]
+                self._buckets[key] = bucket
+                if len(self._buckets) > self.max_call_sites:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return True
+            self._count(f"{record.pathname}:{record.lineno}", record)
+            return False
+
+
+class SamplingFilter(SuppressionFilter):
+    """Head sampling that keeps a configured fraction of records per level."""
+
+    suppressed_by = "sampling"
+
+    def __init__(
+        self,
+        rates: dict[int, float],
+        *,
+        logger: logging.Logger | None = None,
+        summary_interval: float = DEFAULT_SUMMARY_INTERVAL,
+        keep_level: int = DEFAULT_KEEP_LEVEL,
+    ) -> None:
+        """Initialize SamplingFilter.
+
+        Args:
+            rates: Fraction of records kept per level number, from 0.0 to 1.0;
+                levels not listed are kept.
+            logger: Logger whose handlers receive the summary records.
+            summary_interval: Seconds between summary records.
+            keep_level: Records at or above this level always pass.
+        """
+        super().__init__(logger=logger, summary_interval=summary_interval, keep_level=keep_level)
+        self.rates = dict(rates)
+
+    def decide(self, record: logging.LogRecord, now: float) -> bool:  # noqa: ARG002
+        """Keep the record with the probability configured for its level.
+
+        Args:
+            record: LogRecord instance to check.
+            now: Current monotonic time.
+
+        Returns:
+            True if the record was sampled.
+        """
+        rate = self.rates.get(record.levelno)
+        # Sampling needs speed, not unpredictability
+        if rate is None or random.random() < rate:  # noqa: S311
+            return True
+        with self._lock:
+            self._count(record.levelname, record)
+        return False
+
+
+class _DedupWindow:
+    """Repeats of one message seen since its first occurrence."""
+
+    __slots__ = ("closes_at", "count", "first_seen", "last")
+
+    def __init__(self, closes_at: float, first_seen: float, record: logging.LogRecord) -> None:
+        """Initialize _DedupWindow.
+
+        Args:
+            closes_at: Monotonic time the window closes.
+            first_seen: Creation time of the logged first occurrence.
+            record: The first occurrence.
+        """
+        self.closes_at = closes_at
+        self.first_seen = first_seen
+        self.count = 0
+        self.last = record
+
+
+class DedupFilter(_SummaryEmitter, logging.Filter):
+    """Collapse repeats of a message into one "repeated N times" record.
+
+    Records are keyed by (level, message template, pathname, lineno). The
+    first record of a key is logged and opens a window; repeats inside the
+    window are only counted. When the window closes, one record with the
+    last message plus ``repeat_count``, ``first_seen`` and ``last_seen`` is
+    sent to the logger's handlers. Windows are closed as records arrive, by a
+    timer once a window has repeats (so a burst followed by silence is still
+    reported) and at exit; when more than max_keys are open the oldest is
+    closed early.
+    """
+
+    def __init__(
+        self,
+        window: float,
+        *,
+        logger: logging.Logger | None = None,
+        keep_level: int = logging.CRITICAL + 1,
+        max_keys: int = MAX_DEDUP_KEYS,
+    ) -> None:
+        """Initialize DedupFilter.
+
+        Args:
+            window: Seconds repeats are collapsed after a first occurrence.
+            logger: Logger whose handlers receive the summary records.
+            keep_level: Records at or above this level are never collapsed;
+                by default every level is.
+            max_keys: Open windows kept in memory.
+        """
+        super().__init__()
+        self.logger = logger
+        self.keep_level = keep_level
+        self.window = window
+        self.max_keys = max_keys
+        # Insertion order is also closing order, since every window is as long
+        self._windows: OrderedDict[tuple[int, str, str, int], _DedupWindow] = OrderedDict()
+        self._lock = threading.Lock()
+        # Closes windows with repeats when no later record arrives to do it
+        self._timer: threading.Timer | None = None
+        _filters.add(self)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Log the first occurrence of a message and count its repeats.
+
+        Args:
+            record: LogRecord instance to check.
+
+        Returns:
+            True if the record should be logged.
+        """
+        msg = record.msg
+        if record.levelno >= self.keep_level or not isinstance(msg, str):
+            return True
+        now = time.monotonic()
+        key = (record.levelno, msg, record.pathname, record.lineno)
+        with self._lock:
+            windows = self._windows
+            closed = self._pop_closed(now)
+            window = windows.get(key)
+            if window is None:
+                windows[key] = _DedupWindow(now + self.window, record.created, record)
+                if len(windows) > self.max_keys:
+                    _, evicted = windows.popitem(last=False)
+                    if evicted.count:
+                        closed.append(evicted)
+                keep = True
+            else:
+                window.count += 1
+                window.last = record
+                keep = False
+                if window.count == 1:
+                    self._schedule_close(window.closes_at - now)
+
+        for finished in closed:
+            self._emit_repeats(finished)
+        return keep
+
+    def suppressed(self) -> dict[str, int]:
+        """Return the repeats counted in windows that are still open.
+
+        Returns:
+            Repeat count per ``pathname:lineno``.
+        """
+        counts: dict[str, int] = {}
+        with self._lock:
+            for (_, _, pathname, lineno), window in self._windows.items():
+                if window.count:
+                    site = f"{pathname}:{lineno}"
+                    counts[site] = counts.get(site, 0) + window.count
+        return counts
+
+    def flush_summary(self) -> None:
+        """Close every open window, emitting its summary record."""
+        with self._lock:
+            closed = [window for window in self._windows.values() if window.count]
+            self._windows.clear()
+        for window in closed:
+            self._emit_repeats(window)
+
+    def _pop_closed(self, now: float) -> list[_DedupWindow]:
+        """Remove the windows whose time is up; the caller holds the lock.
+
+        Args:
+            now: Current monotonic time.
+
+        Returns:
+            Removed windows that counted repeats.
+        """
+        closed = []
+        windows = self._windows
+        while windows:
+            oldest = next(iter(windows.values()))
+            if oldest.closes_at > now:
+                break
+            windows.popitem(last=False)
+            if oldest.count:
+                closed.append(oldest)
+        return closed
+
+    def _schedule_close(self, delay: float) -> None:
+        """Start the close timer unless one is pending; the caller holds the lock.
+
+        Args:
+            delay: Seconds until the window that needs closing closes.
+        """
+        timer = self._timer
+        if timer is not None and timer.is_alive():
+            return
+        timer = threading.Timer(max(delay, 0.0), self._close_due)
+        timer.name = "mypylogger-dedup"
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _close_due(self) -> None:
+        """Close due windows from the timer, rescheduling for the next one with repeats."""
+        now = time.monotonic()
+        with self._lock:
+            self._timer = None
+            closed = self._pop_closed(now)
+            pending = [w.closes_at for w in self._windows.values() if w.count]
+            if pending:
+                self._schedule_close(pending[0] - now)
+        for finished in closed:
+            self._emit_repeats(finished)
+
+    def _emit_repeats(self, window: _DedupWindow) -> None:
+        """Send the "repeated N times" record for a closed window.
+
+        Args:
+            window: Closed window with at least one repeat.
+        """
+        last = window.last
+        try:
+            message = last.getMessage()
+        except Exception:
+            message = str(last.msg)
+        self._emit(
+            last.levelno,
+            (last.pathname, last.lineno, last.funcName),
+            "%s (repeated %d times)",
+            (message, window.count),
+            {
+                "repeat_count": window.count,
+                "first_seen": _timestamps.format_iso(window.first_seen),
+                "last_seen": _timestamps.format_iso(last.created),
+            },
+        )
+
+
+def parse_sample_rates(spec: str) -> dict[int, float]:
+    """Parse a sampling specification such as ``"DEBUG:0.01,INFO:0.1"``.
+
+    Args:
+        spec: Comma-separated ``LEVEL:ratio`` pairs.
+
+    Returns:
+        Fraction of records kept per level number.
+
+    Raises:
+        ConfigurationError: If an entry is malformed, names an unknown level
+            or has a ratio outside 0.0 to 1.0.
+    """
+    rates: dict[int, float] = {}
+    for raw_entry in spec.split(","):
+        entry = raw_entry.strip()
+        if not entry:
+            continue
+        level_name, _, ratio = entry.partition(":")
+        level = logging.getLevelName(level_name.strip().upper())
+        try:
+            rate = float(ratio)
+        except ValueError:
+            rate = -1.0
+        if not isinstance(level, int) or not 0.0 <= rate <= 1.0:
+            msg = f"Invalid sample rate entry: {entry!r}"
+            raise ConfigurationError(msg)
+        rates[level] = rate
+    return rates
+
+
+def _flush_summaries() -> None:
+    """Report records dropped since the last summary before logging shuts down."""
+    for log_filter in list(_filters):
+        log_filter.flush_summary()
+
+
+# Registered after logging's own atexit hook, so it runs before logging.shutdown
+atexit.register(_flush_summaries)
@@ -0,0 +1,332 @@
+"""In-memory flight recorder for mypylogger.
+
+FlightRecorderHandler keeps references to the most recent records in a
+fixed-size ring buffer. Per record it does no formatting, no I/O and takes
+no lock; it only captures the call-site state a later dump needs (message,
+source location and bound context). The buffer is only formatted when it is dumped,
+which happens when a record at the trigger level (ERROR by default) arrives,
+when dump_all() is called, from a dumper thread on SIGUSR1 once
+install_signal_handler() has run, and at exit when the interpreter is exiting
+because of an uncaught exception. This gives debug-level context around a failure while the
+regular handlers stay at INFO.
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import logging
+import os
+import sys
+import threading
+from typing import TYPE_CHECKING, Any
+import weakref
+
+from .context import capture_context
+from .formatters import SourceLocationJSONFormatter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import FrameType
+
+# Constants
+DEFAULT_CAPACITY = 2000  # Records kept in the ring buffer
+DEFAULT_TRIGGER_LEVEL = logging.ERROR  # Records at or above this level dump the buffer
+
+_recorders: weakref.WeakSet[FlightRecorderHandler] = weakref.WeakSet()
+_signal_lock = threading.Lock()
+_signal_installed = threading.Event()
+# Set by the SIGUSR1 handler; the dumper thread does the dump outside the handler
+_dump_requested = threading.Event()
+
+
+class FlightRecorderHandler(logging.Handler):
+    """Handler keeping the last capacity records in memory until a dump.
+
+    The message, source location and bound context are captured when a
+    record arrives, like AsyncQueueHandler does, since a dump formats it
+    later on whichever thread triggered the dump. Each record is dumped at
+    most once: a dump empties the buffer.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        dump_path: Path | None = None,
+        trigger_level: int = DEFAULT_TRIGGER_LEVEL,
+    ) -> None:
+        """Initialize FlightRecorderHandler.
+
+        Args:
+            capacity: Number of most recent records kept.
+            dump_path: File dumps are appended to; None writes them to stderr.
+            trigger_level: Minimum level of a record that dumps the buffer.
+        """
+        super().__init__()
+        self.capacity = max(1, capacity)
+        self.dump_path = dump_path
+        self.trigger_level = trigger_level
+        # Preallocated once; storing a record is one list item assignment.
+        # Each slot holds the record's sequence number for ordering the dump
+        self._buffer: list[tuple[int, logging.LogRecord] | None] = [None] * self.capacity
+        self._sequence = itertools.count()
+        self.dumps = 0
+        self.bytes_written = 0
+        _recorders.add(self)
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Store record without taking the handler lock, dumping on a trigger.
+
+        Args:
+            record: LogRecord instance to keep.
+
+        Returns:
+            True if the record was stored.
+        """
+        if self.filters and not self.filter(record):
+            return False
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store record in the ring buffer, overwriting the oldest one.
+
+        Args:
+            record: LogRecord instance to keep.
+        """
+        self.prepare(record)
+        # next() on itertools.count is atomic, so concurrent threads get distinct slots
+        sequence = next(self._sequence)
+        self._buffer[sequence % self.capacity] = (sequence, record)
+        if record.levelno >= self.trigger_level:
+            self.dump()
+
+    def prepare(self, record: logging.LogRecord) -> None:
+        """Capture call-site dependent state before the record is buffered.
+
+        Args:
+            record: LogRecord instance to prepare.
+        """
+        formatter = self.formatter
+        # Resolved now in both modes: the call stack is gone by the time of
+        # the dump, and a dump at exit runs after __main__.__file__ is deleted.
+        # Record-based lookups are memoized per (pathname, funcName)
+        if isinstance(formatter, SourceLocationJSONFormatter):
+            formatter.capture_source_location(record)
+        capture_context(record)
+        if record.args:
+            try:
+                # Freeze the message so later mutation of args cannot change the dump
+                record.msg = record.getMessage()
+                record.args = None
+            except Exception:
+                # Leave the record untouched; the formatter falls back to plain text
+                pass
+
+    def records(self) -> list[logging.LogRecord]:
+        """Return the buffered records, oldest first.
+
+        Returns:
+            Records stored since the last dump, at most capacity of them.
+        """
+        return _ordered_records(self._buffer)
+
+    def dump(self) -> int:
+        """Format the buffered records as JSON lines and write them out.
+
+        Returns:
+            Number of records written.
+        """
+        self.acquire()
+        try:
+            # Swap in an empty buffer first; records stored while the old one
+            # is read land in the new one instead of being cleared unseen
+            buffer = self._buffer
+            self._buffer = [None] * self.capacity
+            records = _ordered_records(buffer)
+            if not records:
+                return 0
+            data = b"".join(self._format_bytes(record) + b"\n" for record in records)
+            self._write(data)
+            self.dumps += 1
+            self.bytes_written += len(data)
+            return len(records)
+        except Exception as e:
+            self._log_handler_error(f"Flight recorder dump failed: {e}")
+            return 0
+        finally:
+            self.release()
+
+    def stats(self) -> dict[str, Any]:
+        """Return ring buffer counters.
+
+        Returns:
+            Dictionary with buffered_records, capacity and dumps.
+        """
+        return {
+            "buffered_records": sum(record is not None for record in self._buffer),
+            "capacity": self.capacity,
+            "dumps": self.dumps,
+        }
+
+    def close(self) -> None:
+        """Drop the buffered records and stop receiving dump requests."""
+        _recorders.discard(self)
+        self._buffer = [None] * self.capacity
+        super().close()
+
+    def _format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Format one buffered record.
+
+        Args:
+            record: Record to format.
+
+        Returns:
+            UTF-8 encoded log line without the trailing newline.
+        """
+        formatter = self.formatter
+        if isinstance(formatter, SourceLocationJSONFormatter):
+            return formatter.format_bytes(record)
+        return self.format(record).encode("utf-8", "replace")
+
+    def _write(self, data: bytes) -> None:
+        """Append a dump to dump_path, or write it to stderr.
+
+        Args:
+            data: Formatted log lines.
+        """
+        if self.dump_path is not None:
+            with self.dump_path.open("ab") as stream:
+                stream.write(data)
+            return
+        buffer = getattr(sys.stderr, "buffer", None)
+        if buffer is not None:
+            sys.stderr.flush()
+            buffer.write(data)
+            buffer.flush()
+        else:
+            sys.stderr.write(data.decode("utf-8", "replace"))
+            sys.stderr.flush()
+
+    def _log_handler_error(self, message: str) -> None:
+        """Log handler errors to stderr without affecting user logging.
+
+        Args:
+            message: Error message to log.
+        """
+        try:
+            print(f"mypylogger: {message}", file=sys.stderr)
+        except OSError:
+            # If stderr is not available or fails, silently continue
+            pass
+
+
+def dump_all() -> int:
+    """Dump every open flight recorder.
+
+    Returns:
+        Total number of records written.
+    """
+    return sum(recorder.dump() for recorder in list(_recorders))
+
+
+def install_signal_handler() -> bool:
+    """Dump every flight recorder when the process receives SIGUSR1.
+
+    The signal handler only wakes a daemon dumper thread, because dumping
+    takes locks and writes to stderr, neither of which is safe inside a
+    signal handler that may interrupt code holding them. A SIGUSR1 handler
+    installed before is still called. Only the main thread may install
+    signal handlers.
+
+    Returns:
+        True if the handler is installed, False where SIGUSR1 is unavailable
+        or when not called from the main thread.
+    """
+    # Loaded only when the signal trigger is configured
+    import signal  # noqa: PLC0415
+
+    signum = getattr(signal, "SIGUSR1", None)
+    if signum is None or threading.current_thread() is not threading.main_thread():
+        return False
+    with _signal_lock:
+        if _signal_installed.is_set():
+            return True
+        previous = signal.getsignal(signum)
+
+        def dump_on_signal(received: int, frame: FrameType | None) -> None:
+            _dump_requested.set()
+            if callable(previous):
+                previous(received, frame)
+
+        _start_dumper()
+        signal.signal(signum, dump_on_signal)
+        _signal_installed.set()
+    return True
+
+
+def _start_dumper() -> None:
+    """Start the thread that dumps the flight recorders when a signal asks for it."""
+    dumper = threading.Thread(target=_dump_when_requested, name="mypylogger-flight-recorder")
+    dumper.daemon = True
+    dumper.start()
+
+
+def _dump_when_requested() -> None:
+    """Dumper thread loop: dump every flight recorder each time a dump is requested."""
+    while True:
+        _dump_requested.wait()
+        _dump_requested.clear()
+        try:
+            dump_all()
+        except Exception as e:
+            try:
+                print(f"mypylogger: Flight recorder dump failed: {e}", file=sys.stderr)
+            except OSError:
+                # If stderr is not available or fails, silently continue
+                pass
+
+
+def _restart_dumper_after_fork() -> None:
+    """Start a dumper thread in a forked child, which inherits the signal handler."""
+    if _signal_installed.is_set():
+        _start_dumper()
+
+
+def _ordered_records(buffer: list[tuple[int, logging.LogRecord] | None]) -> list[logging.LogRecord]:
+    """Return the records in a ring buffer, oldest first.
+
+    Args:
+        buffer: Ring buffer slots.
+
+    Returns:
+        Stored records in sequence order.
+    """
+    stored = sorted((slot for slot in buffer if slot is not None), key=_sequence_of)
+    return [record for _, record in stored]
+
+
+def _sequence_of(slot: tuple[int, logging.LogRecord]) -> int:
+    """Return the sequence number of a ring buffer slot.
+
+    Args:
+        slot: Sequence number and record.
+
+    Returns:
+        The sequence number.
+    """
+    return slot[0]
+
+
+def _dump_after_crash() -> None:
+    """Dump the flight recorders when exiting because of an uncaught exception."""
+    # The interpreter sets sys.last_value before running exit hooks
+    if getattr(sys, "last_value", None) is not None:
+        dump_all()
+
+
+# Registered after logging's own atexit hook, so it runs before logging.shutdown
+atexit.register(_dump_after_crash)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_dumper_after_fork)
@@ -2,23 +2,166 @@
 
 from __future__ import annotations
 
-import datetime
-import json
+from itertools import filterfalse
 import logging
 from pathlib import Path
 import sys
-from typing import TYPE_CHECKING, Any
+import time
+from typing import TYPE_CHECKING, Any, Callable, Collection, TypeVar
+
+from .caching import LRUCache
+from .context import CONTEXT_ATTR, BoundContext, current_context
+from .json_backends import BACKEND_STDLIB, JSONBackend, get_json_backend
+from .timestamps import TIMESTAMP_ISO, TimestampEngine
 
 if TYPE_CHECKING:
     from types import FrameType
 
+    from .metrics import PipelineMetrics
+    from .schema import LogSchema
+    from .static_fields import StaticFields
+    from .tracebacks import ExceptionRenderer
+
 # Constants
 MAX_STACK_FRAMES = 20  # Safety limit to prevent infinite loops
+LOCATION_ATTR = "_mypylogger_location"  # Record attribute holding pre-captured source location
+EXCEPTION_ATTR = "_mypylogger_exception"  # Record attribute holding a pre-rendered exception
+STATIC_FIELDS_ATTR = "_mypylogger_static_fields"  # Record attribute holding sender static fields
+# Record attribute marking pathname/lineno/funcName as the location in every mode
+RECORD_LOCATION_ATTR = "_mypylogger_record_location"
+LOCATION_MEMO_SIZE = 1024  # Code objects remembered for source location lookups
+RELATIVE_NAME_CACHE_SIZE = 2048  # Absolute paths remembered with their display names
+CWD_CHECK_INTERVAL = 1.0  # Seconds between working directory checks
+FORMAT_TIME_SAMPLE_INTERVAL = 32  # One record in this many is timed when metrics are on
+
+# Source location modes
+SOURCE_LOCATION_STACK = "stack"  # Walk the call stack from the formatter
+SOURCE_LOCATION_RECORD = "record"  # Trust record.pathname/lineno/funcName (honours stacklevel)
+
+# Record attributes and output keys that custom fields may not override
+RESERVED_FIELDS = frozenset(
+    {
+        "timestamp",
+        "level",
+        "message",
+        "module",
+        "filename",
+        "function_name",
+        "line",
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "stack_info",
+        "exc_info",
+        "exc_text",
+        "taskName",  # pytest-related field
+        "custom",  # Don't include the custom parameter itself as a field
+        LOCATION_ATTR,  # Pre-captured source location from async handlers
+        CONTEXT_ATTR,  # Pre-captured bound context from async handlers
+        EXCEPTION_ATTR,  # Pre-rendered exception from multiprocess clients
+        STATIC_FIELDS_ATTR,  # Sending process's static fields from multiprocess clients
+        RECORD_LOCATION_ATTR,  # Location set explicitly on synthetic records
+    }
+)
+
+# Types that always serialize, so custom field values of these types skip the probe
+_JSON_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Named encoders for values json cannot serialize natively ("drop" skips the field)
+JSON_DEFAULT_ENCODERS: dict[str, Callable[[Any], Any] | None] = {
+    "drop": None,
+    "str": str,
+    "repr": repr,
+}
+
+_Output = TypeVar("_Output", str, bytes)
+
+# Formatter and extraction methods skipped while walking the stack
+_FORMATTER_FUNCTIONS = frozenset({"format", "_extract_source_location", "_build_json_record"})
+
+
+def _encode_utf8(text: str) -> bytes:
+    """Encode a JSON string as UTF-8.
+
+    Args:
+        text: JSON string.
+
+    Returns:
+        UTF-8 encoded bytes.
+    """
+    return text.encode("utf-8")
 
 
 class SourceLocationJSONFormatter(logging.Formatter):
     """JSON formatter with automatic source location tracking."""
 
+    def __init__(
+        self,
+        source_location: str = SOURCE_LOCATION_STACK,
+        *,
+        json_default: Callable[[Any], Any] | None = None,
+        timestamp_format: str = TIMESTAMP_ISO,
+        json_backend: str = BACKEND_STDLIB,
+        static_fields: StaticFields | None = None,
+        schema: LogSchema | None = None,
+        exc_frame_limit: int = 50,
+    ) -> None:
+        """Initialize SourceLocationJSONFormatter.
+
+        Args:
+            source_location: How to find the calling code. "stack" walks the call
+                stack; "record" uses the location logging already stored on the
+                record, which is cheaper and honours ``stacklevel``.
+            json_default: Encoder for values json cannot serialize natively, passed
+                as ``default=`` to the JSON encoder. None drops such fields.
+            timestamp_format: "iso" for ISO 8601 strings, or "ms", "us" or "ns"
+                for integer epoch timestamps.
+            json_backend: JSON encoder: "stdlib", "orjson", "msgspec", "ujson" or
+                "auto" for the fastest installed one. Missing backends fall back
+                to the standard library.
+            static_fields: Constant app/host/pid/version fields written at the
+                start of every line from a pre-encoded prefix.
+            schema: Compiled schema; records whose custom fields all belong to
+                it are rendered by its generated function instead of the
+                JSON encoder.
+            exc_frame_limit: Innermost traceback frames written per exception.
+        """
+        super().__init__()
+        self.source_location = source_location
+        self.json_default = json_default
+        self._timestamps = TimestampEngine(timestamp_format)
+        self._backend = get_json_backend(json_backend, json_default)
+        self.static_fields = static_fields
+        self.schema = schema
+        self.exc_frame_limit = exc_frame_limit
+        # Created by the first record with an exception
+        self._exceptions: ExceptionRenderer | None = None
+        # (co_filename, co_name) -> whether the frame belongs to logging internals
+        self._internal_frames: LRUCache[tuple[str, str], bool] = LRUCache(LOCATION_MEMO_SIZE)
+        # (pathname, funcName) -> module name for record-based locations
+        self._record_modules: LRUCache[tuple[str, str], str] = LRUCache(LOCATION_MEMO_SIZE)
+        # Absolute path -> display name, valid for the working directory in _cwd
+        self._relative_names: LRUCache[str, str] = LRUCache(RELATIVE_NAME_CACHE_SIZE)
+        self._cwd: Path | None = None
+        self._cwd_checked_at = 0.0
+        self.cwd_check_interval = CWD_CHECK_INTERVAL
+        self.filenames_precomputed = False
+        # Pipeline counters; set by LoggerManager when LOG_METRICS is enabled
+        self.metrics: PipelineMetrics | None = None
+        self._untimed_left = 0
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON with source location fields.
 
@@ -28,10 +171,124 @@ class SourceLocationJSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string.
         """
+        metrics = self.metrics
+        if metrics is None:
+            return self._render(record, self._backend.dumps, str, self._fallback_to_plain_text)
+        # Two clock reads and a histogram update cost about as much as a small
+        # record takes to format, so only one record in FORMAT_TIME_SAMPLE_INTERVAL
+        # is timed, starting with the first
+        if self._untimed_left:
+            self._untimed_left -= 1
+            return self._render(record, self._backend.dumps, str, self._fallback_to_plain_text)
+        self._untimed_left = FORMAT_TIME_SAMPLE_INTERVAL - 1
+        start = time.perf_counter_ns()
+        output = self._render(record, self._backend.dumps, str, self._fallback_to_plain_text)
+        metrics.record_format_time(time.perf_counter_ns() - start)
+        return output
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Format log record as UTF-8 encoded JSON without a str round-trip.
+
+        Args:
+            record: LogRecord instance to format.
+
+        Returns:
+            UTF-8 encoded JSON log line (without trailing newline).
+        """
+        metrics = self.metrics
+        # Inlined sampling countdown, see format()
+        if metrics is not None:
+            if self._untimed_left:
+                self._untimed_left -= 1
+                metrics = None
+            else:
+                self._untimed_left = FORMAT_TIME_SAMPLE_INTERVAL - 1
+        start = time.perf_counter_ns() if metrics is not None else 0
+        output = self._render(
+            record,
+            self._backend.dumps_bytes,
+            _encode_utf8,
+            lambda r: self._fallback_to_plain_text(r).encode("utf-8", "replace"),
+        )
+        if metrics is not None:
+            metrics.record_format_time(time.perf_counter_ns() - start)
+        return output
+
+    def format_parts(
+        self, record: logging.LogRecord
+    ) -> tuple[int, str, str, dict[str, Any], bytes, bytes, bytes] | None:
+        """Format a record into the parts a compact binary encoding stores.
+
+        The line format_bytes() returns is ``prefix``, then the fixed fields
+        (timestamp, level, message, module, filename, function_name and line)
+        serialized by the JSON backend without their braces, then ``,`` and
+        ``custom`` if custom is not empty, then ``suffix``. prefix is ``{``
+        followed by any static fields; suffix is ``}`` preceded by any
+        exception and bound context fields.
+
+        Args:
+            record: LogRecord instance to format.
+
+        Returns:
+            Timestamp as TimestampEngine.to_integer() returns it, level name,
+            message, source location, custom fields, prefix and suffix; None
+            when the record is rendered by the compiled schema or cannot be
+            formatted, in which case format_bytes() must be used.
+        """
+        if self.schema is not None:
+            return None
+        try:
+            location = self._extract_source_location(record)
+            message = record.getMessage()
+            custom_fields = self._handle_custom_fields(record)
+            custom = self._backend.dumps_bytes(custom_fields)[1:-1] if custom_fields else b""
+            # Serialized JSON never contains a NUL byte, so it marks where the record goes
+            framing = self._add_preencoded_fields(record, b"{\0}", custom_fields)
+        except Exception:
+            return None
+        prefix, _, suffix = framing.partition(b"\0")
+        timestamp = self._timestamps.to_integer(record.created)
+        return timestamp, record.levelname, message, location, custom, prefix, suffix
+
+    @property
+    def json_backend(self) -> JSONBackend:
+        """JSON backend used for serialization."""
+        return self._backend
+
+    @property
+    def timestamp_format(self) -> str:
+        """Timestamp format: "iso", "ms", "us" or "ns"."""
+        return self._timestamps.timestamp_format
+
+    def _render(
+        self,
+        record: logging.LogRecord,
+        dumps: Callable[[dict[str, Any]], _Output],
+        from_str: Callable[[str], _Output],
+        fallback: Callable[[logging.LogRecord], _Output],
+    ) -> _Output:
+        """Build the JSON record and serialize it, falling back to plain text.
+
+        Args:
+            record: LogRecord instance to format.
+            dumps: Serializer producing the output type.
+            from_str: Conversion of a JSON string to the output type.
+            fallback: Plain text fallback producing the output type.
+
+        Returns:
+            Serialized log line.
+        """
         try:
             # Extract source location information
             location = self._extract_source_location(record)
 
+            # Records matching the compiled schema skip the dict and the encoder
+            if self.schema is not None:
+                rendered = self._render_schema(record, location)
+                if rendered is not None:
+                    line, overridden = rendered
+                    return self._add_preencoded_fields(record, from_str(line), overridden)
+
             # Build the JSON record with consistent field ordering
             json_record = self._build_json_record(record, location)
 
@@ -41,20 +298,177 @@ class SourceLocationJSONFormatter(logging.Formatter):
 
             # Serialize to JSON - this is the most likely point of failure
             try:
-                return json.dumps(json_record, ensure_ascii=False, separators=(",", ":"))
+                output: _Output = dumps(json_record)
             except (TypeError, ValueError, RecursionError) as json_error:
                 # Specific JSON serialization error handling (Requirement 5.2)
                 self._log_formatting_error(f"JSON serialization failed: {json_error}")
-                return self._fallback_to_plain_text(record)
+                return fallback(record)
             except Exception as json_error:
                 # Catch-all for any other JSON-related errors
                 self._log_formatting_error(f"Unexpected JSON error: {json_error}")
-                return self._fallback_to_plain_text(record)
+                return fallback(record)
+
+            return self._add_preencoded_fields(record, output, custom_fields)
 
         except Exception as e:
             # Graceful fallback for any other formatting errors (Requirement 5.2)
             self._log_formatting_error(f"JSON formatting failed: {e}")
-            return self._fallback_to_plain_text(record)
+            return fallback(record)
+
+    def _render_schema(
+        self, record: logging.LogRecord, location: dict[str, Any]
+    ) -> tuple[str, Collection[str]] | None:
+        """Render a record with the compiled schema if its custom fields fit.
+
+        Args:
+            record: LogRecord instance to format.
+            location: Source location information.
+
+        Returns:
+            JSON string and the custom field names it contains, or None when the
+            record has undeclared fields or values of undeclared types.
+        """
+        schema = self.schema
+        record_dict = record.__dict__
+        if schema is None or "custom" in record_dict:
+            return None
+        # Custom fields in record order; filterfalse() with a C predicate
+        # keeps this loop out of the interpreter
+        field_names = tuple(filterfalse(RESERVED_FIELDS.__contains__, record_dict))
+        if not schema.keys.issuperset(field_names):
+            return None
+        try:
+            output = schema.render(
+                record_dict,
+                self._format_timestamp(record),
+                record.levelname,
+                record.getMessage(),
+                location,
+                order=field_names,
+            )
+        except TypeError:
+            # Location or level values of unexpected types; the generic path copes
+            return None
+        if output is None:
+            return None
+        return output, field_names
+
+    def _add_preencoded_fields(
+        self, record: logging.LogRecord, output: _Output, custom_fields: Collection[str]
+    ) -> _Output:
+        """Splice exception, bound context and static fields into serialized JSON output.
+
+        Args:
+            record: LogRecord instance being formatted.
+            output: Serialized JSON object.
+            custom_fields: Custom field names written by the record.
+
+        Returns:
+            Serialized JSON object including the pre-encoded fields.
+        """
+        # Structured exception, rendered from a per-traceback cache
+        exception = record.__dict__.get(EXCEPTION_ATTR)
+        if exception is None and record.exc_info:
+            exception = self._render_exception(record)
+        if exception and "exception" not in custom_fields:
+            if isinstance(output, bytes):
+                output = output[:-1] + b"," + exception.encode("utf-8") + b"}"
+            else:
+                output = output[:-1] + "," + exception + "}"
+
+        # Bound context fields were serialized when bound; splice them in
+        context = record.__dict__.get(CONTEXT_ATTR)
+        if context is None:
+            context = current_context()
+        if context.fields:
+            output = self._splice_fields(output, context, custom_fields, prefix=False)
+
+        # Constant app/host/pid/version fields lead the line as a pre-encoded prefix;
+        # records from multiprocess clients carry the sending process's fields
+        static = record.__dict__.get(STATIC_FIELDS_ATTR)
+        if static is None and self.static_fields is not None:
+            static = self.static_fields.fields
+        if static is not None:
+            overridden = custom_fields
+            if context.fields:
+                overridden = context.fields.keys() | custom_fields
+            output = self._splice_fields(output, static, overridden, prefix=True)
+        return output
+
+    def _splice_fields(
+        self, output: _Output, fields: BoundContext, overridden: Collection[str], prefix: bool
+    ) -> _Output:
+        """Insert pre-serialized fields into serialized JSON output.
+
+        Args:
+            output: Serialized JSON object.
+            fields: Pre-serialized fields to add.
+            overridden: Keys already written by the record, which take precedence.
+            prefix: Insert after the opening brace instead of before the closing one.
+
+        Returns:
+            Serialized JSON object including the fields.
+        """
+        if overridden and not fields.fields.keys().isdisjoint(overridden):
+            text = fields.fragment_excluding(overridden)
+            if not text:
+                return output
+            fragment, fragment_bytes = text, text.encode("utf-8")
+        else:
+            fragment, fragment_bytes = fields.fragment, fields.fragment_bytes
+
+        if isinstance(output, bytes):
+            if prefix:
+                return b"{" + fragment_bytes + b"," + output[1:]
+            return output[:-1] + b"," + fragment_bytes + b"}"
+        if prefix:
+            return "{" + fragment + "," + output[1:]
+        return output[:-1] + "," + fragment + "}"
+
+    def capture_exception(self, record: logging.LogRecord) -> None:
+        """Render the record's exception for formatting in another process.
+
+        Handlers that drop exc_info before sending a record elsewhere must call
+        this first, since traceback objects cannot be pickled.
+
+        Args:
+            record: LogRecord instance to annotate.
+        """
+        if record.exc_info and EXCEPTION_ATTR not in record.__dict__:
+            record.__dict__[EXCEPTION_ATTR] = self._render_exception(record)
+
+    def _render_exception(self, record: logging.LogRecord) -> str:
+        """Render record.exc_info as an ``"exception"`` and ``"stack_hash"`` fragment.
+
+        Args:
+            record: LogRecord instance with exc_info.
+
+        Returns:
+            JSON fragment, or "" if the exception cannot be rendered.
+        """
+        try:
+            exceptions = self._exceptions
+            if exceptions is None:
+                # Traceback rendering is only loaded once an exception is logged
+                from .tracebacks import ExceptionRenderer  # noqa: PLC0415
+
+                exceptions = ExceptionRenderer(self.exc_frame_limit, self._get_relative_filename)
+                self._exceptions = exceptions
+            return exceptions.render(record.exc_info)  # type: ignore[arg-type]
+        except Exception as e:
+            self._log_formatting_error(f"Exception rendering failed: {e}")
+            return ""
+
+    def capture_source_location(self, record: logging.LogRecord) -> None:
+        """Capture source location on the calling thread for deferred formatting.
+
+        Handlers that format records on another thread must call this before
+        handing the record off, since the call stack is only available here.
+
+        Args:
+            record: LogRecord instance to annotate.
+        """
+        record.__dict__[LOCATION_ATTR] = self._extract_source_location(record)
 
     def _extract_source_location(self, record: logging.LogRecord) -> dict[str, Any]:
         """Extract module, filename, function_name, and line from call stack.
@@ -65,6 +479,18 @@ class SourceLocationJSONFormatter(logging.Formatter):
         Returns:
             Dictionary with source location fields.
         """
+        captured = record.__dict__.get(LOCATION_ATTR)
+        if captured is not None:
+            return captured  # type: ignore[no-any-return]
+
+        # Synthetic records (filter summaries) are emitted far from the code
+        # they report on, so the stack would credit an unrelated caller
+        if (
+            self.source_location == SOURCE_LOCATION_RECORD
+            or RECORD_LOCATION_ATTR in record.__dict__
+        ):
+            return self._extract_record_location(record)
+
         try:
             # Start from the current frame and walk up the stack
             frame: FrameType | None = sys._getframe()
@@ -77,11 +503,7 @@ class SourceLocationJSONFormatter(logging.Formatter):
                 function_name = frame.f_code.co_name
 
                 # Skip logging internals and our own formatter methods
-                if not self._is_logging_internal(filename) and function_name not in [
-                    "format",
-                    "_extract_source_location",
-                    "_build_json_record",
-                ]:
+                if not self._is_internal_frame(filename, function_name):
                     # This should be the user code that called the logger
                     module_name = frame.f_globals.get("__name__", "unknown")
                     relative_filename = self._get_relative_filename(frame.f_code.co_filename)
@@ -119,6 +541,74 @@ class SourceLocationJSONFormatter(logging.Formatter):
                 "line": 0,
             }
 
+    def _extract_record_location(self, record: logging.LogRecord) -> dict[str, Any]:
+        """Build source location from the fields logging stored on the record.
+
+        Args:
+            record: LogRecord instance containing call information.
+
+        Returns:
+            Dictionary with source location fields.
+        """
+        try:
+            pathname = record.pathname
+            function_name = record.funcName or "unknown"
+
+            key = (pathname, function_name)
+            module_name = self._record_modules.get(key)
+            if module_name is None:
+                module_name = self._module_name_for_path(pathname, record)
+                self._record_modules.put(key, module_name)
+
+            return {
+                "module": module_name,
+                "filename": self._get_relative_filename(pathname),
+                "function_name": function_name,
+                "line": record.lineno,
+            }
+        except Exception:
+            return {
+                "module": "unknown",
+                "filename": "unknown",
+                "function_name": "unknown",
+                "line": 0,
+            }
+
+    def _module_name_for_path(self, pathname: str, record: logging.LogRecord) -> str:
+        """Find the imported module whose source file is pathname.
+
+        Args:
+            pathname: Source file path from the record.
+            record: LogRecord instance used for the fallback name.
+
+        Returns:
+            Module name, or the logger name if no loaded module matches.
+        """
+        for name, module in list(sys.modules.items()):
+            if getattr(module, "__file__", None) == pathname and name != "__main__":
+                return name
+        main_module = sys.modules.get("__main__")
+        if getattr(main_module, "__file__", None) == pathname:
+            return "__main__"
+        return getattr(record, "name", "unknown") or "unknown"
+
+    def _is_internal_frame(self, filename: str, function_name: str) -> bool:
+        """Check (with memoization) whether a frame should be skipped.
+
+        Args:
+            filename: Code object filename.
+            function_name: Code object name.
+
+        Returns:
+            True if the frame is logging or formatter internals.
+        """
+        key = (filename, function_name)
+        internal = self._internal_frames.get(key)
+        if internal is None:
+            internal = function_name in _FORMATTER_FUNCTIONS or self._is_logging_internal(filename)
+            self._internal_frames.put(key, internal)
+        return internal
+
     def _build_json_record(
         self, record: logging.LogRecord, location: dict[str, Any]
     ) -> dict[str, Any]:
@@ -142,20 +632,17 @@ class SourceLocationJSONFormatter(logging.Formatter):
             "line": location["line"],
         }
 
-    def _format_timestamp(self, record: logging.LogRecord) -> str:
+    def _format_timestamp(self, record: logging.LogRecord) -> str | int:
         """Format timestamp in ISO 8601 format with microsecond precision.
 
         Args:
             record: LogRecord instance.
 
         Returns:
-            ISO 8601 formatted timestamp string.
+            ISO 8601 formatted timestamp string, or an integer epoch timestamp
+            when an epoch timestamp format is configured.
         """
-        # Convert the record's created timestamp to datetime
-        dt = datetime.datetime.fromtimestamp(record.created, tz=datetime.timezone.utc)
-
-        # Format with microsecond precision
-        return dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        return self._timestamps.format(record.created)
 
     def _handle_custom_fields(self, record: logging.LogRecord) -> dict[str, Any]:
         """Extract and merge custom fields from extra and custom parameters.
@@ -166,80 +653,55 @@ class SourceLocationJSONFormatter(logging.Formatter):
         Returns:
             Dictionary of custom fields to merge into JSON output.
         """
-        custom_fields = {}
-
-        # Standard fields that should not be overridden
-        standard_fields = {
-            "timestamp",
-            "level",
-            "message",
-            "module",
-            "filename",
-            "function_name",
-            "line",
-            "name",
-            "msg",
-            "args",
-            "levelname",
-            "levelno",
-            "pathname",
-            "lineno",
-            "funcName",
-            "created",
-            "msecs",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "processName",
-            "process",
-            "stack_info",
-            "exc_info",
-            "exc_text",
-            "taskName",  # pytest-related field
-            "custom",  # Don't include the custom parameter itself as a field
-        }
+        custom_fields: dict[str, Any] = {}
 
         # Handle custom parameter for convenience (Requirement 6.2)
-        if hasattr(record, "custom") and isinstance(record.custom, dict):
-            for key, value in record.custom.items():
-                if key not in standard_fields:
-                    try:
-                        # Ensure the value is JSON serializable
-                        json.dumps(value)
-                        custom_fields[key] = value
-                    except (TypeError, ValueError, RecursionError) as e:
-                        # Skip non-serializable values gracefully (Requirement 6.5)
-                        self._log_formatting_error(
-                            f"Skipping non-serializable custom field '{key}': {e}"
-                        )
-                        continue
-                    except Exception as e:
-                        # Catch-all for any other serialization errors
-                        self._log_formatting_error(
-                            f"Unexpected error with custom field '{key}': {e}"
-                        )
-                        continue
+        custom = record.__dict__.get("custom")
+        if isinstance(custom, dict):
+            for key, value in custom.items():
+                if key not in RESERVED_FIELDS:
+                    self._add_custom_field(custom_fields, key, value, "custom")
 
         # Extract custom fields from record.__dict__ (extra parameter support - Requirement 6.1)
         for key, value in record.__dict__.items():
-            if key not in standard_fields:
-                try:
-                    # Ensure the value is JSON serializable
-                    json.dumps(value)
-                    custom_fields[key] = value
-                except (TypeError, ValueError, RecursionError) as e:
-                    # Skip non-serializable values gracefully (Requirement 6.5)
-                    self._log_formatting_error(
-                        f"Skipping non-serializable extra field '{key}': {e}"
-                    )
-                    continue
-                except Exception as e:
-                    # Catch-all for any other serialization errors
-                    self._log_formatting_error(f"Unexpected error with extra field '{key}': {e}")
-                    continue
+            if key not in RESERVED_FIELDS:
+                self._add_custom_field(custom_fields, key, value, "extra")
 
         return custom_fields
 
+    def _add_custom_field(
+        self, custom_fields: dict[str, Any], key: str, value: object, source: str
+    ) -> None:
+        """Add value to custom_fields if it can be serialized.
+
+        Primitive values are always serializable and are added without a probe;
+        other values are test-encoded with the configured default encoder.
+
+        Args:
+            custom_fields: Dictionary being built for the JSON output.
+            key: Field name.
+            value: Field value.
+            source: "extra" or "custom", used in error messages.
+        """
+        if type(value) in _JSON_PRIMITIVE_TYPES:
+            custom_fields[key] = value
+            return
+
+        try:
+            # Ensure the value is JSON serializable
+            self._backend.dumps(value)
+            custom_fields[key] = value
+        except (TypeError, ValueError, RecursionError) as e:
+            # Skip non-serializable values gracefully (Requirement 6.5)
+            self._log_formatting_error(f"Skipping non-serializable {source} field '{key}': {e}")
+            if self.metrics is not None:
+                self.metrics.count_dropped_field()
+        except Exception as e:
+            # Catch-all for any other serialization errors
+            self._log_formatting_error(f"Unexpected error with {source} field '{key}': {e}")
+            if self.metrics is not None:
+                self.metrics.count_dropped_field()
+
     def _is_logging_internal(self, filename: str) -> bool:
         """Check if filename is part of logging internals.
 
@@ -262,20 +724,82 @@ class SourceLocationJSONFormatter(logging.Formatter):
 
         return any(path in filename for path in logging_paths)
 
+    def precompute_relative_filenames(self) -> None:
+        """Fill the relative filename cache for all already-imported modules."""
+        cwd = self._current_cwd()
+        for module in list(sys.modules.values()):
+            filepath = getattr(module, "__file__", None)
+            if isinstance(filepath, str) and len(self._relative_names) < (
+                self._relative_names.maxsize
+            ):
+                self._relative_names.put(filepath, self._compute_relative_filename(filepath, cwd))
+        self.filenames_precomputed = True
+
+    def invalidate_filename_cache(self) -> None:
+        """Drop cached relative filenames and re-read the working directory."""
+        self._relative_names.clear()
+        self._cwd = None
+        self._cwd_checked_at = 0.0
+
     def _get_relative_filename(self, filepath: str) -> str:
         """Convert absolute filepath to relative path.
 
+        Results are cached per path; the working directory is re-checked at most
+        once per ``cwd_check_interval`` and a change clears the cache.
+
         Args:
             filepath: Absolute file path.
 
         Returns:
             Relative file path.
         """
+        cwd = self._current_cwd()
+        cached = self._relative_names.get(filepath)
+        if cached is not None:
+            return cached
+
+        relative = self._compute_relative_filename(filepath, cwd)
+        self._relative_names.put(filepath, relative)
+        return relative
+
+    def _current_cwd(self) -> Path | None:
+        """Return the working directory, invalidating the filename cache on change.
+
+        Returns:
+            Current working directory, or None if it cannot be determined.
+        """
+        now = time.monotonic()
+        if self._cwd is not None and now - self._cwd_checked_at < self.cwd_check_interval:
+            return self._cwd
+
+        try:
+            cwd: Path | None = Path.cwd()
+        except Exception:
+            cwd = None
+
+        if cwd != self._cwd:
+            self._relative_names.clear()
+            self._cwd = cwd
+        self._cwd_checked_at = now
+        return cwd
+
+    def _compute_relative_filename(self, filepath: str, cwd: Path | None) -> str:
+        """Convert absolute filepath to a path relative to cwd.
+
+        Args:
+            filepath: Absolute file path.
+            cwd: Working directory to make the path relative to.
+
+        Returns:
+            Relative file path, or the bare filename when outside cwd.
+        """
         try:
             path = Path(filepath)
+            if cwd is None:
+                return path.name
             # Try to make it relative to current working directory
             try:
-                return str(path.relative_to(Path.cwd()))
+                return str(path.relative_to(cwd))
             except ValueError:
                 # If not under cwd, just return the filename
                 return path.name
@@ -291,6 +815,8 @@ class SourceLocationJSONFormatter(logging.Formatter):
         Returns:
             Plain text formatted log string.
         """
+        if self.metrics is not None:
+            self.metrics.count_fallback()
         try:
             # Try to get the formatted message safely
             message = record.getMessage()
@@ -2,18 +2,109 @@
 
 from __future__ import annotations
 
+import dataclasses
 from datetime import datetime
 import logging
 from pathlib import Path
 import sys
 import tempfile
-from typing import TYPE_CHECKING, TextIO
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, ClassVar, TextIO
 
 from .exceptions import HandlerError
-from .formatters import SourceLocationJSONFormatter
+from .formatters import JSON_DEFAULT_ENCODERS, SourceLocationJSONFormatter
 
 if TYPE_CHECKING:
+    from .async_handler import AsyncQueueHandler
     from .config import LogConfig
+    from .multiprocess import CollectorClientHandler
+    from .network import NetworkHandler
+
+    # Entry of HandlerFactory._FILE_OUTPUTS
+    _FileOutput = tuple[
+        str,
+        Callable[[LogConfig], bool],
+        Callable[["HandlerFactory", LogConfig], logging.Handler],
+        bool,
+    ]
+
+
+class BytesStreamHandler(logging.Handler):
+    """Handler writing UTF-8 JSON bytes straight to a binary stream.
+
+    Uses SourceLocationJSONFormatter.format_bytes so backends that encode to
+    bytes natively skip the str round-trip.
+    """
+
+    terminator = b"\n"
+
+    def __init__(self, stream: BinaryIO, text_stream: TextIO | None = None) -> None:
+        """Initialize BytesStreamHandler.
+
+        Args:
+            stream: Binary stream to write to.
+            text_stream: Text wrapper around stream, flushed before each write so
+                output interleaves correctly with text written elsewhere.
+        """
+        super().__init__()
+        self.stream = stream
+        self._text_stream = text_stream
+        self.bytes_written = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write formatted record bytes followed by a newline.
+
+        Args:
+            record: LogRecord instance to emit.
+        """
+        try:
+            formatter = self.formatter
+            if isinstance(formatter, SourceLocationJSONFormatter):
+                data = formatter.format_bytes(record)
+            else:
+                data = self.format(record).encode("utf-8")
+            if self._text_stream is not None:
+                self._text_stream.flush()
+            self.stream.write(data + self.terminator)
+            self.bytes_written += len(data) + 1
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush the underlying stream."""
+        self.acquire()
+        try:
+            if self.stream:
+                self.stream.flush()
+        finally:
+            self.release()
+
+
+class BytesFileHandler(BytesStreamHandler):
+    """Append-only file handler writing JSON bytes without text encoding."""
+
+    def __init__(self, filename: Path) -> None:
+        """Initialize BytesFileHandler.
+
+        Args:
+            filename: Path of the log file to append to.
+        """
+        self.baseFilename = str(filename)
+        super().__init__(filename.open("ab"))
+
+    def close(self) -> None:
+        """Close the file."""
+        self.acquire()
+        try:
+            try:
+                self.flush()
+            finally:
+                self.stream.close()
+        finally:
+            self.release()
+        super().close()
 
 
 class HandlerFactory:
@@ -22,16 +113,30 @@ class HandlerFactory:
     def __init__(self) -> None:
         """Initialize HandlerFactory."""
         self._formatter = SourceLocationJSONFormatter()
+        self._formatters: dict[tuple[tuple[str, Any], ...], SourceLocationJSONFormatter] = {}
+        self._reported_conflicts: set[tuple[str, ...]] = set()
 
-    def create_console_handler(self) -> logging.StreamHandler[TextIO]:
+    def create_console_handler(
+        self, config: LogConfig | None = None
+    ) -> logging.StreamHandler[TextIO] | BytesStreamHandler:
         """Create stdout handler with JSON formatter.
 
+        Args:
+            config: Optional LogConfig selecting formatter options.
+
         Returns:
-            Configured StreamHandler for stdout.
+            Configured StreamHandler for stdout, or a BytesStreamHandler on the
+            binary stdout buffer when JSON bytes output is configured.
         """
         try:
+            stdout_buffer = getattr(sys.stdout, "buffer", None)
+            if config is not None and config.json_bytes and stdout_buffer is not None:
+                bytes_handler = BytesStreamHandler(stdout_buffer, text_stream=sys.stdout)
+                bytes_handler.setFormatter(self.get_formatter(config))
+                return bytes_handler
+
             handler = logging.StreamHandler(sys.stdout)
-            handler.setFormatter(self._formatter)
+            handler.setFormatter(self.get_formatter(config))
             # Enable immediate flush for real-time log visibility
             original_flush = handler.flush
 
@@ -45,14 +150,22 @@ class HandlerFactory:
             msg = f"Failed to create console handler: {e}"
             raise HandlerError(msg) from e
 
-    def create_file_handler(self, config: LogConfig) -> logging.FileHandler | None:
+    def create_file_handler(self, config: LogConfig) -> logging.Handler | None:
         """Create file handler with graceful fallback on failure.
 
+        The first file output enabled in _FILE_OUTPUTS is used. When several
+        mutually exclusive outputs are configured, the ones ignored are
+        reported once.
+
         Args:
             config: LogConfig instance with file logging configuration.
 
         Returns:
-            FileHandler instance if successful, None if fallback needed.
+            FileHandler instance if successful (a RotatingFileHandler,
+            MmapFileHandler, BinaryFileHandler, CompressedFileHandler or
+            BufferedFileHandler when rotation, memory-mapped, binary,
+            compressed or buffered file output is configured), None if
+            fallback needed.
         """
         if not config.log_to_file:
             return None
@@ -65,32 +178,349 @@ class HandlerFactory:
                 )
                 return None
 
-            # Generate log filename
-            log_filename = self._generate_log_filename(config)
-            log_filepath = config.log_file_dir / log_filename
+            enabled = [output for output in self._FILE_OUTPUTS if output[1](config)]
+            self._report_file_output_conflict(
+                [setting for setting, _, _, exclusive in enabled if exclusive]
+            )
+            if enabled:
+                return enabled[0][2](self, config)
+            return self._create_plain_file_handler(config)
 
-            # Create file handler
-            handler = logging.FileHandler(log_filepath, mode="a", encoding="utf-8")
-            handler.setFormatter(self._formatter)
+        except (OSError, PermissionError) as e:
+            self._log_handler_error(f"File logging failed, using stdout only: {e}")
+            return None
+        except Exception as e:
+            self._log_handler_error(f"Unexpected error creating file handler: {e}")
+            return None
 
-            # Enable immediate flush for real-time log visibility
-            original_flush = handler.flush
+    def _report_file_output_conflict(self, settings: list[str]) -> None:
+        """Warn once that exclusive file outputs beyond the first are ignored.
 
-            def custom_flush() -> None:
-                if handler.stream:
-                    handler.stream.flush()
-                original_flush()
+        Args:
+            settings: Enabled exclusive file output settings in precedence order.
+        """
+        conflict = tuple(settings)
+        if len(conflict) <= 1 or conflict in self._reported_conflicts:
+            return
+        self._reported_conflicts.add(conflict)
+        self._log_handler_error(
+            f"{' and '.join(conflict)} cannot be combined; "
+            f"using {conflict[0]} and ignoring {', '.join(conflict[1:])}"
+        )
 
-            handler.flush = custom_flush  # type: ignore[method-assign]
+    def _create_rotating_handler(self, config: LogConfig) -> logging.Handler:
+        """Create the hourly and size-based rotating file handler.
 
-            return handler
+        Args:
+            config: LogConfig instance with file logging configuration.
 
-        except (OSError, PermissionError) as e:
-            self._log_handler_error(f"File logging failed, using stdout only: {e}")
+        Returns:
+            Configured RotatingFileHandler.
+        """
+        # gzip and shutil are only loaded when rotation is configured
+        from .rotating_handler import RotatingFileHandler  # noqa: PLC0415
+
+        handler = RotatingFileHandler(
+            config.log_file_dir,
+            config.app_name,
+            max_bytes=config.file_max_bytes,
+            backup_count=config.file_backup_count,
+            compress=config.file_compress,
+            batch_bytes=config.file_batch_bytes if config.file_buffered else 0,
+            batch_interval=config.file_batch_interval_ms / 1000,
+        )
+        handler.setFormatter(self.get_formatter(config))
+        return handler
+
+    def _create_mmap_handler(self, config: LogConfig) -> logging.Handler:
+        """Create the memory-mapped file handler.
+
+        Args:
+            config: LogConfig instance with file logging configuration.
+
+        Returns:
+            Configured MmapFileHandler.
+        """
+        # mmap is only loaded when memory-mapped output is configured
+        from .mmap_handler import MmapFileHandler  # noqa: PLC0415
+
+        handler = MmapFileHandler(
+            config.log_file_dir,
+            config.app_name,
+            segment_bytes=config.file_segment_bytes,
+            sync_interval=config.file_sync_interval_ms / 1000,
+        )
+        handler.setFormatter(self.get_formatter(config))
+        return handler
+
+    def _create_binary_handler(self, config: LogConfig) -> logging.Handler:
+        """Create the binary encoding file handler.
+
+        Args:
+            config: LogConfig instance with file logging configuration.
+
+        Returns:
+            Configured BinaryFileHandler.
+        """
+        # The binary encoding is only loaded when binary files are configured
+        from .binary import BINARY_SUFFIX, BinaryFileHandler  # noqa: PLC0415
+
+        log_filename = self._generate_log_filename(config)
+        handler = BinaryFileHandler(
+            config.log_file_dir / (log_filename + BINARY_SUFFIX),
+            batch_bytes=config.file_batch_bytes if config.file_buffered else 0,
+            batch_interval=config.file_batch_interval_ms / 1000,
+        )
+        handler.setFormatter(self.get_formatter(config))
+        return handler
+
+    def _create_compressed_handler(self, config: LogConfig) -> logging.Handler:
+        """Create the compressed file handler.
+
+        Args:
+            config: LogConfig instance with file logging configuration.
+
+        Returns:
+            Configured CompressedFileHandler.
+        """
+        # Codecs are only loaded when compressed output is configured
+        from .compressed import CompressedFileHandler, get_codec  # noqa: PLC0415
+
+        codec = get_codec(config.file_compression)
+        if config.file_compression not in ("auto", codec.name):
+            self._log_handler_error(
+                f"{config.file_compression} is not installed, compressing with {codec.name}"
+            )
+        log_filename = self._generate_log_filename(config)
+        handler = CompressedFileHandler(
+            config.log_file_dir / (log_filename + codec.suffix),
+            codec=codec,
+            block_bytes=config.file_block_bytes,
+            block_interval=config.file_block_interval_ms / 1000,
+        )
+        handler.setFormatter(self.get_formatter(config))
+        return handler
+
+    def _create_buffered_handler(self, config: LogConfig) -> logging.Handler:
+        """Create the batching file handler.
+
+        Args:
+            config: LogConfig instance with file logging configuration.
+
+        Returns:
+            Configured BufferedFileHandler.
+        """
+        from .buffered_handler import BufferedFileHandler  # noqa: PLC0415
+
+        handler = BufferedFileHandler(
+            config.log_file_dir / self._generate_log_filename(config),
+            batch_bytes=config.file_batch_bytes,
+            batch_interval=config.file_batch_interval_ms / 1000,
+        )
+        handler.setFormatter(self.get_formatter(config))
+        return handler
+
+    def _create_bytes_handler(self, config: LogConfig) -> logging.Handler:
+        """Create the file handler writing JSON bytes.
+
+        Args:
+            config: LogConfig instance with file logging configuration.
+
+        Returns:
+            Configured BytesFileHandler.
+        """
+        handler = BytesFileHandler(config.log_file_dir / self._generate_log_filename(config))
+        handler.setFormatter(self.get_formatter(config))
+        return handler
+
+    def _create_plain_file_handler(self, config: LogConfig) -> logging.Handler:
+        """Create the standard library file handler used when no other output is set.
+
+        Args:
+            config: LogConfig instance with file logging configuration.
+
+        Returns:
+            Configured FileHandler flushing after every record.
+        """
+        log_filepath = config.log_file_dir / self._generate_log_filename(config)
+        handler = logging.FileHandler(log_filepath, mode="a", encoding="utf-8")
+        handler.setFormatter(self.get_formatter(config))
+
+        # Enable immediate flush for real-time log visibility
+        original_flush = handler.flush
+
+        def custom_flush() -> None:
+            if handler.stream:
+                handler.stream.flush()
+            original_flush()
+
+        handler.flush = custom_flush  # type: ignore[method-assign]
+
+        return handler
+
+    # File outputs in precedence order: setting, whether config enables it,
+    # factory, and whether it excludes the outputs after it. Buffering and
+    # JSON bytes only pick the handler when no exclusive output is set
+    _FILE_OUTPUTS: ClassVar[tuple[_FileOutput, ...]] = (
+        ("LOG_FILE_ROTATE", lambda config: config.file_rotate, _create_rotating_handler, True),
+        ("LOG_FILE_MMAP", lambda config: config.file_mmap, _create_mmap_handler, True),
+        (
+            "LOG_FILE_FORMAT=binary",
+            lambda config: config.file_format == "binary",
+            _create_binary_handler,
+            True,
+        ),
+        (
+            "LOG_FILE_COMPRESSION",
+            lambda config: bool(config.file_compression),
+            _create_compressed_handler,
+            True,
+        ),
+        ("LOG_FILE_BUFFERED", lambda config: config.file_buffered, _create_buffered_handler, False),
+        ("LOG_JSON_BYTES", lambda config: config.json_bytes, _create_bytes_handler, False),
+    )
+
+    def get_formatter(self, config: LogConfig | None = None) -> SourceLocationJSONFormatter:
+        """Get the shared formatter for the formatter options in config.
+
+        Args:
+            config: Optional LogConfig; None returns the default formatter.
+
+        Returns:
+            SourceLocationJSONFormatter configured for config.
+        """
+        if config is None:
+            return self._formatter
+
+        options: dict[str, Any] = {
+            "source_location": config.source_location,
+            "json_default": JSON_DEFAULT_ENCODERS.get(config.json_default),
+            "timestamp_format": config.timestamp_format,
+            "json_backend": config.json_backend,
+            "exc_frame_limit": config.exc_frame_limit,
+        }
+        static_key = (config.app_name, config.service_version) if config.static_fields else None
+        key = (
+            *sorted(options.items()),
+            ("static_fields", static_key),
+            ("schema", config.log_schema),
+        )
+        formatter = self._formatters.get(key)
+        if formatter is None:
+            if config.log_schema:
+                from .schema import compile_schema, parse_schema  # noqa: PLC0415
+
+                # The render function is generated once per schema specification
+                options["schema"] = compile_schema(parse_schema(config.log_schema))
+            if static_key is not None:
+                from .static_fields import StaticFields  # noqa: PLC0415
+
+                # Compiled once here; every record reuses the encoded prefix
+                options["static_fields"] = StaticFields(
+                    config.app_name, version=config.service_version
+                )
+            formatter = SourceLocationJSONFormatter(**options)
+            self._formatters[key] = formatter
+        if config.precompute_filenames and not formatter.filenames_precomputed:
+            formatter.precompute_relative_filenames()
+        return formatter
+
+    def create_async_handler(
+        self, config: LogConfig, targets: list[logging.Handler]
+    ) -> AsyncQueueHandler | None:
+        """Wrap target handlers in a queue drained by a dedicated writer thread.
+
+        Args:
+            config: LogConfig instance with async queue configuration.
+            targets: Handlers that format and write records on the writer thread.
+
+        Returns:
+            AsyncQueueHandler instance if successful, None if fallback needed.
+        """
+        # The queue and writer thread are only loaded when async logging is configured
+        from .async_handler import AsyncQueueHandler  # noqa: PLC0415
+
+        try:
+            return AsyncQueueHandler(
+                targets,
+                self.get_formatter(config),
+                queue_size=config.async_queue_size,
+                overflow=config.async_overflow,
+            )
+        except Exception as e:
+            self._log_handler_error(f"Async logging failed, writing synchronously: {e}")
+            return None
+
+    def create_collector_handler(self, config: LogConfig) -> CollectorClientHandler | None:
+        """Create a handler sending records to the multiprocess log collector.
+
+        The collector runs in whichever process connects first and writes the
+        log file through a batched file handler created from config.
+
+        Args:
+            config: LogConfig instance with file logging configuration.
+
+        Returns:
+            CollectorClientHandler instance if supported, None if fallback needed.
+        """
+        # Sockets and pickling are only loaded by processes that use the collector
+        from .multiprocess import (  # noqa: PLC0415
+            CollectorClientHandler,
+            collector_address,
+            multiprocess_supported,
+        )
+
+        if not multiprocess_supported():
+            self._log_handler_error("Multiprocess logging is not supported here, writing directly")
             return None
+
+        try:
+            if not self._ensure_log_directory(config.log_file_dir):
+                return None
+            collector_config = dataclasses.replace(config, multiprocess=False, file_buffered=True)
+
+            def make_targets() -> list[logging.Handler]:
+                file_handler = self.create_file_handler(collector_config)
+                return [file_handler] if file_handler is not None else []
+
+            return CollectorClientHandler(
+                collector_address(config.log_file_dir, config.app_name),
+                self.get_formatter(config),
+                make_targets,
+            )
         except Exception as e:
-            self._log_handler_error(f"Unexpected error creating file handler: {e}")
+            self._log_handler_error(f"Multiprocess logging failed, writing directly: {e}")
+            return None
+
+    def create_network_handler(self, config: LogConfig) -> NetworkHandler | None:
+        """Create a handler shipping records to the collector at config.ship_address.
+
+        Batches that cannot be sent are spooled under config.log_file_dir
+        unless spooling is disabled.
+
+        Args:
+            config: LogConfig instance with log shipping configuration.
+
+        Returns:
+            NetworkHandler instance, or None if the address is invalid.
+        """
+        # Sockets and the sender thread are only loaded when shipping is configured
+        from .network import NetworkHandler  # noqa: PLC0415
+
+        spool_dir = config.log_file_dir / f"{config.app_name}_spool" if config.ship_spool else None
+        try:
+            network_handler = NetworkHandler(
+                config.ship_address,
+                spool_dir=spool_dir,
+                batch_bytes=config.ship_batch_bytes,
+                batch_interval=config.ship_batch_interval_ms / 1000,
+                spool_max_bytes=config.ship_spool_max_bytes,
+            )
+        except ValueError as e:
+            self._log_handler_error(f"Log shipping disabled: {e}")
             return None
+        network_handler.setFormatter(self.get_formatter(config))
+        return network_handler
 
     def _generate_log_filename(self, config: LogConfig) -> str:
         """Generate log filename using pattern {APP_NAME}_{date}_{hour}.log.
@@ -0,0 +1,253 @@
+"""JSON encoder backends for mypylogger.
+
+The standard library encoder is always available and the default. orjson,
+msgspec and ujson are used when installed and selected (or auto-detected
+with "auto"); mypylogger never requires them. Objects an optional backend
+rejects, such as integers beyond 64 bits, are encoded by the standard
+library instead. Output still differs in a few edge cases: orjson and
+msgspec write NaN and infinity as null and may write floats in another
+notation (1e16 rather than 1e+16).
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from typing import Any, Callable
+
+# Backend names
+BACKEND_AUTO = "auto"
+BACKEND_STDLIB = "stdlib"
+BACKEND_ORJSON = "orjson"
+BACKEND_MSGSPEC = "msgspec"
+BACKEND_UJSON = "ujson"
+
+# Preference order for auto-detection, fastest first
+AUTO_DETECT_ORDER = (BACKEND_ORJSON, BACKEND_MSGSPEC, BACKEND_UJSON)
+
+VALID_BACKENDS = frozenset(
+    {BACKEND_AUTO, BACKEND_STDLIB, BACKEND_ORJSON, BACKEND_MSGSPEC, BACKEND_UJSON}
+)
+
+
+class JSONBackend:
+    """Standard library JSON encoder; base class for the optional backends.
+
+    Encoding errors are raised as TypeError, ValueError or RecursionError so
+    callers can treat every backend alike.
+    """
+
+    name = BACKEND_STDLIB
+    native_bytes = False  # True when the encoder produces bytes without a str round-trip
+
+    def __init__(self, default: Callable[[Any], Any] | None = None) -> None:
+        """Initialize JSONBackend.
+
+        Args:
+            default: Encoder for values the backend cannot serialize natively.
+        """
+        self.default = default
+
+    def dumps(self, obj: object) -> str:
+        """Serialize obj to a compact JSON string.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            JSON string.
+        """
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=self.default)
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        """Serialize obj to compact UTF-8 encoded JSON.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            UTF-8 encoded JSON bytes.
+        """
+        return self.dumps(obj).encode("utf-8")
+
+    def _stdlib_dumps(self, obj: object) -> str:
+        """Serialize obj with the standard library encoder.
+
+        Used by the optional backends for objects they reject.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            JSON string.
+        """
+        # The base dumps, which the optional backends override
+        return JSONBackend.dumps(self, obj)
+
+
+class OrjsonBackend(JSONBackend):
+    """orjson encoder."""
+
+    name = BACKEND_ORJSON
+    native_bytes = True
+
+    def __init__(self, default: Callable[[Any], Any] | None = None) -> None:
+        """Initialize OrjsonBackend.
+
+        Args:
+            default: Encoder for values orjson cannot serialize natively.
+        """
+        super().__init__(default)
+        self._orjson: Any = importlib.import_module("orjson")
+        # Match the stdlib encoder, which converts non-string keys to strings
+        self._option = self._orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: object) -> str:
+        """Serialize obj to a compact JSON string.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            JSON string.
+        """
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        """Serialize obj to compact UTF-8 encoded JSON.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            UTF-8 encoded JSON bytes.
+        """
+        try:
+            result: bytes = self._orjson.dumps(obj, default=self.default, option=self._option)
+        except (TypeError, ValueError, OverflowError):
+            # orjson.JSONEncodeError (a TypeError) covers integers beyond 64 bits
+            return self._stdlib_dumps(obj).encode("utf-8")
+        return result
+
+
+class MsgspecBackend(JSONBackend):
+    """msgspec JSON encoder."""
+
+    name = BACKEND_MSGSPEC
+    native_bytes = True
+
+    def __init__(self, default: Callable[[Any], Any] | None = None) -> None:
+        """Initialize MsgspecBackend.
+
+        Args:
+            default: Encoder for values msgspec cannot serialize natively.
+        """
+        super().__init__(default)
+        self._msgspec: Any = importlib.import_module("msgspec")
+        self._encoder = self._msgspec.json.Encoder(enc_hook=default)
+
+    def dumps(self, obj: object) -> str:
+        """Serialize obj to a compact JSON string.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            JSON string.
+        """
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        """Serialize obj to compact UTF-8 encoded JSON.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            UTF-8 encoded JSON bytes.
+        """
+        try:
+            result: bytes = self._encoder.encode(obj)
+        except (self._msgspec.EncodeError, TypeError, ValueError, OverflowError):
+            return self._stdlib_dumps(obj).encode("utf-8")
+        return result
+
+
+class UjsonBackend(JSONBackend):
+    """ujson encoder."""
+
+    name = BACKEND_UJSON
+
+    def __init__(self, default: Callable[[Any], Any] | None = None) -> None:
+        """Initialize UjsonBackend.
+
+        Args:
+            default: Encoder for values ujson cannot serialize natively.
+        """
+        super().__init__(default)
+        self._ujson: Any = importlib.import_module("ujson")
+        self._options: dict[str, Any] = {
+            "ensure_ascii": False,
+            "escape_forward_slashes": False,
+        }
+        if default is not None:
+            self._options["default"] = default
+
+    def dumps(self, obj: object) -> str:
+        """Serialize obj to a compact JSON string.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            JSON string.
+        """
+        try:
+            result: str = self._ujson.dumps(obj, **self._options)
+        except (TypeError, ValueError, OverflowError):
+            return self._stdlib_dumps(obj)
+        return result
+
+
+_BACKEND_CLASSES: dict[str, type[JSONBackend]] = {
+    BACKEND_STDLIB: JSONBackend,
+    BACKEND_ORJSON: OrjsonBackend,
+    BACKEND_MSGSPEC: MsgspecBackend,
+    BACKEND_UJSON: UjsonBackend,
+}
+
+
+def get_json_backend(
+    name: str = BACKEND_AUTO, default: Callable[[Any], Any] | None = None
+) -> JSONBackend:
+    """Create the requested JSON backend, falling back to the standard library.
+
+    Args:
+        name: Backend name, or "auto" to use the fastest installed backend.
+        default: Encoder for values the backend cannot serialize natively.
+
+    Returns:
+        JSONBackend instance. The stdlib backend is returned when the requested
+        backend is unknown or not installed.
+    """
+    candidates = AUTO_DETECT_ORDER if name == BACKEND_AUTO else (name,)
+    for candidate in candidates:
+        backend_class = _BACKEND_CLASSES.get(candidate)
+        if backend_class is None:
+            continue
+        try:
+            return backend_class(default)
+        except ImportError:
+            continue
+    return JSONBackend(default)
+
+
+def available_backends() -> list[str]:
+    """List the backends that can be used in this environment.
+
+    Returns:
+        Names of installed backends, stdlib always included.
+    """
+    available = [BACKEND_STDLIB]
+    available.extend(name for name in AUTO_DETECT_ORDER if get_json_backend(name).name == name)
+    return available
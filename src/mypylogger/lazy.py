@@ -0,0 +1,184 @@
+"""Level-gated lazy logging adapter for mypylogger."""
+
+from __future__ import annotations
+
+import logging
+import sys
+from typing import Any, Callable, Mapping, MutableMapping
+
+# Extra stacklevel so findCaller skips the level method and _log_lazy; before
+# 3.11 findCaller already started one frame above Logger._log's caller
+_ADAPTER_STACK_DEPTH = 2 if sys.version_info >= (3, 11) else 1
+
+
+class Lazy:
+    """Value computed only when a record is actually emitted.
+
+    Wrap expensive message arguments or ``extra`` values::
+
+        logger.debug("state: %s", Lazy(dump_state), extra={"size": Lazy(len, items)})
+    """
+
+    __slots__ = ("args", "func")
+
+    def __init__(self, func: Callable[..., object], *args: object) -> None:
+        """Initialize Lazy.
+
+        Args:
+            func: Callable producing the value.
+            *args: Positional arguments passed to func.
+        """
+        self.func = func
+        self.args = args
+
+    def resolve(self) -> object:
+        """Compute the value.
+
+        Returns:
+            Result of func(*args).
+        """
+        return self.func(*self.args)
+
+
+def _resolve(value: object) -> object:
+    """Resolve a Lazy value, leaving anything else untouched.
+
+    Args:
+        value: Possibly lazy value.
+
+    Returns:
+        The computed or original value.
+    """
+    if isinstance(value, Lazy):
+        return value.resolve()
+    return value
+
+
+class LazyLogger(logging.LoggerAdapter):  # type: ignore[type-arg]
+    """Logger adapter that evaluates message arguments and extras after the level check.
+
+    Message arguments and ``extra`` values may be Lazy instances, and ``extra``
+    may be a callable returning the mapping; none of them is evaluated when
+    the level is disabled. Level checks read the logger's enabled-level cache
+    directly, which logging clears whenever any level in the hierarchy changes.
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        """Initialize LazyLogger.
+
+        Args:
+            logger: Configured logger to wrap.
+        """
+        super().__init__(logger, {})
+        # logging.Logger keeps {level: enabled} and clears it on setLevel/disable
+        cache = getattr(logger, "_cache", None)
+        self._shares_cache = isinstance(cache, dict)
+        self._level_cache: dict[int, bool] = cache if isinstance(cache, dict) else {}
+
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802
+        """Check whether level is enabled, using the cached result when available.
+
+        Args:
+            level: Logging level.
+
+        Returns:
+            True if records at level are processed.
+        """
+        # Checked before the cache, like Logger.isEnabledFor; disabling a
+        # logger does not clear its cache
+        if self.logger.disabled:
+            return False
+        enabled = self._level_cache.get(level)
+        if enabled is None:
+            enabled = self.logger.isEnabledFor(level)
+            if not self._shares_cache:
+                self._level_cache[level] = enabled
+        return enabled
+
+    def setLevel(self, level: int | str) -> None:  # noqa: N802
+        """Set the level of the wrapped logger and invalidate cached level checks.
+
+        Args:
+            level: New logging level.
+        """
+        self.logger.setLevel(level)
+        self._level_cache.clear()
+
+    def debug(self, msg: object, *args: object, **kwargs: object) -> None:
+        """Log msg at DEBUG level, evaluating lazy values only if enabled."""
+        if self.isEnabledFor(logging.DEBUG):
+            self._log_lazy(logging.DEBUG, msg, args, kwargs)
+
+    def info(self, msg: object, *args: object, **kwargs: object) -> None:
+        """Log msg at INFO level, evaluating lazy values only if enabled."""
+        if self.isEnabledFor(logging.INFO):
+            self._log_lazy(logging.INFO, msg, args, kwargs)
+
+    def warning(self, msg: object, *args: object, **kwargs: object) -> None:
+        """Log msg at WARNING level, evaluating lazy values only if enabled."""
+        if self.isEnabledFor(logging.WARNING):
+            self._log_lazy(logging.WARNING, msg, args, kwargs)
+
+    def error(self, msg: object, *args: object, **kwargs: object) -> None:
+        """Log msg at ERROR level, evaluating lazy values only if enabled."""
+        if self.isEnabledFor(logging.ERROR):
+            self._log_lazy(logging.ERROR, msg, args, kwargs)
+
+    def exception(
+        self, msg: object, *args: object, exc_info: object = True, **kwargs: object
+    ) -> None:
+        """Log msg at ERROR level with exception information."""
+        if self.isEnabledFor(logging.ERROR):
+            self._log_lazy(logging.ERROR, msg, args, dict(kwargs, exc_info=exc_info))
+
+    def critical(self, msg: object, *args: object, **kwargs: object) -> None:
+        """Log msg at CRITICAL level, evaluating lazy values only if enabled."""
+        if self.isEnabledFor(logging.CRITICAL):
+            self._log_lazy(logging.CRITICAL, msg, args, kwargs)
+
+    def log(self, level: int, msg: object, *args: object, **kwargs: object) -> None:
+        """Log msg at level, evaluating lazy values only if enabled."""
+        if self.isEnabledFor(level):
+            self._log_lazy(level, msg, args, kwargs)
+
+    def process(
+        self, msg: object, kwargs: MutableMapping[str, Any]
+    ) -> tuple[object, MutableMapping[str, Any]]:
+        """Resolve a lazy message and lazy extra values.
+
+        Args:
+            msg: Log message, possibly Lazy.
+            kwargs: Keyword arguments of the logging call.
+
+        Returns:
+            Resolved message and keyword arguments.
+        """
+        extra = kwargs.get("extra")
+        if extra is not None:
+            if callable(extra):
+                extra = extra()
+            if isinstance(extra, Mapping):
+                kwargs["extra"] = {key: _resolve(value) for key, value in extra.items()}
+        return _resolve(msg), kwargs
+
+    def _log_lazy(
+        self,
+        level: int,
+        msg: object,
+        args: tuple[object, ...],
+        kwargs: MutableMapping[str, Any],
+    ) -> None:
+        """Resolve lazy values and emit the record through the wrapped logger.
+
+        Args:
+            level: Logging level, already known to be enabled.
+            msg: Log message.
+            args: Message arguments.
+            kwargs: Keyword arguments of the logging call.
+        """
+        msg, kwargs = self.process(msg, kwargs)
+        if args:
+            args = tuple(_resolve(arg) for arg in args)
+        # Point record.pathname/funcName at the caller, not at this adapter
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + _ADAPTER_STACK_DEPTH
+        self.logger._log(level, msg, args, **kwargs)
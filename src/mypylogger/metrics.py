@@ -0,0 +1,353 @@
+"""Self-instrumentation of the mypylogger pipeline.
+
+PipelineMetrics counts what the pipeline does: records logged per level,
+bytes written per handler, time spent formatting (sampled), plain text
+fallbacks, dropped non-serializable fields and queue or batch state of async
+and buffered handlers. The counters are read with snapshot() and, when a report
+interval is set, written periodically as a regular JSON log record with a
+``metrics`` field.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import logging
+from pathlib import Path
+import sys
+import threading
+import time
+from typing import Any
+import weakref
+
+from .formatters import RECORD_LOCATION_ATTR
+
+# Constants
+DEFAULT_REPORT_INTERVAL = 60.0  # Seconds between metrics records
+# Upper bounds of the formatting time histogram buckets, in microseconds
+FORMAT_TIME_BUCKETS_US = (5, 10, 25, 50, 100, 250, 500, 1000)
+_FORMAT_TIME_BOUNDS_NS = tuple(bound * 1000 for bound in FORMAT_TIME_BUCKETS_US)
+_NEVER = float("inf")  # Next report time while periodic reports are off
+
+
+class PipelineMetrics:
+    """Thread-safe counters for the logging pipeline.
+
+    Records are counted per thread in a dict only that thread writes, so the
+    per-record count takes no lock; snapshot() adds the threads' counts up.
+    Every other counter is a plain int updated and read under one lock.
+    """
+
+    def __init__(self, report_interval: float = DEFAULT_REPORT_INTERVAL) -> None:
+        """Initialize PipelineMetrics.
+
+        Args:
+            report_interval: Seconds between metrics records; 0 disables them,
+                leaving snapshot() as the only way to read the counters.
+        """
+        self._lock = threading.Lock()
+        # Counts of threads that have exited, folded in by _fold_exited()
+        self._records: dict[str, int] = {}
+        self._thread_records: list[tuple[threading.Thread, dict[str, int]]] = []
+        self._local = threading.local()
+        self._format_buckets = [0] * (len(FORMAT_TIME_BUCKETS_US) + 1)
+        self._fallbacks = 0
+        self._dropped_fields = 0
+        self._handlers: weakref.WeakKeyDictionary[logging.Handler, str] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._last_report = time.time()
+        # Checked per record without a call; infinite while reports are off
+        self._next_report = _NEVER
+        self.report_interval = report_interval
+
+    @property
+    def report_interval(self) -> float:
+        """Seconds between metrics records; 0 disables them."""
+        return self._report_interval
+
+    @report_interval.setter
+    def report_interval(self, value: float) -> None:
+        self._report_interval = value
+        self._next_report = self._last_report + value if value > 0 else _NEVER
+
+    def count_record(self, levelname: str) -> None:
+        """Count a record that passed the logger's filters.
+
+        Args:
+            levelname: Level name of the record.
+        """
+        records = self.thread_records()
+        records[levelname] = records.get(levelname, 0) + 1
+
+    def thread_records(self) -> dict[str, int]:
+        """Return the record counts of the calling thread, which only it may update.
+
+        Returns:
+            Count per level name for this thread.
+        """
+        try:
+            records: dict[str, int] = self._local.records
+        except AttributeError:
+            records = {}
+            self._local.records = records
+            with self._lock:
+                self._fold_exited()
+                self._thread_records.append((threading.current_thread(), records))
+        return records
+
+    def record_format_time(self, elapsed_ns: int) -> None:
+        """Add one formatting duration to the histogram.
+
+        Args:
+            elapsed_ns: Time spent formatting one record, in nanoseconds.
+        """
+        bucket = bisect_left(_FORMAT_TIME_BOUNDS_NS, elapsed_ns)
+        with self._lock:
+            self._format_buckets[bucket] += 1
+
+    def count_fallback(self) -> None:
+        """Count a record written as plain text because JSON formatting failed."""
+        with self._lock:
+            self._fallbacks += 1
+
+    def count_dropped_field(self) -> None:
+        """Count a custom field dropped because it could not be serialized."""
+        with self._lock:
+            self._dropped_fields += 1
+
+    def watch_handler(self, handler: logging.Handler) -> None:
+        """Report bytes written and queue or batch state of handler.
+
+        Async handlers are watched together with their target handlers.
+        Plain stdlib stream handlers get their format method wrapped to count
+        the bytes of each line, the same way the handler factory wraps their
+        flush method.
+
+        Args:
+            handler: Handler created by mypylogger.
+        """
+        if handler in self._handlers:
+            return
+        self._handlers[handler] = _handler_label(handler)
+        if not hasattr(handler, "bytes_written"):
+            _count_text_bytes(handler)
+        for target in getattr(handler, "targets", ()):
+            self.watch_handler(target)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current counters.
+
+        Returns:
+            Dictionary with ``records`` per level, ``handlers`` (bytes written
+            and queue or batch stats per handler label), ``format_time_us``
+            (count and histogram of the sampled formatting times),
+            ``fallbacks`` and ``dropped_fields``.
+        """
+        with self._lock:
+            self._fold_exited()
+            records = dict(self._records)
+            for _, thread_records in self._thread_records:
+                # Copying a dict is atomic; its thread may be counting meanwhile
+                for levelname, count in dict(thread_records).items():
+                    records[levelname] = records.get(levelname, 0) + count
+            snapshot: dict[str, Any] = {
+                "records": records,
+                "fallbacks": self._fallbacks,
+                "dropped_fields": self._dropped_fields,
+            }
+            buckets = list(self._format_buckets)
+        labels = [f"<={bound}" for bound in FORMAT_TIME_BUCKETS_US]
+        labels.append(f">{FORMAT_TIME_BUCKETS_US[-1]}")
+        snapshot["format_time_us"] = {"count": sum(buckets), "buckets": dict(zip(labels, buckets))}
+
+        handlers: dict[str, dict[str, Any]] = {}
+        for handler, label in list(self._handlers.items()):
+            entry = handlers.setdefault(label, {})
+            bytes_written = getattr(handler, "bytes_written", None)
+            if bytes_written is not None:
+                entry["bytes"] = entry.get("bytes", 0) + bytes_written
+            stats = getattr(handler, "stats", None)
+            if callable(stats):
+                try:
+                    for key, value in stats().items():
+                        entry[key] = entry.get(key, 0) + value
+                except Exception as e:
+                    self._log_metrics_error(f"Failed to read handler stats: {e}")
+        snapshot["handlers"] = handlers
+        return snapshot
+
+    def report_due(self, now: float) -> bool:
+        """Claim the next periodic report if the interval has elapsed.
+
+        Args:
+            now: Current time in seconds since the epoch.
+
+        Returns:
+            True for exactly one caller per elapsed interval.
+        """
+        if now < self._next_report:
+            return False
+        with self._lock:
+            if now < self._next_report:
+                return False
+            self._last_report = now
+            self._next_report = now + self._report_interval
+        return True
+
+    def _fold_exited(self) -> None:
+        """Move the counts of exited threads into _records; the caller holds the lock."""
+        live = []
+        for thread, thread_records in self._thread_records:
+            if thread.is_alive():
+                live.append((thread, thread_records))
+                continue
+            for levelname, count in thread_records.items():
+                self._records[levelname] = self._records.get(levelname, 0) + count
+        self._thread_records = live
+
+    def _log_metrics_error(self, message: str) -> None:
+        """Log metrics errors to stderr without affecting user logging.
+
+        Args:
+            message: Error message to log.
+        """
+        try:
+            print(f"mypylogger: {message}", file=sys.stderr)
+        except OSError:
+            # If stderr is not available or fails, silently continue
+            pass
+
+
+class MetricsFilter(logging.Filter):
+    """Logger filter counting records and scheduling the periodic metrics record.
+
+    Added after the dedup, rate limiting and sampling filters, so it counts
+    the records that are actually handled. It never drops a record. The
+    metrics record is written by a timer thread once the report interval has
+    elapsed, never from inside filter(), so it follows the record that started
+    the timer and needs no later traffic to go out.
+    """
+
+    def __init__(self, metrics: PipelineMetrics, logger: logging.Logger | None = None) -> None:
+        """Initialize MetricsFilter.
+
+        Args:
+            metrics: Counters shared by every managed logger.
+            logger: Logger whose handlers receive the metrics records; None
+                only counts.
+        """
+        super().__init__()
+        self.metrics = metrics
+        self.logger = logger
+        self._timer: threading.Timer | None = None
+        self._timer_lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Count record, starting the report timer if none is pending.
+
+        Args:
+            record: LogRecord instance to count.
+
+        Returns:
+            Always True.
+        """
+        metrics = self.metrics
+        # Inlined count_record without a lock; this runs for every handled record
+        try:
+            records = metrics._local.records
+        except AttributeError:
+            records = metrics.thread_records()
+        levelname = record.levelname
+        records[levelname] = records.get(levelname, 0) + 1
+        if self._timer is None and self.logger is not None and metrics._next_report != _NEVER:
+            with self._timer_lock:
+                if self._timer is None:
+                    # record.created spares a clock call per record
+                    self._schedule_report(metrics._next_report - record.created)
+        return True
+
+    def _schedule_report(self, delay: float) -> None:
+        """Start the report timer; the caller holds the timer lock.
+
+        Args:
+            delay: Seconds until the next report is due.
+        """
+        timer = threading.Timer(max(delay, 0.0), self._report_due)
+        timer.name = "mypylogger-metrics"
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _report_due(self) -> None:
+        """Emit the metrics record from the timer if this filter claims the report."""
+        metrics = self.metrics
+        now = time.time()
+        claimed = metrics.report_due(now)
+        with self._timer_lock:
+            self._timer = None
+            if not claimed and metrics._next_report != _NEVER:
+                # Woke before the due time or another logger's filter took this
+                # report; wait for the next one
+                self._schedule_report(metrics._next_report - now)
+        if claimed:
+            self.emit_report()
+
+    def emit_report(self) -> None:
+        """Send the current snapshot to the logger's handlers as an INFO record."""
+        if self.logger is None:
+            return
+        try:
+            report = self.logger.makeRecord(
+                self.logger.name,
+                logging.INFO,
+                __file__,
+                0,
+                "mypylogger metrics",
+                (),
+                None,
+                "emit_report",
+                {"metrics": self.metrics.snapshot()},
+            )
+            # Emitted from the timer thread; the formatter must report this
+            # function, not walk the timer's stack
+            report.__dict__[RECORD_LOCATION_ATTR] = True
+            # Straight to the handlers, so the report is not counted or filtered
+            self.logger.callHandlers(report)
+        except Exception as e:
+            self.metrics._log_metrics_error(f"Failed to emit metrics record: {e}")
+
+
+def _handler_label(handler: logging.Handler) -> str:
+    """Return the name handler's metrics are reported under.
+
+    Args:
+        handler: Watched handler.
+
+    Returns:
+        Handler class name, followed by the file name for file handlers.
+    """
+    label = type(handler).__name__
+    filename = getattr(handler, "baseFilename", None)
+    if filename:
+        label = f"{label}:{Path(filename).name}"
+    return label
+
+
+def _count_text_bytes(handler: logging.Handler) -> None:
+    """Count the UTF-8 bytes of each line a text handler writes.
+
+    Args:
+        handler: Handler writing the str returned by its format method.
+    """
+    format_text = handler.format
+    terminator = len(getattr(handler, "terminator", "\n"))
+    handler.bytes_written = 0  # type: ignore[attr-defined]
+
+    def counted_format(record: logging.LogRecord) -> str:
+        text = format_text(record)
+        size = len(text) if text.isascii() else len(text.encode("utf-8", "replace"))
+        # Handler.handle() holds the handler lock while formatting
+        handler.bytes_written += size + terminator  # type: ignore[attr-defined]
+        return text
+
+    handler.format = counted_format  # type: ignore[method-assign]
@@ -0,0 +1,320 @@
+"""Memory-mapped log file handler for mypylogger."""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+from .formatters import SourceLocationJSONFormatter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Constants
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024  # File space reserved and mapped at a time
+DEFAULT_SYNC_INTERVAL = 1.0  # Seconds between msync calls; 0 syncs every record
+SECONDS_PER_HOUR = 3600
+_SCAN_CHUNK = 64 * 1024  # Bytes read at a time when looking for the end of a reopened file
+
+
+class MmapFileHandler(logging.Handler):
+    """File handler copying encoded JSON lines straight into a mapped file.
+
+    Writes {APP_NAME}_{date}_{hour}.log like the other file handlers and
+    switches to the next file at every local hour boundary. File space is
+    reserved one segment at a time and mapped into memory, so writing a
+    record is a bytes copy with no system call. Dirty pages are written back
+    with msync every sync_interval seconds. When a file is sealed (on hour
+    rollover and on close) it is truncated to the bytes actually written.
+
+    Until then the file ends with zero bytes up to the end of the segment,
+    which tailing readers see as padding. Only one process may write a file;
+    use LOG_MULTIPROCESS to write from several processes.
+    """
+
+    terminator = b"\n"
+
+    def __init__(
+        self,
+        log_dir: Path,
+        app_name: str,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+    ) -> None:
+        """Initialize MmapFileHandler and map the file for the current hour.
+
+        Args:
+            log_dir: Directory log files are written to.
+            app_name: Application name used as the filename prefix.
+            segment_bytes: File space reserved and mapped at a time.
+            sync_interval: Seconds between msync calls; 0 syncs after every record.
+        """
+        super().__init__()
+        self.log_dir = log_dir
+        self.app_name = app_name
+        # Mapping offsets must be multiples of the allocation granularity
+        self.segment_bytes = _round_up(max(segment_bytes, 1), mmap.ALLOCATIONGRANULARITY)
+        self.sync_interval = sync_interval
+        self.bytes_written = 0
+        self.syncs = 0
+        self.segments_mapped = 0
+
+        self._fd = -1
+        self._map: mmap.mmap | None = None
+        self._base = 0  # File offset of the mapped segment
+        self._position = 0  # Write offset within the mapped segment
+        self._synced = 0  # Offset within the segment up to which msync has run
+        self._next_sync = 0.0
+        self._next_rollover = 0.0
+        self._drop_reported = False  # Whether dropping records for lack of a file was reported
+        self.baseFilename = ""
+        self._open_hour(time.time())
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Copy the encoded record into the mapped segment.
+
+        Args:
+            record: LogRecord instance to emit.
+        """
+        try:
+            formatter = self.formatter
+            if isinstance(formatter, SourceLocationJSONFormatter):
+                data = formatter.format_bytes(record) + self.terminator
+            else:
+                data = self.format(record).encode("utf-8") + self.terminator
+
+            if record.created >= self._next_rollover:
+                self._seal()
+                self._open_hour(record.created)
+            mapped = self._map
+            if mapped is None:
+                self._report_dropped()
+                return
+            end = self._position + len(data)
+            if end > len(mapped):
+                mapped = self._map_next_segment(len(data))
+                end = self._position + len(data)
+            mapped[self._position : end] = data
+            self._position = end
+            self.bytes_written += len(data)
+
+            # record.created spares a clock call per record
+            if record.created >= self._next_sync:
+                self._sync()
+                self._next_sync = record.created + self.sync_interval
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write dirty pages of the mapped segment back to the file."""
+        self.acquire()
+        try:
+            self._sync()
+        except Exception as e:
+            self._log_handler_error(f"msync failed: {e}")
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Sync, truncate the file to its written length and close it."""
+        self.acquire()
+        try:
+            self._seal()
+        except Exception as e:
+            self._log_handler_error(f"Failed to seal log file: {e}")
+        finally:
+            self.release()
+        super().close()
+
+    @property
+    def closed(self) -> bool:
+        """True once the file has been sealed and not reopened."""
+        return self._fd < 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return segment and sync counters.
+
+        Returns:
+            Dictionary with file_bytes, segments_mapped and syncs.
+        """
+        return {
+            "file_bytes": self._base + self._position,
+            "segments_mapped": self.segments_mapped,
+            "syncs": self.syncs,
+        }
+
+    def _open_hour(self, now: float) -> None:
+        """Open or resume the file for the hour containing now and map its end.
+
+        Args:
+            now: Seconds since the epoch.
+        """
+        local = time.localtime(now)
+        hour_start = now - (now % 60) - local.tm_min * 60
+        self._next_rollover = hour_start + SECONDS_PER_HOUR
+        path = self.log_dir / f"{self.app_name}_{time.strftime('%Y%m%d_%H', local)}.log"
+        self.baseFilename = str(path)
+
+        flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        self._fd = os.open(path, flags, 0o644)
+        try:
+            # A file left unsealed by a crash ends in zero padding; resume after the data
+            self._map_segment(_data_length(self._fd), 0)
+        except BaseException:
+            # Sealing would truncate this file to the previous file's length
+            os.close(self._fd)
+            self._fd = -1
+            raise
+        self._drop_reported = False
+
+    def _map_segment(self, offset: int, needed: int) -> mmap.mmap:
+        """Reserve and map the segment starting at offset.
+
+        Args:
+            offset: File offset the next record is written at.
+            needed: Bytes the next record needs; larger than a segment maps more.
+
+        Returns:
+            The new mapping.
+        """
+        base = offset - offset % mmap.ALLOCATIONGRANULARITY
+        length = max(self.segment_bytes, _round_up(offset - base + needed, mmap.PAGESIZE))
+        length = _round_up(length, mmap.ALLOCATIONGRANULARITY)
+        if os.fstat(self._fd).st_size < base + length:
+            _reserve(self._fd, base + length)
+        self._map = mmap.mmap(self._fd, length, offset=base)
+        self._base = base
+        self._position = offset - base
+        self._synced = self._position
+        self.segments_mapped += 1
+        return self._map
+
+    def _map_next_segment(self, needed: int) -> mmap.mmap:
+        """Sync and unmap the full segment, then map the next one.
+
+        Args:
+            needed: Bytes the next record needs.
+
+        Returns:
+            The new mapping.
+        """
+        self._sync()
+        mapped = self._map
+        self._map = None
+        if mapped is not None:
+            mapped.close()
+        return self._map_segment(self._base + self._position, needed)
+
+    def _report_dropped(self) -> None:
+        """Report once that records are dropped because no file is mapped."""
+        if self._drop_reported:
+            return
+        self._drop_reported = True
+        self._log_handler_error(
+            f"Log file {self.baseFilename} is not mapped; "
+            "dropping records until the next hour's file opens"
+        )
+
+    def _sync(self) -> None:
+        """Write back the pages written since the last sync."""
+        mapped = self._map
+        if mapped is None or self._position <= self._synced:
+            return
+        start = self._synced - self._synced % mmap.PAGESIZE
+        mapped.flush(start, self._position - start)
+        self._synced = self._position
+        self.syncs += 1
+
+    def _seal(self) -> None:
+        """Sync and unmap the current file, truncating it to the bytes written."""
+        mapped = self._map
+        self._map = None
+        if mapped is not None:
+            try:
+                mapped.flush()
+            finally:
+                mapped.close()
+        if self._fd >= 0:
+            fd = self._fd
+            self._fd = -1
+            try:
+                os.ftruncate(fd, self._base + self._position)
+            finally:
+                os.close(fd)
+
+    def _log_handler_error(self, message: str) -> None:
+        """Log handler errors to stderr without affecting user logging.
+
+        Args:
+            message: Error message to log.
+        """
+        try:
+            print(f"mypylogger: {message}", file=sys.stderr)
+        except OSError:
+            # If stderr is not available or fails, silently continue
+            pass
+
+
+def _round_up(value: int, multiple: int) -> int:
+    """Round value up to a multiple of multiple.
+
+    Args:
+        value: Value to round.
+        multiple: Positive rounding step.
+
+    Returns:
+        Smallest multiple of multiple not below value.
+    """
+    return value + -value % multiple
+
+
+def _reserve(fd: int, size: int) -> None:
+    """Grow the file to size, allocating its blocks where the OS allows.
+
+    Writing to a mapped page the filesystem cannot back kills the process
+    with SIGBUS, so disk space is claimed up front rather than on first touch.
+
+    Args:
+        fd: Open file descriptor.
+        size: New file size in bytes.
+    """
+    allocate = getattr(os, "posix_fallocate", None)
+    if allocate is not None:
+        current = os.fstat(fd).st_size
+        try:
+            allocate(fd, current, size - current)
+            return
+        except OSError:
+            # Not supported by this filesystem; fall back to a sparse extension
+            pass
+    os.ftruncate(fd, size)
+
+
+def _data_length(fd: int) -> int:
+    """Return the length of a log file without its trailing zero padding.
+
+    JSON lines never contain zero bytes, so the data ends at the last
+    non-zero byte.
+
+    Args:
+        fd: Open file descriptor.
+
+    Returns:
+        Offset just past the last written byte.
+    """
+    end = os.fstat(fd).st_size
+    while end > 0:
+        start = max(0, end - _SCAN_CHUNK)
+        os.lseek(fd, start, os.SEEK_SET)
+        chunk = os.read(fd, end - start)
+        stripped = chunk.rstrip(b"\0")
+        if stripped:
+            return start + len(stripped)
+        end = start
+    return 0
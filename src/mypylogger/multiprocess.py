@@ -0,0 +1,501 @@
+"""Multiprocess logging through a single collector for mypylogger.
+
+Every process sends its records over a local Unix socket. Whichever process
+first takes the collector lock starts a collector thread that owns the log
+file and writes all records through one batched file handler. When that
+process exits the lock is released and the next process to reconnect takes
+over, so no process writes to the log file directly.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+import logging.handlers
+import os
+from pathlib import Path
+import pickle
+import selectors
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import threading
+from typing import IO, TYPE_CHECKING, Callable
+import weakref
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+from .context import capture_context
+from .formatters import STATIC_FIELDS_ATTR
+
+if TYPE_CHECKING:
+    from .formatters import SourceLocationJSONFormatter
+
+# Constants
+FRAME_HEADER = struct.Struct(">L")  # Same framing as logging.handlers.SocketHandler
+RECEIVE_SIZE = 65536  # Bytes read from a worker connection at a time
+POLL_INTERVAL = 0.25  # Seconds between checks for collector shutdown
+SOCKET_BACKLOG = 128
+
+_collectors: dict[str, LogCollector] = {}
+_collectors_lock = threading.Lock()
+_client_handlers: weakref.WeakSet[CollectorClientHandler] = weakref.WeakSet()
+
+
+def multiprocess_supported() -> bool:
+    """Check whether Unix sockets and file locks are available.
+
+    Returns:
+        True if multiprocess logging can be used on this platform.
+    """
+    return hasattr(socket, "AF_UNIX") and fcntl is not None
+
+
+def collector_address(log_dir: Path, app_name: str) -> Path:
+    """Return the socket path shared by all processes logging to log_dir.
+
+    The path lives in a private directory under $XDG_RUNTIME_DIR or the temp
+    directory, because Unix socket paths are limited to about 100 characters.
+
+    Args:
+        log_dir: Log file directory.
+        app_name: Application name.
+
+    Returns:
+        Socket path; the collector lock file is the same path with a .lock suffix.
+
+    Raises:
+        PermissionError: If the directory exists but other users can reach it.
+    """
+    digest = hashlib.sha256(f"{log_dir.resolve()}:{app_name}".encode()).hexdigest()[:16]
+    return _private_directory() / f"{digest}.sock"
+
+
+def _private_directory() -> Path:
+    """Create or check the directory holding this user's collector sockets.
+
+    The collector unpickles whatever arrives on its socket, so neither the
+    socket nor its lock file may be reachable, or replaceable, by another user.
+
+    Returns:
+        Directory owned by the current user with mode 0700.
+
+    Raises:
+        PermissionError: If the directory is a symlink, is owned by another
+            user or is accessible to group or others.
+    """
+    uid = os.getuid()
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    directory = Path(base) / f"mypylogger-{uid}"
+    directory.mkdir(mode=0o700, exist_ok=True)
+    info = directory.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != uid or info.st_mode & 0o077:
+        msg = f"Collector directory {directory} is not private to user {uid}"
+        raise PermissionError(msg)
+    return directory
+
+
+class LogCollector:
+    """Receives pickled records from worker processes and writes them to targets."""
+
+    def __init__(
+        self, socket_path: Path, lock_file: IO[bytes], targets: list[logging.Handler]
+    ) -> None:
+        """Initialize LogCollector and start listening.
+
+        Args:
+            socket_path: Unix socket path to listen on.
+            lock_file: Open lock file held exclusively for the collector's lifetime.
+            targets: Handlers that format and write received records.
+        """
+        self.socket_path = socket_path
+        self.targets = list(targets)
+        self.records_received = 0
+        self._lock_file = lock_file
+        self._stop = threading.Event()
+
+        if socket_path.exists():
+            # Left behind by a collector that died; we hold the lock now
+            socket_path.unlink()
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(str(socket_path))
+        socket_path.chmod(0o600)
+        self._server.listen(SOCKET_BACKLOG)
+        self._server.setblocking(False)
+
+        self._thread = threading.Thread(
+            target=self._serve, name="mypylogger-collector", daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def try_start(
+        cls, socket_path: Path, make_targets: Callable[[], list[logging.Handler]]
+    ) -> LogCollector | None:
+        """Start the collector in this process unless another process runs it.
+
+        Args:
+            socket_path: Unix socket path to listen on.
+            make_targets: Creates the output handlers; only called in the collector.
+
+        Returns:
+            Running LogCollector, or None if another process holds the collector lock.
+        """
+        key = str(socket_path)
+        with _collectors_lock:
+            existing = _collectors.get(key)
+            if existing is not None and existing.running:
+                return existing
+
+            lock_file = socket_path.with_suffix(".lock").open("ab")
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return None
+
+            try:
+                collector = cls(socket_path, lock_file, make_targets())
+            except Exception:
+                lock_file.close()
+                raise
+            _collectors[key] = collector
+            return collector
+
+    @property
+    def running(self) -> bool:
+        """Whether the collector thread is serving connections."""
+        return self._thread.is_alive() and not self._stop.is_set()
+
+    def close(self) -> None:
+        """Stop serving, write remaining records and release the collector lock."""
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        with _collectors_lock:
+            if _collectors.get(str(self.socket_path)) is self:
+                del _collectors[str(self.socket_path)]
+        for target in self.targets:
+            self._call_target(target.close, "close")
+        self._lock_file.close()
+
+    def _serve(self) -> None:
+        """Collector thread loop: accept workers and write their records in batches."""
+        selector = selectors.DefaultSelector()
+        selector.register(self._server, selectors.EVENT_READ)
+        buffers: dict[socket.socket, bytearray] = {}
+        try:
+            while not self._stop.is_set():
+                for key, _ in selector.select(POLL_INTERVAL):
+                    if key.fileobj is self._server:
+                        self._accept(selector, buffers)
+                    else:
+                        self._receive(key.fileobj, selector, buffers)  # type: ignore[arg-type]
+                self._flush_targets()
+        except Exception as e:
+            self._log_handler_error(f"Log collector stopped: {e}")
+        finally:
+            # Pick up workers still waiting in the backlog, then read everything sent
+            while self._accept(selector, buffers):
+                pass
+            for connection in list(buffers):
+                self._receive(connection, selector, buffers, drain=True)
+            selector.close()
+            self._server.close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+            self._flush_targets()
+
+    def _accept(
+        self, selector: selectors.BaseSelector, buffers: dict[socket.socket, bytearray]
+    ) -> bool:
+        """Accept a pending worker connection.
+
+        Args:
+            selector: Selector watching the connections.
+            buffers: Partial frame buffers per connection.
+
+        Returns:
+            True if a connection was accepted.
+        """
+        try:
+            connection, _ = self._server.accept()
+        except OSError:
+            return False
+        connection.setblocking(False)
+        selector.register(connection, selectors.EVENT_READ)
+        buffers[connection] = bytearray()
+        return True
+
+    def _receive(
+        self,
+        connection: socket.socket,
+        selector: selectors.BaseSelector,
+        buffers: dict[socket.socket, bytearray],
+        drain: bool = False,
+    ) -> None:
+        """Read from a worker connection and handle every complete record.
+
+        Args:
+            connection: Worker connection that is ready to read.
+            selector: Selector watching the connections.
+            buffers: Partial frame buffers per connection.
+            drain: Keep reading until the connection has no more data.
+        """
+        buffer = buffers[connection]
+        while True:
+            try:
+                chunk = connection.recv(RECEIVE_SIZE)
+            except BlockingIOError:
+                chunk = None
+            except OSError:
+                chunk = b""
+
+            if chunk:
+                buffer.extend(chunk)
+                self._handle_frames(buffer)
+                if drain:
+                    continue
+                return
+
+            if chunk is not None:
+                # Worker disconnected
+                selector.unregister(connection)
+                connection.close()
+                del buffers[connection]
+            return
+
+    def _handle_frames(self, buffer: bytearray) -> None:
+        """Decode and write complete frames, leaving a partial frame in buffer.
+
+        Args:
+            buffer: Bytes received from one connection.
+        """
+        offset = 0
+        size = FRAME_HEADER.size
+        while len(buffer) - offset >= size:
+            (length,) = FRAME_HEADER.unpack_from(buffer, offset)
+            if len(buffer) - offset - size < length:
+                break
+            payload = bytes(buffer[offset + size : offset + size + length])
+            offset += size + length
+            try:
+                # Only processes of the same user can connect (private directory)
+                record = logging.makeLogRecord(pickle.loads(payload))  # noqa: S301
+                self.records_received += 1
+                for target in self.targets:
+                    if record.levelno >= target.level:
+                        target.handle(record)
+            except Exception as e:
+                self._log_handler_error(f"Dropping undecodable log record: {e}")
+        del buffer[:offset]
+
+    def _flush_targets(self) -> None:
+        """Flush the target handlers after each batch."""
+        for target in self.targets:
+            self._call_target(target.flush, "flush")
+
+    def _call_target(self, action: Callable[[], None], verb: str) -> None:
+        """Run a target handler method, reporting instead of raising its errors.
+
+        Args:
+            action: Bound flush or close method of a target handler.
+            verb: What action does, for the error message.
+        """
+        try:
+            action()
+        except Exception as e:
+            self._log_handler_error(f"Failed to {verb} collector target: {e}")
+
+    def _log_handler_error(self, message: str) -> None:
+        """Log handler errors to stderr without affecting user logging.
+
+        Args:
+            message: Error message to log.
+        """
+        try:
+            print(f"mypylogger: {message}", file=sys.stderr)
+        except OSError:
+            # If stderr is not available or fails, silently continue
+            pass
+
+
+class CollectorClientHandler(logging.handlers.SocketHandler):
+    """Handler that sends records to the collector over a Unix socket.
+
+    Source location, the final message and static fields are captured in the
+    sending process, so the collector's output is identical to writing the file
+    directly. If no collector is reachable, this process tries to become the
+    collector.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        formatter: SourceLocationJSONFormatter,
+        make_targets: Callable[[], list[logging.Handler]],
+    ) -> None:
+        """Initialize CollectorClientHandler.
+
+        Args:
+            socket_path: Collector socket path.
+            formatter: Formatter used to capture source location in this process.
+            make_targets: Creates the collector's output handlers if this process
+                becomes the collector.
+        """
+        super().__init__(str(socket_path), None)
+        self.socket_path = socket_path
+        self._location_formatter = formatter
+        self._make_targets = make_targets
+        self.dropped = 0
+        _client_handlers.add(self)
+
+    def makeSocket(self, timeout: float = 1) -> socket.socket:  # noqa: N802
+        """Connect to the collector, starting it in this process if none is running.
+
+        Args:
+            timeout: Connection timeout in seconds.
+
+        Returns:
+            Connected socket.
+        """
+        try:
+            return super().makeSocket(timeout)
+        except OSError:
+            LogCollector.try_start(self.socket_path, self._make_targets)
+            return super().makeSocket(timeout)
+
+    def makePickle(self, record: logging.LogRecord) -> bytes:  # noqa: N802
+        """Serialize record with its source location, final message and static fields.
+
+        Args:
+            record: LogRecord instance to send.
+
+        Returns:
+            Length-prefixed pickle of the record attributes.
+        """
+        self._location_formatter.capture_source_location(record)
+        self._location_formatter.capture_exception(record)
+        capture_context(record)
+        state = dict(record.__dict__)
+        state["msg"] = record.getMessage()
+        state["args"] = None
+        if record.exc_info and not record.exc_text:
+            state["exc_text"] = logging.Formatter().formatException(record.exc_info)
+        state["exc_info"] = None
+        state.pop("message", None)
+        static_fields = self._location_formatter.static_fields
+        if static_fields is not None:
+            # The collector writes this process's pid and host, not its own
+            state[STATIC_FIELDS_ATTR] = static_fields.fields
+
+        try:
+            payload = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Custom fields that cannot cross processes are sent as their repr
+            for key, value in state.items():
+                if not _picklable(value):
+                    state[key] = repr(value)
+            payload = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+        return FRAME_HEADER.pack(len(payload)) + payload
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Send record to the collector, counting records that could not be sent.
+
+        Args:
+            record: LogRecord instance to emit.
+        """
+        try:
+            data = self.makePickle(record)
+            self.send(data)
+            if self.sock is None:
+                # The collector may have exited; reconnect (or take over) at once
+                self.retryTime = None
+                self.send(data)
+            if self.sock is None:
+                self.dropped += 1
+                self._log_handler_error("Log collector unreachable, dropping log record")
+        except Exception:
+            self.handleError(record)
+
+    def _reset_after_fork(self) -> None:
+        """Drop the connection inherited from the parent process."""
+        sock = self.sock
+        self.sock = None
+        self.retryTime = None
+        if sock is not None:
+            sock.close()
+
+    def _log_handler_error(self, message: str) -> None:
+        """Log handler errors to stderr without affecting user logging.
+
+        Args:
+            message: Error message to log.
+        """
+        try:
+            print(f"mypylogger: {message}", file=sys.stderr)
+        except OSError:
+            # If stderr is not available or fails, silently continue
+            pass
+
+
+def _picklable(value: object) -> bool:
+    """Check whether value can be sent to the collector.
+
+    Args:
+        value: Record attribute value.
+
+    Returns:
+        True if pickle can serialize value.
+    """
+    try:
+        pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return False
+    return True
+
+
+def _close_collectors() -> None:
+    """Write remaining records and release the collector lock at interpreter exit."""
+    for collector in list(_collectors.values()):
+        collector.close()
+
+
+def _before_fork() -> None:
+    """Hold the collector registry lock so a child never inherits it mid-update."""
+    _collectors_lock.acquire()
+
+
+def _after_fork_in_parent() -> None:
+    """Release the registry lock taken before fork."""
+    _collectors_lock.release()
+
+
+def _after_fork_in_child() -> None:
+    """Reset inherited connections and collectors in a forked child process."""
+    _collectors_lock.release()
+    for handler in list(_client_handlers):
+        handler._reset_after_fork()
+    # The collector thread does not survive fork; release the child's copies
+    for collector in list(_collectors.values()):
+        collector._server.close()
+        collector._lock_file.close()
+    _collectors.clear()
+
+
+# Registered after logging's own atexit hook, so it runs before logging.shutdown
+atexit.register(_close_collectors)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_in_parent,
+        after_in_child=_after_fork_in_child,
+    )
@@ -0,0 +1,694 @@
+"""Batched network log shipping for mypylogger.
+
+NetworkHandler sends newline-delimited JSON to a log collector (syslog,
+Vector, Fluent Bit or anything else reading JSON lines from a stream
+socket) over TCP or a Unix socket. Lines are batched on the logging thread
+and sent by a background thread over one persistent connection. While the
+collector is unreachable, batches are appended to spool files and replayed
+in order once it is back.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import logging
+import os
+import queue
+import select
+import socket
+import sys
+import threading
+import time
+from typing import IO, TYPE_CHECKING, Any, BinaryIO
+import weakref
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+from .buffered_handler import DEFAULT_FLUSH_LEVEL
+from .formatters import SourceLocationJSONFormatter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Constants
+DEFAULT_BATCH_BYTES = 64 * 1024  # Send once this many bytes are pending
+DEFAULT_BATCH_INTERVAL = 1.0  # Seconds a record may wait before its batch is sent
+DEFAULT_SPOOL_MAX_BYTES = 256 * 1024 * 1024  # Oldest spool files are dropped beyond this
+DEFAULT_BACKOFF_INITIAL = 0.5  # Seconds before the first reconnection attempt
+DEFAULT_BACKOFF_MAX = 30.0  # Longest wait between reconnection attempts
+SPOOL_SEGMENT_BYTES = 4 * 1024 * 1024  # Size at which a new spool file is started
+SPOOL_SUFFIX = ".spool"
+SPOOL_LOCK_NAME = "spool.lock"  # Held by the process that owns a spool directory
+MAX_SPOOL_SLOTS = 16  # Spool directories tried while others are owned by other processes
+MAX_PORT = 65535
+CONNECT_TIMEOUT = 2.0  # Seconds to wait for a connection
+SEND_TIMEOUT = 5.0  # Seconds a send may block before the connection is given up
+MAX_QUEUED_BATCHES = 64  # Batches waiting for the sender before the logging thread waits
+SHUTDOWN_TIMEOUT = 5.0  # Seconds close() waits for the sender thread
+MIN_POLL_INTERVAL = 0.05  # Shortest sender wake-up interval
+
+_network_handlers: weakref.WeakSet[NetworkHandler] = weakref.WeakSet()
+_spool_locks: dict[Path, _SpoolLock] = {}
+_spool_locks_lock = threading.Lock()
+
+
+class _SpoolLock:
+    """Exclusive lock on a spool directory, shared by this process's handlers."""
+
+    __slots__ = ("handlers", "lock_file", "started")
+
+    def __init__(self, lock_file: IO[bytes] | None) -> None:
+        """Initialize _SpoolLock.
+
+        Args:
+            lock_file: Open lock file holding the flock, or None without fcntl.
+        """
+        self.lock_file = lock_file
+        self.handlers = 0  # Handlers currently using the directory
+        self.started = 0  # Handlers that have used it, numbering their spool files
+
+
+def _claim_spool_dir(spool_dir: Path) -> tuple[Path, int] | None:
+    """Lock spool_dir, or a numbered sibling of it, for this process.
+
+    Another process holding spool_dir's lock is still appending to and
+    replaying its files, so the next free sibling (spool_dir.1, spool_dir.2,
+    ...) is used instead. Handlers in one process share the directory.
+
+    Args:
+        spool_dir: Preferred spool directory.
+
+    Returns:
+        The claimed directory and the handler's number in it; 0 means this
+        call took the lock, so files already there were left by a process that
+        has exited. None if every slot is owned by another process.
+
+    Raises:
+        OSError: If the directory or its lock file cannot be created.
+    """
+    with _spool_locks_lock:
+        for slot in range(MAX_SPOOL_SLOTS):
+            path = spool_dir if slot == 0 else spool_dir.with_name(f"{spool_dir.name}.{slot}")
+            spool_lock = _spool_locks.get(path)
+            if spool_lock is None:
+                path.mkdir(parents=True, exist_ok=True)
+                lock_file = None
+                if fcntl is not None:
+                    lock_file = (path / SPOOL_LOCK_NAME).open("ab")
+                    try:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except OSError:
+                        # Owned by another process
+                        lock_file.close()
+                        continue
+                spool_lock = _spool_locks[path] = _SpoolLock(lock_file)
+            number = spool_lock.started
+            spool_lock.started += 1
+            spool_lock.handlers += 1
+            return path, number
+    return None
+
+
+def _release_spool_dir(spool_dir: Path) -> None:
+    """Release a handler's claim on spool_dir, unlocking it after the last one.
+
+    Args:
+        spool_dir: Directory returned by _claim_spool_dir().
+    """
+    with _spool_locks_lock:
+        spool_lock = _spool_locks.get(spool_dir)
+        if spool_lock is None:
+            return
+        spool_lock.handlers -= 1
+        if spool_lock.handlers <= 0:
+            del _spool_locks[spool_dir]
+            if spool_lock.lock_file is not None:
+                spool_lock.lock_file.close()
+
+
+def parse_address(address: str) -> tuple[int, Any]:
+    """Parse a collector address.
+
+    Args:
+        address: "unix:///path/to/socket", "tcp://host:port" or "host:port";
+            IPv6 hosts are written in brackets.
+
+    Returns:
+        socket.AF_UNIX and the socket path, or socket.AF_INET and a
+        (host, port) tuple, which is resolved to IPv4 or IPv6 on connect.
+
+    Raises:
+        ValueError: If the address is malformed or Unix sockets are unavailable.
+    """
+    if address.startswith("unix:"):
+        path = address[len("unix:") :]
+        if path.startswith("//"):
+            path = path[2:]
+        if not path:
+            msg = f"Missing socket path in log collector address: {address!r}"
+            raise ValueError(msg)
+        family = getattr(socket, "AF_UNIX", None)
+        if family is None:
+            msg = "Unix sockets are not available on this platform"
+            raise ValueError(msg)
+        return family, path
+
+    target = address[len("tcp://") :] if address.startswith("tcp://") else address
+    host, _, port = target.rpartition(":")
+    host = host[1:-1] if host.startswith("[") and host.endswith("]") else host
+    if not host or not port.isdigit() or not 0 < int(port) <= MAX_PORT:
+        msg = f"Invalid log collector address: {address!r}"
+        raise ValueError(msg)
+    return socket.AF_INET, (host, int(port))
+
+
+class NetworkHandler(logging.Handler):
+    """Handler shipping JSON lines to a collector in batches over one connection.
+
+    A batch is handed to the sender thread once batch_bytes are pending,
+    once its oldest record is batch_interval seconds old, or at once when a
+    record at flush_level or above arrives. The sender reuses its connection
+    for every batch and, after a failure, reconnects with exponential
+    backoff. Until then batches go to spool files in spool_dir (or are
+    dropped without one); after reconnecting the spool is replayed before
+    any newer batch, so the collector receives lines in the order they were
+    logged. A batch whose send failed part way is sent again in full, so a
+    line may arrive twice but is not lost while the spool has room.
+
+    The first handler in a process locks spool_dir and replays the spool
+    files an earlier run left there. While another process owns spool_dir,
+    a numbered sibling (spool_dir.1, spool_dir.2, ...) is used instead, so
+    processes never read each other's live files. Further handlers in the
+    same process, and forked children, share the directory under file names
+    prefixed with their pid and number; the next run picks those up.
+    """
+
+    terminator = b"\n"
+
+    def __init__(
+        self,
+        address: str,
+        *,
+        spool_dir: Path | None = None,
+        batch_bytes: int = DEFAULT_BATCH_BYTES,
+        batch_interval: float = DEFAULT_BATCH_INTERVAL,
+        flush_level: int = DEFAULT_FLUSH_LEVEL,
+        spool_max_bytes: int = DEFAULT_SPOOL_MAX_BYTES,
+        backoff_initial: float = DEFAULT_BACKOFF_INITIAL,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+    ) -> None:
+        """Initialize NetworkHandler and start its sender thread.
+
+        Args:
+            address: Collector address, see parse_address().
+            spool_dir: Preferred directory for batches that could not be sent; None
+                drops them.
+            batch_bytes: Pending bytes that complete a batch; 0 sends every record.
+            batch_interval: Maximum seconds a record waits before its batch is sent.
+            flush_level: Minimum level that completes the batch at once.
+            spool_max_bytes: Spool size beyond which the oldest spool files are dropped.
+            backoff_initial: Seconds before the first reconnection attempt.
+            backoff_max: Longest wait between reconnection attempts.
+
+        Raises:
+            ValueError: If address is malformed.
+        """
+        super().__init__()
+        self.address = address
+        self._family, self._target = parse_address(address)
+        self.spool_dir = spool_dir
+        self.batch_bytes = batch_bytes
+        self.batch_interval = batch_interval
+        self.flush_level = flush_level
+        self.spool_max_bytes = spool_max_bytes
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+
+        # Logging thread state, guarded by the handler lock
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._oldest_pending = 0.0
+        self._closed = False
+
+        # Sender thread state
+        self._sock: socket.socket | None = None
+        self._backoff = 0.0
+        self._next_attempt = 0.0
+        self._outage_reported = False
+        self._spool_segments: deque[Path] = deque()
+        self._spool_file: BinaryIO | None = None
+        self._spool_file_bytes = 0
+        self._spool_bytes = 0
+        self._segment_prefix = ""
+        self._next_segment = 0
+        self._handler_number = 0
+        self._claim_spool()
+
+        self.bytes_written = 0
+        self.batches_sent = 0
+        self.connects = 0
+        self.batches_spooled = 0
+        self.batches_dropped = 0
+
+        self._batches: queue.Queue[bytes | None] = queue.Queue(maxsize=MAX_QUEUED_BATCHES)
+        self._sender = self._start_sender()
+        _network_handlers.add(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Add a formatted record to the batch, handing the batch over when due.
+
+        Args:
+            record: LogRecord instance to emit.
+        """
+        try:
+            formatter = self.formatter
+            if isinstance(formatter, SourceLocationJSONFormatter):
+                data = formatter.format_bytes(record) + self.terminator
+            else:
+                data = self.format(record).encode("utf-8") + self.terminator
+
+            now = time.monotonic()
+            if not self._pending:
+                self._oldest_pending = now
+            self._pending.append(data)
+            self._pending_bytes += len(data)
+
+            if (
+                self._pending_bytes >= self.batch_bytes
+                or record.levelno >= self.flush_level
+                or now - self._oldest_pending >= self.batch_interval
+            ):
+                self._queue_pending()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Hand over pending records and wait until every batch is sent or spooled."""
+        self.acquire()
+        try:
+            self._queue_pending()
+        finally:
+            self.release()
+        if self._sender.is_alive():
+            self._batches.join()
+
+    def close(self) -> None:
+        """Send or spool the remaining records, then close the connection."""
+        self.acquire()
+        try:
+            already_closed = self._closed
+            self._closed = True
+            self._queue_pending()
+        finally:
+            self.release()
+
+        if not already_closed and self._sender.is_alive():
+            try:
+                self._batches.put(None, timeout=SHUTDOWN_TIMEOUT)
+                self._sender.join(SHUTDOWN_TIMEOUT)
+            except queue.Full:
+                self._log_handler_error("Log shipping thread is stalled, closing anyway")
+        if not already_closed and self.spool_dir is not None:
+            _release_spool_dir(self.spool_dir)
+        _network_handlers.discard(self)
+        super().close()
+
+    @property
+    def closed(self) -> bool:
+        """True once the handler has been closed."""
+        return self._closed
+
+    def stats(self) -> dict[str, Any]:
+        """Return batching, connection and spool counters.
+
+        Returns:
+            Dictionary with pending_records, queued_batches, batches_sent,
+            connects, connected, batches_spooled, batches_dropped and
+            spool_bytes.
+        """
+        return {
+            "pending_records": len(self._pending),
+            "queued_batches": self._batches.qsize(),
+            "batches_sent": self.batches_sent,
+            "connects": self.connects,
+            "connected": int(self._sock is not None),
+            "batches_spooled": self.batches_spooled,
+            "batches_dropped": self.batches_dropped,
+            "spool_bytes": self._spool_bytes,
+        }
+
+    def _queue_pending(self) -> None:
+        """Hand the pending batch to the sender thread. Caller holds the lock."""
+        if not self._pending:
+            return
+        data = b"".join(self._pending)
+        self._pending.clear()
+        self._pending_bytes = 0
+        if self._sender.is_alive():
+            self._batches.put(data)
+        else:
+            # After close there is no sender; ship on this thread
+            self._ship(data)
+
+    def _start_sender(self) -> threading.Thread:
+        """Start the sender thread.
+
+        Returns:
+            The running thread.
+        """
+        sender = threading.Thread(target=self._run, name="mypylogger-shipper", daemon=True)
+        sender.start()
+        return sender
+
+    def _run(self) -> None:
+        """Send queued batches until close() queues None."""
+        poll_interval = max(self.batch_interval, MIN_POLL_INTERVAL)
+        while True:
+            try:
+                data = self._batches.get(timeout=poll_interval)
+            except queue.Empty:
+                self._idle()
+                continue
+            try:
+                if data is None:
+                    self._disconnect()
+                    self._close_spool_file()
+                    return
+                self._ship(data)
+            except Exception as e:
+                # Never let an error kill the sender thread
+                self._log_handler_error(f"Log shipping failed: {e}")
+            finally:
+                self._batches.task_done()
+
+    def _idle(self) -> None:
+        """Send a batch whose interval has elapsed, or retry replaying the spool."""
+        try:
+            data = self._take_due()
+            if data is not None:
+                self._ship(data)
+            elif self._spool_segments:
+                self._ready()
+        except Exception as e:
+            self._log_handler_error(f"Log shipping failed: {e}")
+
+    def _take_due(self) -> bytes | None:
+        """Take the pending batch if its oldest record has waited batch_interval.
+
+        Returns:
+            The batch, or None if it is not due or the logging thread holds the lock.
+        """
+        # A logging thread holding the lock may be waiting for room in the
+        # queue, which only this thread makes; it hands the batch over itself
+        if not self.lock or not self.lock.acquire(blocking=False):
+            return None
+        try:
+            # Queued batches are older and must be sent first
+            if (
+                not self._pending
+                or not self._batches.empty()
+                or time.monotonic() - self._oldest_pending < self.batch_interval
+            ):
+                return None
+            data = b"".join(self._pending)
+            self._pending.clear()
+            self._pending_bytes = 0
+            return data
+        finally:
+            self.lock.release()
+
+    def _ship(self, data: bytes) -> None:
+        """Send a batch, spooling it when the collector cannot take it.
+
+        Args:
+            data: Batch of JSON lines.
+        """
+        if self._ready() and self._send(data):
+            return
+        self._spool(data)
+
+    def _ready(self) -> bool:
+        """Connect when due and replay the spool.
+
+        Returns:
+            True when new batches can be sent right away.
+        """
+        sock = self._sock
+        if sock is not None and _peer_closed(sock):
+            # The collector restarted; reconnect at once rather than lose a batch
+            self._disconnect()
+            self._next_attempt = 0.0
+        if self._sock is None and (time.monotonic() < self._next_attempt or not self._connect()):
+            return False
+        return self._replay_spool()
+
+    def _connect(self) -> bool:
+        """Open the connection to the collector.
+
+        Returns:
+            True if connected; otherwise the next attempt is scheduled.
+        """
+        try:
+            if self._family == socket.AF_INET:
+                sock = socket.create_connection(self._target, timeout=CONNECT_TIMEOUT)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            else:
+                sock = socket.socket(self._family, socket.SOCK_STREAM)
+                try:
+                    sock.settimeout(CONNECT_TIMEOUT)
+                    sock.connect(self._target)
+                except OSError:
+                    sock.close()
+                    raise
+            sock.settimeout(SEND_TIMEOUT)
+        except OSError as e:
+            self._schedule_retry(f"cannot connect: {e}")
+            return False
+        self._sock = sock
+        self._backoff = 0.0
+        self._outage_reported = False
+        self.connects += 1
+        return True
+
+    def _send(self, data: bytes) -> bool:
+        """Send data over the open connection.
+
+        Args:
+            data: Bytes to send.
+
+        Returns:
+            True if sent; otherwise the connection is closed and a retry scheduled.
+        """
+        sock = self._sock
+        if sock is None:
+            return False
+        try:
+            sock.sendall(data)
+        except OSError as e:
+            self._disconnect()
+            self._schedule_retry(f"send failed: {e}")
+            return False
+        self.bytes_written += len(data)
+        self.batches_sent += 1
+        return True
+
+    def _disconnect(self) -> None:
+        """Close the connection if open."""
+        sock = self._sock
+        self._sock = None
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                # Already broken; nothing left to release
+                pass
+
+    def _schedule_retry(self, reason: str) -> None:
+        """Back off exponentially before the next connection attempt.
+
+        Args:
+            reason: Why the collector could not be used, reported once per outage.
+        """
+        self._backoff = min(self.backoff_max, self._backoff * 2 or self.backoff_initial)
+        self._next_attempt = time.monotonic() + self._backoff
+        if not self._outage_reported:
+            self._outage_reported = True
+            fallback = f"spooling to {self.spool_dir}" if self.spool_dir else "dropping logs"
+            self._log_handler_error(
+                f"Log collector {self.address} unavailable ({reason}), {fallback}"
+            )
+
+    def _claim_spool(self) -> None:
+        """Claim a spool directory and pick up files left there by an exited process.
+
+        Spooling is disabled, with a message, when no directory can be claimed.
+        """
+        if self.spool_dir is None:
+            return
+        requested = self.spool_dir
+        try:
+            claimed = _claim_spool_dir(requested)
+        except OSError as e:
+            self._log_handler_error(f"Cannot use log spool {requested}, dropping on outage: {e}")
+            claimed = None
+        if claimed is None:
+            self.spool_dir = None
+            return
+        self.spool_dir, self._handler_number = claimed
+        if self._handler_number:
+            # The process's first handler owns the leftovers; they may still be in use
+            self._segment_prefix = f"{os.getpid()}-{self._handler_number}-"
+            self._next_segment = self._first_free_segment()
+            return
+        # Oldest first, including files of the earlier run's forked children
+        for path in sorted(self.spool_dir.glob(f"*{SPOOL_SUFFIX}")):
+            self._spool_segments.append(path)
+            self._spool_bytes += path.stat().st_size
+        self._next_segment = self._first_free_segment()
+
+    def _first_free_segment(self) -> int:
+        """Return the sequence number after the last spool file with this handler's prefix.
+
+        Returns:
+            0 if spool_dir holds no spool file named with _segment_prefix.
+        """
+        if self.spool_dir is None or not self.spool_dir.is_dir():
+            return 0
+        next_segment = 0
+        for path in self.spool_dir.glob(f"{self._segment_prefix}*{SPOOL_SUFFIX}"):
+            sequence = path.stem[len(self._segment_prefix) :]
+            if sequence.isdigit():
+                next_segment = max(next_segment, int(sequence) + 1)
+        return next_segment
+
+    def _spool(self, data: bytes) -> None:
+        """Append a batch to the spool, or drop it without a spool directory.
+
+        Args:
+            data: Batch of JSON lines.
+        """
+        if self.spool_dir is None:
+            self.batches_dropped += 1
+            return
+        if self._spool_file is None or self._spool_file_bytes >= SPOOL_SEGMENT_BYTES:
+            self._close_spool_file()
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            # Zero-padded sequence numbers sort in the order they were written
+            name = f"{self._segment_prefix}{self._next_segment:012d}{SPOOL_SUFFIX}"
+            path = self.spool_dir / name
+            self._next_segment += 1
+            self._spool_file = path.open("ab", buffering=0)
+            self._spool_file_bytes = 0
+            self._spool_segments.append(path)
+        self._spool_file.write(data)
+        self._spool_file_bytes += len(data)
+        self._spool_bytes += len(data)
+        self.batches_spooled += 1
+
+        while self._spool_bytes > self.spool_max_bytes and len(self._spool_segments) > 1:
+            oldest = self._spool_segments.popleft()
+            self._spool_bytes -= oldest.stat().st_size
+            oldest.unlink()
+            self._log_handler_error(
+                f"Log spool over {self.spool_max_bytes} bytes, dropped {oldest}"
+            )
+
+    def _replay_spool(self) -> bool:
+        """Send spool files oldest first, deleting each once sent.
+
+        Returns:
+            True once the spool is empty.
+        """
+        if not self._spool_segments:
+            return True
+        self._close_spool_file()
+        while self._spool_segments:
+            path = self._spool_segments[0]
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                data = b""
+            if data and not self._send(data):
+                return False
+            self._spool_segments.popleft()
+            self._spool_bytes -= len(data)
+            path.unlink(missing_ok=True)
+        return True
+
+    def _close_spool_file(self) -> None:
+        """Close the spool file being appended to."""
+        spool_file = self._spool_file
+        self._spool_file = None
+        if spool_file is not None:
+            spool_file.close()
+
+    def _reset_after_fork(self) -> None:
+        """Drop the inherited connection and restart the sender in a forked child."""
+        sock = self._sock
+        self._sock = None
+        if sock is not None:
+            sock.close()
+        self._spool_file = None
+        self._spool_segments.clear()
+        self._spool_bytes = 0
+        # The parent keeps replaying its own spool; the child's files sit next
+        # to it under a pid prefix, so the next run's _claim_spool() finds them
+        self._segment_prefix = f"{os.getpid()}-{self._handler_number}-"
+        self._next_segment = self._first_free_segment()
+        self._batches = queue.Queue(maxsize=MAX_QUEUED_BATCHES)
+        self._sender = self._start_sender()
+
+    def _log_handler_error(self, message: str) -> None:
+        """Log handler errors to stderr without affecting user logging.
+
+        Args:
+            message: Error message to log.
+        """
+        try:
+            print(f"mypylogger: {message}", file=sys.stderr)
+        except OSError:
+            # If stderr is not available or fails, silently continue
+            pass
+
+
+def _peer_closed(sock: socket.socket) -> bool:
+    """Check without blocking whether the collector closed the connection.
+
+    Collectors never send data, so a readable socket means end of file or
+    an error.
+
+    Args:
+        sock: Connected socket.
+
+    Returns:
+        True if the connection is closed or broken.
+    """
+    try:
+        if hasattr(select, "poll"):
+            # select() cannot take descriptors above FD_SETSIZE (1024)
+            poller = select.poll()
+            poller.register(sock, select.POLLIN)
+            readable = bool(poller.poll(0))
+        else:
+            # Windows has no poll(); its select() takes any socket handle
+            readable = bool(select.select([sock], [], [], 0)[0])
+        if not readable:
+            return False
+        return not sock.recv(4096)
+    except OSError:
+        return True
+
+
+def _after_fork_in_child() -> None:
+    """Reset inherited connections and restart sender threads in a forked child."""
+    for handler in list(_network_handlers):
+        handler._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,246 @@
+"""Hourly and size-based rotating file handler for mypylogger."""
+
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+import re
+import shutil
+import threading
+import time
+from typing import TYPE_CHECKING, BinaryIO
+
+from .buffered_handler import DEFAULT_BATCH_INTERVAL, DEFAULT_FLUSH_LEVEL, BufferedFileHandler
+
+if TYPE_CHECKING:
+    import logging
+
+# Constants
+DEFAULT_BACKUP_COUNT = 24  # Rotated files kept per application
+SECONDS_PER_HOUR = 3600
+BACKGROUND_JOIN_TIMEOUT = 5.0  # Seconds close() waits for compression to finish
+
+
+class RotatingFileHandler(BufferedFileHandler):
+    """File handler writing {APP_NAME}_{date}_{hour}.log and switching files as it goes.
+
+    A new file is started at every local hour boundary and, when max_bytes is
+    set, once the current file reaches max_bytes; size segments are
+    named {APP_NAME}_{date}_{hour}.{n}.log. The boundary check compares the
+    record time against a precomputed rollover timestamp. Compression of
+    rotated files and retention cleanup run on a background thread.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        app_name: str,
+        *,
+        max_bytes: int = 0,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        compress: bool = False,
+        batch_bytes: int = 0,
+        batch_interval: float = DEFAULT_BATCH_INTERVAL,
+        flush_level: int = DEFAULT_FLUSH_LEVEL,
+    ) -> None:
+        """Initialize RotatingFileHandler and open the file for the current hour.
+
+        Args:
+            log_dir: Directory log files are written to.
+            app_name: Application name used as the filename prefix.
+            max_bytes: Size that starts a new segment; 0 rotates hourly only.
+            backup_count: Number of rotated files kept; 0 keeps all of them.
+            compress: Gzip rotated files in the background.
+            batch_bytes: Pending bytes that trigger a write; 0 writes every record.
+            batch_interval: Maximum seconds a record waits before being written.
+            flush_level: Minimum level written immediately together with the batch.
+        """
+        self.log_dir = log_dir
+        self.app_name = app_name
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
+        self._name_pattern = re.compile(
+            rf"^{re.escape(app_name)}_\d{{8}}_\d{{2}}(\.\d+)?\.log(\.gz)?$"
+        )
+        self._background: list[threading.Thread] = []
+        self._retention_lock = threading.Lock()
+
+        now = time.time()
+        self._hour_stamp = ""
+        self._segment = 0
+        self._next_rollover = 0.0
+        filename = self._start_hour(now)
+        super().__init__(
+            filename,
+            batch_bytes=batch_bytes,
+            batch_interval=batch_interval,
+            flush_level=flush_level,
+        )
+        self._file_bytes = self._current_size()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Switch files when a boundary is reached, then write the record.
+
+        Args:
+            record: LogRecord instance to emit.
+        """
+        if record.created >= self._next_rollover or (
+            self.max_bytes > 0 and self._file_bytes + self._pending_bytes >= self.max_bytes
+        ):
+            try:
+                self.rollover(record.created)
+            except Exception:
+                self.handleError(record)
+                return
+        super().emit(record)
+
+    def rollover(self, now: float | None = None) -> None:
+        """Close the current file and open the next one.
+
+        Args:
+            now: Time of the record causing the rollover; defaults to the current time.
+        """
+        if now is None:
+            now = time.time()
+        self.acquire()
+        try:
+            if self.stream is None:
+                return
+            self._write_pending()
+            rotated = Path(self.baseFilename)
+            stream = self.stream
+            self.stream = None
+            stream.close()
+
+            if now >= self._next_rollover:
+                self.baseFilename = str(self._start_hour(now))
+            else:
+                self._segment += 1
+                self.baseFilename = str(self._segment_path())
+            self.stream = self._open()
+            self._file_bytes = self._current_size()
+        finally:
+            self.release()
+
+        self._run_in_background(rotated)
+
+    def close(self) -> None:
+        """Close the file and wait briefly for background compression."""
+        super().close()
+        for thread in self._background:
+            thread.join(BACKGROUND_JOIN_TIMEOUT)
+        self._background.clear()
+
+    def _start_hour(self, now: float) -> Path:
+        """Compute the file and next rollover time for the hour containing now.
+
+        Args:
+            now: Seconds since the epoch.
+
+        Returns:
+            Path of the first segment of that hour not already full.
+        """
+        local = time.localtime(now)
+        hour_start = now - (now % 60) - local.tm_min * 60
+        self._next_rollover = hour_start + SECONDS_PER_HOUR
+        self._hour_stamp = time.strftime("%Y%m%d_%H", local)
+        self._segment = 0
+
+        # Resume after a restart without appending past max_bytes
+        path = self._segment_path()
+        while self.max_bytes > 0 and path.exists() and path.stat().st_size >= self.max_bytes:
+            self._segment += 1
+            path = self._segment_path()
+        return path
+
+    def _segment_path(self) -> Path:
+        """Return the path of the current hour and segment.
+
+        Returns:
+            Log file path.
+        """
+        if self._segment == 0:
+            return self.log_dir / f"{self.app_name}_{self._hour_stamp}.log"
+        return self.log_dir / f"{self.app_name}_{self._hour_stamp}.{self._segment}.log"
+
+    def _current_size(self) -> int:
+        """Return the size of the open log file.
+
+        Returns:
+            File size in bytes.
+        """
+        try:
+            return Path(self.baseFilename).stat().st_size
+        except OSError:
+            return 0
+
+    def _write(self, stream: BinaryIO, data: bytes) -> None:
+        """Write data and account for it in the current file size.
+
+        Args:
+            stream: Open log file.
+            data: Bytes to append.
+        """
+        super()._write(stream, data)
+        self._file_bytes += len(data)
+
+    def _run_in_background(self, rotated: Path) -> None:
+        """Compress rotated and enforce retention without blocking the caller.
+
+        Args:
+            rotated: Path of the file that was just closed.
+        """
+        self._background = [thread for thread in self._background if thread.is_alive()]
+        thread = threading.Thread(
+            target=self._finish_rollover,
+            args=(rotated,),
+            name="mypylogger-rotation",
+            daemon=True,
+        )
+        self._background.append(thread)
+        thread.start()
+
+    def _finish_rollover(self, rotated: Path) -> None:
+        """Compress a rotated file and delete files beyond the retention count.
+
+        Args:
+            rotated: Path of the file that was just closed.
+        """
+        try:
+            if self.compress:
+                self._compress(rotated)
+            with self._retention_lock:
+                self._enforce_retention()
+        except Exception as e:
+            self._log_handler_error(f"Log rotation cleanup failed: {e}")
+
+    def _compress(self, path: Path) -> None:
+        """Gzip path to path.gz and remove the original.
+
+        Args:
+            path: Rotated log file.
+        """
+        if not path.exists():
+            return
+        target = path.with_name(path.name + ".gz")
+        partial = path.with_name(path.name + ".gz.tmp")
+        with path.open("rb") as source, gzip.open(partial, "wb") as destination:
+            shutil.copyfileobj(source, destination)
+        partial.replace(target)
+        path.unlink()
+
+    def _enforce_retention(self) -> None:
+        """Delete the oldest rotated files beyond backup_count."""
+        if self.backup_count <= 0:
+            return
+        current = Path(self.baseFilename).name
+        rotated = sorted(
+            (entry.stat().st_mtime, entry.name)
+            for entry in os.scandir(self.log_dir)
+            if entry.name != current and self._name_pattern.match(entry.name)
+        )
+        for _, name in rotated[: max(0, len(rotated) - self.backup_count)]:
+            # Another process sharing the directory may have removed it already
+            (self.log_dir / name).unlink(missing_ok=True)
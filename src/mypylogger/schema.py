@@ -0,0 +1,241 @@
+"""Compiled log schemas for mypylogger.
+
+A schema declares the custom fields a logger emits and their types. The
+formatter renders records matching the schema with a generated function
+that writes the JSON line directly from precomputed key fragments, without
+building an intermediate dict or calling the JSON encoder. Records with
+other fields, or values of other types, use the generic path.
+
+Fields are written in the order the record carries them, as the generic
+path writes them, so both paths produce the same line. One function is
+generated per field order seen, up to MAX_FIELD_ORDERS.
+"""
+
+from __future__ import annotations
+
+from json.encoder import encode_basestring
+import math
+from typing import Any, Callable, Mapping
+
+from .exceptions import ConfigurationError
+from .formatters import RESERVED_FIELDS
+
+# Field types a schema may declare, by name as used in LOG_SCHEMA
+SCHEMA_TYPES: dict[str, type] = {"str": str, "int": int, "float": float, "bool": bool}
+MAX_FIELD_ORDERS = 32  # Render functions kept per schema; other orders use the generic path
+
+_MISSING = object()
+
+# One branch per declared type; {n} is the field index. Every branch leaves
+# f{n} empty for an absent field and returns None for an unexpected value.
+_FIELD_TEMPLATES = {
+    str: """\
+    v{n} = d.get(N{n}, MISSING)
+    if v{n}.__class__ is str:
+        f{n} = K{n} + enc(v{n})
+    elif v{n} is MISSING:
+        f{n} = ""
+    elif v{n} is None:
+        f{n} = K{n} + "null"
+    else:
+        return None
+""",
+    int: """\
+    v{n} = d.get(N{n}, MISSING)
+    if v{n}.__class__ is int:
+        f{n} = K{n} + int_repr(v{n})
+    elif v{n} is MISSING:
+        f{n} = ""
+    elif v{n} is None:
+        f{n} = K{n} + "null"
+    else:
+        return None
+""",
+    float: """\
+    v{n} = d.get(N{n}, MISSING)
+    if v{n}.__class__ is float and isfinite(v{n}):
+        f{n} = K{n} + float_repr(v{n})
+    elif v{n}.__class__ is int:
+        f{n} = K{n} + int_repr(v{n})
+    elif v{n} is MISSING:
+        f{n} = ""
+    elif v{n} is None:
+        f{n} = K{n} + "null"
+    else:
+        return None
+""",
+    bool: """\
+    v{n} = d.get(N{n}, MISSING)
+    if v{n} is True:
+        f{n} = K{n} + "true"
+    elif v{n} is False:
+        f{n} = K{n} + "false"
+    elif v{n} is MISSING:
+        f{n} = ""
+    elif v{n} is None:
+        f{n} = K{n} + "null"
+    else:
+        return None
+""",
+}
+
+
+class LogSchema:
+    """Fixed set of custom fields rendered by a generated function.
+
+    Every field is optional: an absent field is left out of the line and
+    None is written as null. Integers are accepted for float fields.
+    Fields are written in the record's order, not the declared one.
+    """
+
+    def __init__(self, fields: Mapping[str, type]) -> None:
+        """Initialize LogSchema and generate its render function.
+
+        Args:
+            fields: Field names mapped to str, int, float or bool.
+
+        Raises:
+            ConfigurationError: If a field name is reserved or a type is not supported.
+        """
+        for name, field_type in fields.items():
+            if not isinstance(name, str) or not name:
+                msg = f"Invalid schema field name: {name!r}"
+                raise ConfigurationError(msg)
+            if name in RESERVED_FIELDS:
+                msg = f"Schema field '{name}' is a reserved field name"
+                raise ConfigurationError(msg)
+            if field_type not in _FIELD_TEMPLATES:
+                msg = f"Unsupported type for schema field '{name}': {field_type!r}"
+                raise ConfigurationError(msg)
+        self.fields = dict(fields)
+        self.keys = frozenset(self.fields)
+        # Field names in record order -> render function; the declared order
+        # is compiled up front
+        order = tuple(self.fields)
+        self._renders: dict[tuple[str, ...], Callable[..., str | None]] = {
+            order: self._compile(order)
+        }
+
+    def render(
+        self,
+        record_dict: dict[str, Any],
+        timestamp: str | int,
+        level: str,
+        message: str,
+        location: dict[str, Any],
+        *,
+        order: tuple[str, ...] | None = None,
+    ) -> str | None:
+        """Render one record as a JSON line.
+
+        Args:
+            record_dict: ``record.__dict__`` holding the custom field values.
+            timestamp: Formatted timestamp.
+            level: Level name.
+            message: Formatted message.
+            location: Source location fields.
+            order: Declared fields present in record_dict, in the order they
+                were set; found from record_dict when None.
+
+        Returns:
+            JSON line, or None if a field value does not match its declared
+            type or MAX_FIELD_ORDERS other field orders were seen first.
+        """
+        if order is None:
+            order = tuple(filter(self.keys.__contains__, record_dict))
+        render = self._renders.get(order)
+        if render is None:
+            if len(self._renders) >= MAX_FIELD_ORDERS:
+                return None
+            render = self._renders.setdefault(order, self._compile(order))
+        return render(
+            record_dict,
+            # ISO timestamps contain no characters that need escaping
+            f'"{timestamp}"' if timestamp.__class__ is str else int.__repr__(timestamp),
+            level,
+            message,
+            location["module"],
+            location["filename"],
+            location["function_name"],
+            location["line"],
+        )
+
+    def _compile(self, order: tuple[str, ...]) -> Callable[..., str | None]:
+        """Generate the render function writing the declared fields in order.
+
+        Field names only reach the generated source as namespace constants, so
+        any name is safe to declare.
+
+        Args:
+            order: Declared field names in the order they are written.
+
+        Returns:
+            Generated function.
+        """
+        namespace: dict[str, Any] = {
+            "MISSING": _MISSING,
+            "enc": encode_basestring,
+            "int_repr": int.__repr__,
+            "float_repr": float.__repr__,
+            "isfinite": math.isfinite,
+        }
+        body = []
+        for n, name in enumerate(order):
+            namespace[f"N{n}"] = name
+            namespace[f"K{n}"] = "," + encode_basestring(name) + ":"
+            body.append(_FIELD_TEMPLATES[self.fields[name]].format(n=n))
+        # One f-string builds the line in a single allocation
+        joined = "".join(f"{{f{n}}}" for n in range(len(order)))
+        source = (
+            "def render(d, timestamp, level, message, module, filename, function_name, line):\n"
+            + "".join(body)
+            + '    return f\'{{"timestamp":{timestamp},"level":{enc(level)}'
+            + ',"message":{enc(message)},"module":{enc(module)}'
+            + ',"filename":{enc(filename)},"function_name":{enc(function_name)}'
+            + ',"line":{int_repr(line)}'
+            + joined
+            + "}}'\n"
+        )
+        exec(compile(source, "<mypylogger schema>", "exec"), namespace)  # noqa: S102
+        return namespace["render"]  # type: ignore[no-any-return]
+
+
+def compile_schema(fields: Mapping[str, type]) -> LogSchema:
+    """Compile a schema for the custom fields a logger emits.
+
+    Args:
+        fields: Field names mapped to str, int, float or bool.
+
+    Returns:
+        LogSchema to pass to the formatter.
+
+    Raises:
+        ConfigurationError: If a field name is reserved or a type is not supported.
+    """
+    return LogSchema(fields)
+
+
+def parse_schema(spec: str) -> dict[str, type]:
+    """Parse a schema specification such as ``"method:str,status:int"``.
+
+    Args:
+        spec: Comma-separated ``name:type`` pairs.
+
+    Returns:
+        Field names mapped to types, in declaration order.
+
+    Raises:
+        ConfigurationError: If an entry is malformed or names an unknown type.
+    """
+    fields: dict[str, type] = {}
+    for raw_entry in spec.split(","):
+        entry = raw_entry.strip()
+        if not entry:
+            continue
+        name, separator, type_name = entry.partition(":")
+        name, type_name = name.strip(), type_name.strip().lower()
+        if not separator or not name or type_name not in SCHEMA_TYPES:
+            msg = f"Invalid schema entry: {entry!r}"
+            raise ConfigurationError(msg)
+        fields[name] = SCHEMA_TYPES[type_name]
+    return fields
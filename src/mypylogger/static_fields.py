@@ -0,0 +1,64 @@
+"""Constant per-process fields encoded once into a JSON prefix."""
+
+from __future__ import annotations
+
+import os
+import socket
+import weakref
+
+from .context import BoundContext
+
+_instances: weakref.WeakSet[StaticFields] = weakref.WeakSet()
+
+
+class StaticFields:
+    """App name, hostname, pid and service version pre-encoded as a JSON prefix.
+
+    The fields are serialized once; the formatter copies the prefix into every
+    record. The prefix is rebuilt in forked children so the pid stays correct.
+    """
+
+    def __init__(
+        self,
+        app_name: str,
+        version: str = "",
+        include_host: bool = True,
+        include_pid: bool = True,
+    ) -> None:
+        """Initialize StaticFields and compile the prefix.
+
+        Args:
+            app_name: Application name written as "app".
+            version: Service version written as "version"; omitted if empty.
+            include_host: Write the hostname as "host".
+            include_pid: Write the process id as "pid".
+        """
+        self.app_name = app_name
+        self.version = version
+        self.include_host = include_host
+        self.include_pid = include_pid
+        self.fields = BoundContext({}, {})
+        self.compile()
+        _instances.add(self)
+
+    def compile(self) -> None:
+        """Serialize the current field values into the prefix."""
+        fields: dict[str, object] = {"app": self.app_name}
+        if self.include_host:
+            fields["host"] = socket.gethostname()
+        if self.include_pid:
+            fields["pid"] = os.getpid()
+        if self.version:
+            fields["version"] = self.version
+        # Swapped as one object so formatting threads never see a partial update
+        self.fields = BoundContext({}, {}).bind(fields)
+
+
+def _recompile_after_fork() -> None:
+    """Rebuild every prefix in a forked child, whose pid differs from the parent's."""
+    for static_fields in list(_instances):
+        static_fields.compile()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_recompile_after_fork)
@@ -0,0 +1,148 @@
+"""Timestamp rendering for mypylogger records."""
+
+from __future__ import annotations
+
+import datetime as dt
+import math
+
+# Timestamp formats
+TIMESTAMP_ISO = "iso"  # ISO 8601 UTC string with microseconds (default)
+TIMESTAMP_EPOCH_MS = "ms"  # Integer milliseconds since the epoch
+TIMESTAMP_EPOCH_US = "us"  # Integer microseconds since the epoch
+TIMESTAMP_EPOCH_NS = "ns"  # Integer nanoseconds since the epoch
+
+VALID_TIMESTAMP_FORMATS = frozenset(
+    {TIMESTAMP_ISO, TIMESTAMP_EPOCH_MS, TIMESTAMP_EPOCH_US, TIMESTAMP_EPOCH_NS}
+)
+
+MICROS_PER_SECOND = 1_000_000
+
+_EPOCH_SCALES = {
+    TIMESTAMP_EPOCH_MS: 1e3,
+    TIMESTAMP_EPOCH_US: 1e6,
+    TIMESTAMP_EPOCH_NS: 1e9,
+}
+
+
+class TimestampEngine:
+    """Render record creation times, caching the ISO prefix per second.
+
+    Records logged within the same second share the ``YYYY-mm-ddTHH:MM:SS``
+    prefix, so only the microseconds are formatted per record. The ISO output
+    is identical to ``datetime.fromtimestamp(created, tz=utc).strftime(...)``.
+    """
+
+    def __init__(self, timestamp_format: str = TIMESTAMP_ISO) -> None:
+        """Initialize TimestampEngine.
+
+        Args:
+            timestamp_format: One of "iso", "ms", "us" or "ns".
+        """
+        self.timestamp_format = timestamp_format
+        self._scale = _EPOCH_SCALES.get(timestamp_format)
+        # (second, "YYYY-mm-ddTHH:MM:SS.") swapped as one tuple for thread safety
+        self._prefix_cache: tuple[int, str] = (0, self._render_prefix(0))
+
+    def format(self, created: float) -> str | int:
+        """Render a record creation time.
+
+        Args:
+            created: Seconds since the epoch, as in ``LogRecord.created``.
+
+        Returns:
+            ISO 8601 string, or an integer epoch timestamp for epoch formats.
+        """
+        if self._scale is not None:
+            return round(created * self._scale)
+        return self.format_iso(created)
+
+    def format_iso(self, created: float) -> str:
+        """Render created as an ISO 8601 UTC string with microsecond precision.
+
+        Args:
+            created: Seconds since the epoch.
+
+        Returns:
+            ISO 8601 formatted timestamp string.
+        """
+        second, micros = _split_micros(created)
+        return self._format_iso_parts(second, micros)
+
+    def to_integer(self, created: float) -> int:
+        """Convert created to the integer from_integer() renders identically.
+
+        Args:
+            created: Seconds since the epoch.
+
+        Returns:
+            The epoch timestamp for epoch formats, or whole microseconds since
+            the epoch for ISO, split exactly as format_iso() splits them.
+        """
+        if self._scale is not None:
+            return round(created * self._scale)
+        second, micros = _split_micros(created)
+        return second * 1000000 + micros
+
+    def from_integer(self, value: int) -> str | int:
+        """Render a value returned by to_integer().
+
+        Args:
+            value: Integer timestamp from to_integer().
+
+        Returns:
+            What format() returns for the original creation time.
+        """
+        if self._scale is not None:
+            return value
+        second, micros = divmod(value, 1000000)
+        return self._format_iso_parts(second, micros)
+
+    def _format_iso_parts(self, second: int, micros: int) -> str:
+        """Render whole seconds and microseconds as an ISO 8601 string.
+
+        Args:
+            second: Whole seconds since the epoch.
+            micros: Microseconds within the second.
+
+        Returns:
+            ISO 8601 formatted timestamp string.
+        """
+        cached_second, prefix = self._prefix_cache
+        if cached_second != second:
+            prefix = self._render_prefix(second)
+            self._prefix_cache = (second, prefix)
+
+        return f"{prefix}{micros:06d}Z"
+
+    def _render_prefix(self, second: int) -> str:
+        """Render the per-second part of the ISO timestamp.
+
+        Args:
+            second: Whole seconds since the epoch.
+
+        Returns:
+            Prefix in the form ``YYYY-mm-ddTHH:MM:SS.``.
+        """
+        moment = dt.datetime.fromtimestamp(second, tz=dt.timezone.utc)
+        return moment.strftime("%Y-%m-%dT%H:%M:%S.")
+
+
+def _split_micros(created: float) -> tuple[int, int]:
+    """Split created into whole seconds and microseconds.
+
+    Args:
+        created: Seconds since the epoch.
+
+    Returns:
+        Whole seconds and microseconds within the second.
+    """
+    # Split exactly like datetime.fromtimestamp (round half even on microseconds)
+    fraction, whole = math.modf(created)
+    micros = round(fraction * MICROS_PER_SECOND)
+    if micros >= MICROS_PER_SECOND:
+        micros -= MICROS_PER_SECOND
+        whole += 1.0
+    elif micros < 0:
+        micros += MICROS_PER_SECOND
+        whole -= 1.0
+    return int(whole), micros
@@ -0,0 +1,230 @@
+"""Structured exception rendering for mypylogger.
+
+Exceptions are written as a JSON object with the exception type, message,
+frames and chained causes, plus a short ``stack_hash`` for grouping
+identical failures. The frames are rendered once per traceback
+fingerprint (the code objects and line numbers of every frame in the
+chain), so repeated identical failures only encode their messages.
+"""
+
+from __future__ import annotations
+
+import json
+from json.encoder import encode_basestring
+from types import CodeType, TracebackType
+from typing import Callable, Optional, Tuple, Type
+
+from .caching import LRUCache
+
+# Constants
+DEFAULT_FRAME_LIMIT = 50  # Innermost frames kept per exception
+MAX_CHAIN_DEPTH = 8  # Chained causes rendered before the chain is cut
+FINGERPRINT_CACHE_SIZE = 512  # Rendered tracebacks remembered
+STACK_HASH_BYTES = 8  # Digest size of stack_hash (16 hex characters)
+
+ExcInfo = Tuple[Optional[Type[BaseException]], Optional[BaseException], Optional[TracebackType]]
+
+# (exception type, ((id(code), lineno), ...)) for each exception in the chain
+_Fingerprint = Tuple[Tuple[type, Tuple[Tuple[int, int], ...]], ...]
+
+
+class _RenderedChain:
+    """Message-independent JSON for one traceback fingerprint."""
+
+    __slots__ = ("codes", "prefixes", "stack_hash", "suffixes")
+
+    def __init__(
+        self,
+        prefixes: list[str],
+        suffixes: list[str],
+        stack_hash: str,
+        codes: list[CodeType],
+    ) -> None:
+        """Initialize _RenderedChain.
+
+        Args:
+            prefixes: ``{"type":...,"message":`` for each exception in the chain.
+            suffixes: ``,"frames":[...]`` for each exception in the chain.
+            stack_hash: Grouping hash of the whole chain.
+            codes: Code objects in the fingerprint, kept alive so their ids
+                cannot be reused while the entry is cached.
+        """
+        self.prefixes = prefixes
+        self.suffixes = suffixes
+        self.stack_hash = stack_hash
+        self.codes = codes
+
+
+class ExceptionRenderer:
+    """Render exc_info as ``"exception":{...},"stack_hash":"..."`` JSON fragments."""
+
+    def __init__(
+        self,
+        frame_limit: int = DEFAULT_FRAME_LIMIT,
+        filename: Callable[[str], str] | None = None,
+        cache_size: int = FINGERPRINT_CACHE_SIZE,
+    ) -> None:
+        """Initialize ExceptionRenderer.
+
+        Args:
+            frame_limit: Innermost frames written per exception; the number of
+                omitted outer frames is reported as ``frames_omitted``.
+            filename: Converts a code filename to the displayed name.
+            cache_size: Traceback fingerprints remembered.
+        """
+        self.frame_limit = frame_limit
+        self._filename = filename or (lambda path: path)
+        self._cache: LRUCache[_Fingerprint, _RenderedChain] = LRUCache(cache_size)
+
+    def render(self, exc_info: ExcInfo) -> str:
+        """Render an exception and its causes as a JSON fragment.
+
+        Args:
+            exc_info: ``(type, value, traceback)`` as stored on log records.
+
+        Returns:
+            ``"exception":{...},"stack_hash":"..."``, or "" without an exception.
+        """
+        exc = exc_info[1]
+        if exc is None:
+            return ""
+        chain = _exception_chain(exc)
+        frames = [_frames(link) for link in chain]
+        fingerprint = tuple(
+            (type(link), tuple((id(code), line) for code, line in link_frames))
+            for link, link_frames in zip(chain, frames)
+        )
+        rendered = self._cache.get(fingerprint)
+        if rendered is None:
+            rendered = self._render_chain(chain, frames)
+            self._cache.put(fingerprint, rendered)
+
+        # Only the messages are encoded per record; causes nest inside "cause"
+        objects = [
+            prefix + encode_basestring(_message(link)) + suffix
+            for prefix, suffix, link in zip(rendered.prefixes, rendered.suffixes, chain)
+        ]
+        return (
+            '"exception":'
+            + ',"cause":'.join(objects)
+            + "}" * len(objects)
+            + ',"stack_hash":"'
+            + rendered.stack_hash
+            + '"'
+        )
+
+    def _render_chain(
+        self, chain: list[BaseException], frames: list[list[tuple[CodeType, int]]]
+    ) -> _RenderedChain:
+        """Render the message-independent parts of an exception chain.
+
+        Args:
+            chain: Logged exception followed by its causes.
+            frames: Traceback frames of each exception in chain.
+
+        Returns:
+            Rendered chain for the cache.
+        """
+        # Imported on the first logged traceback rather than at startup
+        import hashlib  # noqa: PLC0415
+
+        prefixes = []
+        suffixes = []
+        codes = []
+        digest = hashlib.blake2b(digest_size=STACK_HASH_BYTES)
+        for link, link_frames in zip(chain, frames):
+            type_name = _type_name(type(link))
+            digest.update(type_name.encode("utf-8", "replace"))
+
+            omitted = max(0, len(link_frames) - self.frame_limit)
+            rendered_frames = []
+            for index, (code, line) in enumerate(link_frames):
+                codes.append(code)
+                # Displayed names keep the hash stable across install locations
+                filename = self._filename(code.co_filename)
+                digest.update(f"|{filename}:{code.co_name}:{line}".encode("utf-8", "replace"))
+                if index >= omitted:
+                    rendered_frames.append(
+                        {"filename": filename, "line": line, "function": code.co_name}
+                    )
+            digest.update(b"\n")
+
+            prefixes.append('{"type":' + encode_basestring(type_name) + ',"message":')
+            suffix = ',"frames":' + json.dumps(
+                rendered_frames, ensure_ascii=False, separators=(",", ":")
+            )
+            if omitted:
+                suffix += f',"frames_omitted":{omitted}'
+            suffixes.append(suffix)
+        return _RenderedChain(prefixes, suffixes, digest.hexdigest(), codes)
+
+
+def _exception_chain(exc: BaseException) -> list[BaseException]:
+    """Follow explicit causes and implicit contexts from exc.
+
+    Args:
+        exc: Logged exception.
+
+    Returns:
+        exc followed by the exceptions that caused it, outermost first.
+    """
+    chain: list[BaseException] = []
+    seen: set[int] = set()
+    link: BaseException | None = exc
+    while link is not None and id(link) not in seen and len(chain) < MAX_CHAIN_DEPTH:
+        chain.append(link)
+        seen.add(id(link))
+        if link.__cause__ is not None:
+            link = link.__cause__
+        elif not link.__suppress_context__:
+            link = link.__context__
+        else:
+            link = None
+    return chain
+
+
+def _frames(exc: BaseException) -> list[tuple[CodeType, int]]:
+    """Return the code objects and line numbers of exc's traceback.
+
+    Args:
+        exc: Exception to inspect.
+
+    Returns:
+        (code, lineno) pairs, outermost frame first.
+    """
+    frames = []
+    tb = exc.__traceback__
+    while tb is not None:
+        frames.append((tb.tb_frame.f_code, tb.tb_lineno))
+        tb = tb.tb_next
+    return frames
+
+
+def _type_name(exc_type: type) -> str:
+    """Return the qualified name of an exception type.
+
+    Args:
+        exc_type: Exception class.
+
+    Returns:
+        ``module.QualName``, or just the name for built-in exceptions.
+    """
+    module = getattr(exc_type, "__module__", "builtins")
+    if module == "builtins":
+        return exc_type.__qualname__
+    return f"{module}.{exc_type.__qualname__}"
+
+
+def _message(exc: BaseException) -> str:
+    """Return str(exc), tolerating exceptions whose __str__ fails.
+
+    Args:
+        exc: Exception to describe.
+
+    Returns:
+        Exception message.
+    """
+    try:
+        return str(exc)
+    except Exception:
+        return f"<unprintable {type(exc).__name__} object>"
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import json
+import logging
 import os
 from pathlib import Path
 import tempfile
-from typing import Any, Generator
+from typing import Any, Generator, TypeVar
 from unittest.mock import Mock, patch
 
 import pytest
 
+import mypylogger
+from mypylogger.formatters import SourceLocationJSONFormatter
+
+HandlerT = TypeVar("HandlerT", bound=logging.Handler)
+
 
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
@@ -18,6 +25,17 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmp_dir)
 
 
+@pytest.fixture(autouse=True)
+def fresh_config_snapshot() -> None:
+    """Make the global manager re-read the environment in each test.
+
+    The configuration is cached once per process, while tests set
+    environment variables per test.
+    """
+    for manager in mypylogger._managers:
+        manager._config = None
+
+
 @pytest.fixture
 def clean_env() -> Generator[None, None, None]:
     """Clean environment variables before and after test."""
@@ -32,6 +50,50 @@ def clean_env() -> Generator[None, None, None]:
         "LOG_FILE_DIR",
         "LOG_FILE_NAME",
         "LOG_IMMEDIATE_FLUSH",
+        "LOG_ASYNC",
+        "LOG_ASYNC_QUEUE_SIZE",
+        "LOG_ASYNC_OVERFLOW",
+        "LOG_SOURCE_LOCATION",
+        "LOG_PRECOMPUTE_FILENAMES",
+        "LOG_JSON_DEFAULT",
+        "LOG_TIMESTAMP_FORMAT",
+        "LOG_JSON_BACKEND",
+        "LOG_JSON_BYTES",
+        "LOG_FILE_BUFFERED",
+        "LOG_FILE_BATCH_BYTES",
+        "LOG_FILE_BATCH_INTERVAL_MS",
+        "LOG_FILE_ROTATE",
+        "LOG_FILE_MAX_BYTES",
+        "LOG_FILE_BACKUP_COUNT",
+        "LOG_FILE_COMPRESS",
+        "LOG_FILE_MMAP",
+        "LOG_FILE_SEGMENT_BYTES",
+        "LOG_FILE_SYNC_INTERVAL_MS",
+        "LOG_FILE_COMPRESSION",
+        "LOG_FILE_BLOCK_BYTES",
+        "LOG_FILE_BLOCK_INTERVAL_MS",
+        "LOG_FILE_FORMAT",
+        "LOG_SHIP_ADDRESS",
+        "LOG_SHIP_BATCH_BYTES",
+        "LOG_SHIP_BATCH_INTERVAL_MS",
+        "LOG_SHIP_SPOOL",
+        "LOG_SHIP_SPOOL_MAX_BYTES",
+        "LOG_MULTIPROCESS",
+        "LOG_STATIC_FIELDS",
+        "LOG_SERVICE_VERSION",
+        "LOG_SCHEMA",
+        "LOG_RATE_LIMIT",
+        "LOG_RATE_BURST",
+        "LOG_SAMPLE_RATES",
+        "LOG_SUMMARY_INTERVAL",
+        "LOG_DEDUP_WINDOW_MS",
+        "LOG_DEDUP_MAX_KEYS",
+        "LOG_EXC_FRAME_LIMIT",
+        "LOG_METRICS",
+        "LOG_METRICS_INTERVAL",
+        "LOG_FLIGHT_RECORDER",
+        "LOG_FLIGHT_RECORDER_LEVEL",
+        "LOG_FLIGHT_RECORDER_SIGNAL",
     ]
 
     for var in env_vars_to_clear:
@@ -298,3 +360,61 @@ def mock_file_operations() -> Generator[Mock, None, None]:
         "pathlib.Path.read_text"
     ), patch("pathlib.Path.exists"), patch("pathlib.Path.mkdir") as mock_operations:
         yield mock_operations
+
+
+def make_record(
+    msg: str = "message",
+    level: int = logging.INFO,
+    *,
+    name: str = "test",
+    pathname: str = "/srv/app/views.py",
+    lineno: int = 42,
+    func: str = "handle",
+    created: float | None = None,
+    **extra: object,
+) -> logging.LogRecord:
+    """Create a record from a fixed call site.
+
+    Args:
+        msg: Log message.
+        level: Log level.
+        name: Logger name.
+        pathname: Source file of the call site.
+        lineno: Line number of the call site.
+        func: Function name of the call site.
+        created: Creation time; None keeps the current time.
+        **extra: Attributes set on the record, as logging's extra does.
+
+    Returns:
+        LogRecord instance.
+    """
+    record = logging.LogRecord(name, level, pathname, lineno, msg, None, None, func)
+    if created is not None:
+        record.created = created
+    record.__dict__.update(extra)
+    return record
+
+
+def json_handler(handler: HandlerT) -> HandlerT:
+    """Give handler the default JSON formatter.
+
+    Args:
+        handler: Handler to configure.
+
+    Returns:
+        The same handler.
+    """
+    handler.setFormatter(SourceLocationJSONFormatter())
+    return handler
+
+
+def read_messages(path: Path) -> list[str]:
+    """Read the messages of a JSON lines log file.
+
+    Args:
+        path: Log file.
+
+    Returns:
+        The message of every line, in file order.
+    """
+    return [json.loads(line)["message"] for line in path.read_text().splitlines()]
@@ -1,13 +1,16 @@
 """Performance and stress tests for mypylogger."""
 
 import gc
+import logging
 import os
 from pathlib import Path
 import tempfile
+import threading
 import time
 from unittest.mock import patch
 
 import mypylogger
+from tests.conftest import get_performance_threshold
 
 
 class TestPerformance:
@@ -172,6 +175,40 @@ class TestPerformance:
             for logger in loggers:
                 logger.info("Concurrent test message")
 
+    def test_threaded_get_logger_throughput(self) -> None:
+        """Test 64 threads hitting get_logger at once configure each logger once."""
+        thread_count = 64
+        calls_per_thread = 2000
+        names = [f"threaded_logger_{i}" for i in range(8)]
+        barrier = threading.Barrier(thread_count + 1)
+
+        def worker() -> None:
+            barrier.wait()
+            for i in range(calls_per_thread):
+                mypylogger.get_logger(names[i % len(names)])
+
+        with patch.dict(os.environ, {"LOG_TO_FILE": "false"}, clear=True):
+            threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+            for thread in threads:
+                thread.start()
+            barrier.wait()
+            start_time = time.perf_counter()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start_time
+
+        calls = thread_count * calls_per_thread
+        throughput = calls / elapsed
+        print(f"\nget_logger with {thread_count} threads: {throughput:,.0f} calls/s")
+
+        # Racing first calls must not attach a second set of handlers
+        for name in names:
+            assert len(logging.getLogger(name).handlers) == 1
+        # 10us per call (100,000 calls/s), with the suite's allowance on CI runners
+        assert elapsed / calls < get_performance_threshold(0.00001), (
+            f"get_logger throughput {throughput:,.0f} calls/s"
+        )
+
     def test_file_io_performance_stress(self) -> None:
         """Test file I/O performance under stress."""
         with tempfile.TemporaryDirectory() as temp_dir:
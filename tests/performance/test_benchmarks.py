@@ -11,15 +11,30 @@ Requirements addressed:
 - 9.3: Measure single log entry time and fail if it exceeds 1ms with immediate flush
 """
 
+from __future__ import annotations
+
+from importlib.util import find_spec
+from io import StringIO
 import logging
 import os
 from pathlib import Path
+import statistics
+import subprocess
+import sys
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import pytest
 
+import mypylogger
 from mypylogger import get_logger
+from mypylogger.formatters import (
+    SOURCE_LOCATION_RECORD,
+    SOURCE_LOCATION_STACK,
+    SourceLocationJSONFormatter,
+)
+from mypylogger.json_backends import BACKEND_STDLIB, available_backends
+from tests.conftest import is_ci_environment
 
 # Optional import for memory testing
 try:
@@ -30,11 +45,24 @@ except ImportError:
 if TYPE_CHECKING:
     from pytest_benchmark.fixture import BenchmarkFixture
 
+# The benchmark fixture comes from pytest-benchmark; without it these tests
+# would fail at setup instead of being skipped
+requires_benchmark = pytest.mark.skipif(
+    find_spec("pytest_benchmark") is None, reason="pytest-benchmark is not installed"
+)
+
+# Comparisons that assert a wall-clock ratio between two code paths; shared CI
+# runners are too noisy for them, so they only run locally
+compares_wall_clock = pytest.mark.skipif(
+    is_ci_environment(), reason="wall-clock ratios are unreliable on shared CI runners"
+)
+
 
 class TestLoggerInitializationPerformance:
     """Test logger initialization performance requirements."""
 
-    def test_logger_initialization_performance(self, benchmark: "BenchmarkFixture") -> None:
+    @requires_benchmark
+    def test_logger_initialization_performance(self, benchmark: BenchmarkFixture) -> None:
         """Test that logger initialization completes within 10ms threshold.
 
         Requirements:
@@ -53,8 +81,9 @@ class TestLoggerInitializationPerformance:
             f"Logger initialization took {mean_time:.4f}s, exceeds 10ms threshold (0.01s)"
         )
 
+    @requires_benchmark
     def test_logger_initialization_with_file_config_performance(
-        self, benchmark: "BenchmarkFixture", tmp_path: Path
+        self, benchmark: BenchmarkFixture, tmp_path: Path
     ) -> None:
         """Test logger initialization performance with file logging configuration.
 
@@ -99,8 +128,9 @@ class TestLogEntryPerformance:
         """Create a logger instance for performance testing."""
         return get_logger("perf_test_logging")
 
+    @requires_benchmark
     def test_single_log_entry_performance(
-        self, benchmark: "BenchmarkFixture", logger_for_perf_test: logging.Logger
+        self, benchmark: BenchmarkFixture, logger_for_perf_test: logging.Logger
     ) -> None:
         """Test that single log entry completes within 1ms threshold.
 
@@ -118,8 +148,9 @@ class TestLogEntryPerformance:
             f"Single log entry took {mean_time:.6f}s, exceeds 1ms threshold (0.001s)"
         )
 
+    @requires_benchmark
     def test_log_entry_with_extra_fields_performance(
-        self, benchmark: "BenchmarkFixture", logger_for_perf_test: logging.Logger
+        self, benchmark: BenchmarkFixture, logger_for_perf_test: logging.Logger
     ) -> None:
         """Test log entry performance with additional structured data."""
         logger = logger_for_perf_test
@@ -140,7 +171,8 @@ class TestLogEntryPerformance:
             f"Log entry with extra fields took {mean_time:.6f}s, exceeds 1ms threshold (0.001s)"
         )
 
-    def test_file_logging_performance(self, benchmark: "BenchmarkFixture", tmp_path: Path) -> None:
+    @requires_benchmark
+    def test_file_logging_performance(self, benchmark: BenchmarkFixture, tmp_path: Path) -> None:
         """Test log entry performance with file logging enabled."""
         # Set up file logging
         log_dir = tmp_path / "logs"
@@ -282,10 +314,813 @@ class TestThroughputPerformance:
             os.environ.pop("LOG_FILE_DIR", None)
 
 
+def _call_at_depth(depth: int, func: Callable[[], float]) -> float:
+    """Call func with depth extra frames on the stack."""
+    if depth <= 0:
+        return func()
+    return _call_at_depth(depth - 1, func)
+
+
+def _records_per_second(source_location: str, depth: int, count: int = 2000) -> float:
+    """Measure formatted records/sec for a source location mode at a stack depth."""
+    formatter = SourceLocationJSONFormatter(source_location=source_location)
+    handler = logging.StreamHandler(StringIO())
+    handler.setFormatter(formatter)
+    logger = logging.getLogger(f"perf_source_location_{source_location}_{depth}")
+    logger.handlers.clear()
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    def run() -> float:
+        logger.info("warmup")
+        start = time.perf_counter()
+        for i in range(count):
+            logger.info("Source location benchmark %d", i)
+        return count / (time.perf_counter() - start)
+
+    return _call_at_depth(depth, run)
+
+
+@compares_wall_clock
+class TestSourceLocationPerformance:
+    """Compare stack-walking and record-based source location capture."""
+
+    @pytest.mark.parametrize("depth", [5, 50, 500])
+    def test_source_location_throughput_by_stack_depth(self, depth: int) -> None:
+        """Report records/sec before (stack walk) and after (record fast path).
+
+        The record fast path must not depend on stack depth and should be at
+        least as fast as walking the stack.
+        """
+        stack_rate = _records_per_second(SOURCE_LOCATION_STACK, depth)
+        record_rate = _records_per_second(SOURCE_LOCATION_RECORD, depth)
+
+        print(
+            f"\nsource location depth={depth}: stack={stack_rate:,.0f} rec/s, "
+            f"record={record_rate:,.0f} rec/s ({record_rate / stack_rate:.2f}x)"
+        )
+
+        assert record_rate > 1000, f"Record fast path too slow: {record_rate:.0f} rec/s"
+        # Allow for timing noise while still catching a regression of the fast path
+        assert record_rate >= stack_rate * 0.8, (
+            f"Record fast path ({record_rate:.0f} rec/s) slower than stack walk "
+            f"({stack_rate:.0f} rec/s) at depth {depth}"
+        )
+
+
+def _backend_records_per_second(backend: str, count: int = 5000) -> float:
+    """Measure bytes formatting throughput for a JSON backend."""
+    formatter = SourceLocationJSONFormatter(
+        source_location=SOURCE_LOCATION_RECORD, json_backend=backend
+    )
+    record = logging.LogRecord("bench", logging.INFO, __file__, 1, "backend benchmark", (), None)
+    record.__dict__.update({"user_id": 12345, "path": "/api/v1/items", "ok": True, "ms": 1.25})
+
+    start = time.perf_counter()
+    for _ in range(count):
+        formatter.format_bytes(record)
+    return count / (time.perf_counter() - start)
+
+
+@compares_wall_clock
+class TestJSONBackendPerformance:
+    """Compare JSON backend throughput against the standard library encoder."""
+
+    @pytest.mark.parametrize("backend", available_backends()[1:] or [BACKEND_STDLIB])
+    def test_backend_throughput(self, backend: str) -> None:
+        """Installed optional backends should not be slower than the stdlib encoder."""
+        stdlib_rate = _backend_records_per_second(BACKEND_STDLIB)
+        backend_rate = _backend_records_per_second(backend)
+
+        print(
+            f"\njson backend {backend}: {backend_rate:,.0f} rec/s "
+            f"(stdlib {stdlib_rate:,.0f} rec/s, {backend_rate / stdlib_rate:.2f}x)"
+        )
+
+        # Allow for timing noise while still catching a broken backend path
+        assert backend_rate >= stdlib_rate * 0.8
+
+
+def _batched_file_rate(handler: logging.Handler, count: int) -> float:
+    """Log count records through handler and return records per second."""
+    record = logging.LogRecord("bench", logging.INFO, __file__, 1, "batched write", (), None)
+    start = time.perf_counter()
+    for _ in range(count):
+        handler.handle(record)
+    handler.flush()
+    return count / (time.perf_counter() - start)
+
+
+class TestBufferedFileWriterPerformance:
+    """Compare write syscalls of the per-record flush and batched file handlers."""
+
+    def test_batched_writes_reduce_write_calls(self, tmp_path: Path) -> None:
+        """Batching should turn thousands of writes into a handful."""
+        from mypylogger.buffered_handler import BufferedFileHandler
+
+        count = 5000
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        buffered = BufferedFileHandler(tmp_path / "batched.log", batch_interval=60)
+        buffered.setFormatter(formatter)
+        unbuffered = BufferedFileHandler(tmp_path / "unbatched.log", batch_bytes=0)
+        unbuffered.setFormatter(formatter)
+        try:
+            batched_rate = _batched_file_rate(buffered, count)
+            batched_calls = buffered.stats()["batches_written"]
+            unbatched_rate = _batched_file_rate(unbuffered, count)
+            unbatched_calls = unbuffered.stats()["batches_written"]
+        finally:
+            buffered.close()
+            unbuffered.close()
+
+        print(
+            f"\nfile writes: batched {batched_calls} calls, {batched_rate:,.0f} rec/s; "
+            f"per-record {unbatched_calls} calls, {unbatched_rate:,.0f} rec/s"
+        )
+
+        assert unbatched_calls == count
+        assert batched_calls < count / 100
+
+
+@compares_wall_clock
+class TestLazyLoggerPerformance:
+    """Measure the cost of disabled log calls through the lazy adapter."""
+
+    def test_disabled_debug_calls_are_cheap(self) -> None:
+        """Disabled lazy calls should beat eager calls that build their payload."""
+        from mypylogger.lazy import Lazy, LazyLogger
+
+        logger = logging.getLogger("perf_lazy_disabled")
+        logger.setLevel(logging.INFO)
+        lazy = LazyLogger(logger)
+        payload = list(range(200))
+        count = 20000
+
+        start = time.perf_counter()
+        for _ in range(count):
+            logger.debug("state %s", str(payload), extra={"size": sum(payload)})
+        eager_rate = count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(count):
+            lazy.debug("state %s", Lazy(str, payload), extra={"size": Lazy(sum, payload)})
+        lazy_rate = count / (time.perf_counter() - start)
+
+        print(
+            f"\ndisabled debug: eager {eager_rate:,.0f} calls/s, "
+            f"lazy {lazy_rate:,.0f} calls/s ({lazy_rate / eager_rate:.2f}x)"
+        )
+
+        assert lazy_rate > eager_rate
+
+
+@compares_wall_clock
+class TestBoundContextPerformance:
+    """Compare bound context fragments against passing the same fields as extra."""
+
+    def test_bound_context_faster_than_extra(self) -> None:
+        """Pre-serialized bound fields should format faster than per-record extras."""
+        from mypylogger.context import clear_context, contextualize
+
+        fields = {
+            "request_id": "6f1c2a9e-0b7d-4d1e-9a52-3c8e2f1d7b40",
+            "tenant": "acme",
+            "trace_id": "4bf92f3577b34da6a3ce929d0e0e4736",
+            "span_id": "00f067aa0ba902b7",
+            "user_id": 123456,
+            "region": "eu-west-1",
+            "route": "/api/v1/orders",
+            "tags": ["checkout", "beta"],
+        }
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        count = 5000
+
+        extra_record = logging.LogRecord("bench", logging.INFO, __file__, 1, "ctx", (), None)
+        extra_record.__dict__.update(fields)
+        start = time.perf_counter()
+        for _ in range(count):
+            formatter.format(extra_record)
+        extra_rate = count / (time.perf_counter() - start)
+
+        bound_record = logging.LogRecord("bench", logging.INFO, __file__, 1, "ctx", (), None)
+        with contextualize(**fields):
+            start = time.perf_counter()
+            for _ in range(count):
+                formatter.format(bound_record)
+            bound_rate = count / (time.perf_counter() - start)
+        clear_context()
+
+        print(
+            f"\n8 context fields: extra {extra_rate:,.0f} rec/s, "
+            f"bound {bound_rate:,.0f} rec/s ({bound_rate / extra_rate:.2f}x)"
+        )
+
+        assert bound_rate >= extra_rate * 0.9
+
+
+@compares_wall_clock
+class TestCompiledSchemaPerformance:
+    """Compare schema-compiled formatting against the generic path."""
+
+    def test_compiled_schema_faster_than_generic(self) -> None:
+        """Access-log records matching the schema should format faster than json.dumps."""
+        from mypylogger.schema import compile_schema
+
+        fields = {
+            "method": "GET",
+            "path": "/api/v1/orders/12345",
+            "status": 200,
+            "duration_ms": 12.75,
+            "bytes_sent": 5321,
+            "user_agent": "Mozilla/5.0 (X11; Linux x86_64)",
+            "cached": False,
+        }
+        schema = compile_schema({key: type(value) for key, value in fields.items()})
+        generic = SourceLocationJSONFormatter(
+            source_location=SOURCE_LOCATION_RECORD, json_backend=BACKEND_STDLIB
+        )
+        compiled = SourceLocationJSONFormatter(
+            source_location=SOURCE_LOCATION_RECORD, json_backend=BACKEND_STDLIB, schema=schema
+        )
+        record = logging.LogRecord("bench", logging.INFO, __file__, 1, "access", (), None)
+        record.__dict__.update(fields)
+        count = 5000
+
+        rates = {}
+        for name, formatter in (("generic", generic), ("compiled", compiled)):
+            start = time.perf_counter()
+            for _ in range(count):
+                formatter.format(record)
+            rates[name] = count / (time.perf_counter() - start)
+
+        print(
+            f"\nAccess log: generic {rates['generic']:,.0f} rec/s, "
+            f"compiled {rates['compiled']:,.0f} rec/s "
+            f"({rates['compiled'] / rates['generic']:.2f}x)"
+        )
+
+        assert rates["compiled"] >= rates["generic"] * 1.2
+
+
+@compares_wall_clock
+class TestRateLimitPerformance:
+    """Measure the cost of a rate-limited hot loop."""
+
+    def test_suppressed_records_cost_less_than_formatted(self) -> None:
+        """Dropped records should skip formatting and writing entirely."""
+        from mypylogger.filters import RateLimitFilter
+
+        stream = StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD))
+        logger = logging.getLogger("bench_rate_limit")
+        logger.handlers = [handler]
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        count = 5000
+
+        rates = {}
+        for name in ("unlimited", "limited"):
+            if name == "limited":
+                logger.addFilter(RateLimitFilter(rate=100, logger=logger))
+            start = time.perf_counter()
+            for i in range(count):
+                logger.info("hot loop iteration %d", i)
+            rates[name] = count / (time.perf_counter() - start)
+
+        print(
+            f"\nHot loop: unlimited {rates['unlimited']:,.0f} rec/s, "
+            f"rate limited {rates['limited']:,.0f} rec/s "
+            f"({rates['limited'] / rates['unlimited']:.1f}x)"
+        )
+
+        assert rates["limited"] > rates["unlimited"] * 1.3
+
+
+@compares_wall_clock
+class TestDedupPerformance:
+    """Measure an incident flood of identical errors with and without dedup."""
+
+    def test_collapsed_repeats_cost_less_than_formatted(self) -> None:
+        """Counted repeats should be much cheaper than formatted, written lines."""
+        from mypylogger.filters import DedupFilter
+
+        stream = StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(SourceLocationJSONFormatter())
+        logger = logging.getLogger("bench_dedup")
+        logger.handlers = [handler]
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        count = 5000
+
+        rates = {}
+        for name in ("plain", "dedup"):
+            if name == "dedup":
+                logger.addFilter(DedupFilter(window=60, logger=logger))
+            start = time.perf_counter()
+            for i in range(count):
+                logger.error("Upstream timeout after %d ms", 3000 + i % 7)
+            rates[name] = count / (time.perf_counter() - start)
+
+        print(
+            f"\nError flood: plain {rates['plain']:,.0f} rec/s, "
+            f"dedup {rates['dedup']:,.0f} rec/s ({rates['dedup'] / rates['plain']:.1f}x)"
+        )
+
+        assert rates["dedup"] > rates["plain"] * 1.5
+
+
+@compares_wall_clock
+class TestExceptionRenderingPerformance:
+    """Measure the traceback fingerprint cache on repeated identical failures."""
+
+    def test_cached_tracebacks_faster_than_uncached(self) -> None:
+        """Repeated failures should reuse the rendered frames."""
+        from mypylogger.tracebacks import ExceptionRenderer
+
+        def fail(depth: int) -> None:
+            if depth == 0:
+                msg = "upstream returned 503"
+                raise ValueError(msg)
+            fail(depth - 1)
+
+        try:
+            fail(15)
+        except ValueError:
+            exc_info = sys.exc_info()
+        record = logging.LogRecord(
+            "bench", logging.ERROR, __file__, 1, "request failed", (), exc_info
+        )
+        count = 2000
+
+        rates = {}
+        for name, cache_size in (("uncached", 0), ("cached", 512)):
+            formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+            formatter._exceptions = ExceptionRenderer(
+                filename=formatter._get_relative_filename, cache_size=cache_size
+            )
+            start = time.perf_counter()
+            for _ in range(count):
+                formatter.format(record)
+            rates[name] = count / (time.perf_counter() - start)
+
+        print(
+            f"\n17-frame exception: uncached {rates['uncached']:,.0f} rec/s, "
+            f"cached {rates['cached']:,.0f} rec/s ({rates['cached'] / rates['uncached']:.1f}x)"
+        )
+
+        assert rates["cached"] > rates["uncached"] * 1.5
+
+
+@compares_wall_clock
+class TestConfigSnapshotPerformance:
+    """Measure module-level logger creation with the cached configuration."""
+
+    def test_cached_config_faster_than_resolving_per_logger(self) -> None:
+        """Creating many loggers should not re-read the environment each time."""
+        from mypylogger.core import LoggerManager
+
+        count = 300
+        rates = {}
+        for name in ("resolved", "cached"):
+            manager = LoggerManager()
+            names = [f"bench.{name}.module{index}" for index in range(count)]
+            start = time.perf_counter()
+            for logger_name in names:
+                if name == "resolved":
+                    manager._config = None
+                manager.get_or_create_logger(logger_name)
+            rates[name] = count / (time.perf_counter() - start)
+            for logger_name in names:
+                logging.getLogger(logger_name).handlers.clear()
+
+        print(
+            f"\n{count} module loggers: resolving {rates['resolved']:,.0f}/s, "
+            f"cached {rates['cached']:,.0f}/s ({rates['cached'] / rates['resolved']:.1f}x)"
+        )
+
+        assert rates["cached"] > rates["resolved"] * 1.2
+
+
+@compares_wall_clock
+class TestMetricsPerformance:
+    """Measure the cost of pipeline self-instrumentation."""
+
+    def test_instrumentation_overhead_is_small(self) -> None:
+        """Counting records, bytes and format time should cost only a few percent."""
+        import timeit
+
+        from mypylogger.metrics import MetricsFilter, PipelineMetrics
+
+        metrics = PipelineMetrics(report_interval=0)
+        record = logging.LogRecord("bench", logging.INFO, __file__, 1, "request handled", (), None)
+
+        def per_call_ns(call: Callable[[], object], number: int = 20000) -> float:
+            return min(timeit.repeat(call, number=number, repeat=15)) / number * 1e9
+
+        # Each hook is timed on its own against the same path without it: the
+        # few hundred nanoseconds they add are below the run-to-run noise of
+        # two complete ~10us records compared with each other
+        plain_logger = logging.Logger("bench_metrics_plain")
+        counted_logger = logging.Logger("bench_metrics_counted")
+        counted_logger.addFilter(MetricsFilter(metrics, counted_logger))
+        count_ns = per_call_ns(lambda: counted_logger.filter(record)) - per_call_ns(
+            lambda: plain_logger.filter(record)
+        )
+
+        line = SourceLocationJSONFormatter().format(record)
+        constant = logging.Formatter()
+        constant.format = lambda _record: line  # type: ignore[method-assign]
+        plain_handler = logging.StreamHandler(StringIO())
+        plain_handler.setFormatter(constant)
+        counted_handler = logging.StreamHandler(StringIO())
+        counted_handler.setFormatter(constant)
+        metrics.watch_handler(counted_handler)
+        bytes_ns = per_call_ns(lambda: counted_handler.format(record)) - per_call_ns(
+            lambda: plain_handler.format(record)
+        )
+
+        plain_formatter = SourceLocationJSONFormatter()
+        timed_formatter = SourceLocationJSONFormatter()
+        timed_formatter.metrics = metrics
+        for formatter in (plain_formatter, timed_formatter):
+            formatter._render = lambda *_args: line  # type: ignore[method-assign]
+        timing_ns = per_call_ns(lambda: timed_formatter.format(record)) - per_call_ns(
+            lambda: plain_formatter.format(record)
+        )
+
+        logger = logging.getLogger("bench_metrics_record")
+        logger.handlers.clear()
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        handler = logging.StreamHandler(StringIO())
+        handler.setFormatter(SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD))
+        logger.addHandler(handler)
+        record_ns = per_call_ns(
+            lambda: logger.info("request handled", extra={"status": 200, "attempt": 1}), 2000
+        )
+
+        overhead_ns = max(count_ns, 0) + max(bytes_ns, 0) + max(timing_ns, 0)
+        overhead = overhead_ns / record_ns
+        print(
+            f"\nmetrics overhead: {overhead:.1%} of {record_ns / 1000:.1f}us/record "
+            f"(count {count_ns:.0f}ns, bytes {bytes_ns:.0f}ns, format timing {timing_ns:.0f}ns)"
+        )
+
+        assert overhead < 0.05
+
+
+@compares_wall_clock
+class TestFlightRecorderPerformance:
+    """Measure the steady-state cost of the in-memory flight recorder."""
+
+    def test_buffering_is_much_cheaper_than_writing(self, tmp_path: Path) -> None:
+        """Keeping a DEBUG record in the ring should cost a fraction of formatting it."""
+        from mypylogger.flight_recorder import FlightRecorderHandler
+
+        count = 10000
+        record = logging.LogRecord(
+            "bench", logging.DEBUG, __file__, 1, "cache miss %s", ("key",), None
+        )
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        recorder = FlightRecorderHandler(1000, dump_path=tmp_path / "flight.log")
+        # The formatter makes the recorder capture the location, as configured by the manager
+        recorder.setFormatter(formatter)
+        writer = logging.StreamHandler(StringIO())
+        writer.setFormatter(formatter)
+
+        timings = {}
+        for name, handler in (("recorder", recorder), ("writer", writer)):
+            best = float("inf")
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(count):
+                    handler.handle(record)
+                best = min(best, time.perf_counter() - start)
+            timings[name] = best / count * 1_000_000
+
+        print(
+            f"\nflight recorder: {timings['recorder']:.2f}us/record, "
+            f"JSON writer: {timings['writer']:.2f}us/record"
+        )
+
+        assert recorder.stats() == {"buffered_records": 1000, "capacity": 1000, "dumps": 0}
+        assert timings["recorder"] < timings["writer"] / 10
+        recorder.close()
+
+
+@compares_wall_clock
+class TestMmapFilePerformance:
+    """Compare the memory-mapped file handler with logging.FileHandler."""
+
+    def test_throughput_and_p99_latency(self, tmp_path: Path) -> None:
+        """Mapped writes should not be slower than FileHandler writes, on average or at p99."""
+        from mypylogger.mmap_handler import MmapFileHandler
+
+        count = 20000
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        record = logging.LogRecord(
+            "bench", logging.INFO, __file__, 1, "request handled", None, None
+        )
+        record.status = 200
+
+        def measure(handler: logging.Handler) -> tuple[float, float]:
+            handler.setFormatter(formatter)
+            latencies = []
+            clock = time.perf_counter_ns
+            for _ in range(count):
+                start = clock()
+                handler.handle(record)
+                latencies.append(clock() - start)
+            handler.close()
+            latencies.sort()
+            throughput = count / (sum(latencies) / 1e9)
+            return throughput, latencies[int(count * 0.99)] / 1000
+
+        file_dir = tmp_path / "file"
+        mmap_dir = tmp_path / "mmap"
+        file_dir.mkdir()
+        mmap_dir.mkdir()
+        results = {}
+        # Best of three, alternating so machine noise hits both handlers
+        for _ in range(3):
+            for name in ("FileHandler", "MmapFileHandler"):
+                if name == "FileHandler":
+                    handler: logging.Handler = logging.FileHandler(
+                        file_dir / "app.log", encoding="utf-8"
+                    )
+                else:
+                    handler = MmapFileHandler(mmap_dir, "app")
+                throughput, p99 = measure(handler)
+                best_throughput, best_p99 = results.get(name, (0.0, float("inf")))
+                results[name] = (max(best_throughput, throughput), min(best_p99, p99))
+
+        for name, (throughput, p99) in results.items():
+            print(f"\n{name}: {throughput:,.0f} rec/s, p99 {p99:.1f}us")
+
+        # Formatting dominates both; the mmap handler saves the write call per record
+        assert results["MmapFileHandler"][0] > results["FileHandler"][0] * 0.95
+        assert results["MmapFileHandler"][1] < results["FileHandler"][1] * 1.1
+
+
+@compares_wall_clock
+class TestCompressedFilePerformance:
+    """Compare compressed file output with logging.FileHandler."""
+
+    def test_disk_bytes_and_logging_thread_time(self, tmp_path: Path) -> None:
+        """Compressed output should be 5x smaller without slowing the logging thread."""
+        from mypylogger.compressed import CompressedFileHandler, get_codec
+
+        count = 20000
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        records = []
+        for i in range(count):
+            record = logging.LogRecord(
+                "bench", logging.INFO, __file__, 1, "request %d handled", (i,), None
+            )
+            record.user_id = i % 977
+            record.status = 200 if i % 50 else 503
+            records.append(record)
+
+        def measure(handler: logging.Handler, path: Path) -> tuple[float, int]:
+            handler.setFormatter(formatter)
+            start = time.perf_counter()
+            for record in records:
+                handler.handle(record)
+            elapsed = time.perf_counter() - start
+            handler.close()
+            return elapsed, path.stat().st_size
+
+        codec = get_codec("auto")
+        results = {}
+        # Best of three, alternating so machine noise hits both handlers
+        for attempt in range(3):
+            plain_path = tmp_path / f"plain{attempt}.log"
+            compressed_path = tmp_path / f"compressed{attempt}.log{codec.suffix}"
+            for name, handler, path in (
+                ("FileHandler", logging.FileHandler(plain_path, encoding="utf-8"), plain_path),
+                (
+                    f"CompressedFileHandler ({codec.name})",
+                    CompressedFileHandler(compressed_path, codec=codec),
+                    compressed_path,
+                ),
+            ):
+                elapsed, size = measure(handler, path)
+                results[name] = (min(results.get(name, (elapsed, size))[0], elapsed), size)
+
+        for name, (elapsed, size) in results.items():
+            print(f"\n{name}: {elapsed / count * 1e6:.2f}us/record on caller, {size:,} bytes")
+
+        (plain_time, plain_size), (compressed_time, compressed_size) = results.values()
+        assert plain_size / compressed_size >= 5
+        # Formatting dominates both; compression runs on the background thread,
+        # so the caller pays no more than for plain writes
+        assert compressed_time < plain_time * 1.1
+
+
+@compares_wall_clock
+class TestBinaryEncodingPerformance:
+    """Compare the binary record encoding with JSON formatting."""
+
+    def test_encode_cost_and_size(self) -> None:
+        """Binary frames should be far smaller and cheaper to produce than JSON lines."""
+        from mypylogger.binary import BinaryRecordEncoder
+
+        count = 5000
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        records = []
+        for i in range(count):
+            record = logging.LogRecord(
+                "bench", logging.INFO, __file__, 1, "request %d handled", (i,), None
+            )
+            record.created = 1_700_000_000 + i / 1000
+            records.append(record)
+
+        def measure(encode: Callable[[logging.LogRecord], bytes]) -> tuple[float, int]:
+            start = time.perf_counter()
+            size = sum(len(encode(record)) for record in records)
+            return (time.perf_counter() - start) / count, size
+
+        ratios = []
+        # Median of paired rounds so machine noise hits both encodings alike
+        for _ in range(11):
+            json_time, json_size = measure(formatter.format_bytes)
+            binary_time, binary_size = measure(BinaryRecordEncoder(formatter).encode)
+            ratios.append(binary_time / json_time)
+        ratio = statistics.median(ratios)
+
+        print(
+            f"\nJSON {json_time * 1e6:.2f}us {json_size / count:.0f}B/record, "
+            f"binary {binary_time * 1e6:.2f}us {binary_size / count:.0f}B/record, "
+            f"median time ratio {ratio:.2f}"
+        )
+
+        # Newlines are not counted for JSON, so the size comparison favours it
+        assert binary_size * 4 < json_size
+        assert ratio < 0.8
+
+
+@compares_wall_clock
+class TestNetworkShippingPerformance:
+    """Compare batched network shipping with the console (stdout) path."""
+
+    # Stand-in collector in its own process, as a real one would be, so it
+    # does not compete with the logging thread for the GIL
+    COLLECTOR = """
+import socket, sys
+server = socket.create_server(("127.0.0.1", 0))
+print(server.getsockname()[1], flush=True)
+while True:
+    connection, _ = server.accept()
+    with connection:
+        while connection.recv(1 << 20):
+            pass
+"""
+
+    def test_logging_thread_time(self) -> None:
+        """Shipping to a collector should cost the caller no more than writing to stdout."""
+        from unittest.mock import patch
+
+        from mypylogger.config import LogConfig
+        from mypylogger.handlers import HandlerFactory
+        from mypylogger.network import NetworkHandler
+
+        count = 20000
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        records = [
+            logging.LogRecord("bench", logging.INFO, __file__, 1, "request %d handled", (i,), None)
+            for i in range(count)
+        ]
+        config = LogConfig(
+            app_name="bench", log_level="INFO", log_to_file=False, log_file_dir=Path()
+        )
+
+        def measure(handler: logging.Handler) -> tuple[float, float]:
+            handler.setFormatter(formatter)
+            start = time.perf_counter()
+            for record in records:
+                handler.handle(record)
+            caller = time.perf_counter() - start
+            handler.flush()
+            total = time.perf_counter() - start
+            handler.close()
+            return caller, total
+
+        collector = subprocess.Popen(
+            [sys.executable, "-c", self.COLLECTOR], stdout=subprocess.PIPE, text=True
+        )
+        try:
+            assert collector.stdout is not None
+            address = f"127.0.0.1:{collector.stdout.readline().strip()}"
+            ratios = []
+            with Path(os.devnull).open("w", encoding="utf-8") as devnull, patch(
+                "sys.stdout", devnull
+            ):
+                # Median of paired rounds so machine noise hits both paths alike
+                for _ in range(5):
+                    console_caller, console_total = measure(
+                        HandlerFactory().create_console_handler(config)
+                    )
+                    network = NetworkHandler(address)
+                    network_caller, network_total = measure(network)
+                    assert network.stats()["batches_sent"] > 0
+                    ratios.append(network_caller / console_caller)
+        finally:
+            collector.kill()
+            collector.wait()
+        ratio = statistics.median(ratios)
+
+        print(
+            f"\nconsole {console_caller / count * 1e6:.2f}us/record on caller, "
+            f"{count / console_total:,.0f} records/s delivered; "
+            f"network {network_caller / count * 1e6:.2f}us/record on caller, "
+            f"{count / network_total:,.0f} records/s delivered; median caller ratio {ratio:.2f}"
+        )
+
+        # Formatting dominates both; shipping replaces a write and flush per
+        # record with one sendall per 64 KiB batch on the sender thread, so
+        # the caller pays no more than for stdout even against /dev/null
+        assert ratio < 1.15
+
+
+class TestStartupPerformance:
+    """Measure cold-start cost of importing mypylogger and the first get_logger."""
+
+    @staticmethod
+    def _run(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+        """Run code in a fresh interpreter that imports this checkout."""
+        src = str(Path(mypylogger.__file__).parent.parent)
+        path = os.pathsep.join([src, os.environ.get("PYTHONPATH", "")])
+        env = dict(os.environ, PYTHONPATH=path)
+        return subprocess.run(
+            [sys.executable, *options, "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def test_import_defers_logging_machinery(self) -> None:
+        """``import mypylogger`` and the first get_logger should load only what they use."""
+        result = self._run(
+            "import sys, mypylogger; print(' '.join("
+            "m for m in sys.modules if m.startswith('mypylogger') or m == 'logging'))",
+            "-X",
+            "importtime",
+        )
+
+        # -X importtime lines: "import time: self [us] | cumulative | name"
+        cumulative = {
+            line.rsplit("|", 2)[2].strip(): int(line.rsplit("|", 2)[1])
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and line.rsplit("|", 2)[1].strip().isdigit()
+        }
+        print(f"\nimport mypylogger: {cumulative['mypylogger'] / 1000:.1f}ms cumulative")
+
+        assert sorted(result.stdout.split()) == ["mypylogger", "mypylogger.exceptions"]
+
+        # A default logger needs none of the optional handlers, codecs or backends
+        result = self._run(
+            "import sys, mypylogger; mypylogger.get_logger('startup'); print(' '.join(sys.modules))"
+        )
+        deferred = {
+            "mypylogger.async_handler",
+            "mypylogger.buffered_handler",
+            "mypylogger.rotating_handler",
+            "mypylogger.schema",
+            "mypylogger.tracebacks",
+            "queue",
+            "gzip",
+            "orjson",
+        }
+        assert deferred.isdisjoint(result.stdout.split())
+
+    @compares_wall_clock
+    def test_first_get_logger_latency(self) -> None:
+        """Time the import and the first get_logger call in a fresh process."""
+        result = self._run(
+            "import time; start = time.perf_counter(); import mypylogger; "
+            "imported = time.perf_counter(); mypylogger.get_logger('startup'); "
+            "done = time.perf_counter(); print(imported - start, done - imported)"
+        )
+        import_time, first_logger_time = (float(value) for value in result.stdout.split())
+
+        print(
+            f"\nimport {import_time * 1000:.1f}ms, "
+            f"first get_logger {first_logger_time * 1000:.1f}ms"
+        )
+
+        assert import_time < first_logger_time
+        assert import_time + first_logger_time < 2.0
+
+
 class TestPerformanceRegression:
     """Test for performance regression detection."""
 
-    def test_performance_baseline_validation(self, benchmark: "BenchmarkFixture") -> None:
+    @requires_benchmark
+    def test_performance_baseline_validation(self, benchmark: BenchmarkFixture) -> None:
         """Validate current performance against established baselines.
 
         This test serves as a regression detector for performance changes.
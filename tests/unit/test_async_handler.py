@@ -0,0 +1,377 @@
+"""Unit tests for the asynchronous queue-backed handler."""
+
+from __future__ import annotations
+
+from io import StringIO
+import json
+import logging
+from pathlib import Path
+import tempfile
+import threading
+from unittest.mock import patch
+
+from mypylogger.async_handler import (
+    OVERFLOW_BLOCK,
+    OVERFLOW_DROP_NEWEST,
+    OVERFLOW_DROP_OLDEST,
+    AsyncQueueHandler,
+)
+from mypylogger.config import LogConfig
+from mypylogger.core import LoggerManager
+from mypylogger.formatters import LOCATION_ATTR, SourceLocationJSONFormatter
+from mypylogger.handlers import HandlerFactory
+
+
+class _BlockingHandler(logging.Handler):
+    """Handler that blocks the writer thread until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.unblock = threading.Event()
+        self.entered = threading.Event()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.entered.set()
+        self.unblock.wait(5)
+        self.messages.append(record.getMessage())
+
+
+def _make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+
+def _stream_target(formatter: SourceLocationJSONFormatter) -> tuple[logging.Handler, StringIO]:
+    stream = StringIO()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(formatter)
+    return target, stream
+
+
+class TestAsyncQueueHandler:
+    """Test AsyncQueueHandler class."""
+
+    def test_output_matches_synchronous_formatter(self) -> None:
+        """Test async output has the same JSON fields as synchronous output."""
+        formatter = SourceLocationJSONFormatter()
+        target, stream = _stream_target(formatter)
+        handler = AsyncQueueHandler([target], formatter)
+        logger = _make_logger("async_output_test", handler)
+
+        logger.info("Hello %s", "world", extra={"user_id": 7})
+        handler.close()
+
+        entry = json.loads(stream.getvalue().strip())
+        assert entry["message"] == "Hello world"
+        assert entry["level"] == "INFO"
+        assert entry["user_id"] == 7
+        assert LOCATION_ATTR not in entry
+        assert list(entry)[:7] == [
+            "timestamp",
+            "level",
+            "message",
+            "module",
+            "filename",
+            "function_name",
+            "line",
+        ]
+
+    def test_source_location_captured_on_calling_thread(self) -> None:
+        """Test source location points at the caller, not the writer thread."""
+        formatter = SourceLocationJSONFormatter()
+        target, stream = _stream_target(formatter)
+        handler = AsyncQueueHandler([target], formatter)
+        logger = _make_logger("async_location_test", handler)
+
+        logger.info("Location check")
+        handler.close()
+
+        entry = json.loads(stream.getvalue().strip())
+        assert entry["function_name"] == "test_source_location_captured_on_calling_thread"
+        assert entry["filename"].endswith("test_async_handler.py")
+
+    def test_records_written_in_order(self) -> None:
+        """Test records are written in the order they were logged."""
+        formatter = SourceLocationJSONFormatter()
+        target, stream = _stream_target(formatter)
+        handler = AsyncQueueHandler([target], formatter)
+        logger = _make_logger("async_order_test", handler)
+
+        for i in range(200):
+            logger.info("message %d", i)
+        handler.flush()
+
+        lines = stream.getvalue().strip().split("\n")
+        assert [json.loads(line)["message"] for line in lines] == [
+            f"message {i}" for i in range(200)
+        ]
+        handler.close()
+
+    def test_message_frozen_before_enqueue(self) -> None:
+        """Test mutable args are rendered before the record changes threads."""
+        formatter = SourceLocationJSONFormatter()
+        target, stream = _stream_target(formatter)
+        handler = AsyncQueueHandler([target], formatter)
+        logger = _make_logger("async_freeze_test", handler)
+
+        payload = ["before"]
+        logger.info("payload=%s", payload)
+        payload[0] = "after"
+        handler.close()
+
+        assert json.loads(stream.getvalue().strip())["message"] == "payload=['before']"
+
+    def test_drop_newest_policy_counts_drops(self) -> None:
+        """Test drop_newest discards incoming records when the queue is full."""
+        formatter = SourceLocationJSONFormatter()
+        blocker = _BlockingHandler()
+        handler = AsyncQueueHandler(
+            [blocker], formatter, queue_size=2, overflow=OVERFLOW_DROP_NEWEST
+        )
+        logger = _make_logger("async_drop_newest_test", handler)
+
+        logger.info("first")
+        assert blocker.entered.wait(5)
+        for i in range(5):
+            logger.info("queued %d", i)
+
+        assert handler.stats()["dropped_newest"] == 3
+        blocker.unblock.set()
+        handler.close()
+
+        assert blocker.messages == ["first", "queued 0", "queued 1"]
+
+    def test_drop_oldest_policy_counts_drops(self) -> None:
+        """Test drop_oldest evicts the oldest queued record when the queue is full."""
+        formatter = SourceLocationJSONFormatter()
+        blocker = _BlockingHandler()
+        handler = AsyncQueueHandler(
+            [blocker], formatter, queue_size=2, overflow=OVERFLOW_DROP_OLDEST
+        )
+        logger = _make_logger("async_drop_oldest_test", handler)
+
+        logger.info("first")
+        assert blocker.entered.wait(5)
+        for i in range(5):
+            logger.info("queued %d", i)
+
+        assert handler.stats()["dropped_oldest"] == 3
+        blocker.unblock.set()
+        handler.close()
+
+        assert blocker.messages == ["first", "queued 3", "queued 4"]
+
+    def test_block_policy_never_drops(self) -> None:
+        """Test block policy waits for space instead of dropping records."""
+        formatter = SourceLocationJSONFormatter()
+        target, stream = _stream_target(formatter)
+        handler = AsyncQueueHandler([target], formatter, queue_size=1, overflow=OVERFLOW_BLOCK)
+        logger = _make_logger("async_block_test", handler)
+
+        for i in range(50):
+            logger.info("blocked %d", i)
+        handler.close()
+
+        stats = handler.stats()
+        assert stats["dropped_oldest"] == 0
+        assert stats["dropped_newest"] == 0
+        assert len(stream.getvalue().strip().split("\n")) == 50
+
+    def test_emit_after_close_writes_synchronously(self) -> None:
+        """Test records logged after close are still written."""
+        formatter = SourceLocationJSONFormatter()
+        target, stream = _stream_target(formatter)
+        handler = AsyncQueueHandler([target], formatter)
+        logger = _make_logger("async_after_close_test", handler)
+
+        handler.close()
+        logger.warning("late message")
+
+        assert json.loads(stream.getvalue().strip())["message"] == "late message"
+
+    def test_close_does_not_hang_when_writer_is_stuck(self) -> None:
+        """Test close gives up on a stalled writer instead of blocking forever."""
+        formatter = SourceLocationJSONFormatter()
+        blocker = _BlockingHandler()
+        handler = AsyncQueueHandler(
+            [blocker], formatter, queue_size=1, overflow=OVERFLOW_DROP_NEWEST
+        )
+        logger = _make_logger("async_stuck_close_test", handler)
+
+        logger.info("first")
+        assert blocker.entered.wait(5)
+        logger.info("queued")
+
+        with patch("mypylogger.async_handler.SHUTDOWN_TIMEOUT", 0.05), patch.object(
+            handler, "_log_handler_error"
+        ) as mock_log_error:
+            blocker.unblock.clear()
+            timer = threading.Timer(0.5, blocker.unblock.set)
+            timer.start()
+            handler.close()
+            timer.join()
+
+            mock_log_error.assert_called()
+        assert handler.closed
+
+    def test_close_is_idempotent(self) -> None:
+        """Test closing twice is safe."""
+        formatter = SourceLocationJSONFormatter()
+        target, _stream = _stream_target(formatter)
+        handler = AsyncQueueHandler([target], formatter)
+
+        handler.close()
+        handler.close()
+
+        assert not handler._thread.is_alive()
+
+    def test_target_failure_does_not_kill_writer(self) -> None:
+        """Test a failing target is reported and other records still flow."""
+        formatter = SourceLocationJSONFormatter()
+        target, stream = _stream_target(formatter)
+        handler = AsyncQueueHandler([target], formatter)
+        logger = _make_logger("async_target_failure_test", handler)
+
+        with patch.object(handler, "_log_handler_error") as mock_log_error:
+            with patch.object(target, "handle", side_effect=[RuntimeError("boom"), True]):
+                logger.info("fails")
+                handler.flush()
+            logger.info("works")
+            handler.close()
+
+            mock_log_error.assert_called_once()
+        assert json.loads(stream.getvalue().strip())["message"] == "works"
+
+
+class TestAsyncHandlerWiring:
+    """Test async mode selection through HandlerFactory and LoggerManager."""
+
+    def test_factory_creates_async_handler(self) -> None:
+        """Test HandlerFactory wraps targets with the configured policy."""
+        factory = HandlerFactory()
+        config = LogConfig(
+            app_name="test_app",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=Path(tempfile.gettempdir()),
+            async_mode=True,
+            async_queue_size=8,
+            async_overflow=OVERFLOW_DROP_NEWEST,
+        )
+        target = logging.NullHandler()
+
+        handler = factory.create_async_handler(config, [target])
+
+        assert isinstance(handler, AsyncQueueHandler)
+        assert handler.targets == [target]
+        assert handler.stats()["queue_size"] == 8
+        handler.close()
+
+    def test_factory_falls_back_on_error(self) -> None:
+        """Test HandlerFactory returns None when the async handler cannot start."""
+        factory = HandlerFactory()
+        config = LogConfig(
+            app_name="test_app",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=Path(tempfile.gettempdir()),
+            async_mode=True,
+        )
+
+        with patch(
+            "mypylogger.async_handler.AsyncQueueHandler", side_effect=RuntimeError("no threads")
+        ), patch.object(factory, "_log_handler_error") as mock_log_error:
+            assert factory.create_async_handler(config, []) is None
+            mock_log_error.assert_called_once()
+
+    def test_manager_shares_async_handler_between_loggers(self) -> None:
+        """Test loggers with the same configuration share one writer thread."""
+        manager = LoggerManager()
+        config = LogConfig(
+            app_name="test_app",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=Path(tempfile.gettempdir()),
+            async_mode=True,
+        )
+        first = logging.getLogger("async_shared_one")
+        second = logging.getLogger("async_shared_two")
+        first.handlers.clear()
+        second.handlers.clear()
+
+        manager.configure_logger(first, config)
+        manager.configure_logger(second, config)
+
+        assert len(first.handlers) == 1
+        assert isinstance(first.handlers[0], AsyncQueueHandler)
+        assert first.handlers[0] is second.handlers[0]
+        first.handlers[0].close()
+
+    def test_manager_replaces_closed_async_handler(self) -> None:
+        """Test a closed cached handler is not handed to new loggers."""
+        manager = LoggerManager()
+        config = LogConfig(
+            app_name="test_app",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=Path(tempfile.gettempdir()),
+            async_mode=True,
+        )
+        first = logging.getLogger("async_replace_one")
+        second = logging.getLogger("async_replace_two")
+        first.handlers.clear()
+        second.handlers.clear()
+
+        manager.configure_logger(first, config)
+        first.handlers[0].close()
+        manager.configure_logger(second, config)
+
+        assert second.handlers[0] is not first.handlers[0]
+        assert not second.handlers[0].closed
+        second.handlers[0].close()
+
+    def test_manager_keys_async_handler_on_queue_settings(self) -> None:
+        """Test differing queue settings get separate async handlers."""
+        manager = LoggerManager()
+        base = {
+            "app_name": "test_app",
+            "log_level": "INFO",
+            "log_to_file": False,
+            "log_file_dir": Path(tempfile.gettempdir()),
+            "async_mode": True,
+        }
+        first = logging.getLogger("async_key_one")
+        second = logging.getLogger("async_key_two")
+        first.handlers.clear()
+        second.handlers.clear()
+
+        manager.configure_logger(first, LogConfig(**base, async_queue_size=16))
+        manager.configure_logger(second, LogConfig(**base, async_overflow=OVERFLOW_DROP_NEWEST))
+
+        assert first.handlers[0] is not second.handlers[0]
+        first.handlers[0].close()
+        second.handlers[0].close()
+
+    def test_manager_falls_back_to_sync_handlers(self) -> None:
+        """Test LoggerManager uses plain handlers when async creation fails."""
+        manager = LoggerManager()
+        config = LogConfig(
+            app_name="test_app",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=Path(tempfile.gettempdir()),
+            async_mode=True,
+        )
+        logger = logging.getLogger("async_fallback_test")
+        logger.handlers.clear()
+
+        with patch.object(manager._handler_factory, "create_async_handler", return_value=None):
+            manager.configure_logger(logger, config)
+
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.StreamHandler)
@@ -0,0 +1,213 @@
+"""Unit tests for the binary log encoding and its decoder."""
+
+from __future__ import annotations
+
+import io
+import itertools
+import logging
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mypylogger import decode
+from mypylogger.binary import BinaryFileHandler, BinaryRecordEncoder, iter_json_lines
+from mypylogger.config import LogConfig
+from mypylogger.context import contextualize
+from mypylogger.core import LoggerManager
+from mypylogger.formatters import SOURCE_LOCATION_RECORD, SourceLocationJSONFormatter
+from mypylogger.static_fields import StaticFields
+
+_logger_ids = itertools.count()
+
+
+class _Capture(logging.Handler):
+    """Handler keeping what the formatter writes as JSON for each record."""
+
+    def __init__(self, formatter: SourceLocationJSONFormatter) -> None:
+        super().__init__()
+        self.json_formatter = formatter
+        self.lines: list[bytes] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.json_formatter.format_bytes(record))
+
+
+def _log_both(
+    path: Path, formatter: SourceLocationJSONFormatter
+) -> tuple[logging.Logger, BinaryFileHandler, _Capture]:
+    """Attach a binary handler and a JSON capture sharing formatter."""
+    logger = logging.getLogger(f"binary-{next(_logger_ids)}")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    handler = BinaryFileHandler(path)
+    handler.setFormatter(formatter)
+    capture = _Capture(formatter)
+    logger.addHandler(handler)
+    logger.addHandler(capture)
+    return logger, handler, capture
+
+
+def _decoded(path: Path) -> list[bytes]:
+    with path.open("rb") as stream:
+        return list(iter_json_lines(stream))
+
+
+class TestBinaryRoundTrip:
+    """Test decoding reproduces the JSON output exactly."""
+
+    @pytest.mark.parametrize("timestamp_format", ["iso", "ms", "ns"])
+    def test_decodes_to_identical_json(self, tmp_path: Path, timestamp_format: str) -> None:
+        """Test every kind of record decodes to the formatter's JSON line."""
+        formatter = SourceLocationJSONFormatter(
+            source_location=SOURCE_LOCATION_RECORD,
+            timestamp_format=timestamp_format,
+            static_fields=StaticFields("svc", version="1.2"),
+        )
+        path = tmp_path / "app.log.bin"
+        logger, handler, capture = _log_both(path, formatter)
+
+        logger.info("plain")
+        logger.debug('ünïcode "quoted"\n%s', "tab\t", extra={"user_id": 7, "ratio": 0.5})
+        logger.warning("override", extra={"app": "other", "tags": ["a", "b"], "none": None})
+        with contextualize(request_id="r-1"):
+            logger.info("in context")
+        try:
+            int("bad input")
+        except ValueError:
+            logger.exception("failed")
+        with patch("sys.stderr"):
+            logger.error("lone %s", "\ud800")
+        record = logging.LogRecord("odd", logging.INFO, "/x/odd.py", -3, "negative", None, None)
+        record.created = 1.5
+        logger.handle(record)
+        handler.close()
+
+        assert len(capture.lines) == 7
+        assert _decoded(path) == capture.lines
+
+    def test_strings_sent_once_and_smaller(self, tmp_path: Path) -> None:
+        """Test names are interned and records are much smaller than JSON."""
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        path = tmp_path / "app.log.bin"
+        logger, handler, capture = _log_both(path, formatter)
+        for i in range(200):
+            logger.info("request %d served", i)
+        handler.close()
+
+        data = path.read_bytes()
+        assert data.count(b"test_strings_sent_once_and_smaller") == 1
+        assert data.count(Path(__file__).name.encode()) == 1
+        assert len(data) * 3 < sum(len(line) + 1 for line in capture.lines)
+        assert _decoded(path) == capture.lines
+
+    def test_appended_streams_and_truncated_frame(self, tmp_path: Path) -> None:
+        """Test a file written by successive handlers decodes, minus a cut-off record."""
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        path = tmp_path / "app.log.bin"
+        expected = []
+        for run in range(2):
+            logger, handler, capture = _log_both(path, formatter)
+            logger.info("run %d", run)
+            handler.close()
+            expected += capture.lines
+        logger, handler, _ = _log_both(path, formatter)
+        logger.info("cut off by a crash")
+        handler.close()
+        path.write_bytes(path.read_bytes()[:-3])
+
+        assert _decoded(path) == expected
+
+    def test_new_stream_when_tables_full(self) -> None:
+        """Test the string table is bounded by starting a new stream."""
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        encoder = BinaryRecordEncoder(formatter)
+        frames = []
+        with patch("mypylogger.binary.MAX_TABLE_ENTRIES", 12):
+            for i in range(5):
+                record = logging.LogRecord("t", logging.INFO, f"/m{i}.py", 1, "x", None, None)
+                frames.append(encoder.encode(record))
+
+        assert sum(b"MPLB" in frame for frame in frames) == 2
+        lines = list(iter_json_lines(io.BytesIO(b"".join(frames))))
+        assert [line.count(b'"filename":"m') for line in lines] == [1] * 5
+
+    def test_frames_ending_on_chunk_boundary(self) -> None:
+        """Test reads ending exactly between frames, or inside the header, decode."""
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        encoder = BinaryRecordEncoder(formatter)
+        frames = []
+        for i in range(3):
+            record = logging.LogRecord("t", logging.INFO, "/m.py", 1, "x %d", (i,), None)
+            frames.append(encoder.encode(record))
+        data = b"".join(frames)
+        expected = list(iter_json_lines(io.BytesIO(data)))
+
+        with patch("mypylogger.binary.READ_CHUNK", len(frames[0])):
+            assert list(iter_json_lines(io.BytesIO(data))) == expected
+        with patch("mypylogger.binary.READ_CHUNK", 3):
+            assert list(iter_json_lines(io.BytesIO(data))) == expected
+        assert len(expected) == 3
+
+    def test_rejects_json_file(self, tmp_path: Path) -> None:
+        """Test decoding a JSON log fails clearly."""
+        path = tmp_path / "app.log"
+        path.write_bytes(b'{"message":"hello"}\n')
+
+        with pytest.raises(ValueError, match="binary"):
+            _decoded(path)
+
+
+class TestDecodeCommand:
+    """Test python -m mypylogger.decode."""
+
+    def test_writes_json_lines(self, tmp_path: Path) -> None:
+        """Test files are decoded in order into the output file."""
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        paths = [tmp_path / "a.log.bin", tmp_path / "b.log.bin"]
+        expected = []
+        for path in paths:
+            logger, handler, capture = _log_both(path, formatter)
+            logger.info("from %s", path.name)
+            handler.close()
+            expected += capture.lines
+        output = tmp_path / "out.jsonl"
+
+        assert decode.main([str(path) for path in paths] + ["-o", str(output)]) == 0
+        assert output.read_bytes() == b"".join(line + b"\n" for line in expected)
+
+    def test_reports_bad_input(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test unreadable input exits with 1 and a message."""
+        assert decode.main([str(tmp_path / "missing.bin")]) == 1
+        assert capsys.readouterr().err.startswith("mypylogger.decode: ")
+
+
+class TestManagerBinaryFiles:
+    """Test LoggerManager wiring of LOG_FILE_FORMAT."""
+
+    def test_loggers_share_one_binary_file(self, tmp_path: Path) -> None:
+        """Test every logger writes one stream through the same handler."""
+        config = LogConfig(
+            app_name="svc",
+            log_level="INFO",
+            log_to_file=True,
+            log_file_dir=tmp_path,
+            file_format="binary",
+        )
+        manager = LoggerManager()
+        first = logging.getLogger("binary-first")
+        second = logging.getLogger("binary-second")
+        with patch("sys.stdout"):
+            manager.configure_logger(first, config)
+            manager.configure_logger(second, config)
+            first.info("one")
+            second.info("two")
+
+        handler = manager._installed[first.name][0][-1]
+        assert manager._installed[second.name][0][-1] is handler
+        assert isinstance(handler, BinaryFileHandler)
+        handler.close()
+        path = Path(handler.baseFilename)
+        assert path.name.endswith(".log.bin")
+        assert path.read_bytes().count(b"MPLB") == 1
+        assert [b'"message":"one"' in line for line in _decoded(path)] == [True, False]
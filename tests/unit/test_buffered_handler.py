@@ -0,0 +1,174 @@
+"""Unit tests for the batched, buffered file handler."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+import time
+from unittest.mock import patch
+
+from mypylogger.buffered_handler import BufferedFileHandler
+from mypylogger.config import LogConfig
+from mypylogger.core import LoggerManager
+from mypylogger.formatters import SourceLocationJSONFormatter
+from tests.conftest import make_record, read_messages
+
+
+class TestBufferedFileHandler:
+    """Test BufferedFileHandler class."""
+
+    def test_records_are_batched_until_size_threshold(self, tmp_path: Path) -> None:
+        """Test records stay pending until batch_bytes are reached."""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(path, batch_bytes=10_000, batch_interval=60)
+        handler.setFormatter(SourceLocationJSONFormatter())
+        try:
+            for i in range(5):
+                handler.handle(make_record(f"m{i}"))
+
+            assert path.read_bytes() == b""
+            assert handler.stats()["pending_records"] == 5
+
+            while handler.stats()["batches_written"] == 0:
+                handler.handle(make_record("x" * 500))
+
+            assert read_messages(path)[:5] == ["m0", "m1", "m2", "m3", "m4"]
+            assert handler.stats()["pending_records"] == 0
+        finally:
+            handler.close()
+
+    def test_error_records_flush_immediately(self, tmp_path: Path) -> None:
+        """Test ERROR records write the pending batch at once."""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(path, batch_bytes=10_000, batch_interval=60)
+        handler.setFormatter(SourceLocationJSONFormatter())
+        try:
+            handler.handle(make_record("info"))
+            handler.handle(make_record("boom", logging.ERROR))
+
+            assert read_messages(path) == ["info", "boom"]
+            assert handler.stats()["batches_written"] == 1
+        finally:
+            handler.close()
+
+    def test_interval_flushes_idle_batch(self, tmp_path: Path) -> None:
+        """Test the flusher thread writes a batch once its interval elapses."""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(path, batch_bytes=10_000, batch_interval=0.01)
+        handler.setFormatter(SourceLocationJSONFormatter())
+        try:
+            handler.handle(make_record("late"))
+
+            deadline = time.monotonic() + 5
+            while not path.read_bytes() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert read_messages(path) == ["late"]
+        finally:
+            handler.close()
+
+    def test_zero_batch_bytes_writes_every_record(self, tmp_path: Path) -> None:
+        """Test batch_bytes=0 disables batching and starts no flusher thread."""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(path, batch_bytes=0)
+        handler.setFormatter(SourceLocationJSONFormatter())
+        try:
+            handler.handle(make_record("a"))
+            handler.handle(make_record("b"))
+
+            assert handler._flusher is None
+            assert read_messages(path) == ["a", "b"]
+            assert handler.stats()["batches_written"] == 2
+        finally:
+            handler.close()
+
+    def test_flush_and_close_write_pending(self, tmp_path: Path) -> None:
+        """Test flush() and close() write pending records."""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(path, batch_bytes=10_000, batch_interval=60)
+        handler.setFormatter(SourceLocationJSONFormatter())
+
+        handler.handle(make_record("one"))
+        handler.flush()
+        assert read_messages(path) == ["one"]
+
+        handler.handle(make_record("two"))
+        handler.close()
+        assert read_messages(path) == ["one", "two"]
+        assert handler.stream is None
+        assert handler._stop.is_set()
+
+    def test_plain_formatter_is_encoded(self, tmp_path: Path) -> None:
+        """Test non-JSON formatters are written as UTF-8 lines."""
+        path = tmp_path / "app.log"
+        handler = BufferedFileHandler(path, batch_bytes=0)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            handler.handle(make_record("héllo"))
+        finally:
+            handler.close()
+
+        assert path.read_text(encoding="utf-8") == "héllo\n"
+
+    def test_short_writes_are_retried(self, tmp_path: Path) -> None:
+        """Test partial writes are completed."""
+        handler = BufferedFileHandler(tmp_path / "app.log", batch_bytes=0)
+        written = bytearray()
+
+        class _ShortWriter:
+            def write(self, data: memoryview) -> int:
+                written.extend(data[:3])
+                return min(3, len(data))
+
+        try:
+            handler._write(_ShortWriter(), b"0123456789")  # type: ignore[arg-type]
+        finally:
+            handler.close()
+
+        assert bytes(written) == b"0123456789"
+
+    def test_flush_if_due_reports_errors(self, tmp_path: Path) -> None:
+        """Test write errors on the flusher thread are reported, not raised."""
+        handler = BufferedFileHandler(tmp_path / "app.log", batch_bytes=10_000, batch_interval=60)
+        handler.setFormatter(SourceLocationJSONFormatter())
+        handler.handle(make_record("x"))
+        handler.batch_interval = 0
+
+        with patch.object(handler, "_write", side_effect=OSError("disk full")), patch.object(
+            handler, "_log_handler_error"
+        ) as mock_error:
+            handler.flush_if_due()
+
+        mock_error.assert_called_once()
+        assert "disk full" in mock_error.call_args[0][0]
+        handler.close()
+
+
+class TestManagerBufferedFiles:
+    """Test LoggerManager wiring of LOG_FILE_BUFFERED."""
+
+    def test_loggers_share_one_buffered_file(self, tmp_path: Path) -> None:
+        """Test every logger batches through one handler, so lines keep their order."""
+        config = LogConfig(
+            app_name="svc",
+            log_level="INFO",
+            log_to_file=True,
+            log_file_dir=tmp_path,
+            file_buffered=True,
+            file_batch_interval_ms=60_000,
+        )
+        manager = LoggerManager()
+        first = logging.getLogger("buffered-first")
+        second = logging.getLogger("buffered-second")
+        with patch("sys.stdout"):
+            manager.configure_logger(first, config)
+            manager.configure_logger(second, config)
+            first.info("one")
+            second.info("two")
+            first.info("three")
+
+        handler = manager._installed[first.name][0][-1]
+        assert manager._installed[second.name][0][-1] is handler
+        assert isinstance(handler, BufferedFileHandler)
+        handler.close()
+        assert read_messages(Path(handler.baseFilename)) == ["one", "two", "three"]
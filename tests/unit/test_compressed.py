@@ -0,0 +1,153 @@
+"""Unit tests for compressed file output."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from pathlib import Path
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from mypylogger.compressed import (
+    Codec,
+    CompressedFileHandler,
+    available_codecs,
+    get_codec,
+    iter_lines,
+    iter_records,
+)
+from mypylogger.config import LogConfig
+from mypylogger.core import LoggerManager
+from tests.conftest import json_handler, make_record
+
+
+class TestCompressedFileHandler:
+    """Test CompressedFileHandler class."""
+
+    def test_round_trip_across_blocks(self, tmp_path: Path) -> None:
+        """Test records written in several blocks read back in order."""
+        path = tmp_path / "app.log.gz"
+        handler = json_handler(CompressedFileHandler(path, block_bytes=4096))
+        messages = [f"request {i} served" for i in range(500)]
+        for message in messages:
+            handler.handle(make_record(message))
+        handler.close()
+
+        assert handler.batches_written > 1
+        assert handler.bytes_written == path.stat().st_size
+        assert handler.uncompressed_bytes > handler.bytes_written * 5
+        assert [record["message"] for record in iter_records(path)] == messages
+
+    def test_file_readable_by_gzip(self, tmp_path: Path) -> None:
+        """Test the concatenated blocks form a valid multi-member gzip file."""
+        path = tmp_path / "app.log.gz"
+        handler = json_handler(CompressedFileHandler(path, block_bytes=512))
+        for i in range(50):
+            handler.handle(make_record(f"line {i}"))
+        handler.close()
+
+        with gzip.open(path, "rt") as stream:
+            lines = [json.loads(line)["message"] for line in stream]
+        assert lines == [f"line {i}" for i in range(50)]
+
+    def test_truncated_last_block_skipped(self, tmp_path: Path) -> None:
+        """Test a block cut short by a crash does not hide the complete ones."""
+        path = tmp_path / "app.log.gz"
+        handler = json_handler(CompressedFileHandler(path))
+        handler.handle(make_record("kept"))
+        handler.flush()
+        handler.handle(make_record("lost"))
+        handler.close()
+        data = path.read_bytes()
+        path.write_bytes(data[:-10])
+
+        assert [json.loads(line)["message"] for line in iter_lines(path)] == ["kept"]
+
+    def test_compresses_off_the_logging_thread(self, tmp_path: Path) -> None:
+        """Test blocks are compressed by the background thread, ERROR completing one."""
+        threads = []
+        original = Codec.compress
+
+        def compress(codec: Codec, data: bytes) -> bytes:
+            threads.append(threading.current_thread().name)
+            return original(codec, data)
+
+        handler = json_handler(CompressedFileHandler(tmp_path / "app.log.gz"))
+        with patch.object(Codec, "compress", compress):
+            handler.handle(make_record("routine"))
+            assert handler.stats()["records_written"] == 0
+            handler.handle(make_record("failure", logging.ERROR))
+            handler.flush()
+            handler.close()
+
+        assert threads == ["mypylogger-compressor"]
+        assert handler.closed
+
+
+class TestCodecs:
+    """Test codec selection."""
+
+    def test_gzip_always_available(self) -> None:
+        """Test gzip is listed and the fallback for unknown or missing codecs."""
+        assert "gzip" in available_codecs()
+        assert get_codec("gzip").name == "gzip"
+        assert get_codec("rar").name == "gzip"
+        assert get_codec("auto").name == available_codecs()[0]
+
+    def test_missing_codec_falls_back_to_gzip(self) -> None:
+        """Test an uninstalled codec package leaves gzip in use."""
+        with patch("importlib.import_module", side_effect=ImportError):
+            assert get_codec("zstd").name == "gzip"
+            assert get_codec("lz4").name == "gzip"
+
+    @pytest.mark.parametrize("name", ["zstd", "lz4"])
+    def test_optional_codec_round_trip(self, tmp_path: Path, name: str) -> None:
+        """Test the optional codecs where their packages are installed."""
+        if name not in available_codecs():
+            pytest.skip(f"{name} not installed")
+        codec = get_codec(name)
+        path = tmp_path / f"app.log{codec.suffix}"
+        handler = json_handler(CompressedFileHandler(path, codec=codec, block_bytes=1024))
+        for i in range(100):
+            handler.handle(make_record(f"line {i}"))
+        handler.close()
+
+        assert [record["message"] for record in iter_records(path)] == [
+            f"line {i}" for i in range(100)
+        ]
+
+
+class TestManagerCompressedFiles:
+    """Test LoggerManager wiring of LOG_FILE_COMPRESSION."""
+
+    def test_loggers_share_one_compressed_file(self, tmp_path: Path) -> None:
+        """Test every logger writes through the same handler and file."""
+        config = LogConfig(
+            app_name="svc",
+            log_level="INFO",
+            log_to_file=True,
+            log_file_dir=tmp_path,
+            file_compression="gzip",
+            file_block_bytes=8192,
+            file_block_interval_ms=250,
+        )
+        manager = LoggerManager()
+        first = logging.getLogger("compressed-first")
+        second = logging.getLogger("compressed-second")
+        with patch("sys.stdout"):
+            manager.configure_logger(first, config)
+            manager.configure_logger(second, config)
+            first.info("one")
+            second.info("two")
+
+        handler = manager._installed[first.name][0][-1]
+        assert manager._installed[second.name][0][-1] is handler
+        assert isinstance(handler, CompressedFileHandler)
+        assert (handler.batch_bytes, handler.batch_interval) == (8192, 0.25)
+        handler.close()
+        path = Path(handler.baseFilename)
+        assert path.name.endswith(".log.gz")
+        assert [record["message"] for record in iter_records(path)] == ["one", "two"]
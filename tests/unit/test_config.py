@@ -35,6 +35,50 @@ class TestLogConfig:
             "LOG_LEVEL": "log_level",
             "LOG_TO_FILE": "log_to_file",
             "LOG_FILE_DIR": "log_file_dir",
+            "LOG_ASYNC": "async_mode",
+            "LOG_ASYNC_QUEUE_SIZE": "async_queue_size",
+            "LOG_ASYNC_OVERFLOW": "async_overflow",
+            "LOG_SOURCE_LOCATION": "source_location",
+            "LOG_PRECOMPUTE_FILENAMES": "precompute_filenames",
+            "LOG_JSON_DEFAULT": "json_default",
+            "LOG_TIMESTAMP_FORMAT": "timestamp_format",
+            "LOG_JSON_BACKEND": "json_backend",
+            "LOG_JSON_BYTES": "json_bytes",
+            "LOG_FILE_BUFFERED": "file_buffered",
+            "LOG_FILE_BATCH_BYTES": "file_batch_bytes",
+            "LOG_FILE_BATCH_INTERVAL_MS": "file_batch_interval_ms",
+            "LOG_FILE_ROTATE": "file_rotate",
+            "LOG_FILE_MAX_BYTES": "file_max_bytes",
+            "LOG_FILE_BACKUP_COUNT": "file_backup_count",
+            "LOG_FILE_COMPRESS": "file_compress",
+            "LOG_FILE_MMAP": "file_mmap",
+            "LOG_FILE_SEGMENT_BYTES": "file_segment_bytes",
+            "LOG_FILE_SYNC_INTERVAL_MS": "file_sync_interval_ms",
+            "LOG_FILE_COMPRESSION": "file_compression",
+            "LOG_FILE_BLOCK_BYTES": "file_block_bytes",
+            "LOG_FILE_BLOCK_INTERVAL_MS": "file_block_interval_ms",
+            "LOG_FILE_FORMAT": "file_format",
+            "LOG_SHIP_ADDRESS": "ship_address",
+            "LOG_SHIP_BATCH_BYTES": "ship_batch_bytes",
+            "LOG_SHIP_BATCH_INTERVAL_MS": "ship_batch_interval_ms",
+            "LOG_SHIP_SPOOL": "ship_spool",
+            "LOG_SHIP_SPOOL_MAX_BYTES": "ship_spool_max_bytes",
+            "LOG_MULTIPROCESS": "multiprocess",
+            "LOG_STATIC_FIELDS": "static_fields",
+            "LOG_SERVICE_VERSION": "service_version",
+            "LOG_SCHEMA": "log_schema",
+            "LOG_RATE_LIMIT": "rate_limit",
+            "LOG_RATE_BURST": "rate_burst",
+            "LOG_SAMPLE_RATES": "sample_rates",
+            "LOG_SUMMARY_INTERVAL": "summary_interval",
+            "LOG_DEDUP_WINDOW_MS": "dedup_window_ms",
+            "LOG_DEDUP_MAX_KEYS": "dedup_max_keys",
+            "LOG_EXC_FRAME_LIMIT": "exc_frame_limit",
+            "LOG_METRICS": "metrics",
+            "LOG_METRICS_INTERVAL": "metrics_interval",
+            "LOG_FLIGHT_RECORDER": "flight_recorder",
+            "LOG_FLIGHT_RECORDER_LEVEL": "flight_recorder_level",
+            "LOG_FLIGHT_RECORDER_SIGNAL": "flight_recorder_signal",
         }
 
         assert expected_mappings == LogConfig.ENV_MAPPINGS
@@ -196,6 +240,320 @@ class TestConfigResolver:
             result = resolver._get_safe_file_dir("/some/path")
             assert result == Path(tempfile.gettempdir())
 
+    def test_resolve_config_async_defaults(self) -> None:
+        """Test async mode is disabled by default with safe queue settings."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = ConfigResolver().resolve_config()
+
+            assert config.async_mode is False
+            assert config.async_queue_size == 10000
+            assert config.async_overflow == "block"
+
+    def test_resolve_config_async_env_vars(self) -> None:
+        """Test async mode settings are read from environment variables."""
+        env_vars = {
+            "LOG_ASYNC": "true",
+            "LOG_ASYNC_QUEUE_SIZE": "256",
+            "LOG_ASYNC_OVERFLOW": "Drop-Oldest",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = ConfigResolver().resolve_config()
+
+            assert config.async_mode is True
+            assert config.async_queue_size == 256
+            assert config.async_overflow == "drop_oldest"
+
+    def test_resolve_config_async_invalid_values_fall_back(self) -> None:
+        """Test invalid async settings fall back to safe defaults."""
+        env_vars = {"LOG_ASYNC_QUEUE_SIZE": "-5", "LOG_ASYNC_OVERFLOW": "explode"}
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = ConfigResolver().resolve_config()
+
+            assert config.async_queue_size == 10000
+            assert config.async_overflow == "block"
+
+    def test_resolve_config_source_location_mode(self) -> None:
+        """Test source location mode is read from LOG_SOURCE_LOCATION."""
+        with patch.dict(os.environ, {"LOG_SOURCE_LOCATION": "Record"}, clear=True):
+            assert ConfigResolver().resolve_config().source_location == "record"
+
+        with patch.dict(os.environ, {"LOG_SOURCE_LOCATION": "bogus"}, clear=True):
+            assert ConfigResolver().resolve_config().source_location == "stack"
+
+    def test_resolve_config_precompute_filenames(self) -> None:
+        """Test filename precomputation is opt-in via LOG_PRECOMPUTE_FILENAMES."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert ConfigResolver().resolve_config().precompute_filenames is False
+
+        with patch.dict(os.environ, {"LOG_PRECOMPUTE_FILENAMES": "yes"}, clear=True):
+            assert ConfigResolver().resolve_config().precompute_filenames is True
+
+    def test_resolve_config_json_default(self) -> None:
+        """Test the non-serializable value encoder is read from LOG_JSON_DEFAULT."""
+        with patch.dict(os.environ, {"LOG_JSON_DEFAULT": "STR"}, clear=True):
+            assert ConfigResolver().resolve_config().json_default == "str"
+
+        with patch.dict(os.environ, {"LOG_JSON_DEFAULT": "pickle"}, clear=True):
+            assert ConfigResolver().resolve_config().json_default == "drop"
+
+    def test_resolve_config_timestamp_format(self) -> None:
+        """Test timestamp format is read from LOG_TIMESTAMP_FORMAT."""
+        with patch.dict(os.environ, {"LOG_TIMESTAMP_FORMAT": "NS"}, clear=True):
+            assert ConfigResolver().resolve_config().timestamp_format == "ns"
+
+        with patch.dict(os.environ, {"LOG_TIMESTAMP_FORMAT": "rfc2822"}, clear=True):
+            assert ConfigResolver().resolve_config().timestamp_format == "iso"
+
+    def test_resolve_config_json_backend(self) -> None:
+        """Test JSON backend and bytes output are read from the environment."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.json_backend == "stdlib"
+            assert config.json_bytes is False
+
+        env_vars = {"LOG_JSON_BACKEND": "Auto", "LOG_JSON_BYTES": "true"}
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.json_backend == "auto"
+            assert config.json_bytes is True
+
+        with patch.dict(os.environ, {"LOG_JSON_BACKEND": "simplejson"}, clear=True):
+            assert ConfigResolver().resolve_config().json_backend == "stdlib"
+
+    def test_resolve_config_file_batching(self) -> None:
+        """Test buffered file batch policy is read from the environment."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.file_buffered is False
+            assert config.file_batch_bytes == 65536
+            assert config.file_batch_interval_ms == 50
+
+        env_vars = {
+            "LOG_FILE_BUFFERED": "true",
+            "LOG_FILE_BATCH_BYTES": "4096",
+            "LOG_FILE_BATCH_INTERVAL_MS": "200",
+        }
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.file_buffered is True
+            assert config.file_batch_bytes == 4096
+            assert config.file_batch_interval_ms == 200
+
+        env_vars = {"LOG_FILE_BATCH_BYTES": "-1", "LOG_FILE_BATCH_INTERVAL_MS": "soon"}
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.file_batch_bytes == 65536
+            assert config.file_batch_interval_ms == 50
+
+    def test_resolve_config_file_rotation(self) -> None:
+        """Test rotation settings are read from the environment."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.file_rotate is False
+            assert config.file_max_bytes == 0
+            assert config.file_backup_count == 24
+            assert config.file_compress is False
+
+        env_vars = {
+            "LOG_FILE_ROTATE": "true",
+            "LOG_FILE_MAX_BYTES": "1048576",
+            "LOG_FILE_BACKUP_COUNT": "5",
+            "LOG_FILE_COMPRESS": "yes",
+        }
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.file_rotate is True
+            assert config.file_max_bytes == 1048576
+            assert config.file_backup_count == 5
+            assert config.file_compress is True
+
+    def test_resolve_config_file_mmap(self) -> None:
+        """Test memory-mapped file settings are read from the environment."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.file_mmap is False
+            assert config.file_segment_bytes == 64 * 1024 * 1024
+            assert config.file_sync_interval_ms == 1000
+
+        env_vars = {
+            "LOG_FILE_MMAP": "true",
+            "LOG_FILE_SEGMENT_BYTES": "1048576",
+            "LOG_FILE_SYNC_INTERVAL_MS": "250",
+        }
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.file_mmap is True
+            assert config.file_segment_bytes == 1048576
+            assert config.file_sync_interval_ms == 250
+
+    def test_resolve_config_file_compression(self) -> None:
+        """Test compressed output settings are read and invalid codecs disable it."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.file_compression == ""
+            assert config.file_block_bytes == 262144
+            assert config.file_block_interval_ms == 1000
+
+        env_vars = {
+            "LOG_FILE_COMPRESSION": " ZSTD ",
+            "LOG_FILE_BLOCK_BYTES": "1048576",
+            "LOG_FILE_BLOCK_INTERVAL_MS": "5000",
+        }
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.file_compression == "zstd"
+            assert config.file_block_bytes == 1048576
+            assert config.file_block_interval_ms == 5000
+
+        with patch.dict(os.environ, {"LOG_FILE_COMPRESSION": "rar"}, clear=True):
+            assert ConfigResolver().resolve_config().file_compression == ""
+
+    def test_resolve_config_file_format(self) -> None:
+        """Test LOG_FILE_FORMAT selects binary files and defaults to JSON."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert ConfigResolver().resolve_config().file_format == "json"
+
+        with patch.dict(os.environ, {"LOG_FILE_FORMAT": "Binary"}, clear=True):
+            assert ConfigResolver().resolve_config().file_format == "binary"
+
+        with patch.dict(os.environ, {"LOG_FILE_FORMAT": "protobuf"}, clear=True):
+            assert ConfigResolver().resolve_config().file_format == "json"
+
+    def test_resolve_config_ship(self) -> None:
+        """Test log shipping settings are read from the environment."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.ship_address == ""
+            assert config.ship_batch_bytes == 65536
+            assert config.ship_batch_interval_ms == 1000
+            assert config.ship_spool is True
+            assert config.ship_spool_max_bytes == 268435456
+
+        env = {
+            "LOG_SHIP_ADDRESS": " tcp://collector:5170 ",
+            "LOG_SHIP_BATCH_BYTES": "4096",
+            "LOG_SHIP_BATCH_INTERVAL_MS": "200",
+            "LOG_SHIP_SPOOL": "false",
+            "LOG_SHIP_SPOOL_MAX_BYTES": "1048576",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.ship_address == "tcp://collector:5170"
+            assert config.ship_batch_bytes == 4096
+            assert config.ship_batch_interval_ms == 200
+            assert config.ship_spool is False
+            assert config.ship_spool_max_bytes == 1048576
+
+    def test_resolve_config_multiprocess(self) -> None:
+        """Test multiprocess mode is read from the environment."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert ConfigResolver().resolve_config().multiprocess is False
+
+        with patch.dict(os.environ, {"LOG_MULTIPROCESS": "true"}, clear=True):
+            assert ConfigResolver().resolve_config().multiprocess is True
+
+    def test_resolve_config_static_fields(self) -> None:
+        """Test static field settings are read from the environment."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.static_fields is False
+            assert config.service_version == ""
+
+        env_vars = {"LOG_STATIC_FIELDS": "true", "LOG_SERVICE_VERSION": " 1.4.2 "}
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.static_fields is True
+            assert config.service_version == "1.4.2"
+
+    def test_resolve_config_log_schema(self) -> None:
+        """Test LOG_SCHEMA is normalized and invalid schemas are ignored."""
+        env_vars = {"LOG_SCHEMA": " method:STR, status:int ,duration_ms:float"}
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.log_schema == "method:str,status:int,duration_ms:float"
+
+        for invalid in ("status", "status:list", "message:str"):
+            with patch.dict(os.environ, {"LOG_SCHEMA": invalid}, clear=True):
+                assert ConfigResolver().resolve_config().log_schema == ""
+
+    def test_resolve_config_rate_limit_and_sampling(self) -> None:
+        """Test rate limit and sampling settings are read and validated."""
+        env_vars = {
+            "LOG_RATE_LIMIT": "100",
+            "LOG_RATE_BURST": "500",
+            "LOG_SAMPLE_RATES": "debug:0.01, INFO:0.5",
+            "LOG_SUMMARY_INTERVAL": "10",
+        }
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.rate_limit == 100
+            assert config.rate_burst == 500
+            assert config.sample_rates == "DEBUG:0.01,INFO:0.5"
+            assert config.summary_interval == 10
+
+        for invalid in ("INFO", "INFO:2", "VERBOSE:0.5", "INFO:often"):
+            with patch.dict(os.environ, {"LOG_SAMPLE_RATES": invalid}, clear=True):
+                assert ConfigResolver().resolve_config().sample_rates == ""
+
+    def test_resolve_config_dedup(self) -> None:
+        """Test dedup settings are read from the environment."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.dedup_window_ms == 0
+            assert config.dedup_max_keys == 1024
+
+        env_vars = {"LOG_DEDUP_WINDOW_MS": "5000", "LOG_DEDUP_MAX_KEYS": "64"}
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.dedup_window_ms == 5000
+            assert config.dedup_max_keys == 64
+
+    def test_resolve_config_exc_frame_limit(self) -> None:
+        """Test LOG_EXC_FRAME_LIMIT is read and invalid values use the default."""
+        with patch.dict(os.environ, {"LOG_EXC_FRAME_LIMIT": "5"}, clear=True):
+            assert ConfigResolver().resolve_config().exc_frame_limit == 5
+
+        with patch.dict(os.environ, {"LOG_EXC_FRAME_LIMIT": "-1"}, clear=True):
+            assert ConfigResolver().resolve_config().exc_frame_limit == 50
+
+    def test_resolve_config_metrics(self) -> None:
+        """Test LOG_METRICS and LOG_METRICS_INTERVAL are read with safe defaults."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert (config.metrics, config.metrics_interval) == (False, 60)
+
+        env = {"LOG_METRICS": "true", "LOG_METRICS_INTERVAL": "15"}
+        with patch.dict(os.environ, env, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert (config.metrics, config.metrics_interval) == (True, 15)
+
+        with patch.dict(os.environ, {"LOG_METRICS_INTERVAL": "soon"}, clear=True):
+            assert ConfigResolver().resolve_config().metrics_interval == 60
+
+    def test_resolve_config_flight_recorder(self) -> None:
+        """Test the flight recorder is off by default and read from the environment."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.flight_recorder == 0
+            assert config.flight_recorder_level == "DEBUG"
+            assert config.flight_recorder_signal is False
+
+        env = {
+            "LOG_FLIGHT_RECORDER": "5000",
+            "LOG_FLIGHT_RECORDER_LEVEL": "info",
+            "LOG_FLIGHT_RECORDER_SIGNAL": "true",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = ConfigResolver().resolve_config()
+            assert config.flight_recorder == 5000
+            assert config.flight_recorder_level == "INFO"
+            assert config.flight_recorder_signal is True
+
+        with patch.dict(os.environ, {"LOG_FLIGHT_RECORDER_LEVEL": "chatty"}, clear=True):
+            assert ConfigResolver().resolve_config().flight_recorder_level == "DEBUG"
+
     def test_get_safe_file_dir_value_error_handling(self) -> None:
         """Test _get_safe_file_dir handles ValueError gracefully."""
         resolver = ConfigResolver()
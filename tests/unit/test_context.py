@@ -0,0 +1,221 @@
+"""Unit tests for bound request context."""
+
+from __future__ import annotations
+
+import asyncio
+from io import StringIO
+import json
+import logging
+import pickle
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from mypylogger.async_handler import AsyncQueueHandler
+from mypylogger.context import (
+    CONTEXT_ATTR,
+    bind,
+    capture_context,
+    clear_context,
+    contextualize,
+    current_context,
+    get_context,
+    reset_context,
+    unbind,
+)
+from mypylogger.formatters import SourceLocationJSONFormatter
+from tests.conftest import make_record
+
+
+@pytest.fixture(autouse=True)
+def _clean_context() -> None:
+    """Start every test without bound fields."""
+    clear_context()
+    yield
+    clear_context()
+
+
+class TestBoundContext:
+    """Test binding and unbinding context fields."""
+
+    def test_bind_and_unbind(self) -> None:
+        """Test fields are added, replaced and removed."""
+        bind(request_id="r1", tenant="t1")
+        bind(request_id="r2")
+        assert get_context() == {"tenant": "t1", "request_id": "r2"}
+
+        unbind("tenant")
+        assert get_context() == {"request_id": "r2"}
+
+    def test_fields_serialized_once_at_bind(self) -> None:
+        """Test bound values are encoded when bound, not per record."""
+        bind(request_id="r1", attempt=3, tags=["a", "b"])
+        context = current_context()
+
+        assert context.fragment == '"request_id":"r1","attempt":3,"tags":["a","b"]'
+        assert context.fragment_bytes == context.fragment.encode()
+
+        formatter = SourceLocationJSONFormatter()
+        with patch("json.dumps", wraps=json.dumps) as mock_dumps:
+            formatter.format(make_record())
+            formatter.format(make_record())
+
+        # Only the per-record fields are encoded; bound values never reach the encoder
+        assert mock_dumps.call_count == 2
+        for call in mock_dumps.call_args_list:
+            assert "request_id" not in call.args[0]
+
+    def test_reset_context_with_token(self) -> None:
+        """Test reset_context restores the previous binding."""
+        bind(a=1)
+        token = bind(b=2)
+        reset_context(token)
+        assert get_context() == {"a": 1}
+
+    def test_contextualize_scopes_fields(self) -> None:
+        """Test contextualize binds only inside the with block."""
+        with contextualize(trace_id="t"):
+            assert get_context() == {"trace_id": "t"}
+        assert get_context() == {}
+
+    def test_reserved_and_unserializable_fields_are_skipped(self) -> None:
+        """Test invalid fields are reported and not bound."""
+        with patch("mypylogger.context._log_context_error") as mock_error:
+            bind(message="nope", handle=object(), ok=True)
+
+        assert get_context() == {"ok": True}
+        assert mock_error.call_count == 2
+
+    def test_exception_fields_are_reserved(self) -> None:
+        """Test exception and stack_hash cannot be bound next to exc_info output."""
+        with patch("mypylogger.context._log_context_error") as mock_error:
+            bind(exception="nope", stack_hash="nope", ok=True)
+
+        assert get_context() == {"ok": True}
+        assert mock_error.call_count == 2
+
+        try:
+            {}["missing"]
+        except KeyError:
+            record = logging.LogRecord(
+                "ctx", logging.ERROR, __file__, 1, "failed", (), sys.exc_info()
+            )
+        line = SourceLocationJSONFormatter().format(record)
+
+        assert line.count('"exception":') == 1
+        assert line.count('"stack_hash":') == 1
+        assert json.loads(line)["ok"] is True
+
+    def test_threads_do_not_share_context(self) -> None:
+        """Test a new thread starts with an empty context."""
+        bind(request_id="main")
+        seen: list[dict[str, object]] = []
+
+        thread = threading.Thread(target=lambda: seen.append(get_context()))
+        thread.start()
+        thread.join()
+
+        assert seen == [{}]
+
+    def test_asyncio_tasks_are_isolated(self) -> None:
+        """Test concurrent tasks keep their own bound fields."""
+
+        async def handle(request_id: str) -> dict[str, object]:
+            bind(request_id=request_id)
+            await asyncio.sleep(0)
+            return get_context()
+
+        async def main() -> list[dict[str, object]]:
+            return list(await asyncio.gather(handle("a"), handle("b")))
+
+        assert asyncio.run(main()) == [{"request_id": "a"}, {"request_id": "b"}]
+
+
+class TestContextFormatting:
+    """Test splicing bound fields into formatter output."""
+
+    def test_bound_fields_in_output(self) -> None:
+        """Test bound fields appear after the record fields."""
+        formatter = SourceLocationJSONFormatter()
+        bind(request_id="r1", tenant="ünï")
+
+        parsed = json.loads(formatter.format(make_record(user_id=5)))
+
+        assert parsed["request_id"] == "r1"
+        assert parsed["tenant"] == "ünï"
+        assert parsed["user_id"] == 5
+        assert list(parsed)[-2:] == ["request_id", "tenant"]
+
+    def test_bytes_output(self) -> None:
+        """Test the bytes path splices the pre-encoded bytes fragment."""
+        formatter = SourceLocationJSONFormatter()
+        bind(request_id="r1")
+
+        parsed = json.loads(formatter.format_bytes(make_record()))
+
+        assert parsed["request_id"] == "r1"
+
+    def test_record_extra_overrides_bound_field(self) -> None:
+        """Test a per-record field wins over the bound one without duplicate keys."""
+        formatter = SourceLocationJSONFormatter()
+        bind(request_id="bound", tenant="t")
+
+        output = formatter.format(make_record(request_id="explicit"))
+
+        assert output.count('"request_id"') == 1
+        assert json.loads(output)["request_id"] == "explicit"
+        assert json.loads(output)["tenant"] == "t"
+
+    def test_record_extra_overrides_all_bound_fields(self) -> None:
+        """Test nothing is spliced when every bound field is overridden."""
+        formatter = SourceLocationJSONFormatter()
+        bind(request_id="bound")
+
+        assert json.loads(formatter.format(make_record(request_id="x")))["request_id"] == "x"
+
+    def test_no_context_output_unchanged(self) -> None:
+        """Test output is unchanged when nothing is bound."""
+        formatter = SourceLocationJSONFormatter()
+        record = make_record()
+
+        assert not formatter.format(record).endswith(",}")
+        assert json.loads(formatter.format(record))["message"] == "message"
+
+    def test_captured_context_used_on_other_thread(self) -> None:
+        """Test a captured context is formatted even where it is not bound."""
+        formatter = SourceLocationJSONFormatter()
+        record = make_record()
+        with contextualize(request_id="captured"):
+            capture_context(record)
+
+        assert CONTEXT_ATTR in record.__dict__
+        assert json.loads(formatter.format(record))["request_id"] == "captured"
+
+    def test_captured_context_pickles(self) -> None:
+        """Test captured contexts survive pickling for the multiprocess collector."""
+        record = make_record()
+        with contextualize(request_id="p"):
+            capture_context(record)
+
+        context = pickle.loads(pickle.dumps(record.__dict__[CONTEXT_ATTR]))  # noqa: S301
+
+        assert context.fields == {"request_id": "p"}
+        assert context.fragment == '"request_id":"p"'
+
+    def test_async_handler_captures_context(self) -> None:
+        """Test records formatted on the async writer thread keep the caller's context."""
+        stream = StringIO()
+        target = logging.StreamHandler(stream)
+        formatter = SourceLocationJSONFormatter()
+        target.setFormatter(formatter)
+        handler = AsyncQueueHandler([target], formatter)
+        try:
+            with contextualize(request_id="async"):
+                handler.handle(make_record())
+            handler.flush()
+        finally:
+            handler.close()
+
+        assert json.loads(stream.getvalue())["request_id"] == "async"
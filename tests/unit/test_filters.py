@@ -0,0 +1,343 @@
+"""Unit tests for rate limiting and sampling filters."""
+
+import itertools
+import json
+import logging
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mypylogger.config import LogConfig
+from mypylogger.core import LoggerManager
+from mypylogger.exceptions import ConfigurationError
+from mypylogger.filters import (
+    DedupFilter,
+    RateLimitFilter,
+    SamplingFilter,
+    SuppressionFilter,
+    _flush_summaries,
+    parse_sample_rates,
+)
+from mypylogger.formatters import SourceLocationJSONFormatter
+from tests.conftest import make_record
+
+
+class _ListHandler(logging.Handler):
+    """Handler collecting the records it receives."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.lines: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+        self.records.append(record)
+
+
+_logger_ids = itertools.count()
+
+
+@pytest.fixture
+def logger() -> logging.Logger:
+    """Provide an isolated logger with a collecting handler."""
+    test_logger = logging.getLogger(f"filters-{next(_logger_ids)}")
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.propagate = False
+    test_logger.addHandler(_ListHandler())
+    return test_logger
+
+
+class TestSuppressionFilter:
+    """Test the suppression filter base class."""
+
+    def test_decide_is_abstract(self) -> None:
+        """Test the base class cannot be used without a decide() implementation."""
+        with pytest.raises(TypeError, match="decide"):
+            SuppressionFilter()  # type: ignore[abstract]
+
+
+class TestRateLimitFilter:
+    """Test the per-call-site token bucket."""
+
+    def test_burst_then_refill(self) -> None:
+        """Test a call site gets burst records, then rate per second."""
+        limiter = RateLimitFilter(rate=2, burst=3)
+
+        kept = [limiter.decide(make_record(), 100.0) for _ in range(5)]
+        assert kept == [True, True, True, False, False]
+
+        assert limiter.decide(make_record(), 100.5) is True
+        assert limiter.decide(make_record(), 100.5) is False
+        assert limiter.suppressed() == {"/srv/app/views.py:42": 3}
+
+    def test_call_sites_are_independent(self) -> None:
+        """Test one noisy line does not starve another."""
+        limiter = RateLimitFilter(rate=1)
+
+        assert limiter.decide(make_record(lineno=1), 0.0) is True
+        assert limiter.decide(make_record(lineno=1), 0.0) is False
+        assert limiter.decide(make_record(lineno=2), 0.0) is True
+
+    def test_warnings_always_kept(self) -> None:
+        """Test WARNING and above bypass the limit."""
+        limiter = RateLimitFilter(rate=1)
+
+        assert all(limiter.filter(make_record(level=logging.ERROR)) for _ in range(50))
+        assert limiter.suppressed() == {}
+
+    def test_call_sites_bounded(self) -> None:
+        """Test the least recently used call sites are forgotten."""
+        limiter = RateLimitFilter(rate=1, max_call_sites=2)
+
+        for lineno in range(5):
+            limiter.decide(make_record(lineno=lineno), 0.0)
+
+        assert list(limiter._buckets) == [("/srv/app/views.py", 3), ("/srv/app/views.py", 4)]
+
+    def test_dropped_records_never_formatted(self, logger: logging.Logger) -> None:
+        """Test the decision is made before any handler or formatter runs."""
+        handler = logger.handlers[0]
+        handler.format = Mock(wraps=handler.format)  # type: ignore[method-assign]
+        logger.addFilter(RateLimitFilter(rate=1, burst=5, logger=logger))
+
+        for _ in range(1000):
+            logger.info("hot loop")
+
+        assert handler.format.call_count <= 6
+        assert len(handler.records) <= 6  # type: ignore[attr-defined]
+
+
+class TestSamplingFilter:
+    """Test head sampling by level."""
+
+    def test_rates_per_level(self) -> None:
+        """Test each level keeps roughly its configured fraction."""
+        sampler = SamplingFilter({logging.DEBUG: 0.0, logging.INFO: 0.25})
+
+        assert not any(sampler.filter(make_record(level=logging.DEBUG)) for _ in range(100))
+        with patch("mypylogger.filters.random.random", side_effect=[0.1, 0.3, 0.2, 0.9]):
+            kept = [sampler.filter(make_record(level=logging.INFO)) for _ in range(4)]
+
+        assert kept == [True, False, True, False]
+        assert sampler.suppressed() == {"DEBUG": 100, "INFO": 2}
+
+    def test_unlisted_and_high_levels_kept(self) -> None:
+        """Test levels without a rate and WARNING+ are always kept."""
+        sampler = SamplingFilter({logging.INFO: 0.0, logging.ERROR: 0.0})
+
+        assert sampler.filter(make_record(level=logging.DEBUG)) is True
+        assert sampler.filter(make_record(level=logging.ERROR)) is True
+
+    def test_parse_sample_rates(self) -> None:
+        """Test LEVEL:ratio specifications."""
+        assert parse_sample_rates("debug:0.01, INFO:1") == {
+            logging.DEBUG: 0.01,
+            logging.INFO: 1.0,
+        }
+        for invalid in ("INFO", "INFO:1.5", "LOUD:0.1", "INFO:x"):
+            with pytest.raises(ConfigurationError):
+                parse_sample_rates(invalid)
+
+
+class TestDedupFilter:
+    """Test duplicate-message collapsing."""
+
+    def test_repeats_collapsed_into_summary(self, logger: logging.Logger) -> None:
+        """Test the first record is logged and repeats become one summary."""
+        dedup = DedupFilter(window=0.05, logger=logger)
+        logger.addFilter(dedup)
+        records = logger.handlers[0].records  # type: ignore[attr-defined]
+
+        for attempt in range(100):
+            logger.error("Database unavailable (attempt %d)", attempt)
+        assert [r.getMessage() for r in records] == ["Database unavailable (attempt 0)"]
+        assert dedup.suppressed() == {records[0].pathname + f":{records[0].lineno}": 99}
+
+        time.sleep(0.06)
+        logger.error("Database unavailable (attempt %d)", 100)
+
+        summary = records[1]
+        assert summary.getMessage() == "Database unavailable (attempt 99) (repeated 99 times)"
+        assert summary.levelno == logging.ERROR
+        assert summary.lineno == records[0].lineno
+        assert summary.repeat_count == 99
+        assert summary.first_seen <= summary.last_seen
+        # The window closed, so the next occurrence is logged and opens a new one
+        assert records[2].getMessage() == "Database unavailable (attempt 100)"
+        assert len(records) == 3
+
+    def test_key_includes_level_and_call_site(self) -> None:
+        """Test the same text at another level or line is not a repeat."""
+        dedup = DedupFilter(window=60)
+
+        assert dedup.filter(make_record(level=logging.INFO, lineno=1)) is True
+        assert dedup.filter(make_record(level=logging.INFO, lineno=1)) is False
+        assert dedup.filter(make_record(level=logging.ERROR, lineno=1)) is True
+        assert dedup.filter(make_record(level=logging.INFO, lineno=2)) is True
+
+    def test_repeats_never_formatted(self, logger: logging.Logger) -> None:
+        """Test counted repeats skip the formatter entirely."""
+        handler = logger.handlers[0]
+        handler.format = Mock(wraps=handler.format)  # type: ignore[method-assign]
+        logger.addFilter(DedupFilter(window=60, logger=logger))
+
+        for _ in range(1000):
+            logger.error("same failure")
+
+        assert handler.format.call_count == 1
+
+    def test_open_windows_bounded(self, logger: logging.Logger) -> None:
+        """Test the oldest window is closed early when max_keys is exceeded."""
+        dedup = DedupFilter(window=60, logger=logger, max_keys=2)
+        for lineno in (1, 1, 2, 3):
+            dedup.filter(make_record(lineno=lineno))
+
+        assert len(dedup._windows) == 2
+        (summary,) = logger.handlers[0].records  # type: ignore[attr-defined]
+        assert (summary.lineno, summary.repeat_count) == (1, 1)
+
+    def test_window_closed_by_timer(self, logger: logging.Logger) -> None:
+        """Test a burst followed by silence is summarized, located at the burst."""
+        handler = logger.handlers[0]
+        handler.setFormatter(SourceLocationJSONFormatter())  # stack-based location
+        logger.addFilter(DedupFilter(window=0.05, logger=logger))
+
+        def flood() -> None:
+            for _ in range(3):
+                logger.warning("queue full")
+
+        flood()
+        deadline = time.monotonic() + 5
+        while len(handler.lines) < 2 and time.monotonic() < deadline:  # type: ignore[attr-defined]
+            time.sleep(0.01)
+
+        summary = json.loads(handler.lines[1])  # type: ignore[attr-defined]
+        assert summary["message"] == "queue full (repeated 2 times)"
+        assert summary["function_name"] == "flood"
+        assert summary["line"] == flood.__code__.co_firstlineno + 2
+
+    def test_flush_closes_open_windows(self, logger: logging.Logger) -> None:
+        """Test pending repeats are reported at exit."""
+        dedup = DedupFilter(window=60, logger=logger)
+        logger.addFilter(dedup)
+        for _ in range(3):
+            logger.warning("disk almost full")
+
+        _flush_summaries()
+
+        records = logger.handlers[0].records  # type: ignore[attr-defined]
+        assert records[-1].getMessage() == "disk almost full (repeated 2 times)"
+        assert dedup.suppressed() == {}
+
+
+class TestSuppressionSummary:
+    """Test periodic summary records."""
+
+    def test_summary_emitted_when_interval_elapses(self, logger: logging.Logger) -> None:
+        """Test dropped counts are reported by the timer without later traffic."""
+        sampler = SamplingFilter({logging.INFO: 0.0}, logger=logger, summary_interval=0.2)
+        logger.addFilter(sampler)
+        for _ in range(10):
+            logger.info("dropped")
+        records = logger.handlers[0].records  # type: ignore[attr-defined]
+        assert records == []
+
+        deadline = time.monotonic() + 5
+        while not records and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert len(records) == 1
+        summary = records[0]
+        assert summary.levelno == logging.WARNING
+        assert summary.getMessage().startswith("Suppressed 10 log records")
+        assert summary.suppressed_by == "sampling"
+        assert summary.suppressed_total == 10
+        assert summary.suppressed == {"INFO": 10}
+        assert sampler.suppressed() == {}
+
+    def test_summary_located_at_dropped_call(self, logger: logging.Logger) -> None:
+        """Test the summary reports the dropped call site, not the timer that emitted it."""
+        handler = logger.handlers[0]
+        handler.setFormatter(SourceLocationJSONFormatter())  # stack-based location
+        logger.addFilter(RateLimitFilter(rate=1, logger=logger, summary_interval=0.05))
+
+        def flood() -> None:
+            for _ in range(3):
+                logger.info("tick")
+
+        flood()
+        deadline = time.monotonic() + 5
+        while len(handler.lines) < 2 and time.monotonic() < deadline:  # type: ignore[attr-defined]
+            time.sleep(0.01)
+
+        summary = json.loads(handler.lines[1])  # type: ignore[attr-defined]
+        assert summary["message"].startswith("Suppressed 2 log records")
+        assert summary["function_name"] == "flood"
+        assert summary["line"] == flood.__code__.co_firstlineno + 2
+
+    def test_no_summary_without_drops(self, logger: logging.Logger) -> None:
+        """Test nothing is emitted when no record was dropped."""
+        limiter = RateLimitFilter(rate=100, logger=logger, summary_interval=0)
+        logger.addFilter(limiter)
+
+        logger.info("kept")
+
+        assert len(logger.handlers[0].records) == 1  # type: ignore[attr-defined]
+
+    def test_pending_counts_flushed_at_exit(self, logger: logging.Logger) -> None:
+        """Test the exit hook reports counts from an unfinished interval."""
+        limiter = RateLimitFilter(rate=1, logger=logger)
+        logger.addFilter(limiter)
+        for _ in range(3):
+            logger.info("tick")
+
+        _flush_summaries()
+
+        summary = logger.handlers[0].records[-1]  # type: ignore[attr-defined]
+        assert summary.suppressed_by == "rate_limit"
+        assert summary.suppressed_total == 2
+
+
+class TestConfigureLoggerFilters:
+    """Test LoggerManager attaches the configured filters."""
+
+    def test_filters_attached_from_config(self, logger: logging.Logger) -> None:
+        """Test dedup, rate limit and sampling settings add logger filters."""
+        config = LogConfig(
+            app_name="svc",
+            log_level="DEBUG",
+            log_to_file=False,
+            log_file_dir=None,  # type: ignore[arg-type]
+            rate_limit=10,
+            rate_burst=20,
+            sample_rates="DEBUG:0.1",
+            summary_interval=5,
+            dedup_window_ms=2500,
+            dedup_max_keys=16,
+        )
+
+        LoggerManager().configure_logger(logger, config)
+
+        dedup, limiter, sampler = logger.filters
+        assert isinstance(dedup, DedupFilter)
+        assert (dedup.window, dedup.max_keys) == (2.5, 16)
+        assert isinstance(limiter, RateLimitFilter)
+        assert (limiter.rate, limiter.burst, limiter.logger) == (10, 20, logger)
+        assert isinstance(sampler, SamplingFilter)
+        assert sampler.rates == {logging.DEBUG: 0.1}
+        assert sampler.summary_interval == 5
+
+    def test_no_filters_by_default(self, logger: logging.Logger) -> None:
+        """Test filtering is off unless configured."""
+        config = LogConfig(
+            app_name="svc",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=None,  # type: ignore[arg-type]
+        )
+
+        LoggerManager().configure_logger(logger, config)
+
+        assert logger.filters == []
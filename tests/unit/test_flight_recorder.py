@@ -0,0 +1,239 @@
+"""Unit tests for the in-memory flight recorder."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import os
+import signal
+import threading
+import time
+import types
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from mypylogger import flight_recorder
+from mypylogger.config import LogConfig
+from mypylogger.context import contextualize
+from mypylogger.core import LoggerManager
+from mypylogger.flight_recorder import FlightRecorderHandler, dump_all
+from mypylogger.formatters import SOURCE_LOCATION_RECORD, SourceLocationJSONFormatter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_logger_ids = itertools.count()
+
+
+@pytest.fixture
+def logger() -> logging.Logger:
+    """Provide an isolated logger."""
+    test_logger = logging.getLogger(f"flight-{next(_logger_ids)}")
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.propagate = False
+    return test_logger
+
+
+def _recorder(logger: logging.Logger, dump_path: Path, capacity: int) -> FlightRecorderHandler:
+    """Attach a flight recorder dumping to dump_path."""
+    recorder = FlightRecorderHandler(capacity, dump_path=dump_path)
+    recorder.setFormatter(SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD))
+    logger.addHandler(recorder)
+    return recorder
+
+
+def _dumped(dump_path: Path) -> list[dict]:
+    """Read the dumped JSON lines."""
+    return [json.loads(line) for line in dump_path.read_text().splitlines()]
+
+
+class TestFlightRecorderHandler:
+    """Test buffering and dumping."""
+
+    def test_keeps_last_records_unformatted(self, logger: logging.Logger, tmp_path: Path) -> None:
+        """Test only the newest capacity records are kept, oldest first, never formatted."""
+        recorder = _recorder(logger, tmp_path / "flight.log", capacity=3)
+
+        with patch.object(SourceLocationJSONFormatter, "format_bytes") as format_bytes:
+            for i in range(5):
+                logger.debug("step %d", i)
+
+        format_bytes.assert_not_called()
+        assert [r.getMessage() for r in recorder.records()] == ["step 2", "step 3", "step 4"]
+        assert recorder.stats() == {"buffered_records": 3, "capacity": 3, "dumps": 0}
+        assert not (tmp_path / "flight.log").exists()
+
+    def test_error_dumps_context(self, logger: logging.Logger, tmp_path: Path) -> None:
+        """Test an ERROR writes the buffer with the error last, then empties it."""
+        dump_path = tmp_path / "flight.log"
+        recorder = _recorder(logger, dump_path, capacity=10)
+
+        logger.debug("connecting", extra={"attempt": 1})
+        logger.info("connected")
+        logger.error("query failed")
+
+        lines = _dumped(dump_path)
+        assert [line["message"] for line in lines] == ["connecting", "connected", "query failed"]
+        assert lines[0]["level"] == "DEBUG"
+        assert lines[0]["attempt"] == 1
+        # Located at the logging call, not where the dump happened
+        assert lines[0]["function_name"] == "test_error_dumps_context"
+        assert recorder.records() == []
+
+        logger.error("query failed again")
+        assert len(_dumped(dump_path)) == 4
+        assert recorder.dumps == 2
+        assert recorder.bytes_written == dump_path.stat().st_size
+
+    def test_records_keep_their_thread_state(self, logger: logging.Logger, tmp_path: Path) -> None:
+        """Test a record dumped from another thread keeps its own context, location and args."""
+        dump_path = tmp_path / "flight.log"
+        recorder = FlightRecorderHandler(10, dump_path=dump_path)
+        recorder.setFormatter(SourceLocationJSONFormatter())  # stack-based location
+        logger.addHandler(recorder)
+        items = ["first"]
+
+        def worker() -> None:
+            with contextualize(request_id="worker-req"):
+                logger.debug("items %s", items)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        items.append("added later")
+        with contextualize(request_id="main-req"):
+            logger.error("dump from main")
+
+        worker_line, main_line = _dumped(dump_path)
+        assert worker_line["message"] == "items ['first']"
+        assert worker_line["request_id"] == "worker-req"
+        assert worker_line["function_name"] == "worker"
+        assert main_line["request_id"] == "main-req"
+
+    def test_dump_all_and_crash_exit(self, logger: logging.Logger, tmp_path: Path) -> None:
+        """Test manual dumps and the exit hook after an uncaught exception."""
+        dump_path = tmp_path / "flight.log"
+        _recorder(logger, dump_path, capacity=10)
+        logger.debug("before manual dump")
+
+        assert dump_all() >= 1
+        assert dump_all() == 0
+
+        logger.debug("before crash")
+        flight_recorder._dump_after_crash()
+        assert len(_dumped(dump_path)) == 1
+        with patch.object(flight_recorder.sys, "last_value", ValueError("boom"), create=True):
+            flight_recorder._dump_after_crash()
+        assert [line["message"] for line in _dumped(dump_path)] == [
+            "before manual dump",
+            "before crash",
+        ]
+
+    def test_main_module_resolved_when_buffered(
+        self, logger: logging.Logger, tmp_path: Path
+    ) -> None:
+        """Test a dump after __main__.__file__ is gone still credits __main__."""
+        dump_path = tmp_path / "flight.log"
+        recorder = _recorder(logger, dump_path, capacity=10)
+        script = str(tmp_path / "script.py")
+        main = types.ModuleType("__main__")
+        main.__file__ = script
+        record = logger.makeRecord(logger.name, logging.INFO, script, 3, "in script", (), None)
+
+        with patch.dict("sys.modules", {"__main__": main}):
+            recorder.handle(record)
+        # The interpreter deletes __main__.__file__ before exit hooks dump
+        del main.__file__
+        recorder.dump()
+
+        assert _dumped(dump_path)[0]["module"] == "__main__"
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="SIGUSR1 not available")
+    def test_signal_dumps(self, logger: logging.Logger, tmp_path: Path) -> None:
+        """Test SIGUSR1 dumps the buffer on the dumper thread and calls the previous handler."""
+        dump_path = tmp_path / "flight.log"
+        _recorder(logger, dump_path, capacity=10)
+        received = []
+        dump_threads: list[str] = []
+
+        def recording_dump_all() -> int:
+            count = dump_all()
+            dump_threads.append(threading.current_thread().name)
+            return count
+
+        original = signal.signal(signal.SIGUSR1, lambda signum, _frame: received.append(signum))
+        try:
+            with patch.object(flight_recorder, "_signal_installed", threading.Event()):
+                assert flight_recorder.install_signal_handler() is True
+                logger.debug("waiting for input")
+                with patch.object(flight_recorder, "dump_all", recording_dump_all):
+                    os.kill(os.getpid(), signal.SIGUSR1)
+                    deadline = time.monotonic() + 5
+                    while not dump_threads and time.monotonic() < deadline:
+                        time.sleep(0.01)
+        finally:
+            signal.signal(signal.SIGUSR1, original)
+
+        assert [line["message"] for line in _dumped(dump_path)] == ["waiting for input"]
+        assert received == [signal.SIGUSR1]
+        # The signal handler only wakes the dumper thread, which does the dump
+        assert dump_threads == ["mypylogger-flight-recorder"]
+
+
+class TestManagerFlightRecorder:
+    """Test LoggerManager wiring of LOG_FLIGHT_RECORDER."""
+
+    def test_recorder_sees_debug_while_console_stays_at_info(
+        self, logger: logging.Logger, tmp_path: Path
+    ) -> None:
+        """Test the logger is lowered to DEBUG for the recorder only."""
+        config = LogConfig(
+            app_name="svc",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=tmp_path,
+            flight_recorder=100,
+        )
+        manager = LoggerManager()
+        manager.configure_logger(logger, config)
+        ((console, recorder), _) = manager._installed[logger.name]
+
+        assert logger.level == logging.DEBUG
+        assert console.level == logging.INFO
+        assert isinstance(recorder, FlightRecorderHandler)
+        assert recorder.level == logging.DEBUG
+        assert recorder.capacity == 100
+        assert recorder.dump_path is None
+
+        with patch.object(console, "emit") as console_emit:
+            logger.debug("hidden from console")
+        console_emit.assert_not_called()
+        assert [r.getMessage() for r in recorder.records()] == ["hidden from console"]
+        recorder.close()
+
+    def test_recorder_shared_and_dumps_to_log_dir(
+        self, logger: logging.Logger, tmp_path: Path
+    ) -> None:
+        """Test loggers share one recorder writing next to the log files."""
+        config = LogConfig(
+            app_name="svc",
+            log_level="WARNING",
+            log_to_file=True,
+            log_file_dir=tmp_path,
+            flight_recorder=100,
+            flight_recorder_level="INFO",
+        )
+        manager = LoggerManager()
+        other = logging.getLogger(f"{logger.name}-other")
+        manager.configure_logger(logger, config)
+        manager.configure_logger(other, config)
+
+        recorder = manager._installed[logger.name][0][-1]
+        assert manager._installed[other.name][0][-1] is recorder
+        assert logger.level == logging.INFO
+        assert recorder.dump_path == tmp_path / "svc_flight.log"  # type: ignore[attr-defined]
+        for handler in manager._installed[logger.name][0]:
+            handler.close()
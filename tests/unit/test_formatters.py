@@ -1,6 +1,6 @@
 """Unit tests for SourceLocationJSONFormatter functionality."""
 
-import datetime
+import datetime as dt
 import json
 import logging
 from pathlib import Path
@@ -9,7 +9,7 @@ import tempfile
 from types import FrameType
 from unittest.mock import Mock, patch
 
-from mypylogger.formatters import SourceLocationJSONFormatter
+from mypylogger.formatters import RESERVED_FIELDS, SourceLocationJSONFormatter
 
 
 class TestSourceLocationJSONFormatter:
@@ -473,13 +473,14 @@ class TestSourceLocationJSONFormatter:
             exc_info=None,
         )
 
-        record.problem_field = "normal_value"
+        # Primitive values skip the serialization probe, so use a container
+        record.problem_field = ["normal_value"]
 
         # Mock json.dumps to raise an unexpected error for this specific field
         original_dumps = json.dumps
 
         def mock_dumps(obj: object, **kwargs: object) -> str:
-            if obj == "normal_value":
+            if obj == ["normal_value"]:
                 error_msg = "Unexpected error"
                 raise RuntimeError(error_msg)
             return original_dumps(obj, **kwargs)
@@ -498,6 +499,53 @@ class TestSourceLocationJSONFormatter:
                     in mock_log_error.call_args[0][0]
                 )
 
+    def test_handle_custom_fields_primitives_skip_probe(self) -> None:
+        """Test primitive values are accepted without a probe serialization."""
+        formatter = SourceLocationJSONFormatter()
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="/path/to/test.py",
+            lineno=42,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        record.__dict__.update({"s": "x", "i": 1, "f": 1.5, "b": True, "n": None})
+
+        with patch("json.dumps") as mock_dumps:
+            custom_fields = formatter._handle_custom_fields(record)
+
+            mock_dumps.assert_not_called()
+            assert custom_fields == {"s": "x", "i": 1, "f": 1.5, "b": True, "n": None}
+
+    def test_handle_custom_fields_uses_default_encoder(self) -> None:
+        """Test non-serializable values are encoded with json_default instead of dropped."""
+        formatter = SourceLocationJSONFormatter(json_default=str)
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="/path/to/test.py",
+            lineno=42,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        record.path = Path("/var/data")
+        record.tags = {"when": Path("/srv/cache")}
+
+        with patch.object(formatter, "_log_formatting_error") as mock_log_error:
+            parsed = json.loads(formatter.format(record))
+
+            mock_log_error.assert_not_called()
+            assert parsed["path"] == str(Path("/var/data"))
+            assert parsed["tags"] == {"when": str(Path("/srv/cache"))}
+
+    def test_reserved_fields_built_once(self) -> None:
+        """Test reserved record attributes are a shared module-level set."""
+        assert isinstance(RESERVED_FIELDS, frozenset)
+        assert {"msg", "args", "exc_info", "custom", "timestamp"} <= RESERVED_FIELDS
+
     def test_is_logging_internal_true(self) -> None:
         """Test _is_logging_internal identifies logging internal files."""
         formatter = SourceLocationJSONFormatter()
@@ -552,6 +600,61 @@ class TestSourceLocationJSONFormatter:
                     result = formatter._get_relative_filename(str(test_file))
                     assert result == "test.py"  # Should return just filename
 
+    def test_get_relative_filename_cached_between_calls(self) -> None:
+        """Test repeated lookups reuse the cached name without re-reading cwd."""
+        formatter = SourceLocationJSONFormatter()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = str(Path(temp_dir) / "pkg" / "mod.py")
+
+            with patch("pathlib.Path.cwd", return_value=Path(temp_dir)) as mock_cwd:
+                first = formatter._get_relative_filename(test_file)
+                second = formatter._get_relative_filename(test_file)
+
+                assert first == second == str(Path("pkg") / "mod.py")
+                mock_cwd.assert_called_once()
+
+    def test_get_relative_filename_invalidated_on_cwd_change(self) -> None:
+        """Test a working directory change clears cached relative names."""
+        formatter = SourceLocationJSONFormatter()
+        formatter.cwd_check_interval = 0.0
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = str(Path(temp_dir) / "pkg" / "mod.py")
+
+            with patch("pathlib.Path.cwd", return_value=Path(temp_dir)):
+                assert formatter._get_relative_filename(test_file) == str(Path("pkg") / "mod.py")
+
+            with patch("pathlib.Path.cwd", return_value=Path(temp_dir) / "pkg"):
+                assert formatter._get_relative_filename(test_file) == "mod.py"
+
+    def test_get_relative_filename_cwd_unavailable(self) -> None:
+        """Test a deleted working directory falls back to the bare filename."""
+        formatter = SourceLocationJSONFormatter()
+
+        with patch("pathlib.Path.cwd", side_effect=FileNotFoundError("gone")):
+            assert formatter._get_relative_filename("/path/to/file.py") == "file.py"
+
+    def test_invalidate_filename_cache(self) -> None:
+        """Test explicit invalidation forces the working directory to be re-read."""
+        formatter = SourceLocationJSONFormatter()
+
+        with patch("pathlib.Path.cwd", return_value=Path("/path")) as mock_cwd:
+            formatter._get_relative_filename("/path/to/file.py")
+            formatter.invalidate_filename_cache()
+            formatter._get_relative_filename("/path/to/file.py")
+
+            assert mock_cwd.call_count == 2
+
+    def test_precompute_relative_filenames(self) -> None:
+        """Test precomputation caches names for already-imported modules."""
+        formatter = SourceLocationJSONFormatter()
+
+        formatter.precompute_relative_filenames()
+
+        assert formatter.filenames_precomputed is True
+        assert formatter._relative_names.get(json.__file__) is not None
+
     def test_get_relative_filename_exception_handling(self) -> None:
         """Test _get_relative_filename handles exceptions gracefully."""
         formatter = SourceLocationJSONFormatter()
@@ -613,8 +716,26 @@ class TestSourceLocationJSONFormatter:
             assert "." in timestamp  # Should have microseconds
 
             # Should be parseable as ISO format
-            parsed_dt = datetime.datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            assert isinstance(parsed_dt, datetime.datetime)
+            parsed_dt = dt.datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            assert isinstance(parsed_dt, dt.datetime)
+
+    def test_format_timestamp_epoch_precision(self) -> None:
+        """Test epoch timestamp formats emit integers in the JSON output."""
+        formatter = SourceLocationJSONFormatter(timestamp_format="ms")
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="/path/to/test.py",
+            lineno=42,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        record.created = 1_700_000_000.5
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["timestamp"] == 1_700_000_000_500
 
     def test_format_timestamp_method(self) -> None:
         """Test the _format_timestamp method directly."""
@@ -637,8 +758,8 @@ class TestSourceLocationJSONFormatter:
         assert "." in timestamp
 
         # Should be parseable as ISO format
-        parsed_dt = datetime.datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        assert isinstance(parsed_dt, datetime.datetime)
+        parsed_dt = dt.datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        assert isinstance(parsed_dt, dt.datetime)
 
     def test_format_json_output_structure(self) -> None:
         """Test that JSON output has expected structure and no extra fields."""
@@ -1,5 +1,7 @@
 """Unit tests for HandlerFactory functionality."""
 
+from io import BytesIO, StringIO
+import json
 import logging
 from pathlib import Path
 import sys
@@ -8,10 +10,12 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from mypylogger.buffered_handler import BufferedFileHandler
 from mypylogger.config import LogConfig
 from mypylogger.exceptions import HandlerError
 from mypylogger.formatters import SourceLocationJSONFormatter
-from mypylogger.handlers import HandlerFactory
+from mypylogger.handlers import BytesFileHandler, BytesStreamHandler, HandlerFactory
+from mypylogger.rotating_handler import RotatingFileHandler
 
 
 class TestHandlerFactory:
@@ -46,6 +50,61 @@ class TestHandlerFactory:
             assert "Failed to create console handler" in str(exc_info.value)
             assert "Handler error" in str(exc_info.value)
 
+    def test_get_formatter_shared_per_options(self) -> None:
+        """Test formatters are built from config and shared for equal options."""
+        factory = HandlerFactory()
+        stack_config = LogConfig(
+            app_name="test_app",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=Path(tempfile.gettempdir()),
+        )
+        record_config = LogConfig(
+            app_name="other_app",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=Path(tempfile.gettempdir()),
+            source_location="record",
+        )
+
+        assert factory.get_formatter() is factory._formatter
+        assert factory.get_formatter(stack_config).source_location == "stack"
+        assert factory.get_formatter(record_config).source_location == "record"
+        assert factory.get_formatter(record_config) is factory.get_formatter(record_config)
+
+    def test_get_formatter_precomputes_filenames_when_configured(self) -> None:
+        """Test LOG_PRECOMPUTE_FILENAMES fills the formatter's filename cache."""
+        factory = HandlerFactory()
+        config = LogConfig(
+            app_name="test_app",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=Path(tempfile.gettempdir()),
+            precompute_filenames=True,
+        )
+
+        with patch.object(
+            SourceLocationJSONFormatter, "precompute_relative_filenames", autospec=True
+        ) as mock_precompute:
+            factory.get_formatter(config)
+
+            mock_precompute.assert_called_once()
+
+    def test_create_console_handler_uses_config_formatter(self) -> None:
+        """Test console handler uses the formatter selected by config."""
+        factory = HandlerFactory()
+        config = LogConfig(
+            app_name="test_app",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=Path(tempfile.gettempdir()),
+            source_location="record",
+        )
+
+        handler = factory.create_console_handler(config)
+
+        assert handler.formatter is factory.get_formatter(config)
+
     def test_create_file_handler_disabled(self) -> None:
         """Test file handler creation when file logging is disabled."""
         factory = HandlerFactory()
@@ -344,3 +403,162 @@ class TestHandlerFactory:
                 # Second call should be for temp directory
                 mock_mkdir.call_args_list[1]
                 # The temp directory should be created with exist_ok=True
+
+
+class TestBytesHandlers:
+    """Test handlers that write JSON bytes directly."""
+
+    def test_bytes_stream_handler_writes_json_lines(self) -> None:
+        """Test BytesStreamHandler writes UTF-8 JSON lines to a binary stream."""
+        stream = BytesIO()
+        handler = BytesStreamHandler(stream)
+        handler.setFormatter(SourceLocationJSONFormatter(json_backend="auto"))
+        logger = logging.getLogger("bytes_stream_test")
+        logger.handlers.clear()
+        logger.addHandler(handler)
+        logger.propagate = False
+
+        logger.warning("héllo", extra={"n": 1})
+
+        line = stream.getvalue()
+        assert line.endswith(b"\n")
+        parsed = json.loads(line.decode("utf-8"))
+        assert parsed["message"] == "héllo"
+        assert parsed["n"] == 1
+
+    def test_bytes_stream_handler_flushes_text_stream_first(self) -> None:
+        """Test the text wrapper is flushed before bytes are written."""
+        text_stream = Mock(spec=StringIO)
+        handler = BytesStreamHandler(BytesIO(), text_stream=text_stream)
+        handler.setFormatter(SourceLocationJSONFormatter())
+
+        handler.emit(logging.makeLogRecord({"msg": "x", "levelname": "INFO"}))
+
+        text_stream.flush.assert_called_once()
+
+    def test_bytes_stream_handler_plain_formatter(self) -> None:
+        """Test non-JSON formatters are encoded as UTF-8."""
+        stream = BytesIO()
+        handler = BytesStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        handler.emit(logging.makeLogRecord({"msg": "plain"}))
+
+        assert stream.getvalue() == b"plain\n"
+
+    def test_create_file_handler_buffered(self) -> None:
+        """Test LOG_FILE_BUFFERED selects the batching file handler."""
+        factory = HandlerFactory()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = LogConfig(
+                app_name="test_app",
+                log_level="INFO",
+                log_to_file=True,
+                log_file_dir=Path(temp_dir),
+                file_buffered=True,
+                file_batch_bytes=1024,
+                file_batch_interval_ms=250,
+            )
+
+            handler = factory.create_file_handler(config)
+
+            assert isinstance(handler, BufferedFileHandler)
+            assert handler.batch_bytes == 1024
+            assert handler.batch_interval == 0.25
+            assert handler.formatter is factory.get_formatter(config)
+            handler.close()
+
+    def test_create_file_handler_rotating(self) -> None:
+        """Test LOG_FILE_ROTATE selects the rotating file handler."""
+        factory = HandlerFactory()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = LogConfig(
+                app_name="test_app",
+                log_level="INFO",
+                log_to_file=True,
+                log_file_dir=Path(temp_dir),
+                file_rotate=True,
+                file_max_bytes=2048,
+                file_backup_count=3,
+                file_compress=True,
+            )
+
+            handler = factory.create_file_handler(config)
+
+            assert isinstance(handler, RotatingFileHandler)
+            assert handler.max_bytes == 2048
+            assert handler.backup_count == 3
+            assert handler.compress is True
+            assert handler.batch_bytes == 0
+            handler.close()
+
+    def test_conflicting_file_outputs_warn_once(self) -> None:
+        """Test exclusive file outputs set together are reported once."""
+        factory = HandlerFactory()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = LogConfig(
+                app_name="test_app",
+                log_level="INFO",
+                log_to_file=True,
+                log_file_dir=Path(temp_dir),
+                file_rotate=True,
+                file_mmap=True,
+                file_buffered=True,
+            )
+
+            with patch.object(factory, "_log_handler_error") as mock_log_error:
+                first = factory.create_file_handler(config)
+                second = factory.create_file_handler(config)
+
+            assert isinstance(first, RotatingFileHandler)
+            assert isinstance(second, RotatingFileHandler)
+            mock_log_error.assert_called_once()
+            message = mock_log_error.call_args[0][0]
+            assert "ignoring LOG_FILE_MMAP" in message
+            assert "LOG_FILE_BUFFERED" not in message
+            first.close()
+            second.close()
+
+    def test_create_file_handler_json_bytes(self) -> None:
+        """Test LOG_JSON_BYTES selects the binary file handler."""
+        factory = HandlerFactory()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = LogConfig(
+                app_name="test_app",
+                log_level="INFO",
+                log_to_file=True,
+                log_file_dir=Path(temp_dir),
+                json_bytes=True,
+            )
+
+            handler = factory.create_file_handler(config)
+
+            assert isinstance(handler, BytesFileHandler)
+            handler.emit(logging.makeLogRecord({"msg": "to file", "levelname": "INFO"}))
+            handler.close()
+
+            content = Path(handler.baseFilename).read_bytes()
+            assert json.loads(content)["message"] == "to file"
+
+    def test_create_console_handler_json_bytes(self) -> None:
+        """Test LOG_JSON_BYTES writes to the binary stdout buffer when available."""
+        factory = HandlerFactory()
+        config = LogConfig(
+            app_name="test_app",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=Path(tempfile.gettempdir()),
+            json_bytes=True,
+        )
+        fake_stdout = Mock()
+        fake_stdout.buffer = BytesIO()
+
+        with patch("sys.stdout", fake_stdout):
+            handler = factory.create_console_handler(config)
+
+        assert isinstance(handler, BytesStreamHandler)
+        assert handler.stream is fake_stdout.buffer
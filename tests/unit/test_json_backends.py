@@ -0,0 +1,157 @@
+"""Unit tests for JSON encoder backends."""
+
+import json
+import logging
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mypylogger.formatters import SourceLocationJSONFormatter
+from mypylogger.json_backends import (
+    BACKEND_AUTO,
+    BACKEND_ORJSON,
+    BACKEND_STDLIB,
+    JSONBackend,
+    available_backends,
+    get_json_backend,
+)
+
+AVAILABLE = available_backends()
+
+
+def _record() -> logging.LogRecord:
+    record = logging.LogRecord(
+        name="test_logger",
+        level=logging.INFO,
+        pathname="/path/to/test.py",
+        lineno=42,
+        msg="Test message ünïcode",
+        args=(),
+        exc_info=None,
+    )
+    record.__dict__.update({"user_id": 7, "tags": ["a", "b"], "ratio": 0.5, "ok": True})
+    return record
+
+
+class TestJSONBackends:
+    """Test backend selection and encoding."""
+
+    def test_stdlib_always_available(self) -> None:
+        """Test the standard library backend is always usable."""
+        assert AVAILABLE[0] == BACKEND_STDLIB
+        assert get_json_backend(BACKEND_STDLIB).name == BACKEND_STDLIB
+
+    def test_unknown_backend_falls_back_to_stdlib(self) -> None:
+        """Test unknown names fall back to the standard library."""
+        assert get_json_backend("nope").name == BACKEND_STDLIB
+
+    def test_missing_backend_falls_back_to_stdlib(self) -> None:
+        """Test an uninstalled backend falls back to the standard library."""
+        with patch("importlib.import_module", side_effect=ImportError("missing")):
+            assert get_json_backend(BACKEND_ORJSON).name == BACKEND_STDLIB
+            assert get_json_backend(BACKEND_AUTO).name == BACKEND_STDLIB
+
+    def test_auto_prefers_installed_fast_backend(self) -> None:
+        """Test auto-detection picks the first installed optional backend."""
+        expected = AVAILABLE[1] if len(AVAILABLE) > 1 else BACKEND_STDLIB
+        assert get_json_backend(BACKEND_AUTO).name == expected
+
+    @pytest.mark.parametrize("name", AVAILABLE)
+    def test_backend_output_matches_field_order(self, name: str) -> None:
+        """Test every backend keeps field ordering and round-trips the record."""
+        stdlib = SourceLocationJSONFormatter()
+        formatter = SourceLocationJSONFormatter(json_backend=name)
+        record = _record()
+        record.__dict__["_mypylogger_location"] = {
+            "module": "m",
+            "filename": "f.py",
+            "function_name": "fn",
+            "line": 1,
+        }
+
+        expected = json.loads(stdlib.format(record))
+        actual = json.loads(formatter.format(record))
+
+        assert list(actual) == list(expected)
+        assert actual == expected
+        assert formatter.format_bytes(record).decode("utf-8") == formatter.format(record)
+
+    @pytest.mark.parametrize("name", AVAILABLE)
+    def test_backend_errors_fall_back_to_plain_text(self, name: str) -> None:
+        """Test serialization errors keep the plain text fallback for every backend."""
+        formatter = SourceLocationJSONFormatter(json_backend=name)
+        record = _record()
+
+        with patch.object(
+            formatter._backend, "dumps_bytes", side_effect=TypeError("bad")
+        ), patch.object(formatter._backend, "dumps", side_effect=TypeError("bad")), patch.object(
+            formatter, "_log_formatting_error"
+        ):
+            assert formatter.format(record) == "INFO: Test message ünïcode"
+            assert formatter.format_bytes(record) == "INFO: Test message ünïcode".encode()
+
+    @pytest.mark.parametrize("name", AVAILABLE)
+    def test_backend_uses_default_encoder(self, name: str) -> None:
+        """Test the default= encoder is honoured by every backend."""
+        backend = get_json_backend(name, default=str)
+
+        assert json.loads(backend.dumps({"v": object})) == {"v": str(object)}
+
+    @pytest.mark.parametrize("name", AVAILABLE)
+    def test_backend_rejects_unserializable_without_default(self, name: str) -> None:
+        """Test unserializable values raise TypeError/ValueError without a default."""
+        backend = get_json_backend(name)
+
+        with pytest.raises((TypeError, ValueError)):
+            backend.dumps({"v": object()})
+
+    def test_default_config_uses_stdlib(self) -> None:
+        """Test the default configuration keeps the standard library's output."""
+        from mypylogger.config import LogConfig
+        from mypylogger.handlers import HandlerFactory
+
+        config = LogConfig(app_name="app", log_level="INFO", log_to_file=False, log_file_dir=Path())
+        formatter = HandlerFactory().get_formatter(config)
+        record = _record()
+        record.__dict__.update({"nan": float("nan"), "big": 1e16})
+
+        assert formatter.json_backend.name == BACKEND_STDLIB
+        assert '"nan":NaN,"big":1e+16' in formatter.format(record)
+
+    @pytest.mark.skipif(BACKEND_ORJSON not in AVAILABLE, reason="orjson not installed")
+    def test_orjson_big_int_encoded_by_stdlib(self) -> None:
+        """Test integers orjson rejects are written as JSON, not plain text."""
+        stdlib = SourceLocationJSONFormatter()
+        formatter = SourceLocationJSONFormatter(json_backend=BACKEND_ORJSON)
+        record = _record()
+        record.__dict__.update({"big": 2**70, "nested": [-(2**65)]})
+        record.__dict__["_mypylogger_location"] = {
+            "module": "m",
+            "filename": "f.py",
+            "function_name": "fn",
+            "line": 1,
+        }
+
+        with patch.object(formatter, "_log_formatting_error") as log_error:
+            output = formatter.format_bytes(record)
+
+        log_error.assert_not_called()
+        assert output.decode("utf-8") == stdlib.format(record)
+        assert json.loads(output)["big"] == 2**70
+
+    @pytest.mark.skipif(BACKEND_ORJSON not in AVAILABLE, reason="orjson not installed")
+    def test_orjson_non_finite_floats(self) -> None:
+        """Test orjson writes non-finite floats as null and keeps the record as JSON."""
+        formatter = SourceLocationJSONFormatter(json_backend=BACKEND_ORJSON)
+        record = _record()
+        record.__dict__.update({"nan": float("nan"), "inf": float("inf")})
+
+        fields = json.loads(formatter.format(record))
+
+        assert fields["message"] == "Test message ünïcode"
+        assert (fields["nan"], fields["inf"]) == (None, None)
+
+    def test_stdlib_backend_bytes(self) -> None:
+        """Test the stdlib backend encodes bytes via UTF-8."""
+        assert JSONBackend().dumps_bytes({"k": "é"}) == '{"k":"é"}'.encode()
@@ -0,0 +1,174 @@
+"""Unit tests for the level-gated lazy logger adapter."""
+
+from __future__ import annotations
+
+from io import StringIO
+import json
+import logging
+from unittest.mock import Mock
+
+import pytest
+
+import mypylogger
+from mypylogger.formatters import SOURCE_LOCATION_RECORD, SourceLocationJSONFormatter
+from mypylogger.lazy import Lazy, LazyLogger
+
+
+@pytest.fixture
+def logger_and_stream() -> tuple[logging.Logger, StringIO]:
+    """Logger writing JSON lines to a StringIO at INFO level."""
+    stream = StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD))
+    logger = logging.getLogger("lazy_test")
+    logger.handlers.clear()
+    logger.addHandler(handler)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger, stream
+
+
+def _fail(message: str) -> None:
+    raise ValueError(message)
+
+
+def _lines(stream: StringIO) -> list[dict[str, object]]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestLazyLogger:
+    """Test LazyLogger class."""
+
+    def test_disabled_level_evaluates_nothing(
+        self, logger_and_stream: tuple[logging.Logger, StringIO]
+    ) -> None:
+        """Test lazy args, lazy extras and extra callables are skipped when disabled."""
+        logger, stream = logger_and_stream
+        lazy = LazyLogger(logger)
+        expensive = Mock(return_value="value")
+
+        lazy.debug("state %s", Lazy(expensive), extra={"size": Lazy(expensive)})
+        lazy.debug("state", extra=expensive)
+
+        expensive.assert_not_called()
+        assert stream.getvalue() == ""
+
+    def test_enabled_level_resolves_lazy_values(
+        self, logger_and_stream: tuple[logging.Logger, StringIO]
+    ) -> None:
+        """Test lazy values are computed once the level check passes."""
+        logger, stream = logger_and_stream
+        lazy = LazyLogger(logger)
+
+        lazy.info("items: %s", Lazy(len, [1, 2, 3]), extra={"user": Lazy(lambda: "ann")})
+        lazy.warning("built", extra=lambda: {"computed": 42})
+        lazy.error(Lazy(str, "lazy message"))
+
+        lines = _lines(stream)
+        assert lines[0]["message"] == "items: 3"
+        assert lines[0]["user"] == "ann"
+        assert lines[1]["computed"] == 42
+        assert lines[2]["message"] == "lazy message"
+        assert [line["level"] for line in lines] == ["INFO", "WARNING", "ERROR"]
+
+    def test_plain_values_pass_through(
+        self, logger_and_stream: tuple[logging.Logger, StringIO]
+    ) -> None:
+        """Test ordinary arguments behave exactly like the wrapped logger."""
+        logger, stream = logger_and_stream
+        lazy = LazyLogger(logger)
+        func = Mock()
+
+        lazy.info("value %s %r", 1, func, extra={"k": "v"})
+
+        (line,) = _lines(stream)
+        assert line["message"] == f"value 1 {func!r}"
+        assert line["k"] == "v"
+        func.assert_not_called()
+
+    def test_source_location_points_at_caller(
+        self, logger_and_stream: tuple[logging.Logger, StringIO]
+    ) -> None:
+        """Test record-based source location is the caller, not the adapter."""
+        logger, stream = logger_and_stream
+        lazy = LazyLogger(logger)
+
+        lazy.info("here")
+        lazy.log(logging.INFO, "there")
+        try:
+            _fail("boom")
+        except ValueError:
+            lazy.exception("failed")
+
+        for line in _lines(stream):
+            assert line["function_name"] == "test_source_location_points_at_caller"
+            assert str(line["filename"]).endswith("test_lazy.py")
+
+    def test_set_level_invalidates_cache(
+        self, logger_and_stream: tuple[logging.Logger, StringIO]
+    ) -> None:
+        """Test cached level checks follow setLevel on the adapter and the logger."""
+        logger, stream = logger_and_stream
+        lazy = LazyLogger(logger)
+
+        assert lazy.isEnabledFor(logging.DEBUG) is False
+        lazy.setLevel(logging.DEBUG)
+        assert lazy.isEnabledFor(logging.DEBUG) is True
+
+        logger.setLevel(logging.WARNING)
+        assert lazy.isEnabledFor(logging.INFO) is False
+        lazy.info("dropped")
+        assert stream.getvalue() == ""
+
+    def test_disabled_logger_not_cached_as_disabled(
+        self, logger_and_stream: tuple[logging.Logger, StringIO]
+    ) -> None:
+        """Test temporarily disabled loggers do not poison the level cache."""
+        logger, _ = logger_and_stream
+        lazy = LazyLogger(logger)
+
+        logger.disabled = True
+        assert lazy.isEnabledFor(logging.INFO) is False
+        logger.disabled = False
+        assert lazy.isEnabledFor(logging.INFO) is True
+
+    def test_disabled_logger_ignores_cached_level(
+        self, logger_and_stream: tuple[logging.Logger, StringIO]
+    ) -> None:
+        """Test disabling a logger wins over a level already cached as enabled."""
+        logger, stream = logger_and_stream
+        lazy = LazyLogger(logger)
+        expensive = Mock(return_value="value")
+        assert lazy.isEnabledFor(logging.INFO) is True
+
+        logger.disabled = True
+        try:
+            assert lazy.isEnabledFor(logging.INFO) is False
+            lazy.info("state %s", Lazy(expensive))
+        finally:
+            logger.disabled = False
+
+        expensive.assert_not_called()
+        assert stream.getvalue() == ""
+
+    def test_logger_without_cache_uses_own_cache(self) -> None:
+        """Test loggers without a level cache get one from the adapter."""
+        logger = Mock(spec=["disabled", "isEnabledFor", "setLevel", "_log"])
+        logger.disabled = False
+        logger.isEnabledFor.return_value = False
+        lazy = LazyLogger(logger)
+
+        lazy.debug("x")
+        lazy.debug("y")
+        assert logger.isEnabledFor.call_count == 1
+
+        lazy.setLevel(logging.DEBUG)
+        lazy.debug("z")
+        assert logger.isEnabledFor.call_count == 2
+
+    def test_get_lazy_logger(self) -> None:
+        """Test the public factory wraps the configured logger."""
+        lazy = mypylogger.get_lazy_logger("lazy_public_test")
+
+        assert isinstance(lazy, LazyLogger)
+        assert lazy.logger is mypylogger.get_logger("lazy_public_test")
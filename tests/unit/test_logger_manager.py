@@ -4,6 +4,8 @@ import logging
 import os
 from pathlib import Path
 import tempfile
+import threading
+import time
 from unittest.mock import Mock, patch
 
 from mypylogger.config import LogConfig
@@ -313,3 +315,114 @@ class TestLoggerManager:
         with patch("builtins.print", side_effect=OSError("Print error")):
             # Should not raise an exception
             manager._log_library_error("Test error message")
+
+
+class TestConfigSnapshot:
+    """Test the cached configuration and reload_config."""
+
+    def test_config_resolved_once(self) -> None:
+        """Test creating many loggers reads the environment once."""
+        manager = LoggerManager()
+
+        with patch.object(
+            manager._config_resolver,
+            "resolve_config",
+            wraps=manager._config_resolver.resolve_config,
+        ) as resolve:
+            for index in range(50):
+                manager.get_or_create_logger(f"snapshot.module{index}")
+
+        resolve.assert_called_once()
+
+    def test_named_lookup_skips_resolution(self) -> None:
+        """Test a configured name is returned without resolving it again."""
+        manager = LoggerManager()
+        logger = manager.get_or_create_logger("snapshot.cached")
+
+        with patch.object(manager, "_resolve_logger_name") as resolve:
+            assert manager.get_or_create_logger("snapshot.cached") is logger
+
+        resolve.assert_not_called()
+
+    def test_reload_applies_to_existing_loggers(self, tmp_path: Path) -> None:
+        """Test reload_config replaces level, handlers and filters in place."""
+        manager = LoggerManager()
+        with patch.dict(os.environ, {"LOG_LEVEL": "INFO"}, clear=True):
+            logger = manager.get_or_create_logger("snapshot.reload")
+        user_handler = logging.NullHandler()
+        logger.addHandler(user_handler)
+        (old_console, _) = logger.handlers
+        assert logger.filters == []
+
+        env = {
+            "LOG_LEVEL": "DEBUG",
+            "LOG_TO_FILE": "true",
+            "LOG_FILE_DIR": str(tmp_path),
+            "APP_NAME": "reloaded",
+            "LOG_RATE_LIMIT": "10",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = manager.reload_config()
+
+        assert config.log_level == "DEBUG"
+        assert logger.level == logging.DEBUG
+        assert old_console not in logger.handlers
+        assert user_handler in logger.handlers
+        assert any(isinstance(h, logging.FileHandler) for h in logger.handlers)
+        assert len(logger.filters) == 1
+        # New loggers use the reloaded configuration too
+        assert manager.get_or_create_logger("snapshot.after").level == logging.DEBUG
+
+        for handler in logger.handlers:
+            if handler is not user_handler:
+                handler.close()
+        logger.handlers.clear()
+        logger.filters.clear()
+
+    def test_reload_closes_replaced_shared_handlers(self) -> None:
+        """Test a shared async handler is closed once nothing uses it."""
+        manager = LoggerManager()
+        with patch.dict(os.environ, {"LOG_ASYNC": "true"}, clear=True):
+            first = manager.get_or_create_logger("snapshot.async1")
+            second = manager.get_or_create_logger("snapshot.async2")
+        (shared,) = first.handlers
+        assert second.handlers == [shared]
+
+        with patch.dict(os.environ, {}, clear=True):
+            manager.reload_config()
+
+        assert shared.closed  # type: ignore[attr-defined]
+        assert shared not in first.handlers
+        assert shared not in second.handlers
+
+
+class TestConcurrentCreation:
+    """Test get_or_create_logger under concurrent first calls."""
+
+    def test_racing_threads_configure_once(self) -> None:
+        """Test threads requesting a new name together configure it once."""
+        manager = LoggerManager()
+        manager.get_config()
+        barrier = threading.Barrier(16)
+        results: list[logging.Logger] = []
+        configure = manager.configure_logger
+
+        def slow_configure(logger: logging.Logger, config: LogConfig) -> None:
+            time.sleep(0.01)  # Widen the window between check and registration
+            configure(logger, config)
+
+        def worker() -> None:
+            barrier.wait()
+            results.append(manager.get_or_create_logger("concurrent.race"))
+
+        with patch.object(manager, "configure_logger", side_effect=slow_configure) as mock:
+            threads = [threading.Thread(target=worker) for _ in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock.assert_called_once()
+        assert len(results) == 16
+        assert all(logger is results[0] for logger in results)
+        assert len(results[0].handlers) == 1
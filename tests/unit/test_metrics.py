@@ -0,0 +1,202 @@
+"""Unit tests for pipeline self-instrumentation."""
+
+from io import BytesIO, StringIO
+import itertools
+import json
+import logging
+from pathlib import Path
+import tempfile
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from mypylogger.async_handler import AsyncQueueHandler
+from mypylogger.config import LogConfig
+from mypylogger.core import LoggerManager
+from mypylogger.formatters import SourceLocationJSONFormatter
+from mypylogger.handlers import BytesStreamHandler
+from mypylogger.metrics import MetricsFilter, PipelineMetrics
+
+_logger_ids = itertools.count()
+
+
+@pytest.fixture
+def logger() -> logging.Logger:
+    """Provide an isolated logger."""
+    test_logger = logging.getLogger(f"metrics-{next(_logger_ids)}")
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.propagate = False
+    return test_logger
+
+
+def _instrumented(
+    logger: logging.Logger, handler: logging.Handler, metrics: PipelineMetrics
+) -> SourceLocationJSONFormatter:
+    """Attach handler to logger with a formatter and filter reporting to metrics."""
+    formatter = SourceLocationJSONFormatter(source_location="record")
+    formatter.metrics = metrics
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.addFilter(MetricsFilter(metrics, logger))
+    metrics.watch_handler(handler)
+    return formatter
+
+
+class TestPipelineMetrics:
+    """Test the counters collected while logging."""
+
+    def test_records_bytes_and_format_time(self, logger: logging.Logger) -> None:
+        """Test levels, exact bytes written and the formatting histogram."""
+        metrics = PipelineMetrics(report_interval=0)
+        text_stream = StringIO()
+        byte_stream = BytesIO()
+        _instrumented(logger, logging.StreamHandler(text_stream), metrics)
+        _instrumented(logger, BytesStreamHandler(byte_stream), metrics)
+
+        logger.info("plain")
+        logger.info("ünïcode")
+        logger.error("failed")
+
+        snapshot = metrics.snapshot()
+        # Each logger filter counts the record once
+        assert snapshot["records"] == {"INFO": 4, "ERROR": 2}
+        assert snapshot["handlers"]["StreamHandler"]["bytes"] == len(
+            text_stream.getvalue().encode("utf-8")
+        )
+        assert snapshot["handlers"]["BytesStreamHandler"]["bytes"] == len(byte_stream.getvalue())
+        # The first of every FORMAT_TIME_SAMPLE_INTERVAL records per formatter is timed
+        format_time = snapshot["format_time_us"]
+        assert format_time["count"] == 2
+        assert sum(format_time["buckets"].values()) == 2
+        json.dumps(snapshot)
+
+    def test_fallbacks_and_dropped_fields(self) -> None:
+        """Test plain text fallbacks and unserializable extra fields are counted."""
+        metrics = PipelineMetrics()
+        formatter = SourceLocationJSONFormatter(source_location="record")
+        formatter.metrics = metrics
+        broken = logging.LogRecord("test", logging.INFO, __file__, 1, "%d", ("x",), None)
+        unserializable = logging.LogRecord("test", logging.INFO, __file__, 1, "ok", None, None)
+        unserializable.payload = object()
+
+        with patch.object(formatter, "_log_formatting_error"):
+            assert formatter.format(broken).startswith("INFO: ")
+            assert "payload" not in json.loads(formatter.format(unserializable))
+
+        snapshot = metrics.snapshot()
+        assert snapshot["fallbacks"] == 1
+        assert snapshot["dropped_fields"] == 1
+
+    def test_counts_exact_across_threads(self) -> None:
+        """Test concurrent records and format times are all counted."""
+        metrics = PipelineMetrics()
+        record_filter = MetricsFilter(metrics)
+        record = logging.LogRecord("test", logging.WARNING, __file__, 1, "busy", None, None)
+
+        def work() -> None:
+            for _ in range(5000):
+                record_filter.filter(record)
+                metrics.record_format_time(1)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = metrics.snapshot()
+        assert snapshot["records"] == {"WARNING": 20000}
+        assert snapshot["format_time_us"]["count"] == 20000
+
+    def test_async_queue_state_reported(self, logger: logging.Logger) -> None:
+        """Test async handlers report queue depth and drops with their targets' bytes."""
+        metrics = PipelineMetrics()
+        stream = StringIO()
+        target = logging.StreamHandler(stream)
+        target.setFormatter(SourceLocationJSONFormatter(source_location="record"))
+        async_handler = AsyncQueueHandler([target], SourceLocationJSONFormatter())
+        logger.addHandler(async_handler)
+        metrics.watch_handler(async_handler)
+
+        logger.info("queued")
+        async_handler.flush()
+        snapshot = metrics.snapshot()
+        async_handler.close()
+
+        assert snapshot["handlers"]["AsyncQueueHandler"]["queue_depth"] == 0
+        assert snapshot["handlers"]["AsyncQueueHandler"]["dropped_newest"] == 0
+        assert snapshot["handlers"]["StreamHandler"]["bytes"] == len(stream.getvalue())
+
+    def test_periodic_metrics_record(self, logger: logging.Logger) -> None:
+        """Test the metrics record follows the records without later traffic."""
+        metrics = PipelineMetrics(report_interval=3600)
+        stream = StringIO()
+        formatter = _instrumented(logger, logging.StreamHandler(stream), metrics)
+        formatter.source_location = "stack"
+        record_filter = logger.filters[-1]
+        assert isinstance(record_filter, MetricsFilter)
+        metrics._last_report -= 1
+        metrics.report_interval = 0.05
+
+        logger.info("first")
+        timer = record_filter._timer
+        assert timer is not None
+        timer.join(5)
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [line["message"] for line in lines] == ["first", "mypylogger metrics"]
+        assert lines[1]["metrics"]["records"] == {"INFO": 1}
+        assert Path(lines[1]["filename"]).name == "metrics.py"
+        assert lines[1]["function_name"] == "emit_report"
+
+    def test_no_report_timer_when_reports_off(self, logger: logging.Logger) -> None:
+        """Test a zero interval only counts, without starting a timer."""
+        metrics = PipelineMetrics(report_interval=0)
+        _instrumented(logger, logging.StreamHandler(StringIO()), metrics)
+
+        logger.info("counted")
+
+        record_filter = logger.filters[-1]
+        assert isinstance(record_filter, MetricsFilter)
+        assert record_filter._timer is None
+
+
+class TestManagerMetrics:
+    """Test LoggerManager wiring of LOG_METRICS."""
+
+    def _config(self, **overrides: object) -> LogConfig:
+        """Create a console-only config."""
+        return LogConfig(
+            app_name="svc",
+            log_level="DEBUG",
+            log_to_file=False,
+            log_file_dir=Path(tempfile.gettempdir()),
+            **overrides,  # type: ignore[arg-type]
+        )
+
+    def test_metrics_enabled(self, logger: logging.Logger) -> None:
+        """Test enabled metrics count records through the manager's handlers."""
+        manager = LoggerManager()
+        manager.configure_logger(logger, self._config(metrics=True, metrics_interval=30))
+        ((console,), _) = manager._installed[logger.name]
+        console.stream = StringIO()  # type: ignore[attr-defined]
+
+        logger.warning("counted")
+
+        snapshot = manager.metrics_snapshot()
+        assert isinstance(logger.filters[-1], MetricsFilter)
+        assert snapshot["records"] == {"WARNING": 1}
+        assert snapshot["format_time_us"]["count"] == 1
+        assert snapshot["handlers"]["StreamHandler"]["bytes"] > 0
+        assert manager._metrics is not None
+        assert manager._metrics.report_interval == 30
+
+    def test_metrics_disabled_by_default(self, logger: logging.Logger) -> None:
+        """Test nothing is instrumented unless LOG_METRICS is set."""
+        manager = LoggerManager()
+        manager.configure_logger(logger, self._config())
+        assert manager.metrics_snapshot() == {}
+        ((console,), filters) = manager._installed[logger.name]
+        assert filters == []
+        assert console.formatter.metrics is None  # type: ignore[union-attr]
@@ -0,0 +1,153 @@
+"""Unit tests for the memory-mapped file handler."""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+from pathlib import Path
+import time
+from unittest.mock import patch
+
+from mypylogger.config import LogConfig
+from mypylogger.core import LoggerManager
+from mypylogger.mmap_handler import SECONDS_PER_HOUR, MmapFileHandler
+from tests.conftest import json_handler, make_record, read_messages
+
+SEGMENT = mmap.ALLOCATIONGRANULARITY
+
+
+class TestMmapFileHandler:
+    """Test MmapFileHandler class."""
+
+    def test_segment_preallocated_and_truncated_when_sealed(self, tmp_path: Path) -> None:
+        """Test the file is one segment long while open and exact once closed."""
+        handler = json_handler(MmapFileHandler(tmp_path, "app", segment_bytes=SEGMENT))
+        path = Path(handler.baseFilename)
+        assert path.name == time.strftime("app_%Y%m%d_%H.log", time.localtime(time.time()))
+
+        handler.handle(make_record("first"))
+        handler.handle(make_record("sëcond"))
+        assert path.stat().st_size == SEGMENT
+        # Written records are visible to readers before the file is sealed
+        assert path.read_bytes().rstrip(b"\0").count(b"\n") == 2
+
+        handler.close()
+
+        assert path.stat().st_size == handler.bytes_written
+        assert read_messages(path) == ["first", "sëcond"]
+        assert handler.closed
+
+    def test_records_span_segments(self, tmp_path: Path) -> None:
+        """Test filling a segment maps the next one, including oversized records."""
+        handler = json_handler(MmapFileHandler(tmp_path, "app", segment_bytes=SEGMENT))
+        messages = [f"record {i} " + "x" * 200 for i in range(SEGMENT // 100)]
+        messages.append("y" * (SEGMENT * 2))
+        for message in messages:
+            handler.handle(make_record(message))
+        handler.close()
+
+        assert handler.segments_mapped > 2
+        assert read_messages(Path(handler.baseFilename)) == messages
+
+    def test_resumes_after_unsealed_file(self, tmp_path: Path) -> None:
+        """Test a file left padded by a crash is appended to after its data."""
+        handler = json_handler(MmapFileHandler(tmp_path, "app", segment_bytes=SEGMENT))
+        handler.handle(make_record("before crash"))
+        handler.flush()
+        # Simulate a crash: the mapping and descriptor go away without truncating the file
+        handler._map.close()  # type: ignore[union-attr]
+        handler._map = None
+        os.close(handler._fd)
+        handler._fd = -1
+        path = Path(handler.baseFilename)
+        assert path.stat().st_size == SEGMENT
+
+        resumed = json_handler(MmapFileHandler(tmp_path, "app", segment_bytes=SEGMENT))
+        resumed.handle(make_record("after restart"))
+        resumed.close()
+
+        assert read_messages(path) == ["before crash", "after restart"]
+
+    def test_periodic_sync(self, tmp_path: Path) -> None:
+        """Test msync runs once per interval and on flush."""
+        handler = json_handler(MmapFileHandler(tmp_path, "app", sync_interval=3600))
+        try:
+            now = time.time()
+            handler.handle(make_record("synced", created=now))
+            handler.handle(make_record("pending", created=now + 1))
+            assert handler.syncs == 1
+
+            handler.flush()
+            assert handler.syncs == 2
+            handler.flush()
+            assert handler.syncs == 2
+        finally:
+            handler.close()
+
+    def test_rolls_over_at_hour_boundary(self, tmp_path: Path) -> None:
+        """Test the next hour's file is started and the previous one sealed."""
+        handler = json_handler(MmapFileHandler(tmp_path, "app"))
+        first_file = Path(handler.baseFilename)
+        boundary = handler._next_rollover
+        handler.handle(make_record("before"))
+        handler.handle(make_record("after", created=boundary + 1))
+        second_file = Path(handler.baseFilename)
+        handler.close()
+
+        assert second_file.name == time.strftime("app_%Y%m%d_%H.log", time.localtime(boundary + 1))
+        assert read_messages(first_file) == ["before"]
+        assert read_messages(second_file) == ["after"]
+
+    def test_unmapped_file_reported_once_and_reopened(self, tmp_path: Path) -> None:
+        """Test records dropped after a failed open are reported once, not silently."""
+        handler = json_handler(MmapFileHandler(tmp_path, "app"))
+        boundary = handler._next_rollover
+        with patch("os.open", side_effect=OSError("no space")), patch.object(
+            handler, "handleError"
+        ) as mock_handle_error:
+            handler.handle(make_record("failed", created=boundary + 1))
+        mock_handle_error.assert_called_once()
+
+        with patch.object(handler, "_log_handler_error") as mock_error:
+            handler.handle(make_record("dropped", created=boundary + 2))
+            handler.handle(make_record("dropped", created=boundary + 3))
+        mock_error.assert_called_once()
+        assert "dropping records" in mock_error.call_args[0][0]
+
+        handler.handle(make_record("recovered", created=boundary + SECONDS_PER_HOUR + 1))
+        path = Path(handler.baseFilename)
+        handler.close()
+
+        assert read_messages(path) == ["recovered"]
+
+
+class TestManagerMmapFiles:
+    """Test LoggerManager wiring of LOG_FILE_MMAP."""
+
+    def test_loggers_share_one_mapped_file(self, tmp_path: Path) -> None:
+        """Test every logger writes through the same handler."""
+        config = LogConfig(
+            app_name="svc",
+            log_level="INFO",
+            log_to_file=True,
+            log_file_dir=tmp_path,
+            file_mmap=True,
+            file_segment_bytes=SEGMENT,
+            file_sync_interval_ms=250,
+        )
+        manager = LoggerManager()
+        first = logging.getLogger("mmap-first")
+        second = logging.getLogger("mmap-second")
+        with patch("sys.stdout"):
+            manager.configure_logger(first, config)
+            manager.configure_logger(second, config)
+            first.info("one")
+            second.info("two")
+
+        handler = manager._installed[first.name][0][-1]
+        assert manager._installed[second.name][0][-1] is handler
+        assert isinstance(handler, MmapFileHandler)
+        assert (handler.segment_bytes, handler.sync_interval) == (SEGMENT, 0.25)
+        handler.close()
+        assert read_messages(Path(handler.baseFilename)) == ["one", "two"]
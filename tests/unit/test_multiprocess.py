@@ -0,0 +1,344 @@
+"""Unit tests for multiprocess logging through a central collector."""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+from pathlib import Path
+import pickle
+import time
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from mypylogger.config import LogConfig
+from mypylogger.core import LoggerManager
+from mypylogger.formatters import SourceLocationJSONFormatter
+from mypylogger.handlers import HandlerFactory
+from mypylogger.multiprocess import (
+    FRAME_HEADER,
+    CollectorClientHandler,
+    LogCollector,
+    _collectors,
+    collector_address,
+    multiprocess_supported,
+)
+from tests.conftest import make_record
+
+pytestmark = pytest.mark.skipif(
+    not multiprocess_supported(), reason="Unix sockets and fcntl are required"
+)
+
+
+def _config(log_dir: Path, app_name: str, **options: object) -> LogConfig:
+    return LogConfig(
+        app_name=app_name,
+        log_level="INFO",
+        log_to_file=True,
+        log_file_dir=log_dir,
+        multiprocess=True,
+        **options,  # type: ignore[arg-type]
+    )
+
+
+def _unpickle(frame: bytes) -> dict[str, object]:
+    """Decode the state sent in a collector frame."""
+    # The test builds the frame itself
+    state: dict[str, object] = pickle.loads(frame[FRAME_HEADER.size :])  # noqa: S301
+    return state
+
+
+def _fail(message: str) -> None:
+    raise ValueError(message)
+
+
+def _log_lines(log_dir: Path) -> list[dict[str, object]]:
+    lines = []
+    for path in sorted(log_dir.glob("*.log")):
+        lines.extend(json.loads(line) for line in path.read_text().splitlines())
+    return lines
+
+
+def _close_collectors() -> None:
+    for collector in list(_collectors.values()):
+        collector.close()
+
+
+def _worker(log_dir: str, app_name: str, worker: int, count: int) -> None:
+    manager = LoggerManager()
+    logger = logging.getLogger(f"mp_worker_{worker}")
+    logger.handlers.clear()
+    manager.configure_logger(logger, _config(Path(log_dir), app_name))
+    for i in range(count):
+        logger.info("worker record", extra={"worker": worker, "seq": i})
+
+
+def _static_fields_worker(log_dir: str, app_name: str) -> None:
+    manager = LoggerManager()
+    logger = logging.getLogger(f"mp_static_worker_{os.getpid()}")
+    logger.handlers.clear()
+    manager.configure_logger(logger, _config(Path(log_dir), app_name, static_fields=True))
+    logger.info("worker record", extra={"sender": os.getpid()})
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> Iterator[CollectorClientHandler]:
+    """Collector client for a fresh app name, closing all collectors afterwards."""
+    factory = HandlerFactory()
+    handler = factory.create_collector_handler(_config(tmp_path, f"mp{os.getpid()}"))
+    assert handler is not None
+    yield handler
+    handler.close()
+    _close_collectors()
+
+
+class TestMultiprocessLogging:
+    """Test the collector and its client handler."""
+
+    def test_first_client_starts_collector(self, client: CollectorClientHandler) -> None:
+        """Test the first connecting process becomes the collector."""
+        client.handle(make_record("hello"))
+
+        collector = _collectors[str(client.socket_path)]
+        assert collector.running
+        assert client.dropped == 0
+
+    def test_records_written_by_collector(
+        self, client: CollectorClientHandler, tmp_path: Path
+    ) -> None:
+        """Test records are formatted by the collector with caller source location."""
+        logger = logging.getLogger("mp_collector_output")
+        logger.handlers.clear()
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(client)
+
+        logger.info("value %d", 42, extra={"user_id": 7})
+        _close_collectors()
+
+        (line,) = _log_lines(tmp_path)
+        assert line["message"] == "value 42"
+        assert line["user_id"] == 7
+        assert line["function_name"] == "test_records_written_by_collector"
+        assert line["filename"].endswith("test_multiprocess.py")
+
+    def test_unpicklable_values_sent_as_repr(self, client: CollectorClientHandler) -> None:
+        """Test custom fields that cannot be pickled are sent as their repr."""
+        record = make_record("x")
+        record.__dict__["lock"] = __import__("threading").Lock()
+
+        data = client.makePickle(record)
+
+        (length,) = FRAME_HEADER.unpack_from(data)
+        state = _unpickle(data)
+        assert length == len(data) - FRAME_HEADER.size
+        assert str(state["lock"]).startswith("<unlocked _thread.lock")
+
+    def test_exception_text_is_sent(self, client: CollectorClientHandler) -> None:
+        """Test exc_info is replaced by formatted text before pickling."""
+        try:
+            _fail("boom")
+        except ValueError:
+            record = logging.makeLogRecord(
+                {"msg": "x", "levelno": logging.ERROR, "exc_info": __import__("sys").exc_info()}
+            )
+
+        state = _unpickle(client.makePickle(record))
+
+        assert state["exc_info"] is None
+        assert "ValueError: boom" in state["exc_text"]
+
+    def test_client_takes_over_after_collector_exits(
+        self, client: CollectorClientHandler, tmp_path: Path
+    ) -> None:
+        """Test a client starts a new collector when the old one is gone."""
+        client.handle(make_record("first"))
+        first = _collectors[str(client.socket_path)]
+        first.close()
+
+        client.handle(make_record("second"))
+
+        second = _collectors[str(client.socket_path)]
+        assert second is not first
+        assert second.running
+        _close_collectors()
+        assert [line["message"] for line in _log_lines(tmp_path)] == ["first", "second"]
+
+    def test_second_process_cannot_take_lock(self, client: CollectorClientHandler) -> None:
+        """Test only one collector holds the lock."""
+        client.handle(make_record("x"))
+        collector = _collectors.pop(str(client.socket_path))
+        try:
+            assert LogCollector.try_start(client.socket_path, list) is None
+        finally:
+            _collectors[str(client.socket_path)] = collector
+
+    def test_fork_resets_inherited_connection(self, client: CollectorClientHandler) -> None:
+        """Test a forked child drops the parent's socket and collector state."""
+        if not hasattr(os, "fork"):
+            pytest.skip("fork required")
+        client.handle(make_record("x"))
+        assert client.sock is not None
+
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if client.sock is None and not _collectors else 1)
+        _, status = os.waitpid(pid, 0)
+
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert client.sock is not None
+        assert _collectors
+
+    def test_workers_share_one_writer(self, tmp_path: Path) -> None:
+        """Test records from several processes arrive intact in one file."""
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("fork start method required")
+        app_name = f"mpw{os.getpid()}"
+        _worker(str(tmp_path), app_name, 0, 50)
+
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_worker, args=(str(tmp_path), app_name, n, 200))
+            for n in range(1, 4)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(30)
+            assert process.exitcode == 0
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            collector = next(iter(_collectors.values()))
+            if collector.records_received >= 650:
+                break
+            time.sleep(0.05)
+        _close_collectors()
+
+        lines = _log_lines(tmp_path)
+        assert len(lines) == 650
+        for worker in range(1, 4):
+            seqs = [line["seq"] for line in lines if line["worker"] == worker]
+            assert seqs == list(range(200))
+
+    def test_static_fields_come_from_the_sending_process(self, tmp_path: Path) -> None:
+        """Test each worker's lines carry its own pid, not the collector's."""
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("fork start method required")
+        app_name = f"mps{os.getpid()}"
+        # This process becomes the collector before the workers start
+        _static_fields_worker(str(tmp_path), app_name)
+
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_static_fields_worker, args=(str(tmp_path), app_name))
+            for _ in range(2)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(30)
+            assert process.exitcode == 0
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            collector = next(iter(_collectors.values()))
+            if collector.records_received >= 3:
+                break
+            time.sleep(0.05)
+        _close_collectors()
+
+        lines = _log_lines(tmp_path)
+        assert {line["sender"] for line in lines} == {
+            os.getpid(),
+            *(process.pid for process in workers),
+        }
+        for line in lines:
+            assert line["pid"] == line["sender"]
+            assert line["app"] == app_name
+
+    def test_socket_and_lock_in_private_directory(self, tmp_path: Path) -> None:
+        """Test the socket and lock file live in a 0700 directory of this user."""
+        runtime_dir = tmp_path / "run"
+        runtime_dir.mkdir()
+        with patch.dict(os.environ, {"XDG_RUNTIME_DIR": str(runtime_dir)}):
+            socket_path = collector_address(tmp_path, "private")
+            collector = LogCollector.try_start(socket_path, list)
+        assert collector is not None
+        collector.close()
+
+        directory = socket_path.parent
+        assert directory == runtime_dir / f"mypylogger-{os.getuid()}"
+        assert directory.stat().st_mode & 0o777 == 0o700
+        assert directory.stat().st_uid == os.getuid()
+        assert socket_path.with_suffix(".lock").is_file()
+
+    def test_shared_directory_refused(self, tmp_path: Path) -> None:
+        """Test a directory other users can reach is not used."""
+        shared = tmp_path / f"mypylogger-{os.getuid()}"
+        shared.mkdir()
+        shared.chmod(0o755)
+        manager = LoggerManager()
+        logger = logging.getLogger("mp_shared_dir")
+        logger.handlers.clear()
+
+        with patch.dict(os.environ, {"XDG_RUNTIME_DIR": str(tmp_path)}):
+            with pytest.raises(PermissionError, match="not private"):
+                collector_address(tmp_path, "shared")
+            with patch.object(manager._handler_factory, "_log_handler_error") as report:
+                manager.configure_logger(logger, _config(tmp_path, "shared"))
+
+        assert "not private" in report.call_args[0][0]
+        assert isinstance(logger.handlers[1], logging.FileHandler)
+        for handler in logger.handlers[1:]:
+            handler.close()
+        logger.handlers.clear()
+
+    def test_manager_falls_back_without_support(self, tmp_path: Path) -> None:
+        """Test unsupported platforms write the file directly."""
+        manager = LoggerManager()
+        logger = logging.getLogger("mp_fallback")
+        logger.handlers.clear()
+
+        with patch(
+            "mypylogger.multiprocess.multiprocess_supported", return_value=False
+        ), patch.object(manager._handler_factory, "_log_handler_error"):
+            manager.configure_logger(logger, _config(tmp_path, "fallback"))
+
+        assert isinstance(logger.handlers[1], logging.FileHandler)
+        for handler in logger.handlers[1:]:
+            handler.close()
+        logger.handlers.clear()
+
+    def test_manager_shares_collector_client(self, tmp_path: Path) -> None:
+        """Test loggers share one connection to the collector."""
+        manager = LoggerManager()
+        first = logging.getLogger("mp_shared_one")
+        second = logging.getLogger("mp_shared_two")
+        first.handlers.clear()
+        second.handlers.clear()
+        config = _config(tmp_path, f"mps{os.getpid()}")
+
+        manager.configure_logger(first, config)
+        manager.configure_logger(second, config)
+
+        assert isinstance(first.handlers[1], CollectorClientHandler)
+        assert first.handlers[1] is second.handlers[1]
+        first.handlers[1].close()
+        first.handlers.clear()
+        second.handlers.clear()
+        _close_collectors()
+
+    def test_formatter_matches_direct_output(self, client: CollectorClientHandler) -> None:
+        """Test collector records format the same as the originals."""
+        formatter = SourceLocationJSONFormatter()
+        record = logging.LogRecord("n", logging.INFO, __file__, 10, "m %s", ("a",), None)
+        record.__dict__["extra_field"] = 1
+
+        state = _unpickle(client.makePickle(record))
+        rebuilt = logging.makeLogRecord(state)
+
+        assert json.loads(formatter.format(rebuilt)) == json.loads(formatter.format(record))
@@ -0,0 +1,427 @@
+"""Unit tests for batched network log shipping."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+
+from mypylogger.config import LogConfig
+from mypylogger.core import LoggerManager
+from mypylogger.network import SPOOL_LOCK_NAME, NetworkHandler, _peer_closed, parse_address
+from tests.conftest import json_handler, make_record
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class _Collector:
+    """Stand-in log collector keeping every line it receives."""
+
+    def __init__(
+        self, family: int = socket.AF_INET, address: str | tuple[str, int] = ("127.0.0.1", 0)
+    ) -> None:
+        self.family = family
+        self.data = bytearray()
+        self.accepts = 0
+        self._connections: list[socket.socket] = []
+        self._lock = threading.Lock()
+        self._server = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(address)
+        self._server.listen()
+        self._server.settimeout(0.05)
+        self.address = self._server.getsockname()
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while self._running:
+            try:
+                connection, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            self.accepts += 1
+            self._connections.append(connection)
+            threading.Thread(target=self._read, args=(connection,), daemon=True).start()
+
+    def _read(self, connection: socket.socket) -> None:
+        while True:
+            try:
+                chunk = connection.recv(65536)
+            except OSError:
+                return
+            if not chunk:
+                return
+            with self._lock:
+                self.data += chunk
+
+    def messages(self) -> list[str]:
+        with self._lock:
+            lines = bytes(self.data).splitlines()
+        return [json.loads(line)["message"] for line in lines]
+
+    def wait_for(self, count: int, timeout: float = 5.0) -> list[str]:
+        deadline = time.monotonic() + timeout
+        while len(self.messages()) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.messages()
+
+    def stop(self) -> None:
+        self._running = False
+        self._thread.join()
+        self._server.close()
+        for connection in self._connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            connection.close()
+
+
+@pytest.fixture
+def collector() -> Iterator[_Collector]:
+    """Run a TCP collector for the duration of a test."""
+    server = _Collector()
+    yield server
+    server.stop()
+
+
+class TestNetworkHandler:
+    """Test NetworkHandler class."""
+
+    def test_batches_over_one_connection(self, collector: _Collector) -> None:
+        """Test records arrive in order, in several batches over one connection."""
+        handler = json_handler(
+            NetworkHandler(f"tcp://127.0.0.1:{collector.address[1]}", batch_bytes=2048)
+        )
+        messages = [f"request {i} served" for i in range(200)]
+        for message in messages:
+            handler.handle(make_record(message))
+        handler.flush()
+
+        assert collector.wait_for(200) == messages
+        assert 1 < handler.batches_sent < 200
+        assert collector.accepts == 1
+        handler.close()
+        assert handler.closed
+
+    def test_interval_completes_batch(self, collector: _Collector) -> None:
+        """Test a partial batch is sent once its oldest record is batch_interval old."""
+        handler = json_handler(
+            NetworkHandler(f"127.0.0.1:{collector.address[1]}", batch_interval=0.05)
+        )
+        handler.handle(make_record("waiting"))
+
+        assert collector.wait_for(1) == ["waiting"]
+        assert handler.stats()["pending_records"] == 0
+        handler.close()
+
+    def test_error_completes_batch(self, collector: _Collector) -> None:
+        """Test an ERROR record sends the batch at once."""
+        handler = json_handler(
+            NetworkHandler(f"127.0.0.1:{collector.address[1]}", batch_interval=60)
+        )
+        handler.handle(make_record("routine"))
+        time.sleep(0.1)
+        assert collector.messages() == []
+
+        handler.handle(make_record("failure", logging.ERROR))
+        assert collector.wait_for(2) == ["routine", "failure"]
+        handler.close()
+
+    def test_reconnects_after_collector_restart(self, collector: _Collector) -> None:
+        """Test a closed connection is noticed and replaced without losing a batch."""
+        port = collector.address[1]
+        handler = json_handler(NetworkHandler(f"127.0.0.1:{port}", batch_bytes=0))
+        handler.handle(make_record("before"))
+        assert collector.wait_for(1) == ["before"]
+
+        collector.stop()
+        restarted = _Collector(address=("127.0.0.1", port))
+        time.sleep(0.05)
+        handler.handle(make_record("after"))
+        handler.flush()
+
+        assert restarted.wait_for(1) == ["after"]
+        assert handler.connects == 2
+        handler.close()
+        restarted.stop()
+
+    def test_spools_while_down_and_replays_in_order(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test batches are spooled during an outage and sent first once it ends."""
+        down = _Collector()
+        port = down.address[1]
+        down.stop()
+        spool_dir = tmp_path / "spool"
+        handler = json_handler(
+            NetworkHandler(
+                f"127.0.0.1:{port}",
+                spool_dir=spool_dir,
+                batch_bytes=0,
+                backoff_initial=0.01,
+                backoff_max=0.05,
+            )
+        )
+        for i in range(20):
+            handler.handle(make_record(f"spooled {i}"))
+        handler.flush()
+        assert handler.stats()["batches_spooled"] == 20
+        assert list(spool_dir.glob("*.spool"))
+
+        collector = _Collector(address=("127.0.0.1", port))
+        time.sleep(0.1)
+        for i in range(5):
+            handler.handle(make_record(f"live {i}"))
+        handler.flush()
+
+        expected = [f"spooled {i}" for i in range(20)] + [f"live {i}" for i in range(5)]
+        assert collector.wait_for(25) == expected
+        assert not list(spool_dir.glob("*.spool"))
+        assert capsys.readouterr().err.count("unavailable") == 1
+        handler.close()
+        collector.stop()
+
+    def test_leftover_spool_replayed_first(self, tmp_path: Path, collector: _Collector) -> None:
+        """Test spool files from an earlier run are sent before new records."""
+        spool_dir = tmp_path / "spool"
+        spool_dir.mkdir()
+        (spool_dir / "000000000007.spool").write_bytes(b'{"message":"earlier run"}\n')
+        handler = json_handler(
+            NetworkHandler(f"127.0.0.1:{collector.address[1]}", spool_dir=spool_dir)
+        )
+        handler.handle(make_record("this run"))
+        handler.flush()
+
+        assert collector.wait_for(2) == ["earlier run", "this run"]
+        handler.close()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="fork unavailable")
+    def test_forked_child_spool_replayed_next_run(
+        self, tmp_path: Path, collector: _Collector
+    ) -> None:
+        """Test a forked child's spool files are found by the next run."""
+        down = _Collector()
+        address = f"127.0.0.1:{down.address[1]}"
+        down.stop()
+        spool_dir = tmp_path / "spool"
+        with patch("sys.stderr"):
+            parent = json_handler(NetworkHandler(address, spool_dir=spool_dir, batch_bytes=0))
+            parent.handle(make_record("from parent"))
+            parent.flush()
+            pid = os.fork()
+            if pid == 0:
+                parent.handle(make_record("from child"))
+                parent.flush()
+                os._exit(0)
+            os.waitpid(pid, 0)
+            parent.close()
+
+        assert (spool_dir / f"{pid}-0-000000000000.spool").is_file()
+        handler = json_handler(
+            NetworkHandler(f"127.0.0.1:{collector.address[1]}", spool_dir=spool_dir)
+        )
+        handler.flush()
+        assert collector.wait_for(2) == ["from parent", "from child"]
+        handler.close()
+
+    @pytest.mark.skipif(fcntl is None, reason="fcntl unavailable")
+    def test_spool_owned_by_another_process(self, tmp_path: Path, collector: _Collector) -> None:
+        """Test a spool directory locked elsewhere is left alone and a sibling is used."""
+        spool_dir = tmp_path / "spool"
+        spool_dir.mkdir()
+        live_file = spool_dir / "000000000000.spool"
+        live_file.write_bytes(b'{"message":"other process"}\n')
+        # A separate open file description conflicts like another process would
+        with (spool_dir / SPOOL_LOCK_NAME).open("ab") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            handler = json_handler(
+                NetworkHandler(f"127.0.0.1:{collector.address[1]}", spool_dir=spool_dir)
+            )
+            handler.handle(make_record("this process"))
+            handler.flush()
+
+            assert handler.spool_dir == tmp_path / "spool.1"
+            assert collector.wait_for(1) == ["this process"]
+            assert live_file.is_file()
+            handler.close()
+
+        # Once released, the directory is claimed again and its leftovers replayed
+        handler = json_handler(
+            NetworkHandler(f"127.0.0.1:{collector.address[1]}", spool_dir=spool_dir)
+        )
+        handler.flush()
+        assert handler.spool_dir == spool_dir
+        assert collector.wait_for(2) == ["this process", "other process"]
+        handler.close()
+
+    def test_handlers_in_one_process_share_spool(self, tmp_path: Path) -> None:
+        """Test a second handler in the process spools beside the first without replaying it."""
+        down = _Collector()
+        address = f"127.0.0.1:{down.address[1]}"
+        down.stop()
+        spool_dir = tmp_path / "spool"
+        with patch("sys.stderr"):
+            first = json_handler(NetworkHandler(address, spool_dir=spool_dir, batch_bytes=0))
+            second = json_handler(NetworkHandler(address, spool_dir=spool_dir, batch_bytes=0))
+            first.handle(make_record("first"))
+            second.handle(make_record("second"))
+            first.close()
+            second.close()
+
+        assert first.spool_dir == second.spool_dir == spool_dir
+        assert first.stats()["batches_spooled"] == second.stats()["batches_spooled"] == 1
+        names = sorted(path.name for path in spool_dir.glob("*.spool"))
+        assert names == ["000000000000.spool", f"{os.getpid()}-1-000000000000.spool"]
+
+    def test_spool_bounded_and_optional(self, tmp_path: Path) -> None:
+        """Test the oldest spool files are dropped at the limit, all without a spool."""
+        down = _Collector()
+        address = f"127.0.0.1:{down.address[1]}"
+        down.stop()
+        spool_dir = tmp_path / "spool"
+        with patch("mypylogger.network.SPOOL_SEGMENT_BYTES", 100), patch("sys.stderr"):
+            bounded = json_handler(
+                NetworkHandler(address, spool_dir=spool_dir, batch_bytes=0, spool_max_bytes=1000)
+            )
+            unspooled = json_handler(NetworkHandler(address, batch_bytes=0))
+            for i in range(50):
+                bounded.handle(make_record(f"line {i}"))
+                unspooled.handle(make_record(f"line {i}"))
+            bounded.close()
+            unspooled.close()
+
+        spooled = sum(path.stat().st_size for path in spool_dir.glob("*.spool"))
+        assert 0 < spooled <= 1000
+        assert bounded.stats()["spool_bytes"] == spooled
+        assert unspooled.stats()["batches_dropped"] == 50
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+    def test_unix_socket_collector(self, tmp_path: Path) -> None:
+        """Test records are shipped over a Unix socket."""
+        path = tmp_path / "collector.sock"
+        collector = _Collector(socket.AF_UNIX, str(path))
+        handler = json_handler(NetworkHandler(f"unix://{path}"))
+        handler.handle(make_record("over unix"))
+        handler.close()
+
+        assert collector.wait_for(1) == ["over unix"]
+        collector.stop()
+
+
+class TestPeerClosed:
+    """Test _peer_closed function."""
+
+    @pytest.mark.skipif(not hasattr(os, "dup2"), reason="dup2 unavailable")
+    def test_descriptor_above_select_limit(self) -> None:
+        """Test an open connection on a descriptor above 1024 is not taken as closed."""
+        resource = pytest.importorskip("resource")
+        if resource.getrlimit(resource.RLIMIT_NOFILE)[0] <= 1100:
+            pytest.skip("descriptor limit too low")
+        local, peer = socket.socketpair()
+        original = local.detach()
+        os.dup2(original, 1100)
+        os.close(original)
+        sock = socket.socket(fileno=1100)
+        try:
+            assert not _peer_closed(sock)
+            peer.close()
+            assert _peer_closed(sock)
+        finally:
+            sock.close()
+
+
+class TestParseAddress:
+    """Test parse_address function."""
+
+    @pytest.mark.parametrize(
+        ("address", "expected"),
+        [
+            ("tcp://collector:5170", (socket.AF_INET, ("collector", 5170))),
+            ("10.0.0.1:514", (socket.AF_INET, ("10.0.0.1", 514))),
+            ("[::1]:5170", (socket.AF_INET, ("::1", 5170))),
+        ],
+    )
+    def test_tcp_addresses(self, address: str, expected: tuple[int, Any]) -> None:
+        """Test host:port forms are parsed."""
+        assert parse_address(address) == expected
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+    def test_unix_addresses(self) -> None:
+        """Test unix:// and unix: forms are parsed."""
+        assert parse_address("unix:///run/vector.sock") == (socket.AF_UNIX, "/run/vector.sock")
+        assert parse_address("unix:vector.sock") == (socket.AF_UNIX, "vector.sock")
+
+    @pytest.mark.parametrize("address", ["collector", "collector:http", "host:0", ":80", "unix:"])
+    def test_invalid_addresses(self, address: str) -> None:
+        """Test malformed addresses raise ValueError."""
+        with pytest.raises(ValueError, match="address"):
+            parse_address(address)
+
+
+class TestManagerShipping:
+    """Test LoggerManager wiring of LOG_SHIP_ADDRESS."""
+
+    def test_loggers_share_one_network_handler(self, tmp_path: Path, collector: _Collector) -> None:
+        """Test every logger ships through the same handler and connection."""
+        config = LogConfig(
+            app_name="svc",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=tmp_path,
+            ship_address=f"tcp://127.0.0.1:{collector.address[1]}",
+            ship_batch_interval_ms=50,
+        )
+        manager = LoggerManager()
+        first = logging.getLogger("network-first")
+        second = logging.getLogger("network-second")
+        with patch("sys.stdout"):
+            manager.configure_logger(first, config)
+            manager.configure_logger(second, config)
+            first.info("one")
+            second.info("two")
+
+        handler = manager._installed[first.name][0][-1]
+        assert manager._installed[second.name][0][-1] is handler
+        assert isinstance(handler, NetworkHandler)
+        assert handler.spool_dir == tmp_path / "svc_spool"
+        assert collector.wait_for(2) == ["one", "two"]
+        assert collector.accepts == 1
+        handler.close()
+
+    def test_invalid_address_ships_nothing(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a malformed address is reported and logging carries on."""
+        config = LogConfig(
+            app_name="svc",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=tmp_path,
+            ship_address="collector",
+        )
+        logger = logging.getLogger("network-invalid")
+        manager = LoggerManager()
+        manager.configure_logger(logger, config)
+
+        assert not any(
+            isinstance(handler, NetworkHandler) for handler in manager._installed[logger.name][0]
+        )
+        assert "Log shipping disabled" in capsys.readouterr().err
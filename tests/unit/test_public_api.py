@@ -4,6 +4,8 @@ import logging
 import os
 from unittest.mock import patch
 
+import pytest
+
 import mypylogger
 
 
@@ -103,9 +105,14 @@ class TestPublicAPI:
             "ConfigurationError",
             "FormattingError",
             "HandlerError",
+            "Lazy",
+            "LazyLogger",
             "MypyloggerError",
+            "get_lazy_logger",
             "get_logger",
             "get_version",
+            "reload_config",
+            "dump_flight_recorder",
         ]
 
         for export in expected_exports:
@@ -150,3 +157,20 @@ class TestPublicAPI:
         for test_name in test_cases:
             logger = mypylogger.get_logger(test_name)
             assert isinstance(logger, logging.Logger)
+
+    def test_lazy_exports_resolve_on_access(self) -> None:
+        """Test names imported on first access are the module objects."""
+        from mypylogger import context, lazy
+
+        assert mypylogger.bind is context.bind
+        assert mypylogger.LazyLogger is lazy.LazyLogger
+        assert set(mypylogger.__all__) <= set(dir(mypylogger))
+        with pytest.raises(AttributeError):
+            mypylogger.not_an_export  # noqa: B018
+
+    def test_manager_created_once(self) -> None:
+        """Test every get_logger call shares one LoggerManager."""
+        manager = mypylogger._get_manager()
+
+        assert mypylogger._get_manager() is manager
+        assert mypylogger._logger_manager is manager
@@ -0,0 +1,194 @@
+"""Unit tests for the rotating file handler."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from pathlib import Path
+import time
+from unittest.mock import patch
+
+from mypylogger.config import LogConfig
+from mypylogger.core import LoggerManager
+from mypylogger.rotating_handler import RotatingFileHandler
+from tests.conftest import json_handler, make_record, read_messages
+
+
+class TestRotatingFileHandler:
+    """Test RotatingFileHandler class."""
+
+    def test_filename_uses_current_hour(self, tmp_path: Path) -> None:
+        """Test the file follows the {APP_NAME}_{date}_{hour}.log pattern."""
+        handler = json_handler(RotatingFileHandler(tmp_path, "app"))
+        try:
+            expected = time.strftime("app_%Y%m%d_%H.log", time.localtime(time.time()))
+            assert Path(handler.baseFilename).name == expected
+            assert handler._next_rollover > time.time()
+        finally:
+            handler.close()
+
+    def test_rolls_over_at_hour_boundary(self, tmp_path: Path) -> None:
+        """Test a record past the precomputed boundary starts the next hour's file."""
+        handler = json_handler(RotatingFileHandler(tmp_path, "app"))
+        try:
+            first_file = Path(handler.baseFilename)
+            boundary = handler._next_rollover
+            handler.handle(make_record("before"))
+            handler.handle(make_record("after", created=boundary + 1))
+
+            second_file = Path(handler.baseFilename)
+            expected = time.strftime("app_%Y%m%d_%H.log", time.localtime(boundary + 1))
+            assert second_file.name == expected
+            assert second_file != first_file
+            assert handler._next_rollover == boundary + 3600
+        finally:
+            handler.close()
+
+        assert read_messages(first_file) == ["before"]
+        assert read_messages(second_file) == ["after"]
+
+    def test_boundary_check_does_not_recompute_within_hour(self, tmp_path: Path) -> None:
+        """Test records within the hour only compare against the cached boundary."""
+        handler = json_handler(RotatingFileHandler(tmp_path, "app"))
+        try:
+            with patch.object(handler, "_start_hour") as mock_start:
+                for i in range(100):
+                    handler.handle(make_record(f"m{i}"))
+            mock_start.assert_not_called()
+        finally:
+            handler.close()
+
+    def test_rolls_over_at_max_bytes(self, tmp_path: Path) -> None:
+        """Test size segments are started once max_bytes is reached."""
+        handler = json_handler(RotatingFileHandler(tmp_path, "app", max_bytes=400, backup_count=0))
+        try:
+            for i in range(20):
+                handler.handle(make_record(f"message {i}"))
+        finally:
+            handler.close()
+
+        segments = sorted(tmp_path.glob("app_*.log"))
+        assert len(segments) > 1
+        assert any(".1.log" in path.name for path in segments)
+        messages = [m for path in segments for m in read_messages(path)]
+        assert sorted(messages) == sorted(f"message {i}" for i in range(20))
+        for path in segments:
+            # A file may exceed max_bytes by at most the record that crossed it
+            assert path.stat().st_size < 400 + 400
+
+    def test_retention_keeps_backup_count_files(self, tmp_path: Path) -> None:
+        """Test the oldest rotated files are deleted in the background."""
+        handler = json_handler(RotatingFileHandler(tmp_path, "app", max_bytes=1, backup_count=2))
+        try:
+            for i in range(6):
+                handler.handle(make_record(f"m{i}"))
+                time.sleep(0.01)
+        finally:
+            handler.close()
+
+        remaining = sorted(path.name for path in tmp_path.iterdir())
+        # Two rotated files plus the current one
+        assert len(remaining) == 3
+        assert Path(handler.baseFilename).name in remaining
+
+    def test_retention_ignores_other_applications(self, tmp_path: Path) -> None:
+        """Test files of other applications are never deleted."""
+        other = tmp_path / "app_other_20240101_00.log"
+        other.write_text("keep")
+        unrelated = tmp_path / "application_20240101_00.log"
+        unrelated.write_text("keep")
+        handler = json_handler(RotatingFileHandler(tmp_path, "app", max_bytes=1, backup_count=1))
+        try:
+            for i in range(4):
+                handler.handle(make_record(f"m{i}"))
+        finally:
+            handler.close()
+
+        assert other.exists()
+        assert unrelated.exists()
+
+    def test_compresses_rotated_files(self, tmp_path: Path) -> None:
+        """Test rotated files are gzipped and the originals removed."""
+        handler = json_handler(
+            RotatingFileHandler(tmp_path, "app", max_bytes=1, backup_count=0, compress=True)
+        )
+        try:
+            handler.handle(make_record("first"))
+            handler.handle(make_record("second"))
+        finally:
+            handler.close()
+
+        compressed = list(tmp_path.glob("*.log.gz"))
+        assert len(compressed) == 1
+        with gzip.open(compressed[0], "rt") as f:
+            assert json.loads(f.read())["message"] == "first"
+        assert not compressed[0].with_suffix("").exists()
+        assert read_messages(Path(handler.baseFilename)) == ["second"]
+
+    def test_restart_skips_full_segments(self, tmp_path: Path) -> None:
+        """Test a new handler does not append to a segment that is already full."""
+        full = tmp_path / time.strftime("app_%Y%m%d_%H.log", time.localtime(time.time()))
+        full.write_bytes(b"x" * 100)
+
+        handler = json_handler(RotatingFileHandler(tmp_path, "app", max_bytes=100))
+        try:
+            assert Path(handler.baseFilename).name == full.name.replace(".log", ".1.log")
+        finally:
+            handler.close()
+
+    def test_cleanup_errors_are_reported(self, tmp_path: Path) -> None:
+        """Test background failures are reported to stderr, not raised."""
+        handler = json_handler(RotatingFileHandler(tmp_path, "app", compress=True))
+        try:
+            with patch.object(handler, "_compress", side_effect=OSError("read-only")), patch.object(
+                handler, "_log_handler_error"
+            ) as mock_error:
+                handler._finish_rollover(tmp_path / "missing.log")
+            assert "read-only" in mock_error.call_args[0][0]
+        finally:
+            handler.close()
+
+    def test_batched_rotation_writes_pending_to_old_file(self, tmp_path: Path) -> None:
+        """Test pending batched records land in the file for their hour."""
+        handler = json_handler(
+            RotatingFileHandler(tmp_path, "app", batch_bytes=10_000, batch_interval=60)
+        )
+        try:
+            first_file = Path(handler.baseFilename)
+            handler.handle(make_record("pending"))
+            handler.handle(make_record("next hour", created=handler._next_rollover + 1))
+        finally:
+            handler.close()
+
+        assert read_messages(first_file) == ["pending"]
+
+    def test_manager_shares_rotating_handler(self, tmp_path: Path) -> None:
+        """Test loggers writing the same files share one rotating handler."""
+        manager = LoggerManager()
+        config = LogConfig(
+            app_name="test_app",
+            log_level="INFO",
+            log_to_file=True,
+            log_file_dir=tmp_path,
+            file_rotate=True,
+        )
+        first = logging.getLogger("rotating_shared_one")
+        second = logging.getLogger("rotating_shared_two")
+        first.handlers.clear()
+        second.handlers.clear()
+
+        manager.configure_logger(first, config)
+        manager.configure_logger(second, config)
+
+        assert isinstance(first.handlers[1], RotatingFileHandler)
+        assert first.handlers[1] is second.handlers[1]
+
+        first.handlers[1].close()
+        third = logging.getLogger("rotating_shared_three")
+        third.handlers.clear()
+        manager.configure_logger(third, config)
+        assert third.handlers[1] is not first.handlers[1]
+        third.handlers[1].close()
+        for logger in (first, second, third):
+            logger.handlers.clear()
@@ -0,0 +1,194 @@
+"""Unit tests for compiled log schemas."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from mypylogger.config import LogConfig
+from mypylogger.context import contextualize
+from mypylogger.exceptions import ConfigurationError
+from mypylogger.formatters import SourceLocationJSONFormatter
+from mypylogger.handlers import HandlerFactory
+from mypylogger.schema import LogSchema, compile_schema, parse_schema
+from mypylogger.static_fields import StaticFields
+from tests.conftest import make_record
+
+ACCESS_LOG = {"method": str, "status": int, "duration_ms": float, "cached": bool}
+
+
+def _formatters(**options: object) -> tuple[SourceLocationJSONFormatter, ...]:
+    """Create a compiled and a generic formatter with the same options."""
+    compiled = SourceLocationJSONFormatter(
+        source_location="record",
+        json_backend="stdlib",
+        schema=compile_schema(ACCESS_LOG),
+        **options,  # type: ignore[arg-type]
+    )
+    generic = SourceLocationJSONFormatter(
+        source_location="record",
+        json_backend="stdlib",
+        **options,  # type: ignore[arg-type]
+    )
+    return compiled, generic
+
+
+class TestLogSchema:
+    """Test schema declaration and parsing."""
+
+    def test_rejects_reserved_and_unsupported_fields(self) -> None:
+        """Test invalid declarations raise ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            LogSchema({"message": str})
+        with pytest.raises(ConfigurationError):
+            LogSchema({"process": int})
+        with pytest.raises(ConfigurationError):
+            LogSchema({"tags": list})
+
+    def test_field_names_are_not_code(self) -> None:
+        """Test arbitrary field names are encoded, never executed."""
+        schema = LogSchema({'x"): import os #': str, "ü ñ": int})
+        record = make_record("request", **{'x"): import os #': "v", "ü ñ": 1})
+
+        output = SourceLocationJSONFormatter(source_location="record", schema=schema).format(record)
+
+        assert json.loads(output)['x"): import os #'] == "v"
+        assert json.loads(output)["ü ñ"] == 1
+
+    def test_parse_schema(self) -> None:
+        """Test name:type specifications parse in declaration order."""
+        assert parse_schema("method:str, status:INT,,ok:bool") == {
+            "method": str,
+            "status": int,
+            "ok": bool,
+        }
+        with pytest.raises(ConfigurationError):
+            parse_schema("status")
+        with pytest.raises(ConfigurationError):
+            parse_schema("status:decimal")
+
+
+class TestCompiledFormatting:
+    """Test compiled output matches the generic path."""
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            {"method": "GET", "status": 200, "duration_ms": 1.25, "cached": False},
+            {"method": 'P"O\\S\nT é', "status": 500, "duration_ms": 3, "cached": True},
+            {"method": "GET"},
+            {"method": None, "status": None},
+            {"cached": True, "duration_ms": 0.5, "status": 304, "method": "GET"},
+            {},
+        ],
+    )
+    def test_matches_generic_output(self, extra: dict) -> None:
+        """Test str and bytes output are identical to the generic formatter."""
+        compiled, generic = _formatters()
+        record = make_record("user %s", **extra)
+        record.args = ("ünïcode\t",)
+
+        assert compiled.format(record) == generic.format(record)
+        assert compiled.format_bytes(record) == generic.format_bytes(record)
+
+    def test_fields_keep_record_order(self) -> None:
+        """Test fields are written in the order the record carries them."""
+        compiled, _ = _formatters()
+
+        output = compiled.format(make_record("request", status=200, method="GET"))
+
+        assert list(json.loads(output))[-2:] == ["status", "method"]
+
+    def test_field_orders_bounded(self) -> None:
+        """Test records in field orders beyond the limit use the generic path."""
+        compiled, generic = _formatters()
+        record = make_record("request", status=200, method="GET")
+
+        with patch("mypylogger.schema.MAX_FIELD_ORDERS", 1), patch.object(
+            compiled, "_build_json_record", wraps=compiled._build_json_record
+        ) as build:
+            output = compiled.format(record)
+
+        build.assert_called_once()
+        assert output == generic.format(record)
+
+    def test_epoch_timestamps(self) -> None:
+        """Test integer timestamps are written unquoted."""
+        compiled, generic = _formatters(timestamp_format="ms")
+        record = make_record("request", status=204)
+
+        assert compiled.format(record) == generic.format(record)
+
+    def test_skips_the_json_encoder(self) -> None:
+        """Test matching records never reach json.dumps."""
+        compiled, _ = _formatters()
+
+        with patch("json.dumps", wraps=json.dumps) as dumps:
+            compiled.format(make_record("request", method="GET", status=200))
+
+        dumps.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            {"method": "GET", "user": "alice"},
+            {"status": "200"},
+            {"status": True},
+            {"duration_ms": float("nan")},
+            {"cached": 1},
+            {"custom": {"method": "GET"}},
+        ],
+    )
+    def test_falls_back_for_unexpected_fields(self, extra: dict) -> None:
+        """Test undeclared fields and mismatched types use the generic path."""
+        compiled, generic = _formatters()
+        record = make_record("request", **extra)
+
+        with patch.object(
+            compiled, "_build_json_record", wraps=compiled._build_json_record
+        ) as build:
+            output = compiled.format(record)
+
+        build.assert_called_once()
+        assert output == generic.format(record)
+
+    def test_context_and_static_fields_spliced(self) -> None:
+        """Test bound context and static fields apply to compiled output."""
+        static = StaticFields("svc", include_host=False, include_pid=False)
+        compiled, generic = _formatters(static_fields=static)
+        record = make_record("request", method="GET")
+
+        with contextualize(request_id="r-1", method="ctx"):
+            output = compiled.format(record)
+            assert output == generic.format(record)
+
+        data = json.loads(output)
+        assert next(iter(data)) == "app"
+        assert data["method"] == "GET"
+        assert data["request_id"] == "r-1"
+
+
+class TestSchemaFactory:
+    """Test HandlerFactory integration."""
+
+    def test_formatter_compiles_configured_schema(self) -> None:
+        """Test LOG_SCHEMA formatters are compiled once and cached."""
+        factory = HandlerFactory()
+        config = LogConfig(
+            app_name="svc",
+            log_level="INFO",
+            log_to_file=False,
+            log_file_dir=Path(tempfile.gettempdir()),
+            log_schema="method:str,status:int",
+        )
+
+        formatter = factory.get_formatter(config)
+
+        assert formatter is factory.get_formatter(config)
+        assert formatter.schema is not None
+        assert formatter.schema.fields == {"method": str, "status": int}
+        assert factory.get_formatter().schema is None
@@ -1,5 +1,6 @@
 """Comprehensive tests for source location extraction functionality."""
 
+import io
 import json
 import logging
 from pathlib import Path
@@ -7,7 +8,7 @@ import tempfile
 from types import FrameType
 from unittest.mock import Mock, patch
 
-from mypylogger.formatters import SourceLocationJSONFormatter
+from mypylogger.formatters import SOURCE_LOCATION_RECORD, SourceLocationJSONFormatter
 
 
 class TestSourceLocationExtraction:
@@ -342,3 +343,127 @@ class TestSourceLocationExtraction:
                     assert location["filename"] == "user.py"
                     assert location["function_name"] == "user_function"
                     assert location["line"] == 100
+
+
+class TestRecordSourceLocation:
+    """Test the record-based source location fast path."""
+
+    def test_record_mode_uses_record_fields(self) -> None:
+        """Test record mode trusts pathname, lineno and funcName without walking frames."""
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="/path/to/test.py",
+            lineno=42,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+            func="handler_function",
+        )
+
+        with patch("sys._getframe") as mock_getframe, patch.object(
+            formatter, "_get_relative_filename", return_value="test.py"
+        ):
+            location = formatter._extract_source_location(record)
+
+            mock_getframe.assert_not_called()
+            assert location == {
+                "module": "test_logger",
+                "filename": "test.py",
+                "function_name": "handler_function",
+                "line": 42,
+            }
+
+    def test_record_mode_resolves_module_name_from_loaded_modules(self) -> None:
+        """Test record mode maps the record pathname to the imported module name."""
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname=json.__file__,
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+            func="dumps",
+        )
+
+        assert formatter._extract_source_location(record)["module"] == "json"
+
+    def test_record_mode_memoizes_module_lookup(self) -> None:
+        """Test module name lookup runs once per (pathname, funcName)."""
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="/path/to/test.py",
+            lineno=42,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+            func="handler_function",
+        )
+
+        with patch.object(
+            formatter, "_module_name_for_path", return_value="myapp.handlers"
+        ) as mock_lookup:
+            for _ in range(3):
+                location = formatter._extract_source_location(record)
+
+            mock_lookup.assert_called_once()
+            assert location["module"] == "myapp.handlers"
+
+    def test_record_mode_honours_stacklevel(self) -> None:
+        """Test record mode reports the caller selected with stacklevel."""
+        formatter = SourceLocationJSONFormatter(source_location=SOURCE_LOCATION_RECORD)
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(formatter)
+        logger = logging.getLogger("record_stacklevel_test")
+        logger.handlers.clear()
+        logger.addHandler(handler)
+        logger.propagate = False
+
+        def log_helper() -> None:
+            logger.warning("from helper", stacklevel=2)
+
+        log_helper()
+
+        parsed = json.loads(stream.getvalue())
+        assert parsed["function_name"] == "test_record_mode_honours_stacklevel"
+        assert parsed["module"] == __name__
+
+    def test_stack_mode_memoizes_internal_frame_checks(self) -> None:
+        """Test the stack walk checks each code object's path only once."""
+        formatter = SourceLocationJSONFormatter()
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="/path/to/test.py",
+            lineno=42,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+
+        user_frame = Mock(spec=FrameType)
+        user_frame.f_code.co_filename = "/path/to/user.py"
+        user_frame.f_code.co_name = "user_function"
+        user_frame.f_lineno = 100
+        user_frame.f_globals = {"__name__": "user_module"}
+        user_frame.f_back = None
+
+        logging_frame = Mock(spec=FrameType)
+        logging_frame.f_code.co_filename = "/python/logging/__init__.py"
+        logging_frame.f_code.co_name = "info"
+        logging_frame.f_back = user_frame
+
+        with patch("sys._getframe", return_value=logging_frame), patch.object(
+            formatter, "_is_logging_internal", wraps=formatter._is_logging_internal
+        ) as mock_internal:
+            for _ in range(5):
+                location = formatter._extract_source_location(record)
+
+            assert mock_internal.call_count == 2
+            assert location["function_name"] == "user_function"
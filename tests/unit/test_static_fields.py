@@ -0,0 +1,139 @@
+"""Unit tests for the pre-encoded static field prefix."""
+
+import json
+import os
+from pathlib import Path
+import socket
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from mypylogger.config import LogConfig
+from mypylogger.context import contextualize
+from mypylogger.formatters import SourceLocationJSONFormatter
+from mypylogger.handlers import HandlerFactory
+from mypylogger.static_fields import StaticFields
+from tests.conftest import make_record
+
+
+def _config(app_name: str, **options: object) -> LogConfig:
+    """Create a console-only configuration."""
+    return LogConfig(
+        app_name=app_name,
+        log_level="INFO",
+        log_to_file=False,
+        log_file_dir=Path(tempfile.gettempdir()),
+        **options,  # type: ignore[arg-type]
+    )
+
+
+class TestStaticFields:
+    """Test StaticFields compilation."""
+
+    def test_compiles_app_host_pid_and_version(self) -> None:
+        """Test all fields are encoded once, in a fixed order."""
+        static = StaticFields("svc", version="1.2.3")
+
+        assert static.fields.fields == {
+            "app": "svc",
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "version": "1.2.3",
+        }
+        assert static.fields.fragment.startswith('"app":"svc","host":')
+
+    def test_empty_version_and_disabled_fields_omitted(self) -> None:
+        """Test optional fields are left out of the prefix."""
+        static = StaticFields("svc", include_host=False, include_pid=False)
+
+        assert static.fields.fragment == '"app":"svc"'
+
+    def test_fork_recompiles_pid(self) -> None:
+        """Test a forked child writes its own pid without a per-record check."""
+        if not hasattr(os, "fork"):
+            pytest.skip("fork required")
+        static = StaticFields("svc")
+        parent_pid = os.getpid()
+
+        pid = os.fork()
+        if pid == 0:
+            child_pid = static.fields.fields.get("pid")
+            os._exit(0 if child_pid == os.getpid() and child_pid != parent_pid else 1)
+        _, status = os.waitpid(pid, 0)
+
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert static.fields.fields["pid"] == parent_pid
+
+
+class TestStaticFieldFormatting:
+    """Test the formatter writes the prefix."""
+
+    def test_prefix_leads_the_line(self) -> None:
+        """Test static fields come first and the rest of the record is unchanged."""
+        static = StaticFields("svc", version="2.0")
+        formatter = SourceLocationJSONFormatter(static_fields=static)
+
+        output = formatter.format(make_record("hello"))
+        data = json.loads(output)
+
+        assert list(data)[:4] == ["app", "host", "pid", "version"]
+        assert data["message"] == "hello"
+        assert output.startswith("{" + static.fields.fragment + ",")
+
+    def test_prefix_in_bytes_output(self) -> None:
+        """Test format_bytes writes the same prefix."""
+        static = StaticFields("svc")
+        formatter = SourceLocationJSONFormatter(static_fields=static)
+
+        output = formatter.format_bytes(make_record("hello"))
+
+        assert output.startswith(b"{" + static.fields.fragment_bytes + b",")
+        assert json.loads(output)["app"] == "svc"
+
+    def test_prefix_not_reencoded_per_record(self) -> None:
+        """Test static values never reach the JSON encoder."""
+        formatter = SourceLocationJSONFormatter(static_fields=StaticFields("svc"))
+
+        with patch("json.dumps", wraps=json.dumps) as dumps:
+            formatter.format(make_record("hello"))
+
+        for call in dumps.call_args_list:
+            assert "app" not in call.args[0]
+
+    def test_extra_and_context_override_static_fields(self) -> None:
+        """Test record extra and bound context win without duplicate keys."""
+        formatter = SourceLocationJSONFormatter(static_fields=StaticFields("svc"))
+
+        with contextualize(host="ctx-host"):
+            output = formatter.format(make_record("hello", app="override"))
+
+        assert output.count('"app"') == 1
+        assert output.count('"host"') == 1
+        data = json.loads(output)
+        assert data["app"] == "override"
+        assert data["host"] == "ctx-host"
+        assert data["pid"] == os.getpid()
+
+
+class TestStaticFieldsFactory:
+    """Test HandlerFactory integration."""
+
+    def test_formatter_built_once_per_config(self) -> None:
+        """Test the prefix is compiled once and shared per app and version."""
+        factory = HandlerFactory()
+        config = _config("svc", static_fields=True, service_version="3.1")
+
+        formatter = factory.get_formatter(config)
+
+        assert formatter is factory.get_formatter(config)
+        assert formatter.static_fields is not None
+        assert formatter.static_fields.fields.fields["version"] == "3.1"
+        other = factory.get_formatter(_config("other", static_fields=True))
+        assert other is not formatter
+
+    def test_disabled_by_default(self) -> None:
+        """Test no prefix is written unless enabled."""
+        formatter = HandlerFactory().get_formatter(_config("svc"))
+
+        assert formatter.static_fields is None
@@ -0,0 +1,87 @@
+"""Unit tests for timestamp rendering."""
+
+import datetime as dt
+import random
+
+from mypylogger.timestamps import (
+    TIMESTAMP_EPOCH_MS,
+    TIMESTAMP_EPOCH_NS,
+    TIMESTAMP_EPOCH_US,
+    TimestampEngine,
+)
+
+
+def _reference_iso(created: float) -> str:
+    """Render created the way the formatter did before the engine existed."""
+    moment = dt.datetime.fromtimestamp(created, tz=dt.timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class TestTimestampEngine:
+    """Test TimestampEngine class."""
+
+    def test_iso_output_matches_datetime(self) -> None:
+        """Test ISO output is byte-identical to datetime.strftime."""
+        engine = TimestampEngine()
+        rng = random.Random(1234)  # noqa: S311
+
+        samples = [rng.uniform(0, 4_000_000_000) for _ in range(5000)]
+        samples += [1_700_000_000.9999996, 1_700_000_000.9999994, 1_700_000_000.0000005]
+        samples += [1_700_000_000.0, 0.0, 1_700_000_000.1234565]
+
+        for created in samples:
+            assert engine.format_iso(created) == _reference_iso(created), created
+
+    def test_iso_output_matches_datetime_within_same_second(self) -> None:
+        """Test cached prefixes are reused correctly for records in one second."""
+        engine = TimestampEngine()
+
+        for micros in range(0, 1_000_000, 997):
+            created = 1_700_000_000 + micros / 1e6
+            assert engine.format_iso(created) == _reference_iso(created)
+
+    def test_prefix_cached_per_second(self) -> None:
+        """Test the per-second prefix is rendered once per second."""
+        engine = TimestampEngine()
+        engine.format_iso(1_700_000_000.1)
+        cached = engine._prefix_cache
+
+        engine.format_iso(1_700_000_000.9)
+        assert engine._prefix_cache is cached
+
+        engine.format_iso(1_700_000_001.1)
+        assert engine._prefix_cache[0] == 1_700_000_001
+
+    def test_rounding_into_next_second(self) -> None:
+        """Test microsecond rounding that carries into the next second."""
+        engine = TimestampEngine()
+
+        assert engine.format_iso(1_700_000_000.9999999) == "2023-11-14T22:13:21.000000Z"
+
+    def test_epoch_formats(self) -> None:
+        """Test epoch integer precisions."""
+        created = 1_700_000_000.123456
+
+        assert TimestampEngine(TIMESTAMP_EPOCH_MS).format(created) == 1_700_000_000_123
+        assert TimestampEngine(TIMESTAMP_EPOCH_US).format(created) == 1_700_000_000_123_456
+        ns = TimestampEngine(TIMESTAMP_EPOCH_NS).format(created)
+        assert isinstance(ns, int)
+        assert abs(ns - 1_700_000_000_123_456_000) < 1000
+
+    def test_default_format_is_iso(self) -> None:
+        """Test format() returns the ISO string by default."""
+        assert TimestampEngine().format(0.5) == "1970-01-01T00:00:00.500000Z"
+
+    def test_integer_round_trip(self) -> None:
+        """Test from_integer(to_integer(x)) renders exactly what format(x) does."""
+        rng = random.Random(4321)  # noqa: S311
+        samples = [rng.uniform(0, 4_000_000_000) for _ in range(2000)]
+        samples += [1_700_000_000.9999996, 1_700_000_000.9999999, 0.0]
+
+        for timestamp_format in ("iso", TIMESTAMP_EPOCH_MS, TIMESTAMP_EPOCH_NS):
+            encoder = TimestampEngine(timestamp_format)
+            decoder = TimestampEngine(timestamp_format)
+            for created in samples:
+                value = encoder.to_integer(created)
+                assert isinstance(value, int)
+                assert decoder.from_integer(value) == encoder.format(created), created
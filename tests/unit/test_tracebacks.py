@@ -0,0 +1,185 @@
+"""Unit tests for structured exception rendering."""
+
+import json
+import logging
+import pickle
+import sys
+from unittest.mock import patch
+
+from mypylogger.formatters import EXCEPTION_ATTR, SourceLocationJSONFormatter
+from mypylogger.tracebacks import ExceptionRenderer
+
+
+class LookupFailedError(Exception):
+    """Exception type defined outside builtins."""
+
+
+def _fail(message: str) -> None:
+    """Raise a ValueError from a fixed line."""
+    raise ValueError(message)
+
+
+def _exc_record(exc_info: object, msg: str = "request failed") -> logging.LogRecord:
+    """Create a record carrying exc_info."""
+    return logging.LogRecord(
+        "test",
+        logging.ERROR,
+        __file__,
+        10,
+        msg,
+        None,
+        exc_info,  # type: ignore[arg-type]
+        "handler",
+    )
+
+
+def _caught(message: str = "bad input") -> tuple:
+    """Return exc_info for a ValueError raised by _fail."""
+    try:
+        _fail(message)
+    except ValueError:
+        return sys.exc_info()
+    msg = "unreachable"
+    raise AssertionError(msg)
+
+
+class TestStructuredExceptions:
+    """Test exceptions are written as JSON objects."""
+
+    def test_exception_type_message_and_frames(self) -> None:
+        """Test logger.exception output includes the structured traceback."""
+        output = SourceLocationJSONFormatter().format(_exc_record(_caught()))
+        data = json.loads(output)
+
+        exception = data["exception"]
+        assert exception["type"] == "ValueError"
+        assert exception["message"] == "bad input"
+        assert [frame["function"] for frame in exception["frames"]] == ["_caught", "_fail"]
+        assert exception["frames"][-1]["line"] == _fail.__code__.co_firstlineno + 2
+        assert exception["frames"][-1]["filename"].endswith("test_tracebacks.py")
+        assert len(data["stack_hash"]) == 16
+
+    def test_chained_causes_nested(self) -> None:
+        """Test explicit causes and implicit contexts are nested under cause."""
+        try:
+            try:
+                _fail("inner")
+            except ValueError as e:
+                msg = "outer"
+                raise LookupFailedError(msg) from e
+        except LookupFailedError:
+            exc_info = sys.exc_info()
+
+        data = json.loads(SourceLocationJSONFormatter().format(_exc_record(exc_info)))
+
+        exception = data["exception"]
+        assert exception["type"] == f"{__name__}.LookupFailedError"
+        assert exception["cause"]["type"] == "ValueError"
+        assert exception["cause"]["message"] == "inner"
+        assert "cause" not in exception["cause"]
+
+    def test_suppressed_context_not_rendered(self) -> None:
+        """Test ``raise ... from None`` hides the original exception."""
+        try:
+            try:
+                _fail("hidden")
+            except ValueError:
+                msg = "shown"
+                raise KeyError(msg) from None
+        except KeyError:
+            exc_info = sys.exc_info()
+
+        data = json.loads(SourceLocationJSONFormatter().format(_exc_record(exc_info)))
+
+        assert "cause" not in data["exception"]
+
+    def test_frame_limit_keeps_innermost_frames(self) -> None:
+        """Test only the innermost frames are written beyond the limit."""
+
+        def recurse(depth: int) -> None:
+            if depth == 0:
+                _fail("deep")
+            recurse(depth - 1)
+
+        try:
+            recurse(10)
+        except ValueError:
+            exc_info = sys.exc_info()
+
+        formatter = SourceLocationJSONFormatter(exc_frame_limit=3)
+        exception = json.loads(formatter.format(_exc_record(exc_info)))["exception"]
+
+        assert [frame["function"] for frame in exception["frames"]] == [
+            "recurse",
+            "recurse",
+            "_fail",
+        ]
+        assert exception["frames_omitted"] == 10
+
+    def test_bytes_output(self) -> None:
+        """Test format_bytes includes the same exception object."""
+        formatter = SourceLocationJSONFormatter()
+        record = _exc_record(_caught("ünïcode"))
+
+        assert json.loads(formatter.format_bytes(record)) == json.loads(formatter.format(record))
+
+    def test_no_exception_without_exc_info(self) -> None:
+        """Test records without a current exception have no exception field."""
+        formatter = SourceLocationJSONFormatter()
+
+        assert "exception" not in json.loads(formatter.format(_exc_record(None)))
+        assert "exception" not in json.loads(formatter.format(_exc_record((None, None, None))))
+
+    def test_extra_exception_field_wins(self) -> None:
+        """Test a custom "exception" field is not duplicated."""
+        record = _exc_record(_caught())
+        record.exception = "custom"
+
+        output = SourceLocationJSONFormatter().format(record)
+
+        assert output.count('"exception"') == 1
+        assert json.loads(output)["exception"] == "custom"
+
+
+class TestFingerprintCache:
+    """Test rendering is cached per traceback fingerprint."""
+
+    def test_identical_failures_reuse_rendering(self) -> None:
+        """Test repeats only encode the message, keeping the same stack hash."""
+        renderer = ExceptionRenderer()
+
+        with patch.object(renderer, "_render_chain", wraps=renderer._render_chain) as render:
+            first = renderer.render(_caught("user 1 not found"))
+            second = renderer.render(_caught("user 2 not found"))
+
+        render.assert_called_once()
+        assert "user 2 not found" in second
+        first_hash = first.rsplit('"stack_hash":', 1)[1]
+        assert second.endswith(first_hash)
+
+    def test_different_call_sites_differ(self) -> None:
+        """Test a different raising line gives a different fingerprint and hash."""
+        renderer = ExceptionRenderer()
+        try:
+            int("bad input")
+        except ValueError:
+            local = sys.exc_info()
+
+        first = renderer.render(_caught())
+        second = renderer.render(local)
+
+        assert first.rsplit('"stack_hash":', 1)[1] != second.rsplit('"stack_hash":', 1)[1]
+
+    def test_captured_exception_survives_pickling(self) -> None:
+        """Test capture_exception lets another process format the exception."""
+        formatter = SourceLocationJSONFormatter()
+        record = _exc_record(_caught())
+        expected = json.loads(formatter.format(record))["exception"]
+
+        formatter.capture_exception(record)
+        state = dict(record.__dict__, exc_info=None)
+        received = logging.makeLogRecord(pickle.loads(pickle.dumps(state)))  # noqa: S301
+
+        data = json.loads(formatter.format(received))
+        assert data["exception"] == expected
+        assert EXCEPTION_ATTR not in data